@@ -0,0 +1,3 @@
+"""
+GoalPath Benchmark Suite
+"""
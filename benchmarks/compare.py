@@ -0,0 +1,92 @@
+"""
+Compare two pytest-benchmark JSON result files and flag regressions
+
+Usage:
+    python -m benchmarks.compare BASELINE.json CURRENT.json [--threshold 10] [--stat median]
+
+Exits with status 1 when any benchmark present in both files got slower than
+the baseline by more than the threshold (in percent).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+STATS = ("min", "max", "mean", "median")
+
+
+def load_results(path: Path, stat: str) -> Dict[str, float]:
+    """Map benchmark full names to the selected statistic (seconds)"""
+    with open(path) as handle:
+        data = json.load(handle)
+    return {bench["fullname"]: bench["stats"][stat] for bench in data.get("benchmarks", [])}
+
+
+def compare_results(
+    baseline: Dict[str, float], current: Dict[str, float], threshold: float
+) -> Tuple[List[Tuple[str, float, float, float]], List[str], List[str]]:
+    """
+    Compare two result maps.
+
+    Returns (rows, regressions, missing) where rows hold
+    (name, baseline, current, change_percent) for benchmarks present in both.
+    """
+    rows = []
+    regressions = []
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name], current[name]
+        change = ((after - before) / before * 100) if before > 0 else 0.0
+        rows.append((name, before, after, change))
+        if change > threshold:
+            regressions.append(name)
+
+    missing = sorted(baseline.keys() - current.keys())
+    return rows, regressions, missing
+
+
+def main(argv=None) -> int:
+    """Main function for direct script execution"""
+    parser = argparse.ArgumentParser(description="Compare GoalPath benchmark results")
+    parser.add_argument("baseline", type=Path, help="Baseline pytest-benchmark JSON file")
+    parser.add_argument("current", type=Path, help="Current pytest-benchmark JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Allowed slowdown in percent before a benchmark counts as a regression",
+    )
+    parser.add_argument("--stat", choices=STATS, default="median", help="Statistic to compare")
+
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline, args.stat)
+    current = load_results(args.current, args.stat)
+    rows, regressions, missing = compare_results(baseline, current, args.threshold)
+
+    width = max((len(name) for name, *_ in rows), default=20)
+    print(f"{'benchmark':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>8}")
+    for name, before, after, change in rows:
+        flag = "  REGRESSION" if name in regressions else ""
+        print(
+            f"{name:<{width}}  {before * 1000:>10.3f}ms  {after * 1000:>10.3f}ms  "
+            f"{change:>+7.1f}%{flag}"
+        )
+
+    for name in missing:
+        print(f"⚠️  {name} is missing from the current results")
+
+    if regressions:
+        print(
+            f"\n❌ {len(regressions)} benchmark(s) regressed by more than "
+            f"{args.threshold:.0f}% ({args.stat})"
+        )
+        return 1
+
+    print(f"\n✅ No regressions above {args.threshold:.0f}% ({args.stat})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
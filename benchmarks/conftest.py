@@ -0,0 +1,70 @@
+"""
+Benchmark fixtures for GoalPath
+
+Each benchmark runs once per dataset scale. Select scales with the
+GOALPATH_BENCH_SCALES environment variable (comma separated, default
+"small,medium"); see benchmarks/datasets.py for the available scales.
+"""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.goalpath.database import DatabaseManager, get_db
+from src.goalpath.main import app
+
+from .datasets import SCALES, seed_dataset
+
+# The app's reminder scheduler would run against the default database, not the seeded one
+os.environ.setdefault("GOALPATH_REMINDER_SCHEDULER", "off")
+
+
+def _selected_scales():
+    names = os.environ.get("GOALPATH_BENCH_SCALES", "small,medium")
+    return [SCALES[name.strip()] for name in names.split(",") if name.strip()]
+
+
+@pytest.fixture(scope="session", params=_selected_scales(), ids=lambda scale: scale.name)
+def bench_dataset(request):
+    """Seed an in-memory database for one scale and keep it for the whole run"""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.create_tables()
+
+    session = db_manager.get_sync_session()
+    dataset = seed_dataset(session, request.param)
+    session.close()
+
+    yield db_manager, dataset
+
+    db_manager.engine.dispose()
+
+
+@pytest.fixture
+def bench_session(bench_dataset):
+    """Database session bound to the seeded benchmark database"""
+    db_manager, _ = bench_dataset
+    session = db_manager.get_sync_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def bench_client(bench_session):
+    """Test client whose requests run against the seeded benchmark database"""
+
+    def override_get_db():
+        yield bench_session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    with TestClient(app) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def dataset(bench_dataset):
+    """Identifiers of the seeded rows for the current scale"""
+    return bench_dataset[1]
@@ -0,0 +1,179 @@
+"""
+Synthetic dataset generation for GoalPath benchmarks
+Seeds projects, task hierarchies, dependencies and goals at fixed scales
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.goalpath.models import Goal, GoalProject, Project, Task, TaskDependency, generate_uuid
+
+TASK_STATUSES = ["backlog", "todo", "in_progress", "in_review", "done", "blocked"]
+TASK_PRIORITIES = ["low", "medium", "high", "critical"]
+
+
+@dataclass(frozen=True)
+class DatasetScale:
+    """Size parameters for a seeded benchmark database"""
+
+    name: str
+    projects: int
+    tasks_per_project: int
+    goals: int
+
+    @property
+    def total_tasks(self) -> int:
+        return self.projects * self.tasks_per_project
+
+
+SCALES: Dict[str, DatasetScale] = {
+    "small": DatasetScale("small", projects=5, tasks_per_project=40, goals=10),
+    "medium": DatasetScale("medium", projects=20, tasks_per_project=100, goals=40),
+    "large": DatasetScale("large", projects=50, tasks_per_project=400, goals=100),
+}
+
+
+@dataclass
+class SeededDataset:
+    """Identifiers of the seeded rows, used to target benchmarked operations"""
+
+    scale: DatasetScale
+    project_ids: List[str]
+    task_ids: List[str]
+    root_goal_ids: List[str]
+
+
+def seed_dataset(session: Session, scale: DatasetScale, seed: int = 42) -> SeededDataset:
+    """
+    Populate an empty database with a deterministic dataset of the given scale.
+
+    Rows are written with bulk INSERTs so that seeding the large scale takes
+    seconds rather than minutes.
+    """
+    rng = random.Random(seed)
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    base_date = date(2025, 1, 1)
+
+    project_rows = []
+    for index in range(scale.projects):
+        project_rows.append(
+            {
+                "id": generate_uuid(),
+                "name": f"Benchmark Project {index:04d}",
+                "description": f"Synthetic project {index} used for benchmarking",
+                "status": "active" if index % 5 else "paused",
+                "priority": TASK_PRIORITIES[index % len(TASK_PRIORITIES)],
+                "start_date": base_date,
+                "target_end_date": base_date + timedelta(days=180),
+                "created_at": now,
+                "updated_at": now - timedelta(minutes=index),
+                "created_by": "benchmark",
+            }
+        )
+    session.execute(insert(Project), project_rows)
+
+    task_rows = []
+    dependency_rows = []
+    for project in project_rows:
+        epic_ids: List[str] = []
+        project_task_ids: List[str] = []
+        for index in range(scale.tasks_per_project):
+            task_id = generate_uuid()
+            # Every tenth task is an epic; the rest hang off the latest epic
+            is_epic = index % 10 == 0
+            parent_id = None if is_epic or not epic_ids else epic_ids[-1]
+            status = rng.choice(TASK_STATUSES)
+            start = base_date + timedelta(days=rng.randint(0, 150))
+            task_rows.append(
+                {
+                    "id": task_id,
+                    "project_id": project["id"],
+                    "parent_task_id": parent_id,
+                    "title": f"Task {index:05d} of {project['name']}",
+                    "description": "Lorem ipsum dolor sit amet. " * rng.randint(1, 20),
+                    "task_type": "epic" if is_epic else "task",
+                    "status": status,
+                    "priority": rng.choice(TASK_PRIORITIES),
+                    "story_points": rng.randint(1, 8),
+                    "estimated_hours": rng.randint(1, 40),
+                    "start_date": start,
+                    "due_date": start + timedelta(days=rng.randint(1, 30)),
+                    "completed_date": now if status == "done" else None,
+                    "created_by": "benchmark",
+                    "order_index": index + 1,
+                    "created_at": now,
+                    "updated_at": now - timedelta(seconds=rng.randint(0, 86400)),
+                }
+            )
+            if is_epic:
+                epic_ids.append(task_id)
+            elif project_task_ids and rng.random() < 0.2:
+                # Depend on an earlier task so the dependency graph stays acyclic
+                dependency_rows.append(
+                    {
+                        "id": generate_uuid(),
+                        "task_id": task_id,
+                        "depends_on_task_id": rng.choice(project_task_ids),
+                        "dependency_type": "blocks",
+                        "created_at": now,
+                    }
+                )
+            project_task_ids.append(task_id)
+    session.execute(insert(Task), task_rows)
+    if dependency_rows:
+        session.execute(insert(TaskDependency), dependency_rows)
+
+    # Goals form a three-level tree: roots, children and grandchildren
+    goal_rows = []
+    root_goal_ids: List[str] = []
+    level_sizes = [max(1, scale.goals // 10), max(1, scale.goals // 3)]
+    previous_level: List[str] = []
+    for level, goal_type in enumerate(["long_term", "medium_term", "short_term"]):
+        count = level_sizes[level] if level < len(level_sizes) else scale.goals - len(goal_rows)
+        current_level = []
+        for index in range(max(1, count)):
+            goal_id = generate_uuid()
+            goal_rows.append(
+                {
+                    "id": goal_id,
+                    "parent_goal_id": (
+                        previous_level[index % len(previous_level)] if previous_level else None
+                    ),
+                    "title": f"Benchmark Goal L{level} #{index}",
+                    "description": "Synthetic goal used for benchmarking",
+                    "goal_type": goal_type,
+                    "status": "active",
+                    "progress_percentage": 0,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            current_level.append(goal_id)
+        if level == 0:
+            root_goal_ids = list(current_level)
+        previous_level = current_level
+    session.execute(insert(Goal), goal_rows)
+
+    link_rows = [
+        {
+            "goal_id": goal["id"],
+            "project_id": project_rows[index % len(project_rows)]["id"],
+            "weight": 1,
+        }
+        for index, goal in enumerate(goal_rows)
+    ]
+    session.execute(insert(GoalProject), link_rows)
+
+    session.commit()
+
+    return SeededDataset(
+        scale=scale,
+        project_ids=[row["id"] for row in project_rows],
+        task_ids=[row["id"] for row in task_rows],
+        root_goal_ids=root_goal_ids,
+    )
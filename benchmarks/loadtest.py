@@ -0,0 +1,263 @@
+"""
+HTTP load-test harness for GoalPath
+
+Starts uvicorn locally against a freshly seeded SQLite database, replays a
+mixed workload with concurrent virtual users and reports throughput,
+p50/p95/p99 latency and error rate per route. No external services needed.
+
+Usage:
+    python -m benchmarks.loadtest [--scale medium] [--users 20] [--duration 30]
+                                  [--workers 1] [--json results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+
+from src.goalpath.database import DatabaseManager
+
+from .datasets import SCALES, SeededDataset, seed_dataset
+
+REPO_ROOT = Path(__file__).parent.parent
+HTMX_HEADERS = {"HX-Request": "true"}
+TASK_STATUSES = ["todo", "in_progress", "done"]
+
+
+@dataclass(frozen=True)
+class Operation:
+    """One weighted entry of the workload mix"""
+
+    route: str
+    weight: int
+    build: Callable[[random.Random, SeededDataset], Tuple[str, str, dict]]
+
+
+def _dashboard_page(rng, dataset):
+    return "GET", "/", {}
+
+
+def _dashboard_stats(rng, dataset):
+    return "GET", "/api/dashboard/stats", {"headers": HTMX_HEADERS}
+
+
+def _htmx_status_toggle(rng, dataset):
+    task_id = rng.choice(dataset.task_ids)
+    return (
+        "PUT",
+        f"/htmx/tasks/{task_id}/status",
+        {"params": {"status": rng.choice(TASK_STATUSES)}, "headers": HTMX_HEADERS},
+    )
+
+
+def _api_status_toggle(rng, dataset):
+    task_id = rng.choice(dataset.task_ids)
+    return "PUT", f"/api/tasks/{task_id}/status", {"params": {"status": rng.choice(TASK_STATUSES)}}
+
+
+def _task_search(rng, dataset):
+    params = {"project_id": rng.choice(dataset.project_ids), "search": "Task", "size": 50}
+    return "GET", "/api/tasks/", {"params": params}
+
+
+def _project_search(rng, dataset):
+    return "GET", "/api/projects/", {"params": {"search": "Benchmark"}}
+
+
+def _htmx_tasks_list(rng, dataset):
+    return "GET", "/htmx/tasks/list", {"headers": HTMX_HEADERS}
+
+
+def _project_detail(rng, dataset):
+    return "GET", f"/projects/{rng.choice(dataset.project_ids)}", {"headers": HTMX_HEADERS}
+
+
+# Weights approximate a team with dashboards open and a few people triaging tasks
+WORKLOAD: List[Operation] = [
+    Operation("GET /api/dashboard/stats (poll)", 30, _dashboard_stats),
+    Operation("GET / (dashboard)", 5, _dashboard_page),
+    Operation("PUT /htmx/tasks/{id}/status", 10, _htmx_status_toggle),
+    Operation("PUT /api/tasks/{id}/status", 5, _api_status_toggle),
+    Operation("GET /api/tasks/?search", 15, _task_search),
+    Operation("GET /api/projects/?search", 5, _project_search),
+    Operation("GET /htmx/tasks/list", 15, _htmx_tasks_list),
+    Operation("GET /projects/{id}", 15, _project_detail),
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples: Dict[str, List[Tuple[float, bool]]], elapsed: float) -> Dict[str, dict]:
+    """Aggregate raw (latency, ok) samples into per-route statistics"""
+    report = {}
+    for route, route_samples in sorted(samples.items()):
+        latencies = sorted(latency for latency, _ in route_samples)
+        errors = sum(1 for _, ok in route_samples if not ok)
+        report[route] = {
+            "requests": len(route_samples),
+            "throughput_rps": round(len(route_samples) / elapsed, 2),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "error_rate": round(errors / len(route_samples), 4),
+        }
+    return report
+
+
+async def run_workload(
+    base_url: str, dataset: SeededDataset, users: int, duration: float, seed: int
+) -> Tuple[Dict[str, List[Tuple[float, bool]]], float]:
+    """Run `users` concurrent virtual users for `duration` seconds"""
+    samples: Dict[str, List[Tuple[float, bool]]] = defaultdict(list)
+    weights = [operation.weight for operation in WORKLOAD]
+    deadline = time.perf_counter() + duration
+
+    async def virtual_user(client: httpx.AsyncClient, user_seed: int):
+        rng = random.Random(user_seed)
+        while time.perf_counter() < deadline:
+            operation = rng.choices(WORKLOAD, weights=weights)[0]
+            method, path, kwargs = operation.build(rng, dataset)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            samples[operation.route].append((time.perf_counter() - started, ok))
+
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(virtual_user(client, seed + index) for index in range(users)))
+        elapsed = time.perf_counter() - started
+
+    return samples, elapsed
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_healthy(base_url: str, server: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited before becoming healthy")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become healthy within {timeout}s")
+
+
+def print_report(report: Dict[str, dict], elapsed: float):
+    """Print the per-route table and totals"""
+    width = max(len(route) for route in report)
+    print(
+        f"\n{'route':<{width}}  {'reqs':>7}  {'rps':>8}  {'p50':>8}  {'p95':>8}  "
+        f"{'p99':>8}  {'errors':>7}"
+    )
+    for route, stats in report.items():
+        print(
+            f"{route:<{width}}  {stats['requests']:>7}  {stats['throughput_rps']:>8.1f}  "
+            f"{stats['p50_ms']:>6.1f}ms  {stats['p95_ms']:>6.1f}ms  {stats['p99_ms']:>6.1f}ms  "
+            f"{stats['error_rate']:>6.1%}"
+        )
+
+    total = sum(stats["requests"] for stats in report.values())
+    errors = sum(stats["requests"] * stats["error_rate"] for stats in report.values())
+    print(f"\nTotal: {total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s)")
+    print(f"Errors: {int(errors)} ({(errors / total if total else 0):.2%})")
+
+
+def main(argv=None) -> int:
+    """Main function for direct script execution"""
+    parser = argparse.ArgumentParser(description="GoalPath HTTP load test")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="medium", help="Dataset scale")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Test duration in seconds")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the workload")
+    parser.add_argument("--json", type=Path, help="Write the per-route report to this file")
+
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="goalpath-loadtest-") as workdir:
+        database_url = f"sqlite:///{Path(workdir) / 'loadtest.db'}"
+
+        print(f"🌱 Seeding '{args.scale}' dataset...")
+        db_manager = DatabaseManager(database_url)
+        db_manager.create_tables()
+        with db_manager.get_sync_session() as session:
+            dataset = seed_dataset(session, SCALES[args.scale])
+        db_manager.engine.dispose()
+
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        env = dict(os.environ, DATABASE_URL=database_url)
+        command = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.goalpath.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+        ]
+
+        print(f"🚀 Starting uvicorn on {base_url} ({args.workers} worker(s))...")
+        server = subprocess.Popen(command, cwd=REPO_ROOT, env=env)
+        try:
+            _wait_until_healthy(base_url, server)
+            print(f"📈 Running {args.users} users for {args.duration:.0f}s...")
+            samples, elapsed = asyncio.run(
+                run_workload(base_url, dataset, args.users, args.duration, args.seed)
+            )
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+    report = summarize(samples, elapsed)
+    print_report(report, elapsed)
+
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(
+                {"scale": args.scale, "users": args.users, "elapsed": elapsed, "routes": report},
+                handle,
+                indent=2,
+            )
+        print(f"💾 Report written to {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Benchmarks for recurrence expansion and the calendar feed
+
+RECURRING_REMINDERS recurring reminders, cycling through a handful of
+patterns and started up to five years back, are seeded into their own
+in-memory database; a month view expands every one of them.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from src.goalpath.calendar_feed import build_calendar
+from src.goalpath.database import DatabaseManager
+from src.goalpath.models import Project
+from src.goalpath.models.extended import Reminder
+from src.goalpath.recurrence import parse_recurrence
+
+RECURRING_REMINDERS = 10_000
+PATTERNS = (
+    "FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR",
+    "FREQ=WEEKLY;BYDAY=MO,TH",
+    "FREQ=WEEKLY;INTERVAL=2",
+    "FREQ=MONTHLY;BYMONTHDAY=1,15,-1",
+    '{"freq": "monthly", "byday": ["FR"]}',
+    "FREQ=YEARLY;BYMONTH=3,6,9,12",
+)
+MONTH_START = date(2025, 3, 1)
+MONTH_END = date(2025, 3, 31)
+
+
+@pytest.fixture(scope="module")
+def calendar_db():
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.create_tables()
+    session = db_manager.get_sync_session()
+    project = Project(name="Calendar", description="Benchmark reminders")
+    session.add(project)
+    session.commit()
+    first = datetime(2020, 3, 1, 8, 0)
+    session.execute(
+        insert(Reminder.__table__),
+        [
+            {
+                "id": f"reminder-{number:05d}",
+                "project_id": project.id,
+                "title": f"Reminder {number}",
+                "reminder_type": "recurring",
+                "recurrence_pattern": PATTERNS[number % len(PATTERNS)],
+                "trigger_datetime": first + timedelta(hours=number % (5 * 365 * 24)),
+                "status": "pending",
+                "created_at": first,
+            }
+            for number in range(RECURRING_REMINDERS)
+        ],
+    )
+    session.commit()
+    session.close()
+    yield db_manager
+    db_manager.engine.dispose()
+
+
+@pytest.mark.benchmark(group="calendar")
+def test_expand_month_window(benchmark):
+    """Pure expansion: one month of every pattern, from a series five years old"""
+    rules = [parse_recurrence(pattern) for pattern in PATTERNS]
+    dtstart = datetime(2020, 3, 1, 8, 0)
+    window = (datetime(2025, 3, 1), datetime(2025, 3, 31, 23, 59, 59))
+
+    def expand():
+        return sum(1 for rule in rules for _ in rule.between(dtstart, *window))
+
+    assert benchmark(expand) > 0
+
+
+@pytest.mark.benchmark(group="calendar")
+@pytest.mark.parametrize("limit", [200_000, 100], ids=["everything", "first-page"])
+def test_month_view(benchmark, calendar_db, limit):
+    """The whole feed: query, expansion of 10,000 series and merge, up to ``limit`` items"""
+    session = calendar_db.get_sync_session()
+    data = benchmark(build_calendar, session, MONTH_START, MONTH_END, None, limit)
+    session.close()
+    benchmark.extra_info["items"] = data["count"]
+    assert data["truncated"] == (limit == 100)
@@ -0,0 +1,115 @@
+"""
+Benchmarks for task comments and the activity feed
+
+One long-lived epic with ENTRIES event log entries (two comments for every
+status change) is seeded into its own in-memory database. Paging compares
+the newest page with one deep in the history, which the keyset streams
+keep at the same cost.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from src.goalpath.comments import CommentCountCache, activity_page, load_comment_page
+from src.goalpath.database import DatabaseManager
+from src.goalpath.models import Project, Task
+from src.goalpath.models.extended import TaskComment
+
+ENTRIES = 30_000
+TASKS = 1_000
+FIRST = datetime(2023, 1, 1)
+STATUS_CHANGE = json.dumps({"from": "todo", "to": "in_progress", "reason": None})
+
+
+@pytest.fixture(scope="module")
+def comments_db():
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.create_tables()
+    session = db_manager.get_sync_session()
+    project = Project(name="Comments")
+    session.add(project)
+    session.flush()
+    tasks = [Task(project_id=project.id, title=f"Task {number}") for number in range(TASKS)]
+    session.add_all(tasks)
+    session.commit()
+    task_ids = [task.id for task in tasks]
+    epic_id = task_ids[0]
+    rows = [
+        {
+            "id": f"entry-{number:06d}",
+            "task_id": epic_id,
+            "author": "bench",
+            "content": f"Entry {number}",
+            "comment_type": "status_change" if number % 3 == 0 else "comment",
+            "comment_metadata": STATUS_CHANGE if number % 3 == 0 else None,
+            "created_at": FIRST + timedelta(minutes=number),
+        }
+        for number in range(ENTRIES)
+    ]
+    # Five comments on every task for the counts
+    rows += [
+        {
+            "id": f"note-{number:06d}",
+            "task_id": task_ids[number % TASKS],
+            "author": "bench",
+            "content": "Note",
+            "comment_type": "comment",
+            "comment_metadata": None,
+            "created_at": FIRST,
+        }
+        for number in range(TASKS * 5)
+    ]
+    session.execute(insert(TaskComment.__table__), rows)
+    session.commit()
+    session.close()
+    yield db_manager, task_ids
+    db_manager.engine.dispose()
+
+
+def _before(depth):
+    # Newest first: the deep page starts halfway down the history
+    return (FIRST + timedelta(minutes=ENTRIES // 2), "") if depth == "deep" else None
+
+
+@pytest.mark.benchmark(group="comments")
+@pytest.mark.parametrize("depth", ["first", "deep"])
+def test_activity_page(benchmark, comments_db, depth):
+    """One 30-entry page of the merged activity feed"""
+    db_manager, task_ids = comments_db
+    session = db_manager.get_sync_session()
+    items, _ = benchmark(activity_page, session, task_ids[0], _before(depth))
+    session.close()
+    assert len(items) == 30
+
+
+@pytest.mark.benchmark(group="comments")
+@pytest.mark.parametrize("depth", ["first", "deep"])
+def test_comment_page(benchmark, comments_db, depth):
+    """One 50-comment page of the epic's thread"""
+    db_manager, task_ids = comments_db
+    session = db_manager.get_sync_session()
+    comments, _ = benchmark(load_comment_page, session, task_ids[0], _before(depth))
+    session.close()
+    assert len(comments) == 50
+
+
+@pytest.mark.benchmark(group="comments")
+@pytest.mark.parametrize("cached", [False, True], ids=["query", "cached"])
+def test_comment_counts(benchmark, comments_db, cached):
+    """Comment counts for every task, counted fresh versus served from the cache"""
+    db_manager, task_ids = comments_db
+    session = db_manager.get_sync_session()
+    cache = CommentCountCache(max_entries=TASKS)
+    cache.get_many(session, task_ids)
+
+    def counts():
+        if not cached:
+            cache.invalidate_all()
+        return cache.get_many(session, task_ids)
+
+    result = benchmark(counts)
+    session.close()
+    assert len(result) == TASKS
@@ -0,0 +1,56 @@
+"""
+Benchmarks for dependency graph construction and critical path analysis
+
+The synthetic graph has GRAPH_TASKS tasks, each blocked by up to two
+earlier tasks, which is the size of the largest projects we plan for.
+"""
+
+import random
+
+import pytest
+
+from src.goalpath.dependency_graph import DependencyGraph
+
+GRAPH_TASKS = 20_000
+
+
+@pytest.fixture(scope="module")
+def synthetic_graph():
+    rng = random.Random(42)
+    task_ids = [f"task-{number}" for number in range(GRAPH_TASKS)]
+    edges = set()
+    for number in range(1, GRAPH_TASKS):
+        for _ in range(2):
+            edges.add((task_ids[number], task_ids[rng.randrange(max(0, number - 500), number)]))
+    durations = [float(rng.randint(1, 16)) for _ in task_ids]
+    return task_ids, sorted(edges), durations
+
+
+@pytest.mark.benchmark(group="dependency-graph")
+def test_build_graph(benchmark, synthetic_graph):
+    task_ids, edges, _ = synthetic_graph
+    graph = benchmark(DependencyGraph, task_ids, edges)
+    assert len(graph) == GRAPH_TASKS
+
+
+@pytest.mark.benchmark(group="dependency-graph")
+def test_cycle_check(benchmark, synthetic_graph):
+    task_ids, edges, _ = synthetic_graph
+    graph = DependencyGraph(task_ids, edges)
+    # Worst case: the first task walks every transitive blockee of the last one
+    assert benchmark(graph.would_create_cycle, task_ids[0], task_ids[-1])
+
+
+@pytest.mark.benchmark(group="dependency-graph")
+def test_critical_path(benchmark, synthetic_graph):
+    task_ids, edges, durations = synthetic_graph
+    graph = DependencyGraph(task_ids, edges)
+    result = benchmark(graph.critical_path, durations)
+    assert result.chain
+
+
+@pytest.mark.benchmark(group="critical-path-route")
+def test_critical_path_route(benchmark, bench_client, dataset):
+    url = f"/api/projects/{dataset.project_ids[0]}/critical-path"
+    response = benchmark(bench_client.get, url)
+    assert response.status_code == 200
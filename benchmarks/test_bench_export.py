@@ -0,0 +1,72 @@
+"""
+Benchmarks for the streaming task export
+
+Throughput is measured by pytest-benchmark; peak allocation while draining
+the stream is measured with tracemalloc and recorded in extra_info. The
+peak should track the batch size rather than the number of exported rows.
+"""
+
+import tracemalloc
+
+import pytest
+
+from src.goalpath.exports import stream_csv, stream_ndjson, task_export_select
+from src.goalpath.schemas import TaskFilters
+from src.goalpath.serializers import dumps
+
+BATCH_SIZE = 100
+
+
+def _drain(stream):
+    total = 0
+    for chunk in stream:
+        total += len(chunk)
+    return total
+
+
+def _export_ndjson(session):
+    return _drain(stream_ndjson(session, task_export_select(TaskFilters()), BATCH_SIZE))
+
+
+def _export_csv(session):
+    return _drain(stream_csv(session, task_export_select(TaskFilters()), BATCH_SIZE))
+
+
+def _export_materialized(session):
+    rows = session.execute(task_export_select(TaskFilters())).all()
+    return len(b"".join(dumps(dict(row._mapping)) + b"\n" for row in rows))
+
+
+def _peak_bytes(func, session):
+    tracemalloc.start()
+    try:
+        func(session)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark(group="export-tasks")
+def test_stream_ndjson(benchmark, bench_session):
+    benchmark.extra_info["peak_bytes"] = _peak_bytes(_export_ndjson, bench_session)
+    assert benchmark(_export_ndjson, bench_session)
+
+
+@pytest.mark.benchmark(group="export-tasks")
+def test_stream_csv(benchmark, bench_session):
+    benchmark.extra_info["peak_bytes"] = _peak_bytes(_export_csv, bench_session)
+    assert benchmark(_export_csv, bench_session)
+
+
+@pytest.mark.benchmark(group="export-tasks")
+def test_materialized_ndjson(benchmark, bench_session):
+    benchmark.extra_info["peak_bytes"] = _peak_bytes(_export_materialized, bench_session)
+    assert benchmark(_export_materialized, bench_session)
+
+
+def test_stream_allocates_less(bench_session):
+    """Streaming must not hold the whole result set in memory"""
+    streamed_peak = _peak_bytes(_export_ndjson, bench_session)
+    materialized_peak = _peak_bytes(_export_materialized, bench_session)
+
+    assert streamed_peak < materialized_peak
@@ -0,0 +1,30 @@
+"""
+Benchmarks for Monte Carlo delivery forecasting
+
+The simulation runs FORECAST_TRIALS trials against a noisy 12-week
+throughput history for a small and a large backlog; the report benchmark
+adds the history and backlog queries over the shared dataset.
+"""
+
+import numpy as np
+import pytest
+
+from src.goalpath.forecast import FORECAST_TRIALS, build_forecast, simulate_completion_weeks
+from src.goalpath.models import Project
+
+HISTORY = np.array([3, 0, 7, 5, 2, 9, 4, 6, 1, 8, 5, 3])
+
+
+@pytest.mark.benchmark(group="forecast")
+@pytest.mark.parametrize("remaining", [50, 2_000], ids=["50-tasks", "2000-tasks"])
+def test_simulation(benchmark, remaining):
+    rng = np.random.default_rng(0)
+    weeks = benchmark(simulate_completion_weeks, HISTORY, remaining, FORECAST_TRIALS, rng)
+    assert weeks.max() > 0
+
+
+@pytest.mark.benchmark(group="forecast")
+def test_report(benchmark, bench_session, dataset):
+    project = bench_session.get(Project, dataset.project_ids[0])
+    report = benchmark(build_forecast, bench_session, project)
+    assert report["trials"] == FORECAST_TRIALS
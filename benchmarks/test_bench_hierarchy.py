@@ -0,0 +1,96 @@
+"""
+Benchmarks for subtree deletes on large task trees
+
+Each round seeds a fresh tree of TREE_FANOUT children per node and
+TREE_DEPTH levels below the root (11,111 tasks) into the benchmark
+database and removes it again. The recursive-CTE delete is compared with
+the ORM relationship cascade that loads and deletes the tree node by node.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert
+
+from src.goalpath.hierarchy import delete_node, delete_subtree
+from src.goalpath.models import Task, generate_uuid
+
+TREE_FANOUT = 10
+TREE_DEPTH = 4
+
+
+def _seed_tree(session, project_id):
+    """Insert a full tree and return the root task ID"""
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    root_id = generate_uuid()
+    rows = []
+    level = [root_id]
+    parents = {root_id: None}
+    for _ in range(TREE_DEPTH):
+        next_level = []
+        for parent_id in level:
+            for _ in range(TREE_FANOUT):
+                child_id = generate_uuid()
+                parents[child_id] = parent_id
+                next_level.append(child_id)
+        level = next_level
+
+    for order, (task_id, parent_id) in enumerate(parents.items()):
+        rows.append(
+            {
+                "id": task_id,
+                "project_id": project_id,
+                "parent_task_id": parent_id,
+                "title": f"Tree node {order}",
+                "task_type": "task",
+                "status": "todo",
+                "priority": "medium",
+                "order_index": order,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+    session.execute(insert(Task.__table__), rows)
+    session.commit()
+    return root_id
+
+
+def _run(benchmark, session, project_id, delete):
+    def setup():
+        return (_seed_tree(session, project_id),), {}
+
+    benchmark.pedantic(delete, setup=setup, rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="delete-subtree")
+def test_cte_cascade_delete(benchmark, bench_session, dataset):
+    def delete(root_id):
+        delete_subtree(bench_session, Task, root_id)
+        bench_session.commit()
+
+    _run(benchmark, bench_session, dataset.project_ids[0], delete)
+
+
+@pytest.mark.benchmark(group="delete-subtree")
+def test_orm_cascade_delete(benchmark, bench_session, dataset):
+    def delete(root_id):
+        bench_session.delete(bench_session.get(Task, root_id))
+        bench_session.commit()
+
+    _run(benchmark, bench_session, dataset.project_ids[0], delete)
+
+
+@pytest.mark.benchmark(group="promote-children")
+def test_cte_promote_children(benchmark, bench_session, dataset):
+    project_id = dataset.project_ids[0]
+
+    def delete(root_id):
+        delete_node(bench_session, Task, bench_session.get(Task, root_id), cascade=False)
+        bench_session.commit()
+
+    _run(benchmark, bench_session, project_id, delete)
+    # The promoted subtrees stay behind; remove them so other benchmarks see the seeded data
+    bench_session.query(Task).filter(Task.title.like("Tree node %")).delete(
+        synchronize_session=False
+    )
+    bench_session.commit()
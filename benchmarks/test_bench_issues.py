@@ -0,0 +1,97 @@
+"""
+Benchmarks for the issue triage API
+
+ISSUES issues across a few projects are seeded into their own in-memory
+database. Paging compares the first page with one deep in the listing,
+which keyset pagination keeps at the same cost.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from src.goalpath.database import DatabaseManager
+from src.goalpath.issues import load_issue_page, load_issues, promote_issues, triage_counters
+from src.goalpath.models import Project
+from src.goalpath.models.extended import Issue
+
+ISSUES = 100_000
+PROJECTS = 4
+PROMOTE_BATCH = 500
+STATUSES = ("triage", "triage", "backlog", "in_progress", "resolved", "closed")
+PRIORITIES = ("low", "medium", "high", "critical")
+FIRST = datetime(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def issues_db():
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.create_tables()
+    session = db_manager.get_sync_session()
+    projects = [Project(name=f"Issues {number}") for number in range(PROJECTS)]
+    session.add_all(projects)
+    session.commit()
+    project_ids = [project.id for project in projects]
+    session.execute(
+        insert(Issue.__table__),
+        [
+            {
+                "id": f"issue-{number:06d}",
+                "project_id": project_ids[number % PROJECTS],
+                "title": f"Issue {number}",
+                "issue_type": "bug" if number % 3 == 0 else "feature",
+                "priority": PRIORITIES[number % len(PRIORITIES)],
+                "status": STATUSES[number % len(STATUSES)],
+                "reporter": "bench",
+                "created_at": FIRST + timedelta(minutes=number),
+                "updated_at": FIRST,
+            }
+            for number in range(ISSUES)
+        ],
+    )
+    session.commit()
+    session.close()
+    yield db_manager, project_ids
+    db_manager.engine.dispose()
+
+
+@pytest.mark.benchmark(group="issues")
+@pytest.mark.parametrize("depth", ["first", "deep"])
+def test_triage_page(benchmark, issues_db, depth):
+    """One 50-issue page of a project's triage queue"""
+    db_manager, project_ids = issues_db
+    session = db_manager.get_sync_session()
+    filters = {"project_id": project_ids[0], "status": "triage"}
+    # Newest first: the deep page starts halfway down the listing
+    after = (FIRST + timedelta(minutes=ISSUES // 2), "") if depth == "deep" else None
+    issues, _ = benchmark(load_issue_page, session, 50, after=after, **filters)
+    session.close()
+    assert len(issues) > 0
+
+
+@pytest.mark.benchmark(group="issues")
+def test_counters(benchmark, issues_db):
+    db_manager, _ = issues_db
+    session = db_manager.get_sync_session()
+    counters = benchmark(triage_counters, session)
+    session.close()
+    assert counters["total"] == ISSUES
+
+
+@pytest.mark.benchmark(group="issues")
+def test_promote_batch(benchmark, issues_db):
+    """Promote PROMOTE_BATCH issues: one task INSERT and one issue UPDATE, rolled back"""
+    db_manager, _ = issues_db
+    session = db_manager.get_sync_session()
+    issue_ids = [f"issue-{number:06d}" for number in range(PROMOTE_BATCH)]
+
+    def promote():
+        issues = list(load_issues(session, issue_ids).values())
+        result = promote_issues(session, issues)
+        session.rollback()
+        return result
+
+    result = benchmark(promote)
+    session.close()
+    assert len(result.promoted) == PROMOTE_BATCH
@@ -0,0 +1,37 @@
+"""
+Benchmarks for QueryUtils read paths
+"""
+
+import pytest
+
+from src.goalpath.db_utils import QueryUtils
+
+
+@pytest.mark.benchmark(group="query-projects")
+def test_get_projects_with_stats(benchmark, bench_session):
+    result = benchmark(QueryUtils.get_projects_with_stats, bench_session, page=1, size=20)
+    assert result
+
+
+@pytest.mark.benchmark(group="query-projects")
+def test_get_project_with_stats(benchmark, bench_session, dataset):
+    result = benchmark(QueryUtils.get_project_with_stats, bench_session, dataset.project_ids[0])
+    assert result["total_tasks"] == dataset.scale.tasks_per_project
+
+
+@pytest.mark.benchmark(group="query-tasks")
+def test_get_tasks_with_hierarchy(benchmark, bench_session, dataset):
+    result = benchmark(
+        QueryUtils.get_tasks_with_hierarchy,
+        bench_session,
+        project_id=dataset.project_ids[0],
+        page=1,
+        size=100,
+    )
+    assert result
+
+
+@pytest.mark.benchmark(group="query-goals")
+def test_get_goals_with_progress(benchmark, bench_session):
+    result = benchmark(QueryUtils.get_goals_with_progress, bench_session, page=1, size=20)
+    assert result
@@ -0,0 +1,55 @@
+"""
+Benchmarks for column-projected list reads vs ORM entity hydration
+
+Latency is measured by pytest-benchmark; peak allocation of one call is
+measured with tracemalloc and recorded in each benchmark's extra_info.
+"""
+
+import tracemalloc
+
+import pytest
+
+from src.goalpath.models import Task
+from src.goalpath.read_models import task_list_select, to_task_items
+
+LIST_SIZE = 200
+
+
+def _orm_task_list(session):
+    tasks = session.query(Task).order_by(Task.updated_at.desc()).limit(LIST_SIZE).all()
+    session.expunge_all()
+    return tasks
+
+
+def _projected_task_list(session):
+    statement = task_list_select().order_by(Task.updated_at.desc()).limit(LIST_SIZE)
+    return to_task_items(session.execute(statement))
+
+
+def _peak_bytes(func, session):
+    tracemalloc.start()
+    try:
+        func(session)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark(group="read-task-list")
+def test_orm_entities(benchmark, bench_session):
+    benchmark.extra_info["peak_bytes"] = _peak_bytes(_orm_task_list, bench_session)
+    assert benchmark(_orm_task_list, bench_session)
+
+
+@pytest.mark.benchmark(group="read-task-list")
+def test_projected_rows(benchmark, bench_session):
+    benchmark.extra_info["peak_bytes"] = _peak_bytes(_projected_task_list, bench_session)
+    assert benchmark(_projected_task_list, bench_session)
+
+
+def test_projection_allocates_less(bench_session):
+    """The projected read must stay cheaper in memory than hydrating entities"""
+    orm_peak = _peak_bytes(_orm_task_list, bench_session)
+    projected_peak = _peak_bytes(_projected_task_list, bench_session)
+
+    assert projected_peak < orm_peak
@@ -0,0 +1,89 @@
+"""
+Benchmarks for the reminder due queue
+
+PENDING_REMINDERS pending reminders, one a minute, are seeded into their
+own in-memory database. The scheduler only ever reads keyset pages of
+the queue, so its refill cost stays flat however many reminders wait.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, update
+
+from src.goalpath.database import DatabaseManager
+from src.goalpath.models import Project
+from src.goalpath.models.extended import Reminder
+from src.goalpath.reminders import (
+    FIRE_BATCH_SIZE,
+    PREFETCH_SIZE,
+    ReminderScheduler,
+    load_due_keys,
+)
+
+PENDING_REMINDERS = 100_000
+FIRST_TRIGGER = datetime(2025, 1, 1, 0, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def reminder_db():
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.create_tables()
+    session = db_manager.get_sync_session()
+    project = Project(name="Reminders", description="Benchmark reminders")
+    session.add(project)
+    session.commit()
+    session.execute(
+        insert(Reminder.__table__),
+        [
+            {
+                "id": f"reminder-{number:06d}",
+                "project_id": project.id,
+                "title": f"Reminder {number}",
+                "reminder_type": "one_time",
+                "trigger_datetime": FIRST_TRIGGER + timedelta(minutes=number),
+                "status": "pending",
+                "created_at": FIRST_TRIGGER,
+            }
+            for number in range(PENDING_REMINDERS)
+        ],
+    )
+    session.commit()
+    session.close()
+    yield db_manager
+    db_manager.engine.dispose()
+
+
+@pytest.mark.benchmark(group="reminders")
+def test_refill_page_at_queue_tail(benchmark, reminder_db):
+    session = reminder_db.get_sync_session()
+    after = (FIRST_TRIGGER + timedelta(minutes=PENDING_REMINDERS - PREFETCH_SIZE * 2), "")
+    keys, exhausted = benchmark(load_due_keys, session, after, PREFETCH_SIZE)
+    session.close()
+    assert len(keys) == PREFETCH_SIZE
+    assert not exhausted
+
+
+@pytest.mark.benchmark(group="reminders")
+def test_claim_and_fire_batch(benchmark, reminder_db):
+    """One lease-claim-fire round for a full batch of due reminders"""
+    reminder_ids = [f"reminder-{number:06d}" for number in range(FIRE_BATCH_SIZE)]
+    now = FIRST_TRIGGER + timedelta(minutes=FIRE_BATCH_SIZE)
+    scheduler = ReminderScheduler(reminder_db.get_sync_session, clock=lambda: now)
+
+    def reset():
+        with reminder_db.get_sync_session() as session:
+            session.execute(
+                update(Reminder)
+                .where(Reminder.id.in_(reminder_ids))
+                .values(status="pending", fired_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+
+    def fire():
+        return asyncio.run(scheduler.fire(reminder_ids, now))
+
+    fired = benchmark.pedantic(fire, setup=reset, rounds=10)
+    assert fired == FIRE_BATCH_SIZE
@@ -0,0 +1,70 @@
+"""
+Benchmarks for HTTP routes: dashboard, task writes, goal hierarchy and HTMX lists
+"""
+
+import itertools
+
+import pytest
+
+HTMX_HEADERS = {"HX-Request": "true"}
+
+
+@pytest.mark.benchmark(group="dashboard")
+def test_dashboard_page(benchmark, bench_client):
+    response = benchmark(bench_client.get, "/")
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="dashboard")
+def test_dashboard_stats_fragment(benchmark, bench_client):
+    response = benchmark(bench_client.get, "/api/dashboard/stats", headers=HTMX_HEADERS)
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="task-writes")
+def test_create_task(benchmark, bench_client, dataset):
+    counter = itertools.count()
+
+    def create():
+        return bench_client.post(
+            "/api/tasks/",
+            json={
+                "project_id": dataset.project_ids[0],
+                "title": f"Benchmark created task {next(counter)}",
+                "status": "todo",
+            },
+        )
+
+    response = benchmark(create)
+    assert response.status_code == 201
+
+
+@pytest.mark.benchmark(group="task-writes")
+def test_update_task_status(benchmark, bench_client, dataset):
+    statuses = itertools.cycle(["in_progress", "done", "todo"])
+    task_id = dataset.task_ids[1]
+
+    def toggle():
+        return bench_client.put(f"/api/tasks/{task_id}/status", params={"status": next(statuses)})
+
+    response = benchmark(toggle)
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="goals")
+def test_goal_hierarchy(benchmark, bench_client, dataset):
+    goal_id = dataset.root_goal_ids[0]
+    response = benchmark(bench_client.get, f"/api/goals/{goal_id}/hierarchy")
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="htmx-lists")
+def test_htmx_tasks_list(benchmark, bench_client):
+    response = benchmark(bench_client.get, "/htmx/tasks/list", headers=HTMX_HEADERS)
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="htmx-lists")
+def test_htmx_projects_list(benchmark, bench_client):
+    response = benchmark(bench_client.get, "/htmx/projects/list", headers=HTMX_HEADERS)
+    assert response.status_code == 200
@@ -0,0 +1,67 @@
+"""
+Benchmarks for list serialization: orjson records vs per-item Pydantic validation
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from src.goalpath.schemas import TaskResponse
+from src.goalpath.serializers import serialize_many
+
+ITEM_COUNTS = [100, 1000]
+
+_task_list_adapter = TypeAdapter(List[TaskResponse])
+
+
+def _task_records(count):
+    created = datetime(2025, 1, 1, 9, 0)
+    return [
+        {
+            "id": f"task-{index}",
+            "project_id": "project-1",
+            "parent_task_id": None,
+            "title": f"Task {index}",
+            "description": "Benchmark task description " * 4,
+            "task_type": "task",
+            "status": "todo",
+            "priority": "medium",
+            "story_points": 3,
+            "estimated_hours": 4.5,
+            "actual_hours": None,
+            "start_date": "2025-01-01",
+            "due_date": "2025-02-01",
+            "completed_date": None,
+            "assigned_to": "dev",
+            "created_by": "bench",
+            "order_index": index,
+            "created_at": (created + timedelta(minutes=index)).isoformat(),
+            "updated_at": (created + timedelta(minutes=index)).isoformat(),
+            "subtask_count": 0,
+            "dependency_count": 1,
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.benchmark(group="serialize-tasks")
+@pytest.mark.parametrize("count", ITEM_COUNTS)
+def test_pydantic_validate_and_dump(benchmark, count):
+    """Previous path: TaskResponse(**dict) per item, then JSON encoding"""
+    records = _task_records(count)
+
+    def run():
+        return _task_list_adapter.dump_json([TaskResponse(**record) for record in records])
+
+    assert benchmark(run)
+
+
+@pytest.mark.benchmark(group="serialize-tasks")
+@pytest.mark.parametrize("count", ITEM_COUNTS)
+def test_orjson_serialize_many(benchmark, count):
+    """Trusted read path: project onto schema fields and dump with orjson"""
+    records = _task_records(count)
+
+    assert benchmark(serialize_many, records, TaskResponse)
@@ -0,0 +1,111 @@
+"""
+Benchmarks for the sprint board and burndown series
+
+A two-week sprint of SPRINT_TASKS tasks, each with three status changes
+spread over the sprint, is seeded into its own in-memory database.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from src.goalpath.database import DatabaseManager
+from src.goalpath.models import Project, Sprint, SprintTask, Task
+from src.goalpath.models.extended import TaskComment
+from src.goalpath.schemas import BurndownUnit
+from src.goalpath.sprints import build_board, build_burndown, burndown_cache, sprint_task_rows
+
+SPRINT_TASKS = 1_000
+SPRINT_START = date(2025, 3, 3)
+SPRINT_END = date(2025, 3, 16)
+TODAY = date(2025, 3, 12)
+WORKFLOW = ("todo", "in_progress", "in_review", "done")
+
+
+@pytest.fixture(scope="module")
+def sprint_db():
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.create_tables()
+    session = db_manager.get_sync_session()
+    project = Project(name="Sprints", description="Benchmark sprint")
+    sprint = Sprint(project=project, name="Sprint", start_date=SPRINT_START, end_date=SPRINT_END)
+    session.add_all([project, sprint])
+    session.commit()
+    sprint_id = sprint.id
+
+    start = datetime.combine(SPRINT_START, datetime.min.time())
+    task_ids = [f"task-{number:05d}" for number in range(SPRINT_TASKS)]
+    session.execute(
+        insert(Task.__table__),
+        [
+            {
+                "id": task_id,
+                "project_id": project.id,
+                "title": f"Task {number}",
+                "task_type": "task",
+                "status": "done",
+                "priority": "medium",
+                "story_points": 1 + number % 8,
+                "order_index": number,
+                "created_at": start,
+                "updated_at": start,
+            }
+            for number, task_id in enumerate(task_ids)
+        ],
+    )
+    session.execute(
+        insert(SprintTask.__table__),
+        [{"sprint_id": sprint_id, "task_id": task_id, "added_at": start} for task_id in task_ids],
+    )
+    session.execute(
+        insert(TaskComment.__table__),
+        [
+            {
+                "id": f"{task_id}-{step}",
+                "task_id": task_id,
+                "author": "bench",
+                "content": "status change",
+                "comment_type": "status_change",
+                "comment_metadata": (
+                    f'{{"from": "{WORKFLOW[step]}", "to": "{WORKFLOW[step + 1]}"}}'
+                ),
+                "created_at": start + timedelta(hours=(number % 60) * (step + 1) * 2),
+            }
+            for number, task_id in enumerate(task_ids)
+            for step in range(3)
+        ],
+    )
+    session.commit()
+    session.close()
+    yield db_manager, sprint_id
+    db_manager.engine.dispose()
+
+
+@pytest.mark.benchmark(group="sprints")
+def test_board(benchmark, sprint_db):
+    """One join query and the grouping into status columns"""
+    db_manager, sprint_id = sprint_db
+    session = db_manager.get_sync_session()
+    columns = benchmark(lambda: build_board(sprint_task_rows(session, sprint_id)))
+    session.close()
+    assert sum(column["count"] for column in columns) == SPRINT_TASKS
+
+
+@pytest.mark.benchmark(group="sprints")
+@pytest.mark.parametrize("cached", [False, True], ids=["replay", "cached"])
+def test_burndown(benchmark, sprint_db, cached):
+    """Replaying the status log for the closed days, or reusing the cached days"""
+    db_manager, sprint_id = sprint_db
+    session = db_manager.get_sync_session()
+    sprint = session.get(Sprint, sprint_id)
+    burndown_cache.clear()
+
+    def run():
+        if not cached:
+            burndown_cache.clear()
+        return build_burndown(session, sprint, BurndownUnit.STORY_POINTS, today=TODAY)
+
+    series = benchmark(run)
+    session.close()
+    assert series["completed"][-1] is None and series["remaining"][0] > 0
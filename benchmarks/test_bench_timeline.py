@@ -0,0 +1,26 @@
+"""
+Benchmarks for the timeline endpoint
+
+Seeded tasks start between January and May 2025, so a one-month window
+matches about a fifth of them and a six-month window matches all of them.
+"""
+
+import pytest
+
+MONTH = "from=2025-03-01&to=2025-03-31"
+HALF_YEAR = "from=2025-01-01&to=2025-06-30"
+
+
+@pytest.mark.benchmark(group="timeline")
+@pytest.mark.parametrize("window", [MONTH, HALF_YEAR], ids=["month", "half-year"])
+def test_timeline_all_projects(benchmark, bench_client, window):
+    response = benchmark(bench_client.get, f"/api/timeline?{window}&limit=50000")
+    assert response.status_code == 200
+    assert response.json()["tasks"]["count"] > 0
+
+
+@pytest.mark.benchmark(group="timeline")
+def test_timeline_one_project(benchmark, bench_client, dataset):
+    url = f"/api/timeline?{HALF_YEAR}&project_id={dataset.project_ids[0]}"
+    response = benchmark(bench_client.get, url)
+    assert response.status_code == 200
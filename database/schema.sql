@@ -77,6 +77,10 @@ CREATE INDEX idx_tasks_due_date ON tasks(due_date);
 CREATE INDEX idx_tasks_assigned_to ON tasks(assigned_to);
 CREATE INDEX idx_tasks_created_at ON tasks(created_at);
 CREATE INDEX idx_tasks_type_status ON tasks(task_type, status);
+CREATE INDEX idx_tasks_sibling_order ON tasks(project_id, parent_task_id, order_index);
+CREATE INDEX idx_tasks_timeline ON tasks(due_date, start_date);
+CREATE INDEX idx_tasks_project_timeline ON tasks(project_id, due_date, start_date);
+CREATE INDEX idx_tasks_project_completed ON tasks(project_id, completed_date);
 
 -- Task Dependencies Table
 CREATE TABLE task_dependencies (
@@ -136,4 +140,5 @@ CREATE TABLE sprints (
 
 CREATE INDEX idx_sprints_project_id ON sprints(project_id);
 CREATE INDEX idx_sprints_status ON sprints(status);
-CREATE INDEX idx_sprints_dates ON sprints(start_date, end_date);
\ No newline at end of file
+CREATE INDEX idx_sprints_dates ON sprints(start_date, end_date);
+CREATE INDEX idx_sprints_timeline ON sprints(end_date, start_date);
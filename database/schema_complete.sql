@@ -45,6 +45,10 @@ CREATE TABLE tasks (
 CREATE INDEX idx_tasks_project_id ON tasks(project_id);
 CREATE INDEX idx_tasks_parent_task_id ON tasks(parent_task_id);
 CREATE INDEX idx_tasks_status ON tasks(status);
+CREATE INDEX idx_tasks_sibling_order ON tasks(project_id, parent_task_id, order_index);
+CREATE INDEX idx_tasks_timeline ON tasks(due_date, start_date);
+CREATE INDEX idx_tasks_project_timeline ON tasks(project_id, due_date, start_date);
+CREATE INDEX idx_tasks_project_completed ON tasks(project_id, completed_date);
 
 -- Goals Table
 CREATE TABLE goals (
@@ -60,6 +64,8 @@ CREATE TABLE goals (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX idx_goals_parent_goal_id ON goals(parent_goal_id);
+
 -- Views for common queries
 CREATE VIEW project_stats AS
 SELECT 
@@ -109,10 +115,16 @@ CREATE TABLE reminders (
     message TEXT,
     reminder_type VARCHAR(20) CHECK (reminder_type IN ('one_time', 'recurring')) DEFAULT 'one_time',
     trigger_datetime TIMESTAMP NOT NULL,
-    status VARCHAR(20) CHECK (status IN ('pending', 'acknowledged', 'snoozed', 'cancelled')) DEFAULT 'pending',
+    recurrence_anchor TIMESTAMP,
+    status VARCHAR(20) CHECK (status IN ('pending', 'fired', 'acknowledged', 'snoozed', 'cancelled')) DEFAULT 'pending',
+    fired_at TIMESTAMP,
+    leased_by VARCHAR(100),
+    lease_expires_at TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX idx_reminders_due ON reminders(status, trigger_datetime, id);
+
 -- Issues Table
 CREATE TABLE issues (
     id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
@@ -124,7 +136,7 @@ CREATE TABLE issues (
     status VARCHAR(20) CHECK (status IN ('triage', 'backlog', 'in_progress', 'resolved', 'closed')) DEFAULT 'triage',
     reporter VARCHAR(100) NOT NULL,
     assignee VARCHAR(100),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%d %H:%M:%f000', 'now')),
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -135,7 +147,7 @@ CREATE TABLE task_comments (
     author VARCHAR(100) NOT NULL,
     content TEXT NOT NULL,
     comment_type VARCHAR(20) CHECK (comment_type IN ('comment', 'status_change', 'assignment', 'attachment')) DEFAULT 'comment',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%d %H:%M:%f000', 'now'))
 );
 
 -- Project Context Table
@@ -147,4 +159,10 @@ CREATE TABLE project_context (
     value TEXT NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
\ No newline at end of file
+);
+
+-- Data Versions Table (committed writes per table, for conditional GET ETags)
+CREATE TABLE data_versions (
+    table_name VARCHAR(100) PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
@@ -30,13 +30,14 @@ CREATE TABLE task_comments (
     content TEXT NOT NULL,
     comment_type VARCHAR(20) CHECK (comment_type IN ('comment', 'status_change', 'assignment', 'attachment')) DEFAULT 'comment',
     metadata TEXT, -- JSON string for SQLite compatibility
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%d %H:%M:%f000', 'now'))
 );
 
 -- Task Comments Indexes
 CREATE INDEX idx_task_comments_task_id ON task_comments(task_id);
 CREATE INDEX idx_task_comments_created_at ON task_comments(created_at);
 CREATE INDEX idx_task_comments_type ON task_comments(comment_type);
+CREATE INDEX idx_task_comments_history ON task_comments(task_id, comment_type, created_at, id);
 
 -- Task Attachments Table
 CREATE TABLE task_attachments (
@@ -70,7 +71,7 @@ CREATE TABLE issues (
     reporter VARCHAR(100) NOT NULL,
     assignee VARCHAR(100),
     promoted_to_task_id TEXT REFERENCES tasks(id) ON DELETE SET NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%d %H:%M:%f000', 'now')),
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -80,6 +81,9 @@ CREATE INDEX idx_issues_status ON issues(status);
 CREATE INDEX idx_issues_priority ON issues(priority);
 CREATE INDEX idx_issues_assignee ON issues(assignee);
 CREATE INDEX idx_issues_promoted_task ON issues(promoted_to_task_id);
+CREATE INDEX idx_issues_created ON issues(created_at, id);
+CREATE INDEX idx_issues_project_created ON issues(project_id, created_at, id);
+CREATE INDEX idx_issues_triage ON issues(project_id, status, created_at, id);
 
 -- =============================================================================
 -- TRIGGERS FOR AUTOMATIC UPDATES
@@ -0,0 +1,22 @@
+-- Keyset timestamp upgrade (SQLite)
+--
+-- issues and task_comments are paged by (created_at, id) cursors. SQLite
+-- compares DATETIME values as text, and rows stamped by CURRENT_TIMESTAMP
+-- hold whole seconds ("YYYY-MM-DD HH:MM:SS") while the application writes
+-- and binds microseconds ("YYYY-MM-DD HH:MM:SS.ffffff"), so a cursor never
+-- moves past rows created within the same second. The application applies
+-- this upgrade itself on startup (init_database runs
+-- src/goalpath/schema_upgrades.py); this file is the same upgrade for
+-- running by hand:
+--
+--     sqlite3 goalpath.db < database/upgrade_keyset_timestamps.sql
+--
+-- It only rewrites whole-second values, so running it again is harmless.
+-- PostgreSQL compares real timestamps and needs no upgrade.
+
+BEGIN TRANSACTION;
+
+UPDATE issues SET created_at = created_at || '.000000' WHERE length(created_at) = 19;
+UPDATE task_comments SET created_at = created_at || '.000000' WHERE length(created_at) = 19;
+
+COMMIT;
@@ -0,0 +1,73 @@
+-- Reminder scheduler upgrade (SQLite)
+--
+-- Databases created before the reminder scheduler lack the reminders
+-- columns fired_at, leased_by, lease_expires_at and recurrence_anchor,
+-- and their chk_reminder_status constraint rejects the 'fired' status. The
+-- application applies this upgrade itself on startup (init_database runs
+-- src/goalpath/schema_upgrades.py); this file is the same upgrade for
+-- running by hand:
+--
+--     sqlite3 goalpath.db < database/upgrade_reminder_scheduler.sql
+--
+-- SQLite cannot alter a CHECK constraint, so the table is rebuilt and its
+-- rows copied over. Run it once, against a backup first. A table that
+-- already has some of the new columns needs them added to the column
+-- lists of the INSERT below. On PostgreSQL
+-- the equivalent is:
+--
+--     ALTER TABLE reminders ADD COLUMN fired_at TIMESTAMP;
+--     ALTER TABLE reminders ADD COLUMN leased_by VARCHAR(100);
+--     ALTER TABLE reminders ADD COLUMN lease_expires_at TIMESTAMP;
+--     ALTER TABLE reminders ADD COLUMN recurrence_anchor TIMESTAMP;
+--     ALTER TABLE reminders DROP CONSTRAINT IF EXISTS chk_reminder_status;
+--     ALTER TABLE reminders ADD CONSTRAINT chk_reminder_status
+--         CHECK (status IN ('pending', 'fired', 'acknowledged', 'snoozed', 'cancelled'));
+
+PRAGMA foreign_keys = OFF;
+BEGIN;
+
+CREATE TABLE reminders_upgrade (
+    id VARCHAR NOT NULL,
+    task_id VARCHAR,
+    project_id VARCHAR,
+    title VARCHAR(255) NOT NULL,
+    message TEXT,
+    reminder_type VARCHAR(20) NOT NULL,
+    trigger_datetime DATETIME NOT NULL,
+    view_after DATETIME,
+    recurrence_pattern TEXT,
+    recurrence_anchor DATETIME,
+    status VARCHAR(20) NOT NULL,
+    acknowledged_at DATETIME,
+    fired_at DATETIME,
+    leased_by VARCHAR(100),
+    lease_expires_at DATETIME,
+    created_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT chk_reminder_type CHECK (reminder_type IN ('one_time', 'recurring')),
+    CONSTRAINT chk_reminder_status
+        CHECK (status IN ('pending', 'fired', 'acknowledged', 'snoozed', 'cancelled')),
+    CONSTRAINT chk_reminder_relation CHECK (
+        (task_id IS NOT NULL AND project_id IS NULL)
+        OR (task_id IS NULL AND project_id IS NOT NULL)
+    ),
+    FOREIGN KEY(task_id) REFERENCES tasks (id) ON DELETE CASCADE,
+    FOREIGN KEY(project_id) REFERENCES projects (id) ON DELETE CASCADE
+);
+
+INSERT INTO reminders_upgrade (
+    id, task_id, project_id, title, message, reminder_type, trigger_datetime,
+    view_after, recurrence_pattern, status, acknowledged_at, created_at
+)
+SELECT
+    id, task_id, project_id, title, message, reminder_type, trigger_datetime,
+    view_after, recurrence_pattern, status, acknowledged_at, created_at
+FROM reminders;
+
+DROP TABLE reminders;
+ALTER TABLE reminders_upgrade RENAME TO reminders;
+
+CREATE INDEX idx_reminders_due ON reminders (status, trigger_datetime, id);
+
+COMMIT;
+PRAGMA foreign_keys = ON;
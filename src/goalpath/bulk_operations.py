@@ -0,0 +1,397 @@
+"""
+Bulk task operations for GoalPath
+Set-based validation and batched writes for /api/tasks/bulk and /api/batch
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from .db_utils import QueryUtils
+from .models import Project, Task, generate_uuid
+from .ordering import ORDER_GAP
+from .schemas import (
+    BatchRequest,
+    BatchResponse,
+    TaskBulkItemResult,
+    TaskBulkRequest,
+    TaskBulkResponse,
+)
+from .status_propagation import StatusChange, propagate_status_changes
+
+# Keep IN lists below SQLite's host parameter limit
+IN_CHUNK_SIZE = 500
+
+
+def chunked(values: Sequence[Any], size: int = IN_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def fetch_existing_ids(db: Session, column: Any, ids: Iterable[str]) -> set:
+    """IDs from ``ids`` that exist in ``column``'s table, looked up in chunks"""
+    ids = list({value for value in ids if value})
+    found = set()
+    for chunk in chunked(ids):
+        found.update(db.execute(select(column).where(column.in_(chunk))).scalars())
+    return found
+
+
+def fetch_task_refs(db: Session, ids: Iterable[str]) -> Dict[str, Any]:
+    """id -> (project_id, parent_task_id, status) rows for the referenced tasks"""
+    ids = list({value for value in ids if value})
+    refs = {}
+    for chunk in chunked(ids):
+        rows = db.execute(
+            select(Task.id, Task.project_id, Task.parent_task_id, Task.status).where(
+                Task.id.in_(chunk)
+            )
+        )
+        refs.update({row.id: row for row in rows})
+    return refs
+
+
+def closes_parent_cycle(
+    db: Session,
+    task_id: str,
+    parent_id: str,
+    pending: Dict[str, Optional[str]],
+    refs: Dict[str, Any],
+) -> bool:
+    """
+    Whether making ``parent_id`` the parent of ``task_id`` closes a loop.
+
+    Ancestors are followed through ``pending``, the parent changes already
+    accepted in this request, before the stored parents, so two updates
+    that point at each other are caught before anything is written.
+    """
+    current: Optional[str] = parent_id
+    visited = set()
+    while current and current not in visited:
+        if current == task_id:
+            return True
+        visited.add(current)
+        if current in pending:
+            current = pending[current]
+        elif current in refs:
+            current = refs[current].parent_task_id
+        else:
+            current = db.scalar(select(Task.parent_task_id).where(Task.id == current))
+    return False
+
+
+def next_order_indexes(
+    db: Session, keys: Iterable[Tuple[str, Optional[str]]]
+) -> Dict[Tuple[str, Optional[str]], int]:
+    """Current max order_index per (project_id, parent_task_id) sibling group"""
+    project_ids = list({project_id for project_id, _ in keys})
+    maxima: Dict[Tuple[str, Optional[str]], int] = {}
+    for chunk in chunked(project_ids):
+        rows = db.execute(
+            select(Task.project_id, Task.parent_task_id, func.max(Task.order_index))
+            .where(Task.project_id.in_(chunk))
+            .group_by(Task.project_id, Task.parent_task_id)
+        )
+        for project_id, parent_task_id, max_order in rows:
+            maxima[(project_id, parent_task_id)] = max_order or 0
+    return maxima
+
+
+def completed_date_for(old_status: str, new_status: str, now: datetime) -> Tuple[bool, Any]:
+    """Whether a status change touches completed_date, and its new value"""
+    if new_status == "done" and old_status != "done":
+        return True, now
+    if new_status != "done" and old_status == "done":
+        return True, None
+    return False, None
+
+
+def apply_task_bulk(db: Session, request: TaskBulkRequest) -> TaskBulkResponse:
+    """
+    Validate and apply a bulk task request in a single transaction.
+
+    References (projects, parents, targets) are checked with one set-based
+    lookup per table. Items that fail validation are reported and skipped;
+    everything else is written with executemany-style statements and
+    committed together.
+    """
+    now = datetime.utcnow()
+    results: List[TaskBulkItemResult] = []
+
+    def reject(op: str, index: int, task_id: Optional[str], error: str) -> None:
+        results.append(
+            TaskBulkItemResult(op=op, index=index, id=task_id, success=False, error=error)
+        )
+
+    def accept(op: str, index: int, task_id: str) -> None:
+        results.append(TaskBulkItemResult(op=op, index=index, id=task_id, success=True))
+
+    # Set-based reference lookups
+    project_ids = fetch_existing_ids(db, Project.id, (item.project_id for item in request.create))
+    task_refs = fetch_task_refs(
+        db,
+        [item.parent_task_id for item in request.create]
+        + [item.parent_task_id for item in request.update]
+        + [item.id for item in request.update]
+        + [item.id for item in request.status]
+        + list(request.delete),
+    )
+
+    # Creates: order_index assigned in one pass per sibling group
+    insert_rows = []
+    order_maxima = next_order_indexes(
+        db, [(item.project_id, item.parent_task_id) for item in request.create]
+    )
+    for index, item in enumerate(request.create):
+        if item.project_id not in project_ids:
+            reject("create", index, None, f"Project with ID {item.project_id} not found")
+            continue
+        if item.parent_task_id:
+            parent = task_refs.get(item.parent_task_id)
+            if parent is None:
+                error = f"Parent task with ID {item.parent_task_id} not found"
+                reject("create", index, None, error)
+                continue
+            if parent.project_id != item.project_id:
+                reject("create", index, None, "Parent task must be in the same project")
+                continue
+
+        key = (item.project_id, item.parent_task_id)
+        order_maxima[key] = order_maxima.get(key, 0) + ORDER_GAP
+
+        row = item.model_dump()
+        row.update(
+            id=generate_uuid(),
+            created_by="system",
+            order_index=order_maxima[key],
+            created_at=now,
+            updated_at=now,
+            completed_date=now if item.status == "done" else None,
+        )
+        insert_rows.append(row)
+        accept("create", index, row["id"])
+
+    # Updates and status changes, merged into one parameter set per task
+    update_params: Dict[str, Dict[str, Any]] = {}
+    current_status = {task_id: ref.status for task_id, ref in task_refs.items()}
+    pending_parents: Dict[str, Optional[str]] = {}
+
+    for index, item in enumerate(request.update):
+        target = task_refs.get(item.id)
+        if target is None:
+            reject("update", index, item.id, f"Task with ID {item.id} not found")
+            continue
+
+        values = item.model_dump(exclude_unset=True, exclude={"id"})
+        new_parent_id = values.get("parent_task_id")
+        if new_parent_id:
+            parent = task_refs.get(new_parent_id)
+            if parent is None:
+                reject("update", index, item.id, f"Parent task with ID {new_parent_id} not found")
+                continue
+            if parent.project_id != target.project_id:
+                reject("update", index, item.id, "Parent task must be in the same project")
+                continue
+            if closes_parent_cycle(db, item.id, new_parent_id, pending_parents, task_refs):
+                reject("update", index, item.id, "Invalid task hierarchy - would create a cycle")
+                continue
+        if "parent_task_id" in values:
+            pending_parents[item.id] = new_parent_id
+
+        if "status" in values:
+            changed, completed_date = completed_date_for(
+                current_status[item.id], values["status"], now
+            )
+            if changed:
+                values["completed_date"] = completed_date
+            current_status[item.id] = values["status"]
+
+        update_params.setdefault(item.id, {}).update(values)
+        accept("update", index, item.id)
+
+    for index, item in enumerate(request.status):
+        if item.id not in task_refs:
+            reject("status", index, item.id, f"Task with ID {item.id} not found")
+            continue
+
+        values: Dict[str, Any] = {"status": item.status}
+        changed, completed_date = completed_date_for(current_status[item.id], item.status, now)
+        if changed:
+            values["completed_date"] = completed_date
+        current_status[item.id] = item.status
+
+        update_params.setdefault(item.id, {}).update(values)
+        accept("status", index, item.id)
+
+    # Deletes: children of deleted tasks move up to the nearest surviving ancestor
+    delete_ids = []
+    for index, task_id in enumerate(request.delete):
+        if task_id not in task_refs:
+            reject("delete", index, task_id, f"Task with ID {task_id} not found")
+            continue
+        delete_ids.append(task_id)
+        accept("delete", index, task_id)
+
+    deleted = set(delete_ids)
+    reparent: Dict[str, Optional[str]] = {}
+    if deleted:
+        for chunk in chunked(delete_ids):
+            rows = db.execute(
+                select(Task.id, Task.parent_task_id).where(Task.parent_task_id.in_(chunk))
+            )
+            for child_id, parent_id in rows:
+                if child_id in deleted:
+                    continue
+                while parent_id in deleted:
+                    parent_id = task_refs[parent_id].parent_task_id
+                reparent[child_id] = parent_id
+
+    # Writes: grouped executemany statements, one commit
+    updated_ids = set(update_params) - deleted
+    if insert_rows:
+        db.execute(insert(Task), insert_rows)
+
+    for task_id, parent_id in reparent.items():
+        update_params.setdefault(task_id, {})["parent_task_id"] = parent_id
+
+    batches: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for task_id, values in update_params.items():
+        if task_id in deleted:
+            continue
+        params = {"id": task_id, **values, "updated_at": now}
+        batches.setdefault(tuple(sorted(params)), []).append(params)
+    for params in batches.values():
+        db.execute(update(Task), params)
+
+    for chunk in chunked(delete_ids):
+        db.execute(delete(Task).where(Task.id.in_(chunk)))
+
+    propagate_status_changes(
+        db,
+        [
+            StatusChange(task_id, task_refs[task_id].project_id, task_refs[task_id].status, status)
+            for task_id, status in current_status.items()
+            if task_id in updated_ids
+        ],
+    )
+    db.commit()
+
+    failed = sum(1 for result in results if not result.success)
+    return TaskBulkResponse(
+        results=results,
+        created=len(insert_rows),
+        updated=len(updated_ids),
+        deleted=len(delete_ids),
+        failed=failed,
+    )
+
+
+def _set_status(task: Task, status: str, now: datetime) -> None:
+    changed, completed_date = completed_date_for(task.status, status, now)
+    if changed:
+        task.completed_date = completed_date
+    task.status = status
+
+
+def _apply_batch_operation(
+    db: Session, task: Task, operation: Any, tasks: Dict[str, Task], now: datetime
+) -> Optional[str]:
+    """Apply one batch operation to a loaded task; returns an error instead of raising"""
+    if operation.op == "status":
+        _set_status(task, operation.status.value, now)
+    elif operation.op == "reorder":
+        task.order_index = operation.order_index
+    else:
+        values = operation.fields.model_dump(exclude_unset=True)
+        new_parent_id = values.get("parent_task_id")
+        if new_parent_id:
+            parent = tasks.get(new_parent_id)
+            if parent is None:
+                return f"Parent task with ID {new_parent_id} not found"
+            if parent.project_id != task.project_id:
+                return "Parent task must be in the same project"
+            # Earlier operations may have moved tasks; check against them
+            db.flush()
+            if not QueryUtils.validate_task_hierarchy(db, task.id, new_parent_id):
+                return "Invalid task hierarchy - would create a cycle"
+
+        status = values.pop("status", None)
+        if status is not None:
+            _set_status(task, status.value, now)
+        for field, value in values.items():
+            setattr(task, field, getattr(value, "value", value))
+
+    task.updated_at = now
+    return None
+
+
+def apply_task_batch(db: Session, request: BatchRequest) -> Tuple[BatchResponse, List[Task]]:
+    """
+    Apply an ordered list of task operations in one session and transaction.
+
+    Every referenced task is loaded with one set-based query; operations
+    then run in order against those objects, so later operations see the
+    effect of earlier ones. With ``atomic`` any rejected operation rolls the
+    whole batch back; otherwise the valid operations are committed together.
+    Returns the response and the tasks that were changed, including
+    dependents whose status was propagated.
+    """
+    now = datetime.utcnow()
+    operations = request.operations
+
+    ids = [operation.id for operation in operations] + [
+        operation.fields.parent_task_id
+        for operation in operations
+        if operation.op == "update" and operation.fields.parent_task_id
+    ]
+    tasks: Dict[str, Task] = {}
+    for chunk in chunked(list(set(ids))):
+        rows = db.execute(select(Task).where(Task.id.in_(chunk))).scalars()
+        tasks.update((task.id, task) for task in rows)
+    original_status = {task_id: task.status for task_id, task in tasks.items()}
+
+    results: List[TaskBulkItemResult] = []
+    touched: Dict[str, Task] = {}
+    for index, operation in enumerate(operations):
+        task = tasks.get(operation.id)
+        if task is None:
+            error = f"Task with ID {operation.id} not found"
+        else:
+            error = _apply_batch_operation(db, task, operation, tasks, now)
+
+        results.append(
+            TaskBulkItemResult(
+                op=operation.op, index=index, id=operation.id, success=error is None, error=error
+            )
+        )
+        if error is None:
+            touched[task.id] = task
+
+    failed = sum(1 for result in results if not result.success)
+    if failed and request.atomic:
+        db.rollback()
+        for result in results:
+            if result.success:
+                result.success = False
+                result.error = "Not applied: batch rolled back"
+        return BatchResponse(results=results, applied=0, failed=failed, committed=False), []
+
+    propagated = propagate_status_changes(
+        db,
+        [
+            StatusChange(task.id, task.project_id, original_status[task.id], task.status)
+            for task in touched.values()
+        ],
+    )
+    # Dependents moved by propagation are returned too so their cards refresh
+    for change in propagated:
+        if change.task_id not in touched:
+            touched[change.task_id] = tasks.get(change.task_id) or db.get(Task, change.task_id)
+
+    db.commit()
+    response = BatchResponse(
+        results=results, applied=len(results) - failed, failed=failed, committed=True
+    )
+    return response, list(touched.values())
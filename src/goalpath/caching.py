@@ -0,0 +1,200 @@
+"""
+Caching primitives for GoalPath
+A bounded LRU base for the in-process caches and the session hooks that invalidate them on commit
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Returned by LRUCache.lookup on a miss, so None stays a cacheable value
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU map bounded by the total weight of its entries.
+
+    Every entry weighs 1 unless ``_weigh`` is overridden, so ``capacity`` is
+    an entry count by default. Subclasses build their typed get/put API on
+    ``lookup`` and ``store``; ``_on_remove`` is called for every entry that
+    is evicted or discarded, for subclasses that keep secondary indexes.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable, fresh: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Cached value for ``key``, or MISSING; a value failing ``fresh`` is a miss"""
+        with self._lock:
+            value = self._entries.get(key, MISSING)
+            if value is MISSING or (fresh is not None and not fresh(value)):
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Cache ``value`` as most recently used, evicting the oldest entries past capacity"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = value
+            self._size += self._weigh(value)
+            while self._size > self.capacity and self._entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def discard(self, *keys: Hashable) -> int:
+        """Drop the given keys; returns the number removed"""
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def discard_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Drop every entry for which ``predicate(key, value)`` holds"""
+        with self._lock:
+            return self.discard(
+                *[key for key, value in self._entries.items() if predicate(key, value)]
+            )
+
+    def invalidate_all(self) -> None:
+        """Drop every entry, keeping the metrics"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def clear(self) -> None:
+        """Drop every entry and reset the metrics"""
+        with self._lock:
+            self.invalidate_all()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit-rate metrics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _weigh(self, value: Any) -> int:
+        return 1
+
+    def _on_remove(self, key: Hashable, value: Any) -> None:
+        pass
+
+    def _remove(self, key: Hashable) -> None:
+        value = self._entries.pop(key)
+        self._size -= self._weigh(value)
+        self._on_remove(key, value)
+
+
+# Change tracking: one set of session hooks shared by every cache. A subscriber
+# names the models it depends on and how a written instance maps to cache keys;
+# keys are collected per session on flush and handed over once the commit lands.
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    models: Tuple[type, ...]
+    deletes: Tuple[type, ...]
+    keys: Callable[[Any], Iterable[Hashable]]
+    invalidate: Callable[..., Any]
+    invalidate_all: Callable[[], Any]
+
+
+_subscriptions: List[_Subscription] = []
+
+_PENDING_CHANGES_KEY = "goalpath_cache_changes"
+# Collected instead of keys when a bulk statement hides which rows it touched
+_ALL = object()
+
+
+def invalidate_on_commit(
+    models: Iterable[type],
+    keys: Callable[[Any], Iterable[Hashable]],
+    invalidate: Callable[..., Any],
+    invalidate_all: Callable[[], Any],
+    deletes: Iterable[type] = (),
+) -> None:
+    """
+    Subscribe a cache to committed writes.
+
+    Instances of ``models`` written in a session contribute ``keys(instance)``,
+    and instances of ``deletes`` only when they are deleted. Once the session
+    commits, ``invalidate(*keys)`` is called with everything collected. Bulk
+    statements against those models do not say which rows they hit, so they
+    call ``invalidate_all()`` instead. A rollback discards the collected keys.
+    """
+    _subscriptions.append(
+        _Subscription(tuple(models), tuple(deletes), keys, invalidate, invalidate_all)
+    )
+
+
+def _pending(session: Session, index: int) -> Set[Any]:
+    return session.info.setdefault(_PENDING_CHANGES_KEY, {}).setdefault(index, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context: Any) -> None:
+    deleted = list(session.deleted)
+    for objects, is_delete in ((session.new, False), (session.dirty, False), (deleted, True)):
+        for obj in objects:
+            for index, subscription in enumerate(_subscriptions):
+                if isinstance(obj, subscription.models) or (
+                    is_delete and isinstance(obj, subscription.deletes)
+                ):
+                    _pending(session, index).update(subscription.keys(obj))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statements(orm_execute_state: Any) -> None:
+    state = orm_execute_state
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    classes = [mapper.class_ for mapper in state.all_mappers]
+    for index, subscription in enumerate(_subscriptions):
+        models = subscription.models + (subscription.deletes if state.is_delete else ())
+        if any(issubclass(cls, models) for cls in classes):
+            _pending(state.session, index).add(_ALL)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    changes = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if not changes:
+        return
+    for index, keys in changes.items():
+        subscription = _subscriptions[index]
+        if _ALL in keys:
+            subscription.invalidate_all()
+        elif keys:
+            subscription.invalidate(*keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
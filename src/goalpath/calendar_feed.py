@@ -0,0 +1,189 @@
+"""
+Calendar feed for GoalPath
+Reminder occurrences expanded over a window and merged with schedule events in time order
+"""
+
+import heapq
+from datetime import date, datetime, time
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import Select, and_, or_, select
+from sqlalchemy.orm import Session
+
+from .models import Task
+from .models.extended import Reminder
+from .recurrence import parse_recurrence
+from .reminders import DUE_STATUSES
+from .timeline import event_timeline_select, to_columns
+
+# Upper bound on items in one calendar response
+CALENDAR_MAX_ITEMS = 50_000
+# Longest window one calendar request may span, in days
+CALENDAR_MAX_DAYS = 366
+
+# Statuses of reminders that already fired and are still shown where they occurred
+PAST_STATUSES = ("fired", "acknowledged")
+
+CALENDAR_COLUMNS = (
+    "start",
+    "end",
+    "kind",
+    "id",
+    "title",
+    "type",
+    "project_id",
+    "task_id",
+    "status",
+)
+
+CalendarItem = Tuple[Any, ...]
+
+
+def reminder_calendar_select(
+    window_start: datetime, window_end: datetime, project_id: Optional[str] = None
+) -> Select:
+    """
+    Reminders that can occur in the window.
+
+    Live reminders (pending or snoozed) triggering before the window ends,
+    recurring ones whatever their next trigger and one-time ones inside
+    the window, plus fired reminders that triggered inside it. Both
+    branches are ranges on idx_reminders_due.
+    """
+    statement = select(
+        Reminder.id,
+        Reminder.title,
+        Reminder.reminder_type,
+        Reminder.status,
+        Reminder.project_id,
+        Reminder.task_id,
+        Reminder.trigger_datetime,
+        Reminder.recurrence_pattern,
+        Reminder.recurrence_anchor,
+    ).where(
+        or_(
+            and_(
+                Reminder.status.in_(DUE_STATUSES),
+                Reminder.trigger_datetime <= window_end,
+                or_(
+                    Reminder.reminder_type == "recurring",
+                    Reminder.trigger_datetime >= window_start,
+                ),
+            ),
+            and_(
+                Reminder.status.in_(PAST_STATUSES),
+                Reminder.trigger_datetime >= window_start,
+                Reminder.trigger_datetime <= window_end,
+            ),
+        )
+    )
+    if project_id:
+        statement = statement.where(
+            or_(
+                Reminder.project_id == project_id,
+                Reminder.task_id.in_(select(Task.id).where(Task.project_id == project_id)),
+            )
+        )
+    return statement
+
+
+def reminder_occurrences(
+    reminder: Any, window_start: datetime, window_end: datetime
+) -> Iterator[CalendarItem]:
+    """
+    Calendar items for one reminder inside the window, in time order.
+
+    A live recurring reminder is expanded lazily from its pattern's
+    DTSTART, or else from its next trigger (earlier occurrences have
+    already fired). A snoozed one shows its snooze time and then the rest
+    of its series, which runs on from the occurrence that was snoozed.
+    Anything else, including patterns that do not parse, shows its trigger.
+    """
+    item = (
+        "reminder",
+        reminder.id,
+        reminder.title,
+        reminder.reminder_type,
+        reminder.project_id,
+        reminder.task_id,
+        reminder.status,
+    )
+    if (
+        reminder.reminder_type == "recurring"
+        and reminder.status in DUE_STATUSES
+        and reminder.recurrence_pattern
+    ):
+        try:
+            rule = parse_recurrence(reminder.recurrence_pattern)
+        except ValueError:
+            rule = None
+        if rule is not None and reminder.recurrence_anchor is not None:
+            snoozed_until = reminder.trigger_datetime
+            if window_start <= snoozed_until <= window_end:
+                yield (snoozed_until, None) + item
+            dtstart = rule.dtstart or reminder.recurrence_anchor
+            for moment in rule.expand(dtstart, window_start, window_end):
+                if moment > snoozed_until:
+                    yield (moment, None) + item
+            return
+        if rule is not None:
+            dtstart = rule.dtstart or reminder.trigger_datetime
+            for moment in rule.expand(dtstart, window_start, window_end):
+                yield (moment, None) + item
+            return
+
+    if window_start <= reminder.trigger_datetime <= window_end:
+        yield (reminder.trigger_datetime, None) + item
+
+
+def _event_items(db: Session, statement: Select) -> Iterator[CalendarItem]:
+    for event in db.execute(statement):
+        yield (
+            event.start,
+            event.end,
+            "event",
+            event.id,
+            event.title,
+            event.event_type,
+            event.project_id,
+            event.task_id,
+            None,
+        )
+
+
+def build_calendar(
+    db: Session,
+    window_start: date,
+    window_end: date,
+    project_id: Optional[str] = None,
+    limit: int = CALENDAR_MAX_ITEMS,
+) -> Dict[str, Any]:
+    """
+    Reminder occurrences and schedule events in ``[window_start, window_end]``.
+
+    Each reminder's occurrences and the start-ordered events are lazy
+    streams, merged on start time. Items are only generated up to the
+    ``limit`` + 1st (plus one look-ahead per stream), so a small limit
+    stays cheap however dense the window; ``truncated`` says whether more
+    matched. The result is columnar, like the timeline.
+    """
+    first = datetime.combine(window_start, time.min)
+    last = datetime.combine(window_end, time.max)
+
+    reminders = db.execute(reminder_calendar_select(first, last, project_id)).all()
+    streams = [reminder_occurrences(reminder, first, last) for reminder in reminders]
+    streams.append(_event_items(db, event_timeline_select(window_start, window_end, project_id)))
+    items = list(islice(heapq.merge(*streams, key=itemgetter(0)), limit + 1))
+
+    truncated = len(items) > limit
+    items = items[:limit]
+    return {
+        "from": window_start,
+        "to": window_end,
+        "project_id": project_id,
+        "count": len(items),
+        "truncated": truncated,
+        "columns": to_columns(CALENDAR_COLUMNS, items),
+    }
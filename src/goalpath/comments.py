@@ -0,0 +1,195 @@
+"""
+Task comments for GoalPath
+Keyset-paginated comment threads, the merged activity feed and cached comment counts
+"""
+
+import heapq
+import json
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from .bulk_operations import chunked
+from .caching import MISSING, LRUCache, invalidate_on_commit
+from .etags import data_version
+from .models.extended import TaskComment
+from .read_models import KeysetCursor, encode_cursor
+
+COMMENT_PAGE_SIZE = 50
+ACTIVITY_PAGE_SIZE = 30
+
+# Event log entries shown in the activity feed, each read as its own stream
+ACTIVITY_TYPES = ("comment", "status_change")
+
+# Columns of an activity entry; the feed never needs the task relationship
+ACTIVITY_COLUMNS = (
+    TaskComment.id,
+    TaskComment.comment_type,
+    TaskComment.author,
+    TaskComment.content,
+    TaskComment.comment_metadata,
+    TaskComment.created_at,
+)
+
+
+def comment_page_select(
+    task_id: str,
+    comment_type: str = "comment",
+    before: Optional[KeysetCursor] = None,
+    limit: int = COMMENT_PAGE_SIZE,
+    columns: Sequence[Any] = (TaskComment,),
+) -> Select:
+    """
+    One keyset page of a task's event log entries of one type, newest first.
+
+    Pages continue strictly before ``before`` in (created_at, id) order, so
+    every page is a single range of idx_task_comments_history however long
+    the thread is. One extra row is selected to tell whether a next page
+    exists.
+    """
+    statement = select(*columns).where(
+        TaskComment.task_id == task_id, TaskComment.comment_type == comment_type
+    )
+    key = (TaskComment.created_at, TaskComment.id)
+    if before is not None:
+        statement = statement.where(tuple_(*key) < tuple_(*before))
+    return statement.order_by(*(column.desc() for column in key)).limit(limit + 1)
+
+
+def load_comment_page(
+    db: Session,
+    task_id: str,
+    before: Optional[KeysetCursor] = None,
+    limit: int = COMMENT_PAGE_SIZE,
+) -> Tuple[List[TaskComment], Optional[str]]:
+    """Comments of one page and the cursor of the next (None on the last page)"""
+    comments = db.scalars(comment_page_select(task_id, "comment", before, limit)).all()
+    if len(comments) <= limit:
+        return list(comments), None
+    last = comments[limit - 1]
+    return list(comments[:limit]), encode_cursor(last.created_at, last.id)
+
+
+def _history_stream(
+    db: Session, task_id: str, comment_type: str, before: Optional[KeysetCursor], batch: int
+) -> Iterator[Any]:
+    """Entries of one type newest first, read a keyset page at a time as they are consumed"""
+    while True:
+        rows = db.execute(
+            comment_page_select(task_id, comment_type, before, batch, ACTIVITY_COLUMNS)
+        ).all()
+        yield from rows
+        if len(rows) <= batch:
+            return
+        before = (rows[-1].created_at, rows[-1].id)
+
+
+def _activity_item(row: Any) -> Dict[str, Any]:
+    item = {
+        "id": row.id,
+        "kind": row.comment_type,
+        "author": row.author,
+        "content": row.content,
+        "created_at": row.created_at,
+        "from_status": None,
+        "to_status": None,
+    }
+    if row.comment_type == "status_change" and row.comment_metadata:
+        try:
+            change = json.loads(row.comment_metadata)
+        except ValueError:
+            change = {}
+        item["from_status"] = change.get("from")
+        item["to_status"] = change.get("to")
+    return item
+
+
+def activity_page(
+    db: Session,
+    task_id: str,
+    before: Optional[KeysetCursor] = None,
+    limit: int = ACTIVITY_PAGE_SIZE,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    One page of a task's activity feed, newest first, and the next cursor.
+
+    Comments and status events are read as separate newest-first streams
+    over idx_task_comments_history and merged lazily on (created_at, id):
+    each stream fetches at most limit + 1 rows per query and only as far
+    as the merge consumes, so a page costs about one query per stream
+    whatever the depth of the history.
+    """
+    streams = [
+        _history_stream(db, task_id, comment_type, before, limit) for comment_type in ACTIVITY_TYPES
+    ]
+    merged = heapq.merge(*streams, key=lambda row: (row.created_at, row.id), reverse=True)
+    rows = list(islice(merged, limit + 1))
+    if len(rows) <= limit:
+        return [_activity_item(row) for row in rows], None
+    last = rows[limit - 1]
+    return [_activity_item(row) for row in rows[:limit]], encode_cursor(last.created_at, last.id)
+
+
+class CommentCountCache(LRUCache):
+    """
+    Bounded cache of comment counts per task.
+
+    Comment writes committed in this process drop the counts of their
+    tasks, and bulk statements against task_comments drop them all. Every
+    entry also carries the data_version stamp of task_comments it was
+    counted under, so comments written by other replicas are noticed on
+    the next read.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        super().__init__(capacity=max_entries)
+
+    def get(self, db: Session, task_id: str) -> int:
+        """Number of comments on a task"""
+        return self.get_many(db, [task_id])[task_id]
+
+    def get_many(self, db: Session, task_ids: Sequence[str]) -> Dict[str, int]:
+        """task_id -> comment count; the misses are counted in one grouped query per chunk"""
+        stamp = data_version(db, TaskComment)
+        counts: Dict[str, int] = {}
+        missing: List[str] = []
+        for task_id in dict.fromkeys(task_ids):
+            entry = self.lookup(task_id, lambda entry: entry[0] == stamp)
+            if entry is MISSING:
+                missing.append(task_id)
+            else:
+                counts[task_id] = entry[1]
+
+        if not missing:
+            return counts
+
+        fetched = dict.fromkeys(missing, 0)
+        for chunk in chunked(missing):
+            fetched.update(
+                db.execute(
+                    select(TaskComment.task_id, func.count())
+                    .where(TaskComment.task_id.in_(chunk), TaskComment.comment_type == "comment")
+                    .group_by(TaskComment.task_id)
+                ).all()
+            )
+        for task_id, count in fetched.items():
+            self.store(task_id, (stamp, count))
+        counts.update(fetched)
+        return counts
+
+    def invalidate(self, *task_ids: str) -> None:
+        """Drop the counts of the given tasks"""
+        self.discard(*task_ids)
+
+
+# Global comment count cache shared by all routes
+comment_count_cache = CommentCountCache()
+
+invalidate_on_commit(
+    (TaskComment,),
+    lambda comment: (comment.task_id,),
+    comment_count_cache.invalidate,
+    comment_count_cache.invalidate_all,
+)
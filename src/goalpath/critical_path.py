@@ -0,0 +1,135 @@
+"""
+Critical path analysis for GoalPath projects
+CPM over the cached dependency graph, weighted by estimated hours or story points
+"""
+
+from array import array
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .caching import MISSING, LRUCache, invalidate_on_commit
+from .dependency_graph import FINISHED_STATUSES, DependencyGraph, graph_cache
+from .models import Task
+from .schemas import ScheduleWeight
+
+WEIGHT_COLUMNS = {
+    ScheduleWeight.ESTIMATED_HOURS: Task.estimated_hours,
+    ScheduleWeight.STORY_POINTS: Task.story_points,
+}
+
+# Slack below this is treated as zero (float noise from the two passes)
+SLACK_EPSILON = 1e-9
+
+
+def estimates_stamp(db: Session, project_id: str) -> Tuple[Any, ...]:
+    """Version stamp of a project's task rows: count and max(updated_at)"""
+    return tuple(
+        db.execute(
+            select(func.count(), func.max(Task.updated_at)).where(Task.project_id == project_id)
+        ).one()
+    )
+
+
+def build_report(
+    db: Session, project_id: str, graph: DependencyGraph, weight: ScheduleWeight
+) -> Dict[str, Any]:
+    """
+    Run CPM for a project and shape the result.
+
+    Durations come from one query over the project's tasks. Tasks without an
+    estimate, and finished tasks (no time left on the schedule), count as
+    zero-length.
+    """
+    column = WEIGHT_COLUMNS[weight]
+    rows = db.execute(
+        select(Task.id, Task.title, Task.status, column).where(Task.project_id == project_id)
+    ).all()
+
+    durations = array("d", bytes(8 * len(graph)))
+    details = {}
+    unestimated = 0
+    for task_id, title, status, estimate in rows:
+        position = graph.index.get(task_id)
+        if position is None:
+            continue
+        details[position] = (title, status)
+        if estimate is None:
+            unestimated += 1
+        elif status not in FINISHED_STATUSES:
+            durations[position] = float(estimate)
+
+    result = graph.critical_path(durations)
+    tasks = []
+    for position in graph.topological_positions():
+        title, status = details.get(position, (None, None))
+        slack = result.slack(position)
+        tasks.append(
+            {
+                "task_id": graph.task_ids[position],
+                "title": title,
+                "status": status,
+                "duration": durations[position],
+                "earliest_start": round(result.earliest_start[position], 4),
+                "earliest_finish": round(result.earliest_finish[position], 4),
+                "latest_start": round(result.latest_start[position], 4),
+                "latest_finish": round(result.latest_finish[position], 4),
+                "slack": round(slack, 4),
+                "critical": slack <= SLACK_EPSILON,
+            }
+        )
+
+    return {
+        "project_id": project_id,
+        "weight": weight.value,
+        "project_duration": round(result.duration, 4),
+        "task_count": len(graph),
+        "dependency_count": graph.edge_count,
+        "unestimated_tasks": unestimated,
+        "critical_chain": [graph.task_ids[position] for position in result.chain],
+        "tasks": tasks,
+    }
+
+
+class CriticalPathCache(LRUCache):
+    """
+    Bounded cache of critical path reports per (project, weight).
+
+    An entry stays valid while the project's cached dependency graph is the
+    same object and its task rows have not changed, so edge changes and
+    estimate edits both trigger a recomputation. Task writes committed in
+    this process drop entries directly; estimates_stamp catches writes from
+    other workers (to the resolution of updated_at).
+    """
+
+    def __init__(self, max_entries: int = 128):
+        super().__init__(capacity=max_entries)
+
+    def get(self, db: Session, project_id: str, weight: ScheduleWeight) -> Dict[str, Any]:
+        """Cached report, recomputed when the graph or the task rows changed"""
+        graph = graph_cache.get(db, project_id)
+        stamp = estimates_stamp(db, project_id)
+        key = (project_id, weight.value)
+        entry = self.lookup(key, lambda entry: entry[0] is graph and entry[1] == stamp)
+        if entry is not MISSING:
+            return entry[2]
+
+        report = build_report(db, project_id, graph, weight)
+        self.store(key, (graph, stamp, report))
+        return report
+
+    def invalidate(self, *project_ids: str) -> None:
+        """Drop the reports of the given projects"""
+        self.discard_where(lambda key, _: key[0] in project_ids)
+
+
+# Global critical path cache shared by all routes
+critical_path_cache = CriticalPathCache()
+
+invalidate_on_commit(
+    (Task,),
+    lambda task: (task.project_id,),
+    critical_path_cache.invalidate,
+    critical_path_cache.invalidate_all,
+)
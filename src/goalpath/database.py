@@ -2,26 +2,33 @@
 Database configuration and setup for GoalPath
 """
 
+import os
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, Optional
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 # Import all models to ensure they are registered with SQLAlchemy
 from .models import Base, Project, Task, Goal, TaskDependency, GoalProject, Sprint, SprintTask
-from .models.extended import Issue, Reminder, TaskComment, TaskAttachment, ProjectContext, ScheduleEvent  # noqa: F401
+from .models.extended import Issue, Reminder, TaskComment, TaskAttachment, ProjectContext, ScheduleEvent, DataVersion  # noqa: F401
+from .schema_upgrades import upgrade_schema
 
 # Ensure all models are registered (prevents F401 warnings)
 __all__ = ["Base", "Project", "Task", "Goal", "TaskDependency", "GoalProject", "Sprint", "SprintTask",
-           "Issue", "Reminder", "TaskComment", "TaskAttachment", "ProjectContext", "ScheduleEvent"]
+           "Issue", "Reminder", "TaskComment", "TaskAttachment", "ProjectContext", "ScheduleEvent",
+           "DataVersion"]
 
 
 class DatabaseManager:
     """Database manager for GoalPath application"""
 
     def __init__(self, database_url: str = None):
+        if database_url is None:
+            database_url = os.environ.get("DATABASE_URL") or None
+
         if database_url is None:
             # Default to SQLite in project root
             db_path = Path(__file__).parent.parent.parent.parent / "goalpath.db"
@@ -30,8 +37,9 @@ class DatabaseManager:
         self.database_url = database_url
         self.engine = self._create_engine()
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self._dedicated_sessions: Optional[sessionmaker] = None
 
-    def _create_engine(self):
+    def _create_engine(self, poolclass=StaticPool):
         """Create SQLAlchemy engine with appropriate configuration"""
         if self.database_url.startswith("sqlite"):
             # SQLite specific configuration
@@ -41,7 +49,7 @@ class DatabaseManager:
                     "check_same_thread": False,  # Allow multiple threads
                     "timeout": 20,  # 20 second timeout
                 },
-                poolclass=StaticPool,
+                poolclass=poolclass,
                 echo=False,  # Set to True for SQL debugging
             )
 
@@ -78,6 +86,31 @@ class DatabaseManager:
         """Get synchronous database session (manual cleanup required)"""
         return self.SessionLocal()
 
+    def get_dedicated_session_factory(self) -> Callable[[], Session]:
+        """
+        Session factory whose sessions never share a connection with request sessions.
+
+        The SQLite engine hands its one connection (StaticPool) to every
+        session, so a session used from another thread could commit or roll
+        back a request's transaction. For a database file the sessions here
+        come from a second engine that opens a connection per session. An
+        in-memory database only exists on the shared connection, and other
+        databases already pool a connection per session, so both keep the
+        regular sessions.
+        """
+        if self._dedicated_sessions is None:
+            url = make_url(self.database_url)
+            in_memory = url.database in (None, "", ":memory:") or "memory" in str(
+                url.query.get("mode", "")
+            )
+            if url.get_backend_name() != "sqlite" or in_memory:
+                self._dedicated_sessions = self.SessionLocal
+            else:
+                self._dedicated_sessions = sessionmaker(
+                    autocommit=False, autoflush=False, bind=self._create_engine(NullPool)
+                )
+        return self._dedicated_sessions
+
 
 # Global database manager instance
 db_manager = DatabaseManager()
@@ -89,6 +122,11 @@ def get_db() -> Generator[Session, None, None]:
     yield from db_manager.get_session()
 
 
+def get_session_factory() -> Callable[[], Session]:
+    """FastAPI dependency for work that outlives the request, such as streamed responses"""
+    return db_manager.get_dedicated_session_factory()
+
+
 # Initialize database
 def init_database(drop_existing: bool = False):
     """Initialize database with tables"""
@@ -100,6 +138,10 @@ def init_database(drop_existing: bool = False):
     db_manager.create_tables()
     print("Database tables created successfully!")
 
+    # Tables that existed before create_all get their new columns here
+    for upgrade in upgrade_schema(db_manager.engine):
+        print(f"Applied schema upgrade: {upgrade}")
+
 
 if __name__ == "__main__":
     # Test database setup
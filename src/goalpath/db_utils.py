@@ -2,13 +2,49 @@
 Database utilities and query helpers for GoalPath
 """
 
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
-from sqlalchemy import or_
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
-from .models import Goal, GoalProject, Project, Task
+from .models import Goal, GoalProject, Project, Task, TaskDependency
+from .read_models import (
+    SIBLING_ORDER,
+    project_list_select,
+    task_list_select,
+    to_project_items,
+    to_task_items,
+)
+
+GOAL_LIST_COLUMNS = (
+    Goal.id,
+    Goal.parent_goal_id,
+    Goal.title,
+    Goal.description,
+    Goal.goal_type,
+    Goal.target_date,
+    Goal.status,
+    Goal.progress_percentage,
+    Goal.created_at,
+    Goal.updated_at,
+)
+
+
+def _format_value(value: Any) -> Any:
+    """JSON-friendly value for the dict-returning helpers"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _fieldset_dict(item: Any, fields: Sequence[str]) -> Dict[str, Any]:
+    """Only the requested fields of a read model, formatted like the full dicts"""
+    return {name: _format_value(getattr(item, name, None)) for name in fields}
 
 
 class QueryUtils:
@@ -22,41 +58,39 @@ class QueryUtils:
         search: Optional[str] = None,
         page: int = 1,
         size: int = 20,
+        include_description: bool = True,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get projects with calculated statistics"""
+        """
+        Get projects with calculated statistics.
 
-        # Base query
-        query = db.query(Project)
+        ``fields`` narrows the result to a sparse fieldset; task counts are
+        only computed when one of the statistics is requested.
+        """
+
+        # Project columns plus task counts in one statement, no entity hydration
+        query = project_list_select(include_description=include_description, fields=fields)
 
         # Apply filters
         if status:
-            query = query.filter(Project.status == status)
+            query = query.where(Project.status == status)
         if priority:
-            query = query.filter(Project.priority == priority)
+            query = query.where(Project.priority == priority)
         if search:
             search_filter = or_(
                 Project.name.ilike(f"%{search}%"), Project.description.ilike(f"%{search}%")
             )
-            query = query.filter(search_filter)
+            query = query.where(search_filter)
 
         # Apply pagination
         offset = (page - 1) * size
-        projects = query.offset(offset).limit(size).all()
+        projects = to_project_items(db.execute(query.offset(offset).limit(size)))
+
+        if fields is not None:
+            return [_fieldset_dict(project, fields) for project in projects]
 
-        # Calculate statistics for each project
         result = []
         for project in projects:
-            # Count tasks by status
-            total_tasks = db.query(Task).filter(Task.project_id == project.id).count()
-            completed_tasks = (
-                db.query(Task).filter(Task.project_id == project.id, Task.status == "done").count()
-            )
-
-            # Calculate completion percentage
-            completion_percentage = (
-                (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
-            )
-
             project_dict = {
                 "id": project.id,
                 "name": project.name,
@@ -73,9 +107,9 @@ class QueryUtils:
                 "created_at": project.created_at.isoformat(),
                 "updated_at": project.updated_at.isoformat(),
                 "created_by": project.created_by,
-                "total_tasks": total_tasks,
-                "completed_tasks": completed_tasks,
-                "completion_percentage": round(completion_percentage, 1),
+                "total_tasks": project.total_tasks,
+                "completed_tasks": project.completed_tasks,
+                "completion_percentage": project.completion_percentage,
             }
             result.append(project_dict)
 
@@ -138,33 +172,49 @@ class QueryUtils:
         assigned_to: Optional[str] = None,
         page: int = 1,
         size: int = 20,
+        include_description: bool = True,
+        search: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get tasks with hierarchy information"""
+        """
+        Get tasks with hierarchy information.
+
+        ``fields`` narrows the result to a sparse fieldset; the subtask count
+        is only computed when requested.
+        """
 
-        # Base query
-        query = db.query(Task)
+        # Task columns plus subtask count in one statement, no entity hydration
+        query = task_list_select(
+            include_description=include_description, with_subtask_count=True, fields=fields
+        )
 
         # Apply filters
         if project_id:
-            query = query.filter(Task.project_id == project_id)
+            query = query.where(Task.project_id == project_id)
         if parent_task_id:
-            query = query.filter(Task.parent_task_id == parent_task_id)
+            query = query.where(Task.parent_task_id == parent_task_id)
         if status:
-            query = query.filter(Task.status == status)
+            query = query.where(Task.status == status)
         if task_type:
-            query = query.filter(Task.task_type == task_type)
+            query = query.where(Task.task_type == task_type)
         if assigned_to:
-            query = query.filter(Task.assigned_to == assigned_to)
+            query = query.where(Task.assigned_to == assigned_to)
+        if search:
+            search_filter = or_(
+                Task.title.ilike(f"%{search}%"), Task.description.ilike(f"%{search}%")
+            )
+            query = query.where(search_filter)
 
         # Apply pagination
         offset = (page - 1) * size
-        tasks = query.offset(offset).limit(size).all()
+        query = query.order_by(*SIBLING_ORDER).offset(offset).limit(size)
+        tasks = to_task_items(db.execute(query))
+
+        if fields is not None:
+            return [_fieldset_dict(task, fields) for task in tasks]
 
-        # Calculate subtask counts
         result = []
         for task in tasks:
-            subtask_count = db.query(Task).filter(Task.parent_task_id == task.id).count()
-
             task_dict = {
                 "id": task.id,
                 "project_id": task.project_id,
@@ -185,7 +235,7 @@ class QueryUtils:
                 "order_index": task.order_index,
                 "created_at": task.created_at.isoformat(),
                 "updated_at": task.updated_at.isoformat(),
-                "subtask_count": subtask_count,
+                "subtask_count": task.subtask_count,
             }
             result.append(task_dict)
 
@@ -200,72 +250,95 @@ class QueryUtils:
         search: Optional[str] = None,
         page: int = 1,
         size: int = 20,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get goals with calculated progress from linked projects"""
+        """
+        Get goals with calculated progress from linked projects.
 
-        # Base query
-        query = db.query(Goal)
+        ``fields`` narrows the result to a sparse fieldset; progress, subgoal
+        and linked project counts are only computed when requested.
+        """
+
+        def wanted(name: str) -> bool:
+            return fields is None or name in fields
+
+        # Base query over goal columns only
+        columns = [column for column in GOAL_LIST_COLUMNS if wanted(column.key)]
+        query = select(*columns)
 
         # Apply filters
         if parent_goal_id:
-            query = query.filter(Goal.parent_goal_id == parent_goal_id)
+            query = query.where(Goal.parent_goal_id == parent_goal_id)
         if goal_type:
-            query = query.filter(Goal.goal_type == goal_type)
+            query = query.where(Goal.goal_type == goal_type)
         if status:
-            query = query.filter(Goal.status == status)
+            query = query.where(Goal.status == status)
         if search:
             search_filter = or_(
                 Goal.title.ilike(f"%{search}%"), Goal.description.ilike(f"%{search}%")
             )
-            query = query.filter(search_filter)
+            query = query.where(search_filter)
 
         # Apply pagination
         offset = (page - 1) * size
-        goals = query.offset(offset).limit(size).all()
+        goals = db.execute(query.offset(offset).limit(size)).all()
 
         # Calculate progress from linked projects
         result = []
         for goal in goals:
-            # Get linked projects and their weights
-            project_links = db.query(GoalProject).filter(GoalProject.goal_id == goal.id).all()
-
-            if project_links:
-                # Calculate weighted progress
-                total_weight = sum(link.weight for link in project_links)
-                weighted_progress = 0.0
-
-                for link in project_links:
-                    project_progress = QueryUtils.get_project_completion_percentage(
-                        db, link.project_id
+            goal_dict = {key: _format_value(value) for key, value in goal._mapping.items()}
+
+            if wanted("progress_percentage") or wanted("linked_projects"):
+                # Get linked projects and their weights
+                project_links = db.query(GoalProject).filter(GoalProject.goal_id == goal.id).all()
+                goal_dict["linked_projects"] = len(project_links)
+
+            if wanted("progress_percentage"):
+                if project_links:
+                    # Calculate weighted progress
+                    total_weight = sum(link.weight for link in project_links)
+                    weighted_progress = 0.0
+
+                    for link in project_links:
+                        project_progress = QueryUtils.get_project_completion_percentage(
+                            db, link.project_id
+                        )
+                        weighted_progress += project_progress * float(link.weight)
+
+                    calculated_progress = (
+                        weighted_progress / float(total_weight) if total_weight > 0 else 0.0
                     )
-                    weighted_progress += project_progress * float(link.weight)
+                else:
+                    calculated_progress = float(goal.progress_percentage)
+                goal_dict["progress_percentage"] = round(calculated_progress, 1)
 
-                calculated_progress = (
-                    weighted_progress / float(total_weight) if total_weight > 0 else 0.0
+            if wanted("subgoal_count"):
+                goal_dict["subgoal_count"] = (
+                    db.query(Goal).filter(Goal.parent_goal_id == goal.id).count()
                 )
-            else:
-                calculated_progress = float(goal.progress_percentage)
-
-            subgoal_count = db.query(Goal).filter(Goal.parent_goal_id == goal.id).count()
-
-            goal_dict = {
-                "id": goal.id,
-                "parent_goal_id": goal.parent_goal_id,
-                "title": goal.title,
-                "description": goal.description,
-                "goal_type": goal.goal_type,
-                "target_date": goal.target_date.isoformat() if goal.target_date else None,
-                "status": goal.status,
-                "progress_percentage": round(calculated_progress, 1),
-                "created_at": goal.created_at.isoformat(),
-                "updated_at": goal.updated_at.isoformat(),
-                "subgoal_count": subgoal_count,
-                "linked_projects": len(project_links),
-            }
+
+            if fields is not None:
+                goal_dict = {name: goal_dict.get(name) for name in fields}
             result.append(goal_dict)
 
         return result
 
+    @staticmethod
+    def get_dependency_counts(db: Session, task_ids: Iterable[str]) -> Dict[str, int]:
+        """Number of dependencies per task, for a batch of tasks in one query"""
+        task_ids = list(task_ids)
+        if not task_ids:
+            return {}
+
+        rows = db.execute(
+            select(TaskDependency.task_id, func.count(TaskDependency.id))
+            .where(TaskDependency.task_id.in_(task_ids))
+            .group_by(TaskDependency.task_id)
+        ).all()
+        counts = dict.fromkeys(task_ids, 0)
+        counts.update({task_id: count for task_id, count in rows})
+        return counts
+
     @staticmethod
     def get_project_completion_percentage(db: Session, project_id: str) -> float:
         """Calculate project completion percentage"""
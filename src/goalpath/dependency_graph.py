@@ -0,0 +1,304 @@
+"""
+Task dependency graph for GoalPath
+Per-project adjacency arrays with cycle checks, transitive lookups and topological order
+"""
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .caching import MISSING, LRUCache, invalidate_on_commit
+from .models import Task, TaskDependency
+from .read_models import SIBLING_ORDER
+from .schemas import DependencyType, TaskStatus
+
+# Dependency types that order work; related_to links are informational only
+ORDERING_TYPES = (DependencyType.BLOCKS.value, DependencyType.SUBTASK_OF.value)
+
+# Statuses of a blocker that no longer hold up the tasks depending on it
+FINISHED_STATUSES = (TaskStatus.DONE.value, TaskStatus.CANCELLED.value)
+
+
+def _csr(count: int, edges: List[Tuple[int, int]]) -> Tuple[array, array]:
+    """Compressed adjacency arrays: targets of node i are targets[offsets[i]:offsets[i + 1]]"""
+    offsets = array("l", [0]) * (count + 1)
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for position in range(count):
+        offsets[position + 1] += offsets[position]
+
+    targets = array("l", [0]) * len(edges)
+    cursor = array("l", offsets)
+    for source, target in edges:
+        targets[cursor[source]] = target
+        cursor[source] += 1
+    return offsets, targets
+
+
+class DependencyGraph:
+    """
+    Immutable dependency graph of one project's tasks.
+
+    An edge task -> depends_on means depends_on blocks task. Both directions
+    are kept as compressed adjacency arrays over integer task positions, so
+    every traversal is O(V + E) without touching the database.
+    """
+
+    def __init__(self, task_ids: Iterable[str], edges: Iterable[Tuple[str, str]]):
+        self.task_ids: List[str] = list(task_ids)
+        self.index: Dict[str, int] = {task_id: i for i, task_id in enumerate(self.task_ids)}
+
+        forward = []
+        for task_id, depends_on_id in edges:
+            if task_id in self.index and depends_on_id in self.index:
+                forward.append((self.index[task_id], self.index[depends_on_id]))
+
+        count = len(self.task_ids)
+        self.edge_count = len(forward)
+        self._blocker_offsets, self._blockers = _csr(count, forward)
+        self._blockee_offsets, self._blockees = _csr(
+            count, [(target, source) for source, target in forward]
+        )
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    def _reach(self, start: int, offsets: array, targets: array) -> List[int]:
+        """Breadth-first walk from ``start``; returns reached positions in BFS order"""
+        seen = bytearray(len(self.task_ids))
+        seen[start] = 1
+        queue = deque([start])
+        reached = []
+        while queue:
+            node = queue.popleft()
+            for edge in range(offsets[node], offsets[node + 1]):
+                target = targets[edge]
+                if not seen[target]:
+                    seen[target] = 1
+                    reached.append(target)
+                    queue.append(target)
+        return reached
+
+    def direct_blockers(self, task_id: str) -> List[str]:
+        """Tasks ``task_id`` depends on directly"""
+        position = self.index.get(task_id)
+        if position is None:
+            return []
+        edges = range(self._blocker_offsets[position], self._blocker_offsets[position + 1])
+        return [self.task_ids[self._blockers[edge]] for edge in edges]
+
+    def direct_blockees(self, task_id: str) -> List[str]:
+        """Tasks depending directly on ``task_id``"""
+        position = self.index.get(task_id)
+        if position is None:
+            return []
+        edges = range(self._blockee_offsets[position], self._blockee_offsets[position + 1])
+        return [self.task_ids[self._blockees[edge]] for edge in edges]
+
+    def blockers(self, task_id: str) -> List[str]:
+        """Every task ``task_id`` transitively depends on, nearest first"""
+        if task_id not in self.index:
+            return []
+        reached = self._reach(self.index[task_id], self._blocker_offsets, self._blockers)
+        return [self.task_ids[position] for position in reached]
+
+    def blockees(self, task_id: str) -> List[str]:
+        """Every task that transitively depends on ``task_id``, nearest first"""
+        if task_id not in self.index:
+            return []
+        reached = self._reach(self.index[task_id], self._blockee_offsets, self._blockees)
+        return [self.task_ids[position] for position in reached]
+
+    def would_create_cycle(self, task_id: str, depends_on_id: str) -> bool:
+        """Whether adding task_id -> depends_on_id closes a cycle"""
+        if task_id == depends_on_id:
+            return True
+        if task_id not in self.index or depends_on_id not in self.index:
+            return False
+        # A cycle appears exactly when task_id already blocks depends_on_id
+        return task_id in self.blockers(depends_on_id)
+
+    def topological_positions(self) -> array:
+        """
+        Task positions with every blocker before the tasks it blocks (Kahn's algorithm).
+
+        Ties keep the order the tasks were loaded in. Raises ValueError when
+        the stored edges already contain a cycle.
+        """
+        count = len(self.task_ids)
+        pending = array(
+            "l",
+            (self._blocker_offsets[i + 1] - self._blocker_offsets[i] for i in range(count)),
+        )
+        queue = deque(position for position in range(count) if pending[position] == 0)
+        order = array("l")
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for edge in range(self._blockee_offsets[node], self._blockee_offsets[node + 1]):
+                target = self._blockees[edge]
+                pending[target] -= 1
+                if pending[target] == 0:
+                    queue.append(target)
+
+        if len(order) != count:
+            raise ValueError(
+                f"Dependency cycle among {count - len(order)} tasks; no topological order exists"
+            )
+        return order
+
+    def topological_order(self) -> List[str]:
+        """Task IDs in topological order; see topological_positions"""
+        return [self.task_ids[position] for position in self.topological_positions()]
+
+    def critical_path(self, durations: Sequence[float]) -> "CriticalPath":
+        """
+        Critical path method over the graph, ``durations`` indexed like task_ids.
+
+        One forward pass in topological order gives earliest start/finish,
+        one backward pass gives latest start/finish; both only walk the
+        adjacency arrays, so the cost is O(V + E).
+        """
+        order = self.topological_positions()
+        count = len(self.task_ids)
+        earliest_start = array("d", bytes(8 * count))
+        earliest_finish = array("d", bytes(8 * count))
+        predecessor = array("l", [-1]) * count
+
+        for node in order:
+            start = 0.0
+            for edge in range(self._blocker_offsets[node], self._blocker_offsets[node + 1]):
+                blocker = self._blockers[edge]
+                if predecessor[node] == -1 or earliest_finish[blocker] > start:
+                    start = earliest_finish[blocker]
+                    predecessor[node] = blocker
+            earliest_start[node] = start
+            earliest_finish[node] = start + durations[node]
+
+        duration = max(earliest_finish) if count else 0.0
+        latest_finish = array("d", [duration]) * count
+        latest_start = array("d", bytes(8 * count))
+        for node in reversed(order):
+            finish = latest_finish[node]
+            for edge in range(self._blockee_offsets[node], self._blockee_offsets[node + 1]):
+                finish = min(finish, latest_start[self._blockees[edge]])
+            latest_finish[node] = finish
+            latest_start[node] = finish - durations[node]
+
+        chain = []
+        if count:
+            node = max(range(count), key=earliest_finish.__getitem__)
+            while node != -1:
+                chain.append(node)
+                node = predecessor[node]
+            chain.reverse()
+
+        return CriticalPath(
+            duration=duration,
+            earliest_start=earliest_start,
+            earliest_finish=earliest_finish,
+            latest_start=latest_start,
+            latest_finish=latest_finish,
+            chain=chain,
+        )
+
+
+@dataclass
+class CriticalPath:
+    """CPM result; arrays are indexed like DependencyGraph.task_ids"""
+
+    duration: float
+    earliest_start: array
+    earliest_finish: array
+    latest_start: array
+    latest_finish: array
+    chain: List[int]
+
+    def slack(self, position: int) -> float:
+        return self.latest_start[position] - self.earliest_start[position]
+
+
+def graph_stamp(db: Session, project_id: str) -> Tuple[Any, ...]:
+    """
+    Cheap version stamp of a project's tasks and ordering edges.
+
+    Catches edge changes made by other processes, which the in-process
+    invalidation hooks below never see.
+    """
+    edges = (
+        select(func.count(), func.max(TaskDependency.created_at))
+        .join(Task, TaskDependency.task_id == Task.id)
+        .where(Task.project_id == project_id, TaskDependency.dependency_type.in_(ORDERING_TYPES))
+    )
+    tasks = select(func.count()).select_from(Task).where(Task.project_id == project_id)
+    return tuple(db.execute(select(edges.subquery(), tasks.scalar_subquery())).one())
+
+
+def load_graph(db: Session, project_id: str) -> DependencyGraph:
+    """Build a project's graph with two queries: its task IDs and its ordering edges"""
+    task_ids = db.execute(
+        select(Task.id).where(Task.project_id == project_id).order_by(*SIBLING_ORDER)
+    ).scalars()
+    edges = db.execute(
+        select(TaskDependency.task_id, TaskDependency.depends_on_task_id)
+        .join(Task, TaskDependency.task_id == Task.id)
+        .where(Task.project_id == project_id, TaskDependency.dependency_type.in_(ORDERING_TYPES))
+    ).all()
+    return DependencyGraph(task_ids, edges)
+
+
+class DependencyGraphCache(LRUCache):
+    """
+    Bounded per-project cache of dependency graphs.
+
+    Entries are dropped when a commit touches the dependencies of their tasks
+    or deletes one of them, and are also checked against graph_stamp so edges
+    written by other workers are noticed on the next read.
+    """
+
+    def __init__(self, max_projects: int = 256):
+        super().__init__(capacity=max_projects)
+
+    def get(self, db: Session, project_id: str) -> DependencyGraph:
+        """Cached graph for the project, rebuilt when its stamp has moved"""
+        stamp = graph_stamp(db, project_id)
+        entry = self.lookup(project_id, lambda entry: entry[0] == stamp)
+        if entry is not MISSING:
+            return entry[1]
+
+        graph = load_graph(db, project_id)
+        self.store(project_id, (stamp, graph))
+        return graph
+
+    def invalidate(self, *project_ids: Optional[str]) -> None:
+        """Drop the graphs of the given projects"""
+        self.discard(*project_ids)
+
+    def invalidate_tasks(self, *task_ids: str) -> None:
+        """Drop every cached graph containing any of the given tasks"""
+        task_ids = set(task_ids)
+        self.discard_where(lambda _, entry: not task_ids.isdisjoint(entry[1].index))
+
+
+# Global graph cache shared by all routes
+graph_cache = DependencyGraphCache()
+
+
+def _graph_tasks(obj: Any) -> Tuple[str, ...]:
+    if isinstance(obj, TaskDependency):
+        return (obj.task_id, obj.depends_on_task_id)
+    return (obj.id,)
+
+
+# Edge writes change a graph; of the task writes only deletes remove a node
+invalidate_on_commit(
+    (TaskDependency,),
+    _graph_tasks,
+    graph_cache.invalidate_tasks,
+    graph_cache.invalidate_all,
+    deletes=(Task,),
+)
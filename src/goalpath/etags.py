@@ -0,0 +1,179 @@
+"""
+Conditional GET support for GoalPath
+Weak ETags derived from a cheap data version stamp, with 304 short-circuiting
+"""
+
+import hashlib
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .database import get_db
+from .models.extended import DataVersion
+
+# Tables written in a session, bumped in data_versions when it commits
+_WRITTEN_TABLES_KEY = "goalpath_written_tables"
+_UPSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _written(session: Session) -> set:
+    return session.info.setdefault(_WRITTEN_TABLES_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written_tables(session: Session, flush_context: Any) -> None:
+    for objects in (session.new, session.dirty, session.deleted):
+        _written(session).update(type(obj).__table__.name for obj in objects)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_written_statements(orm_execute_state: Any) -> None:
+    state = orm_execute_state
+    if state.is_insert or state.is_update or state.is_delete:
+        _written(state.session).update(mapper.local_table.name for mapper in state.all_mappers)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_data_versions(session: Session) -> None:
+    # Flush first so the last pending changes are collected too
+    session.flush()
+    tables = session.info.pop(_WRITTEN_TABLES_KEY, set())
+    tables.discard(DataVersion.__tablename__)
+    if tables:
+        bump_data_versions(session, tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_tables(session: Session) -> None:
+    session.info.pop(_WRITTEN_TABLES_KEY, None)
+
+
+def bump_data_versions(db: Session, tables: Iterable[str]) -> None:
+    """
+    Count one more committed write against each of the given tables.
+
+    Runs in the writing transaction, so the new versions become visible
+    together with the data. Tables are bumped in name order so concurrent
+    writers lock the version rows in the same order.
+    """
+    table = DataVersion.__table__
+    upsert = _UPSERTS.get(db.get_bind().dialect.name)
+    for name in sorted(tables):
+        if upsert is not None:
+            db.execute(
+                upsert(table)
+                .values(table_name=name, version=1)
+                .on_conflict_do_update(
+                    index_elements=[table.c.table_name],
+                    set_={"version": table.c.version + 1},
+                )
+            )
+            continue
+        bumped = db.execute(
+            update(table).where(table.c.table_name == name).values(version=table.c.version + 1)
+        )
+        if not bumped.rowcount:
+            db.execute(insert(table).values(table_name=name, version=1))
+
+
+def data_version(db: Session, *models: Any) -> Tuple[Any, ...]:
+    """
+    Version stamp for the given tables, read from the database alone.
+
+    Per table this is the committed write version from data_versions plus
+    the row count and max(updated_at), which also catch writes made outside
+    a session. All values are fetched in a single statement. Tables without
+    an updated_at column contribute their version and row count only.
+    """
+    columns = []
+    for model in models:
+        columns.append(
+            select(DataVersion.version)
+            .where(DataVersion.table_name == model.__table__.name)
+            .scalar_subquery()
+        )
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        if hasattr(model, "updated_at"):
+            columns.append(select(func.max(model.updated_at)).scalar_subquery())
+
+    if not columns:
+        return ()
+    return tuple(db.execute(select(*columns)).one())
+
+
+def make_etag(request: Request, version: Any) -> str:
+    """
+    Build a weak ETag for a request and a version stamp.
+
+    The path, query string and HX-Request header are part of the tag so that
+    different filters and the HTML/JSON variants of a route never collide.
+    """
+    key = "|".join(
+        [
+            request.url.path,
+            str(sorted(request.query_params.multi_items())),
+            request.headers.get("HX-Request", ""),
+            repr(version),
+        ]
+    )
+    return 'W/"' + hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of an ETag against the request's If-None-Match header"""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return opaque(etag) in {opaque(tag) for tag in header.split(",")}
+
+
+class ConditionalETag:
+    """
+    Dependency that answers conditional GETs before the route does any work.
+
+    The ETag is built from the data_version stamp of the tables the route
+    reads. The stamp comes from the database only, so every replica hands out
+    the same ETag for the same data, and the write versions still change when
+    a write lands within the same second as the previous one. When
+    If-None-Match matches, a bodyless 304 is raised; otherwise the ETag is set
+    on the response and returned so routes that build their own Response can
+    attach it.
+
+    ``extra`` adds a non-database component to the stamp, for payloads that
+    also depend on e.g. the current date.
+    """
+
+    def __init__(self, *models: Any, extra: Optional[Callable[[], Any]] = None):
+        self.models = models
+        self.extra = extra
+
+    def __call__(self, request: Request, response: Response, db: Session = Depends(get_db)) -> str:
+        version = (data_version(db, *self.models),)
+        if self.extra is not None:
+            version += (self.extra(),)
+        etag = make_etag(request, version)
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "HX-Request"}
+
+        if etag_matches(request, etag):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+        return etag
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    """Attach conditional GET headers to a response built by the route"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["Vary"] = "HX-Request"
+    return response
@@ -0,0 +1,281 @@
+"""
+Change events for GoalPath
+In-process broadcast hub for Server-Sent Events with a pluggable fan-out backend
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from .models import Goal, Project, Task
+from .models.extended import DataVersion
+
+logger = logging.getLogger(__name__)
+
+# Entity name per model; only these tables produce change events
+TRACKED_MODELS = {Task: "task", Project: "project", Goal: "goal"}
+
+_PENDING_EVENTS_KEY = "goalpath_pending_events"
+
+# Seconds between data_versions reads of the polling backend
+VERSION_POLL_INTERVAL = 2.0
+
+
+class Subscription:
+    """A single subscriber's bounded event queue"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, topics: Optional[Set[str]], max_size: int):
+        self.loop = loop
+        self.topics = topics
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max_size)
+
+    def wants(self, message: Dict[str, Any]) -> bool:
+        return self.topics is None or message["entity"] in self.topics
+
+    def offer(self, message: Dict[str, Any]) -> None:
+        """Enqueue on the subscriber's loop, dropping the oldest event when full"""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+
+class EventHub:
+    """
+    Fans change events out to the SSE subscribers of this process.
+
+    Publishing never touches the database: subscribers receive small change
+    notifications and only re-fetch what they display, so idle tabs cost no
+    queries at all.
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, topics: Optional[Set[str]] = None) -> Subscription:
+        """Register a subscriber on the running event loop"""
+        subscription = Subscription(asyncio.get_running_loop(), topics, self.max_queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def deliver(self, message: Dict[str, Any]) -> int:
+        """Hand a message to every local subscriber; safe to call from any thread"""
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s.wants(message)]
+
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+            except RuntimeError:
+                # Subscriber's loop is closed; it will be unsubscribed on disconnect
+                self.unsubscribe(subscription)
+        return len(subscriptions)
+
+
+class BroadcastBackend(ABC):
+    """
+    Fan-out backend interface.
+
+    ``publish`` is called once per committed change. A multi-replica backend
+    (e.g. Redis pub/sub or Postgres LISTEN/NOTIFY) sends the message to every
+    replica and calls ``hub.deliver`` for each message it receives, including
+    its own.
+    """
+
+    def __init__(self, hub: EventHub):
+        self.hub = hub
+
+    @abstractmethod
+    def publish(self, message: Dict[str, Any]) -> None:
+        """Fan a committed change out to the subscribers of every replica"""
+
+
+class LocalBroadcastBackend(BroadcastBackend):
+    """Single-process backend: delivers straight to the local hub"""
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        self.hub.deliver(message)
+
+
+class DataVersionBroadcastBackend(LocalBroadcastBackend):
+    """
+    Multi-replica backend that needs nothing but the shared database.
+
+    Changes committed in this process are delivered at once. Every
+    ``interval`` seconds, while anyone is subscribed, the data_versions rows
+    of the tracked tables are read; a table whose version moved gets a
+    ``bulk`` event, followed by one dashboard event, so subscribers of every
+    replica hear about writes made on the others. A local write is announced
+    again by the next read; the re-fetch it triggers is answered by a 304.
+    """
+
+    def __init__(
+        self,
+        hub: EventHub,
+        session_factory: Callable[[], Session],
+        interval: float = VERSION_POLL_INTERVAL,
+    ):
+        super().__init__(hub)
+        self.session_factory = session_factory
+        self.interval = interval
+        self._versions: Optional[Dict[str, int]] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start polling on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """Cancel polling and wait for it to finish"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def run(self) -> None:
+        """Poll loop; failures are logged and retried on the next tick"""
+        while True:
+            await asyncio.sleep(self.interval)
+            if not self.hub.subscriber_count:
+                # Nobody to tell; start from fresh versions once someone subscribes
+                self._versions = None
+                continue
+            try:
+                await asyncio.to_thread(self.poll)
+            except Exception:
+                logger.exception("Change event poll failed")
+
+    def poll(self) -> int:
+        """Read the tracked tables' versions and deliver events for the ones that moved"""
+        tables = {model.__tablename__: entity for model, entity in TRACKED_MODELS.items()}
+        with self.session_factory() as db:
+            versions = dict(
+                db.execute(
+                    select(DataVersion.table_name, DataVersion.version).where(
+                        DataVersion.table_name.in_(tables)
+                    )
+                ).all()
+            )
+        previous, self._versions = self._versions, versions
+        if previous is None:
+            return 0
+        changed = sorted(name for name in versions if versions[name] != previous.get(name))
+        for name in changed:
+            self.hub.deliver({"entity": tables[name], "action": "bulk", "id": None})
+        if changed:
+            self.hub.deliver({"entity": "dashboard", "action": "changed", "id": None})
+        return len(changed)
+
+
+hub = EventHub()
+_backend: BroadcastBackend = LocalBroadcastBackend(hub)
+
+
+def get_backend() -> BroadcastBackend:
+    return _backend
+
+
+def set_backend(backend: BroadcastBackend) -> None:
+    """Swap the fan-out backend, e.g. for a shared broker across replicas"""
+    global _backend
+    _backend = backend
+
+
+def queue_event(
+    session: Session, entity: str, action: str, entity_id: Optional[str] = None, **data: Any
+) -> None:
+    """Publish a change event once ``session`` commits; dropped on rollback"""
+    message = {"entity": entity, "action": action, "id": entity_id}
+    message.update(data)
+    session.info.setdefault(_PENDING_EVENTS_KEY, []).append(message)
+
+
+def format_sse(message: Dict[str, Any]) -> str:
+    """Encode a change event as an SSE frame named after its entity"""
+    return f"event: {message['entity']}\ndata: {json.dumps(message, default=str)}\n\n"
+
+
+def _describe(instance: Any, action: str) -> Optional[Dict[str, Any]]:
+    entity = TRACKED_MODELS.get(type(instance))
+    if entity is None:
+        return None
+
+    message = {"entity": entity, "action": action, "id": instance.id}
+    if entity == "task":
+        message["project_id"] = instance.project_id
+    return message
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flush_events(session: Session, flush_context: Any) -> None:
+    pending: List[Dict[str, Any]] = session.info.setdefault(_PENDING_EVENTS_KEY, [])
+    for instances, action in (
+        (session.new, "created"),
+        (session.dirty, "updated"),
+        (session.deleted, "deleted"),
+    ):
+        for instance in instances:
+            if action == "updated" and not session.is_modified(instance):
+                continue
+            message = _describe(instance, action)
+            if message is not None:
+                pending.append(message)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_events(orm_execute_state: Any) -> None:
+    if not (
+        orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert
+    ):
+        return
+
+    mapper = orm_execute_state.bind_arguments.get("mapper")
+    entity = TRACKED_MODELS.get(mapper.class_) if mapper is not None else None
+    if entity is not None:
+        # Bulk statements do not expose row identities; announce the table
+        pending = orm_execute_state.session.info.setdefault(_PENDING_EVENTS_KEY, [])
+        pending.append({"entity": entity, "action": "bulk", "id": None})
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_events(session: Session) -> None:
+    pending = session.info.pop(_PENDING_EVENTS_KEY, None)
+    if not pending:
+        return
+
+    seen = set()
+    for message in pending:
+        key = (message["entity"], message["action"], message["id"])
+        if key in seen:
+            continue
+        seen.add(key)
+        _backend.publish(message)
+
+    # Stats depend on every tracked table; one dashboard event per commit
+    _backend.publish({"entity": "dashboard", "action": "changed", "id": None})
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(_PENDING_EVENTS_KEY, None)
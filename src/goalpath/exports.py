@@ -0,0 +1,156 @@
+"""
+Streaming exports for GoalPath
+Column-projected SELECTs read in fixed-size batches and encoded as NDJSON or CSV
+"""
+
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from sqlalchemy import Select, or_, select
+from sqlalchemy.orm import Session
+
+from .db_utils import GOAL_LIST_COLUMNS
+from .models import Goal, Project, Task
+from .read_models import PROJECT_LIST_COLUMNS, TASK_LIST_COLUMNS
+from .schemas import GoalFilters, ProjectFilters, TaskFilters
+from .serializers import dumps
+
+# Rows fetched per round trip; memory use is bounded by one batch, not the table
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _value(value: Any) -> Any:
+    """Plain value for a filter; enums are compared by their stored string"""
+    return getattr(value, "value", value)
+
+
+def task_export_select(filters: TaskFilters) -> Select:
+    """All task columns, filtered like the task list and in a stable order"""
+    statement = select(*TASK_LIST_COLUMNS, Task.description)
+    if filters.project_id:
+        statement = statement.where(Task.project_id == filters.project_id)
+    if filters.parent_task_id:
+        statement = statement.where(Task.parent_task_id == filters.parent_task_id)
+    if filters.status:
+        statement = statement.where(Task.status == _value(filters.status))
+    if filters.priority:
+        statement = statement.where(Task.priority == _value(filters.priority))
+    if filters.task_type:
+        statement = statement.where(Task.task_type == _value(filters.task_type))
+    if filters.assigned_to:
+        statement = statement.where(Task.assigned_to == filters.assigned_to)
+    if filters.search:
+        statement = statement.where(
+            or_(
+                Task.title.ilike(f"%{filters.search}%"),
+                Task.description.ilike(f"%{filters.search}%"),
+            )
+        )
+    return statement.order_by(Task.created_at, Task.id)
+
+
+def project_export_select(filters: ProjectFilters) -> Select:
+    """All project columns, filtered like the project list and in a stable order"""
+    statement = select(*PROJECT_LIST_COLUMNS, Project.description)
+    if filters.status:
+        statement = statement.where(Project.status == _value(filters.status))
+    if filters.priority:
+        statement = statement.where(Project.priority == _value(filters.priority))
+    if filters.search:
+        statement = statement.where(
+            or_(
+                Project.name.ilike(f"%{filters.search}%"),
+                Project.description.ilike(f"%{filters.search}%"),
+            )
+        )
+    return statement.order_by(Project.created_at, Project.id)
+
+
+def goal_export_select(filters: GoalFilters) -> Select:
+    """All goal columns, filtered like the goal list and in a stable order"""
+    statement = select(*GOAL_LIST_COLUMNS)
+    if filters.status:
+        statement = statement.where(Goal.status == _value(filters.status))
+    if filters.goal_type:
+        statement = statement.where(Goal.goal_type == _value(filters.goal_type))
+    if filters.parent_goal_id:
+        statement = statement.where(Goal.parent_goal_id == filters.parent_goal_id)
+    if filters.search:
+        statement = statement.where(
+            or_(
+                Goal.title.ilike(f"%{filters.search}%"),
+                Goal.description.ilike(f"%{filters.search}%"),
+            )
+        )
+    return statement.order_by(Goal.created_at, Goal.id)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _batches(db: Session, statement: Select, batch_size: int) -> Iterator[Sequence[Any]]:
+    """Result rows in batches, fetched from a streaming cursor"""
+    result = db.execute(statement, execution_options={"yield_per": batch_size})
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
+
+
+def stream_ndjson(
+    db: Session, statement: Select, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """One JSON object per line; one chunk is yielded per fetched batch"""
+    for rows in _batches(db, statement, batch_size):
+        yield b"".join(dumps(dict(row._mapping)) + b"\n" for row in rows)
+
+
+def stream_csv(
+    db: Session, statement: Select, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """A header row followed by one CSV row per record, chunked per fetched batch"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(column.key for column in statement.selected_columns)
+
+    for rows in _batches(db, statement, batch_size):
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header only, when nothing matched
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def stream_export(
+    session_factory: Callable[[], Session],
+    statement: Select,
+    export_format: str,
+    batch_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Encode ``statement``'s rows in ``export_format`` as they are fetched.
+
+    The body is iterated in a worker thread after the request's
+    dependencies have exited, so it reads through a session of its own from
+    ``session_factory``, which must not share a connection with request
+    sessions. The session is closed once the stream finishes.
+    """
+    encode = stream_csv if export_format == "csv" else stream_ndjson
+    with session_factory() as db:
+        yield from encode(db, statement, batch_size or EXPORT_BATCH_SIZE)
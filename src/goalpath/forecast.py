@@ -0,0 +1,196 @@
+"""
+Delivery forecasting for GoalPath projects
+Monte Carlo backlog completion from historical weekly throughput, vectorized with NumPy
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .caching import MISSING, LRUCache
+from .critical_path import estimates_stamp
+from .dependency_graph import FINISHED_STATUSES
+from .models import Project, Task
+
+# Simulated futures per forecast
+FORECAST_TRIALS = 10_000
+
+# Weeks of completed work sampled from
+HISTORY_WEEKS = 12
+
+# Trials still unfinished after this many weeks count as "no forecast"
+MAX_FORECAST_WEEKS = 520
+
+# Bounds on the weeks sampled per step for the trials still running
+MIN_BLOCK_WEEKS = 4
+MAX_BLOCK_WEEKS = 104
+
+PERCENTILES = (50, 85, 95)
+
+ONE_WEEK = np.timedelta64(7, "D")
+
+
+def weekly_throughput(db: Session, project_id: str, now: datetime, weeks: int) -> np.ndarray:
+    """
+    Tasks completed in each of the last ``weeks`` weeks, oldest first.
+
+    The last entry is the seven days up to ``now``. Served by
+    idx_tasks_project_completed.
+    """
+    since = now - timedelta(weeks=weeks)
+    completed = db.scalars(
+        select(Task.completed_date).where(
+            Task.project_id == project_id,
+            Task.status == "done",
+            Task.completed_date > since,
+            Task.completed_date <= now,
+        )
+    ).all()
+    ages = (np.datetime64(now) - np.array(completed, dtype="datetime64[us]")) // ONE_WEEK
+    counts = np.bincount(ages.astype(np.intp), minlength=weeks)[:weeks]
+    return counts[::-1]
+
+
+def remaining_backlog(db: Session, project_id: str) -> int:
+    """Tasks of the project that are neither done nor cancelled"""
+    return db.scalar(
+        select(func.count()).where(
+            Task.project_id == project_id, Task.status.not_in(FINISHED_STATUSES)
+        )
+    )
+
+
+def simulate_completion_weeks(
+    throughput: np.ndarray,
+    remaining: int,
+    trials: int = FORECAST_TRIALS,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Weeks each trial needs to finish ``remaining`` tasks.
+
+    Every trial draws its weekly throughput from the history with
+    replacement. Weeks are sampled in blocks, as one (trials, block) array
+    per step and only for the trials still running; each block is sized to
+    the average weeks those trials still need, so about half of them finish
+    per step and little is sampled past a trial's finish. Trials that do
+    not finish within MAX_FORECAST_WEEKS are reported as
+    MAX_FORECAST_WEEKS + 1.
+    """
+    if remaining <= 0:
+        return np.zeros(trials, dtype=np.int64)
+    weeks = np.full(trials, MAX_FORECAST_WEEKS + 1, dtype=np.int64)
+    if not throughput.any():
+        return weeks
+
+    rng = rng or np.random.default_rng()
+    history = throughput.astype(np.int32)
+    mean = float(history.mean())
+    done = np.zeros(trials, dtype=np.int32)
+    running = np.arange(trials)
+    elapsed = 0
+    while running.size and elapsed < MAX_FORECAST_WEEKS:
+        needed = int(np.ceil((remaining - done[running].mean()) / mean))
+        block = min(max(needed, MIN_BLOCK_WEEKS), MAX_BLOCK_WEEKS, MAX_FORECAST_WEEKS - elapsed)
+        draws = rng.integers(0, history.size, size=(running.size, block), dtype=np.intp)
+        totals = done[running, None] + history[draws].cumsum(axis=1, dtype=np.int32)
+        finished = totals[:, -1] >= remaining
+        crossing = np.argmax(totals[finished] >= remaining, axis=1)
+        weeks[running[finished]] = elapsed + crossing + 1
+        done[running] = totals[:, -1]
+        running = running[~finished]
+        elapsed += block
+    return weeks
+
+
+def build_forecast(
+    db: Session,
+    project: Project,
+    trials: int = FORECAST_TRIALS,
+    history_weeks: int = HISTORY_WEEKS,
+    now: Optional[datetime] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, Any]:
+    """
+    P50/P85/P95 completion dates for a project's open backlog.
+
+    The throughput history starts no earlier than the project's creation,
+    so a young project is not diluted by weeks it did not exist. A
+    percentile beyond MAX_FORECAST_WEEKS (or with no completed work to
+    sample) has no date.
+    """
+    now = now or datetime.utcnow()
+    if project.created_at:
+        age_weeks = (now - project.created_at) // timedelta(weeks=1) + 1
+        history_weeks = max(1, min(history_weeks, age_weeks))
+
+    throughput = weekly_throughput(db, project.id, now, history_weeks)
+    remaining = remaining_backlog(db, project.id)
+    weeks = simulate_completion_weeks(throughput, remaining, trials, rng)
+
+    forecasts = []
+    for percentile, value in zip(PERCENTILES, np.percentile(weeks, PERCENTILES, method="higher")):
+        value = int(value)
+        reachable = value <= MAX_FORECAST_WEEKS
+        forecasts.append(
+            {
+                "percentile": percentile,
+                "weeks": value if reachable else None,
+                "date": (now + timedelta(weeks=value)).date() if reachable else None,
+            }
+        )
+
+    return {
+        "project_id": project.id,
+        "remaining_tasks": remaining,
+        "trials": trials,
+        "history_weeks": history_weeks,
+        "throughput": throughput.tolist(),
+        "mean_throughput": round(float(throughput.mean()), 2),
+        "forecasts": forecasts,
+    }
+
+
+class ForecastCache(LRUCache):
+    """
+    Bounded cache of forecasts per (project, trials, history weeks).
+
+    An entry stays valid for the calendar day it was computed on while the
+    project's task rows are unchanged (estimates_stamp: count and latest
+    updated_at), so completing, adding or removing a task, which moves
+    either the throughput history or the backlog, triggers a new
+    simulation.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        super().__init__(capacity=max_entries)
+
+    def get(
+        self,
+        db: Session,
+        project: Project,
+        trials: int = FORECAST_TRIALS,
+        history_weeks: int = HISTORY_WEEKS,
+    ) -> Dict[str, Any]:
+        """Cached forecast, re-simulated when the project's tasks changed"""
+        stamp = estimates_stamp(db, project.id)
+        today = datetime.utcnow().date()
+        key = (project.id, trials, history_weeks)
+        entry = self.lookup(key, lambda entry: entry[0] == stamp and entry[1] == today)
+        if entry is not MISSING:
+            return entry[2]
+
+        report = build_forecast(db, project, trials, history_weeks)
+        self.store(key, (stamp, today, report))
+        return report
+
+    def invalidate(self, *project_ids: str) -> None:
+        """Drop the forecasts of the given projects"""
+        self.discard_where(lambda key, _: key[0] in project_ids)
+
+
+# Global forecast cache shared by all routes
+forecast_cache = ForecastCache()
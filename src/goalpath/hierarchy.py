@@ -0,0 +1,91 @@
+"""
+Set-based hierarchy operations for GoalPath
+Recursive-CTE subtree lookups, cascade deletes and child promotion for tasks and goals
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import delete, literal, select, update
+from sqlalchemy.orm import Session
+
+from .bulk_operations import chunked
+from .models import Goal, Task
+
+# Parent column of each self-referencing hierarchy
+PARENT_COLUMNS = {Task: Task.parent_task_id, Goal: Goal.parent_goal_id}
+
+# Rows per DELETE statement when removing a subtree
+DELETE_BATCH_SIZE = 500
+
+# Recursion guard; validated hierarchies never come close
+MAX_TREE_DEPTH = 100_000
+
+
+def subtree_ids(db: Session, model: Any, root_id: str, include_root: bool = True) -> List[str]:
+    """
+    IDs of ``root_id`` and all its descendants, deepest first, in one query.
+
+    Deleting in this order removes children before their parents, so the
+    ON DELETE SET NULL action on the parent column never has work to do.
+    """
+    parent_column = PARENT_COLUMNS[model]
+    tree = (
+        select(model.id.label("id"), literal(0).label("depth"))
+        .where(model.id == root_id)
+        .cte("subtree", recursive=True)
+    )
+    children = select(model.id, tree.c.depth + 1).where(
+        parent_column == tree.c.id, tree.c.depth < MAX_TREE_DEPTH
+    )
+    tree = tree.union_all(children)
+
+    statement = select(tree.c.id).order_by(tree.c.depth.desc())
+    if not include_root:
+        statement = statement.where(tree.c.depth > 0)
+    return list(db.execute(statement).scalars())
+
+
+def delete_subtree(
+    db: Session, model: Any, root_id: str, batch_size: int = DELETE_BATCH_SIZE
+) -> int:
+    """
+    Delete a node and every descendant; returns the number of rows deleted.
+
+    Rows are removed deepest-first in DELETE statements of ``batch_size``
+    IDs. Dependent rows (dependencies, comments, goal links, ...) go through
+    the database's ON DELETE CASCADE. The caller commits.
+    """
+    ids = subtree_ids(db, model, root_id)
+    for chunk in chunked(ids, batch_size):
+        db.execute(
+            delete(model).where(model.id.in_(chunk)).execution_options(synchronize_session=False)
+        )
+    return len(ids)
+
+
+def promote_children(db: Session, model: Any, node_id: str, new_parent_id: Optional[str]) -> int:
+    """Move the direct children of ``node_id`` under ``new_parent_id`` in one UPDATE"""
+    parent_column = PARENT_COLUMNS[model]
+    result = db.execute(
+        update(model)
+        .where(parent_column == node_id)
+        .values({parent_column.key: new_parent_id, "updated_at": datetime.utcnow()})
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def delete_node(db: Session, model: Any, node: Any, cascade: bool) -> int:
+    """
+    Delete ``node``, either with its whole subtree or promoting its children
+    to its own parent. Returns the number of descendants deleted or promoted.
+    """
+    if cascade:
+        return delete_subtree(db, model, node.id) - 1
+
+    promoted = promote_children(db, model, node.id, getattr(node, PARENT_COLUMNS[model].key))
+    db.execute(
+        delete(model).where(model.id == node.id).execution_options(synchronize_session=False)
+    )
+    return promoted
@@ -3,16 +3,16 @@ HTMX Utilities for GoalPath
 Helper functions for HTMX request detection and response handling
 """
 
-from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple, Union
 
 from fastapi import Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
+from sqlalchemy import inspect
 
-# Get templates directory
-templates_dir = Path(__file__).parent / "templates"
-templates = Jinja2Templates(directory=templates_dir)
+from .caching import MISSING, LRUCache, invalidate_on_commit
+from .models import Project, Task
+from .templating import templates
 
 
 def is_htmx_request(request: Request) -> bool:
@@ -180,6 +180,153 @@ def render_fragment(template_name: str, context: Dict[str, Any], request: Reques
     return templates.get_template(template_name).render(context)
 
 
+class FragmentCache(LRUCache):
+    """
+    Bounded LRU cache of rendered HTML fragments.
+
+    Entries are keyed by template name plus a version tuple built from the
+    `updated_at` values (and any derived values) of the entities the fragment
+    shows, so a changed entity simply misses. Each entry also carries tags
+    (usually entity IDs); committed task and project writes drop the entries
+    tagged with their IDs, which also covers writes within updated_at's
+    resolution. The bound is on the total size of the cached HTML.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        super().__init__(capacity=max_bytes)
+        self.max_bytes = max_bytes
+        self._tags: Dict[str, Set[Tuple[str, Hashable]]] = {}
+
+    def get(self, template_name: str, version: Hashable) -> Optional[str]:
+        """Return cached HTML for the key, or None on a miss"""
+        entry = self.lookup((template_name, version))
+        return None if entry is MISSING else entry[0]
+
+    def put(
+        self, template_name: str, version: Hashable, html: str, tags: Iterable[str] = ()
+    ) -> None:
+        """Store rendered HTML, evicting least recently used entries past the size bound"""
+        key = (template_name, version)
+        tag_set = set(tags)
+        with self._lock:
+            self.store(key, (html, tag_set))
+            if key in self._entries:
+                for tag in tag_set:
+                    self._tags.setdefault(tag, set()).add(key)
+
+    def invalidate(self, *tags: Optional[str]) -> int:
+        """Drop every entry carrying any of the given tags; returns the number removed"""
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                if tag is not None:
+                    keys.update(self._tags.get(tag, ()))
+            return self.discard(*keys)
+
+    def invalidate_all(self) -> None:
+        """Drop every entry, keeping the metrics"""
+        with self._lock:
+            super().invalidate_all()
+            self._tags.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit-rate metrics"""
+        with self._lock:
+            return {**super().stats(), "size_bytes": self._size, "max_bytes": self.max_bytes}
+
+    def _weigh(self, entry: Tuple[str, Set[str]]) -> int:
+        return len(entry[0])
+
+    def _on_remove(self, key: Tuple[str, Hashable], entry: Tuple[str, Set[str]]) -> None:
+        for tag in entry[1]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+# Global fragment cache shared by all HTMX routes
+fragment_cache = FragmentCache()
+
+# Tag carried by fragments that summarise all entities (dashboard stats)
+DASHBOARD_TAG = "dashboard"
+
+
+def _fragment_tags(obj: Any) -> Tuple[Optional[str], ...]:
+    # Fragment versions carry updated_at, which only has one-second resolution
+    # for rows stamped by the database, so any committed write drops its cards
+    if isinstance(obj, Task):
+        previous = inspect(obj).attrs.project_id.history.deleted
+        return (obj.id, obj.project_id, DASHBOARD_TAG, *previous)
+    return (obj.id, DASHBOARD_TAG)
+
+
+invalidate_on_commit(
+    (Task, Project), _fragment_tags, fragment_cache.invalidate, fragment_cache.invalidate_all
+)
+
+
+def render_cached_fragment(
+    template_name: str,
+    context: Dict[str, Any],
+    request: Request,
+    version: Hashable,
+    tags: Iterable[str] = (),
+) -> Markup:
+    """
+    Render a fragment through the fragment cache.
+
+    `version` must change whenever the rendered output would change; the
+    template is only rendered on a cache miss.
+    """
+    html = fragment_cache.get(template_name, version)
+    if html is None:
+        html = render_fragment(template_name, dict(context), request)
+        fragment_cache.put(template_name, version, html, tags)
+    return Markup(html)
+
+
+def task_fragment_version(task: Any) -> Tuple[Any, ...]:
+    """Version tuple for a task card: the task and the project name it displays"""
+    project = task.project if task.project_id else None
+    return (
+        task.id,
+        task.updated_at,
+        project.id if project else None,
+        project.updated_at if project else None,
+    )
+
+
+def render_task_item(task: Any, request: Request, oob: bool = False) -> Markup:
+    """Render (or reuse) the task_item.html card for an ORM task, optionally as an OOB swap"""
+    return render_cached_fragment(
+        "fragments/task_item.html",
+        {"task": task, "oob": oob},
+        request,
+        version=(*task_fragment_version(task), oob),
+        tags=(task.id, task.project_id),
+    )
+
+
+def render_project_card(project: Dict[str, Any], request: Request) -> Markup:
+    """Render (or reuse) the project_card.html card for a QueryUtils project dict"""
+    # Task counts are part of the card, so they belong in the version with updated_at
+    version = (
+        project["id"],
+        project["updated_at"],
+        project["total_tasks"],
+        project["completed_tasks"],
+    )
+    return render_cached_fragment(
+        "fragments/project_card.html",
+        {"project": project},
+        request,
+        version=version,
+        tags=(project["id"],),
+    )
+
+
 class HTMXDepends:
     """
     FastAPI dependency for HTMX request validation.
@@ -0,0 +1,889 @@
+"""
+Bulk import for GoalPath
+Chunked CSV/NDJSON parsing, enum validation and batched upserts for tracker migrations
+"""
+
+import codecs
+import csv
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
+
+import orjson
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from .bulk_operations import (
+    chunked,
+    closes_parent_cycle,
+    fetch_existing_ids,
+    fetch_task_refs,
+    next_order_indexes,
+)
+from .dependency_graph import ORDERING_TYPES
+from .models import Goal, GoalProject, Project, Task, TaskDependency, generate_uuid
+from .ordering import ORDER_GAP
+from .schemas import (
+    DependencyType,
+    ImportReport,
+    ImportRowError,
+    Priority,
+    ProjectStatus,
+    TaskPriority,
+    TaskStatus,
+    TaskType,
+)
+
+IMPORT_BATCH_SIZE = 1000
+READ_CHUNK_SIZE = 64 * 1024
+MAX_REPORTED_ERRORS = 100
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+
+class RowError(ValueError):
+    """A source record that cannot be imported"""
+
+
+# Field converters: raw CSV/JSON value -> column value; empty values become None
+
+
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _text(max_length: Optional[int] = None) -> Callable[[Any], Optional[str]]:
+    def convert(value: Any) -> Optional[str]:
+        text = str(value).strip()
+        if max_length is not None and len(text) > max_length:
+            raise RowError(f"longer than {max_length} characters")
+        return text
+
+    return convert
+
+
+def _choice(enum: Type[Any]) -> Callable[[Any], str]:
+    allowed = {member.value for member in enum}
+
+    def convert(value: Any) -> str:
+        text = str(value).strip().lower()
+        if text not in allowed:
+            raise RowError(f"'{value}' is not one of {', '.join(sorted(allowed))}")
+        return text
+
+    return convert
+
+
+def _integer(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise RowError(f"'{value}' is not an integer") from None
+
+
+def _decimal(value: Any) -> Decimal:
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        raise RowError(f"'{value}' is not a number") from None
+
+
+def _date(value: Any) -> date:
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        raise RowError(f"'{value}' is not an ISO date") from None
+
+
+def _datetime(value: Any) -> datetime:
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        raise RowError(f"'{value}' is not an ISO datetime") from None
+
+
+# name -> (converter, required, default)
+FieldSpec = Dict[str, Tuple[Callable[[Any], Any], bool, Any]]
+
+PROJECT_FIELDS: FieldSpec = {
+    "id": (_text(), False, None),
+    "name": (_text(255), True, None),
+    "description": (_text(), False, None),
+    "status": (_choice(ProjectStatus), False, ProjectStatus.ACTIVE.value),
+    "priority": (_choice(Priority), False, Priority.MEDIUM.value),
+    "start_date": (_date, False, None),
+    "target_end_date": (_date, False, None),
+    "actual_end_date": (_date, False, None),
+    "created_by": (_text(100), False, "system"),
+}
+
+TASK_FIELDS: FieldSpec = {
+    "id": (_text(), False, None),
+    "project_id": (_text(), True, None),
+    "parent_task_id": (_text(), False, None),
+    "title": (_text(255), True, None),
+    "description": (_text(), False, None),
+    "task_type": (_choice(TaskType), False, TaskType.TASK.value),
+    "status": (_choice(TaskStatus), False, TaskStatus.BACKLOG.value),
+    "priority": (_choice(TaskPriority), False, TaskPriority.MEDIUM.value),
+    "story_points": (_integer, False, None),
+    "estimated_hours": (_decimal, False, None),
+    "actual_hours": (_decimal, False, None),
+    "start_date": (_date, False, None),
+    "due_date": (_date, False, None),
+    "completed_date": (_datetime, False, None),
+    "assigned_to": (_text(100), False, None),
+    "created_by": (_text(100), False, "system"),
+    "order_index": (_integer, False, None),
+}
+
+TASK_DEPENDENCY_FIELDS: FieldSpec = {
+    "task_id": (_text(), True, None),
+    "depends_on_task_id": (_text(), True, None),
+    "dependency_type": (_choice(DependencyType), False, DependencyType.BLOCKS.value),
+}
+
+GOAL_PROJECT_FIELDS: FieldSpec = {
+    "goal_id": (_text(), True, None),
+    "project_id": (_text(), True, None),
+    "weight": (_decimal, False, Decimal("1.00")),
+}
+
+
+def _not_before(later: str, earlier: str) -> Callable[[Dict[str, Any]], bool]:
+    return lambda row: row[later] is None or row[earlier] is None or row[later] >= row[earlier]
+
+
+def _at_least(name: str, minimum: Any, inclusive: bool = True) -> Callable[[Dict[str, Any]], bool]:
+    if inclusive:
+        return lambda row: row[name] is None or row[name] >= minimum
+    return lambda row: row[name] is None or row[name] > minimum
+
+
+# Row-level rules mirroring the table CHECK constraints, so one bad record
+# is rejected on its own instead of failing the whole batch statement
+ROW_CHECKS: Dict[str, List[Tuple[Callable[[Dict[str, Any]], bool], str]]] = {
+    "projects": [
+        (_not_before("target_end_date", "start_date"), "target_end_date is before start_date"),
+        (_not_before("actual_end_date", "start_date"), "actual_end_date is before start_date"),
+    ],
+    "tasks": [
+        (_not_before("due_date", "start_date"), "due_date is before start_date"),
+        (_at_least("story_points", 0, inclusive=False), "story_points must be positive"),
+        (_at_least("estimated_hours", 0), "estimated_hours cannot be negative"),
+        (_at_least("actual_hours", 0), "actual_hours cannot be negative"),
+    ],
+    "task_dependencies": [],
+    "goal_projects": [
+        (_at_least("weight", 0, inclusive=False), "weight must be greater than 0"),
+        (lambda row: row["weight"] <= 1, "weight cannot be greater than 1"),
+    ],
+}
+
+IMPORT_ENTITIES: Dict[str, FieldSpec] = {
+    "projects": PROJECT_FIELDS,
+    "tasks": TASK_FIELDS,
+    "task_dependencies": TASK_DEPENDENCY_FIELDS,
+    "goal_projects": GOAL_PROJECT_FIELDS,
+}
+
+
+def convert_record(record: Dict[str, Any], entity: str) -> Dict[str, Any]:
+    """Validate one source record for ``entity``; unknown keys are ignored"""
+    spec = IMPORT_ENTITIES[entity]
+    row = {}
+    for name, (convert, required, default) in spec.items():
+        value = record.get(name)
+        if _blank(value):
+            if required:
+                raise RowError(f"{name} is required")
+            row[name] = default
+            continue
+        try:
+            row[name] = convert(value)
+        except RowError as e:
+            raise RowError(f"{name}: {e}") from None
+
+    for check, message in ROW_CHECKS[entity]:
+        if not check(row):
+            raise RowError(message)
+    return row
+
+
+# Incremental parsers: feed raw bytes, get back complete records
+
+
+class NDJSONParser:
+    """One JSON object per line; malformed lines come back as RowError instances"""
+
+    def __init__(self):
+        self._buffer = b""
+
+    def feed(self, chunk: bytes) -> Iterator[Any]:
+        lines = (self._buffer + chunk).split(b"\n")
+        self._buffer = lines.pop()
+        for line in lines:
+            yield from self._parse(line)
+
+    def close(self) -> Iterator[Any]:
+        line, self._buffer = self._buffer, b""
+        yield from self._parse(line)
+
+    @staticmethod
+    def _parse(line: bytes) -> Iterator[Any]:
+        if not line.strip():
+            return
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield RowError(f"Invalid JSON: {e}")
+            return
+        if not isinstance(record, dict):
+            yield RowError("Each line must be a JSON object")
+            return
+        yield record
+
+
+class CSVParser:
+    """
+    CSV with a header row, parsed as complete records arrive.
+
+    A line ends a record only when the quotes seen so far are balanced, so
+    quoted values spanning lines and chunk boundaries are kept together.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._pending: List[str] = []
+        self._quotes = 0
+        self._header: Optional[List[str]] = None
+
+    def feed(self, chunk: bytes) -> Iterator[Any]:
+        lines = (self._buffer + self._decoder.decode(chunk)).split("\n")
+        self._buffer = lines.pop()
+        complete = []
+        for line in lines:
+            self._pending.append(line + "\n")
+            self._quotes += line.count('"')
+            if self._quotes % 2 == 0:
+                complete.extend(self._pending)
+                self._pending = []
+                self._quotes = 0
+        yield from self._rows(complete)
+
+    def close(self) -> Iterator[Any]:
+        tail = self._buffer + self._decoder.decode(b"", final=True)
+        lines, self._pending, self._buffer = self._pending + [tail], [], ""
+        yield from self._rows(lines)
+
+    def _rows(self, lines: List[str]) -> Iterator[Any]:
+        for values in csv.reader(lines):
+            if not values or values == [""]:
+                continue
+            if self._header is None:
+                self._header = [name.strip() for name in values]
+                continue
+            if len(values) != len(self._header):
+                yield RowError(f"Expected {len(self._header)} columns, got {len(values)}")
+                continue
+            yield dict(zip(self._header, values))
+
+
+def make_parser(import_format: str) -> Any:
+    if import_format == "csv":
+        return CSVParser()
+    if import_format == "ndjson":
+        return NDJSONParser()
+    raise ValueError(f"Unsupported import format: {import_format}")
+
+
+def read_records(stream: Any, import_format: str) -> Iterator[Any]:
+    """Records from a binary file object, read in fixed-size chunks"""
+    parser = make_parser(import_format)
+    while True:
+        chunk = stream.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+class ImportCheckpoint:
+    """
+    Progress of a resumable import, stored as JSON next to the source.
+
+    ``rows`` counts source records covered by committed batches; a resumed
+    run skips them. Task parent links that pointed forward in the file are
+    kept until the run that resolves them finishes.
+    """
+
+    def __init__(self, path: str, entity: str):
+        self.path = path
+        self.entity = entity
+        self.rows = 0
+        self.deferred_parents: List[Tuple[int, str, str]] = []
+
+    def load(self) -> "ImportCheckpoint":
+        if not os.path.exists(self.path):
+            return self
+        with open(self.path, encoding="utf-8") as handle:
+            state = json.load(handle)
+        if state.get("entity") != self.entity:
+            raise ValueError(
+                f"Checkpoint {self.path} belongs to a {state.get('entity')} import, "
+                f"not {self.entity}"
+            )
+        self.rows = state.get("rows", 0)
+        self.deferred_parents = [tuple(item) for item in state.get("deferred_parents", [])]
+        return self
+
+    def save(self) -> None:
+        state = {
+            "entity": self.entity,
+            "rows": self.rows,
+            "deferred_parents": self.deferred_parents,
+        }
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(state, handle)
+        os.replace(temporary, self.path)
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def upsert_statement(
+    db: Session, model: Any, conflict_columns: Iterable[str], update_columns: Iterable[str]
+) -> Any:
+    """INSERT ... ON CONFLICT DO UPDATE for the session's dialect"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Upsert is not supported on {dialect}")
+
+    # Core table insert: one executemany per batch, instead of the ORM bulk
+    # path which splits rows into groups by their None-valued keys
+    statement = insert(model.__table__)
+    return statement.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_={name: statement.excluded[name] for name in update_columns},
+    )
+
+
+class BulkImporter:
+    """
+    Push records in, get an ImportReport out.
+
+    Records are validated as they arrive and written in batches of
+    ``batch_size``; each batch is one upsert statement and one commit,
+    after which the checkpoint (if any) is advanced. Project and task
+    references are resolved through in-memory ID maps that fall back to one
+    set-based lookup per batch for IDs not seen yet. Projects are matched by
+    name as well as ID, so re-running an import updates instead of failing
+    on the unique name. Parent links and blocking dependencies that would
+    close a cycle are rejected.
+
+    Without a checkpoint, the records skipped on resume are still parsed
+    for their parent links: a link that pointed forward past the point
+    where the earlier run stopped was never written, and is restored with
+    the other forward links at the end.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        entity: str,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        skip: int = 0,
+        checkpoint: Optional[ImportCheckpoint] = None,
+        on_batch: Optional[Callable[[ImportReport], None]] = None,
+    ):
+        if entity not in IMPORT_ENTITIES:
+            raise ValueError(f"Unknown import entity: {entity}")
+
+        self.db = db
+        self.entity = entity
+        self.batch_size = batch_size
+        self.checkpoint = checkpoint
+        self.on_batch = on_batch
+
+        self.skip = max(skip, checkpoint.rows if checkpoint else 0)
+        self.deferred_parents: List[Tuple[int, str, str]] = (
+            list(checkpoint.deferred_parents) if checkpoint else []
+        )
+        # Parent links of skipped records (the task ID is None when the source had
+        # none) and the row of each skipped task ID
+        self._skipped_parents: List[Tuple[int, Optional[str], str]] = []
+        self._skipped_rows: Dict[str, int] = {}
+
+        self.report = ImportReport(entity=entity, skipped=self.skip, committed_rows=self.skip)
+        self._row_number = 0
+        self._batch: List[Tuple[int, Dict[str, Any]]] = []
+        self._started = time.perf_counter()
+
+        # source ID -> database ID
+        self.project_ids: Dict[str, str] = {}
+        self.project_names: Dict[str, str] = {}
+        self.task_ids: Dict[str, str] = {}
+        self.goal_ids: Dict[str, str] = {}
+        # task ID -> project ID, for the same-project check on parent links
+        self._task_projects: Dict[str, str] = {}
+        self._order_maxima: Dict[Tuple[str, Optional[str]], int] = {}
+        self._ordered_projects: set = set()
+        # Parents written by this run, for the cycle checks ahead of the stored ones
+        self._parents: Dict[str, Optional[str]] = {}
+        # Blocking edges (task -> the tasks it depends on), loaded with the first batch
+        self._blockers: Optional[Dict[str, Set[str]]] = None
+        if entity in ("projects", "tasks", "goal_projects"):
+            self.project_names = dict(db.execute(select(Project.name, Project.id)).all())
+
+    # Public API
+
+    def add(self, record: Any) -> None:
+        self._row_number += 1
+        if self._row_number <= self.skip:
+            if self.entity == "tasks" and self.checkpoint is None:
+                self._note_skipped_parent(record)
+            return
+
+        self.report.processed += 1
+        if isinstance(record, RowError):
+            self._fail(self._row_number, str(record))
+        else:
+            try:
+                self._batch.append((self._row_number, convert_record(record, self.entity)))
+            except RowError as e:
+                self._fail(self._row_number, str(e))
+
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def add_all(self, records: Iterable[Any]) -> "BulkImporter":
+        for record in records:
+            self.add(record)
+        return self
+
+    def flush(self) -> None:
+        """Write the pending batch, commit, and advance the checkpoint"""
+        batch, self._batch = self._batch, []
+        if batch:
+            writer = getattr(self, f"_write_{self.entity}")
+            self.report.imported += writer(batch)
+            self.db.commit()
+
+        self.report.committed_rows = self._row_number
+        if self.checkpoint is not None:
+            self.checkpoint.rows = self._row_number
+            self.checkpoint.deferred_parents = self.deferred_parents
+            self.checkpoint.save()
+        self._update_timing()
+        if self.on_batch is not None:
+            self.on_batch(self.report)
+
+    def finish(self) -> ImportReport:
+        """Flush the last batch, resolve forward parent links and return the report"""
+        self.flush()
+        if self.deferred_parents or self._skipped_parents:
+            self._resolve_deferred_parents()
+            self.db.commit()
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+        self._update_timing()
+        return self.report
+
+    # Bookkeeping
+
+    def _fail(self, row: int, error: str) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < MAX_REPORTED_ERRORS:
+            self.report.errors.append(ImportRowError(row=row, error=error))
+
+    def _update_timing(self) -> None:
+        elapsed = time.perf_counter() - self._started
+        self.report.elapsed_seconds = round(elapsed, 3)
+        self.report.rows_per_second = round(self.report.processed / elapsed, 1) if elapsed else 0.0
+
+    def _lookup(self, cache: Dict[str, str], column: Any, refs: Iterable[Optional[str]]) -> None:
+        """Load references missing from ``cache`` with one chunked lookup"""
+        missing = {ref for ref in refs if ref and ref not in cache}
+        for found in fetch_existing_ids(self.db, column, missing):
+            cache[found] = found
+
+    def _lookup_tasks(self, refs: Iterable[Optional[str]]) -> None:
+        """Load referenced tasks missing from task_ids, with their projects"""
+        missing = {ref for ref in refs if ref and ref not in self.task_ids}
+        for task_id, ref in fetch_task_refs(self.db, missing).items():
+            self.task_ids[task_id] = task_id
+            self._task_projects[task_id] = ref.project_id
+
+    def _project_id(self, ref: str) -> Optional[str]:
+        return self.project_ids.get(ref) or self.project_names.get(ref)
+
+    def _note_skipped_parent(self, record: Any) -> None:
+        if isinstance(record, RowError):
+            return
+        try:
+            row = convert_record(record, self.entity)
+        except RowError:
+            return
+        if row["id"]:
+            self._skipped_rows.setdefault(row["id"], self._row_number)
+        if row["parent_task_id"]:
+            self._skipped_parents.append((self._row_number, row["id"], row["parent_task_id"]))
+
+    def _closes_dependency_cycle(self, task_id: str, depends_on_id: str) -> bool:
+        """Whether task_id already blocks depends_on_id, through stored or imported edges"""
+        if self._blockers is None:
+            self._blockers = {}
+            edges = self.db.execute(
+                select(TaskDependency.task_id, TaskDependency.depends_on_task_id).where(
+                    TaskDependency.dependency_type.in_(ORDERING_TYPES)
+                )
+            )
+            for source, target in edges:
+                self._blockers.setdefault(source, set()).add(target)
+
+        stack, seen = [depends_on_id], {depends_on_id}
+        while stack:
+            for blocker in self._blockers.get(stack.pop(), ()):
+                if blocker == task_id:
+                    return True
+                if blocker not in seen:
+                    seen.add(blocker)
+                    stack.append(blocker)
+        return False
+
+    # Writers: each returns the number of rows written
+
+    def _write_projects(self, batch: List[Tuple[int, Dict[str, Any]]]) -> int:
+        now = datetime.utcnow()
+        self._lookup(self.project_ids, Project.id, (row["id"] for _, row in batch))
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        for _, row in batch:
+            source_id = row["id"]
+            target_id = (
+                self.project_names.get(row["name"])
+                or (source_id and self.project_ids.get(source_id))
+                or source_id
+                or generate_uuid()
+            )
+            if source_id:
+                self.project_ids[source_id] = target_id
+            self.project_ids[target_id] = target_id
+            self.project_names[row["name"]] = target_id
+            rows[target_id] = {**row, "id": target_id, "created_at": now, "updated_at": now}
+
+        columns = [name for name in PROJECT_FIELDS if name != "id"] + ["updated_at"]
+        self.db.execute(upsert_statement(self.db, Project, ["id"], columns), list(rows.values()))
+        return len(batch)
+
+    def _write_tasks(self, batch: List[Tuple[int, Dict[str, Any]]]) -> int:
+        now = datetime.utcnow()
+        self._lookup(
+            self.project_ids,
+            Project.id,
+            (row["project_id"] for _, row in batch if row["project_id"] not in self.project_names),
+        )
+        self._lookup_tasks(
+            [row["id"] for _, row in batch] + [row["parent_task_id"] for _, row in batch]
+        )
+
+        accepted = []
+        for row_number, row in batch:
+            project_id = self._project_id(row["project_id"])
+            if project_id is None:
+                self._fail(row_number, f"Project {row['project_id']} not found")
+                continue
+            task_id = row["id"] or generate_uuid()
+            parent_ref = row["parent_task_id"]
+            if parent_ref == task_id:
+                self._fail(row_number, "A task cannot be its own parent")
+                continue
+
+            parent_id = self.task_ids.get(parent_ref) if parent_ref else None
+            if parent_id is not None and self._task_projects.get(parent_id) != project_id:
+                self._fail(row_number, "Parent task must be in the same project")
+                continue
+            if parent_id is not None and closes_parent_cycle(
+                self.db, task_id, parent_id, self._parents, {}
+            ):
+                self._fail(row_number, f"Parent task {parent_ref} would create a cycle")
+                continue
+            if parent_ref and parent_id is None:
+                # The parent may appear later in the source; link it at the end
+                self.deferred_parents.append((row_number, task_id, parent_ref))
+
+            self.task_ids[task_id] = task_id
+            self._task_projects[task_id] = project_id
+            self._parents[task_id] = parent_id
+            completed_date = row["completed_date"]
+            if row["status"] == TaskStatus.DONE.value and completed_date is None:
+                completed_date = now
+            accepted.append(
+                {
+                    **row,
+                    "id": task_id,
+                    "project_id": project_id,
+                    "parent_task_id": parent_id,
+                    "completed_date": completed_date,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+
+        # Sibling maxima are loaded once per project and then kept up to date here
+        new_projects = {row["project_id"] for row in accepted} - self._ordered_projects
+        if new_projects:
+            self._order_maxima.update(
+                next_order_indexes(self.db, [(project_id, None) for project_id in new_projects])
+            )
+            self._ordered_projects |= new_projects
+        maxima = self._order_maxima
+        for row in accepted:
+            key = (row["project_id"], row["parent_task_id"])
+            if row["order_index"] is None:
+                maxima[key] = maxima.get(key, 0) + ORDER_GAP
+                row["order_index"] = maxima[key]
+            else:
+                maxima[key] = max(maxima.get(key, 0), row["order_index"])
+
+        if accepted:
+            columns = [name for name in TASK_FIELDS if name != "id"] + ["updated_at"]
+            self.db.execute(upsert_statement(self.db, Task, ["id"], columns), accepted)
+        return len(accepted)
+
+    def _write_task_dependencies(self, batch: List[Tuple[int, Dict[str, Any]]]) -> int:
+        now = datetime.utcnow()
+        self._lookup(
+            self.task_ids,
+            Task.id,
+            [row["task_id"] for _, row in batch] + [row["depends_on_task_id"] for _, row in batch],
+        )
+
+        accepted: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for row_number, row in batch:
+            task_id = self.task_ids.get(row["task_id"])
+            depends_on_id = self.task_ids.get(row["depends_on_task_id"])
+            if task_id is None or depends_on_id is None:
+                missing = row["task_id"] if task_id is None else row["depends_on_task_id"]
+                self._fail(row_number, f"Task {missing} not found")
+                continue
+            if task_id == depends_on_id:
+                self._fail(row_number, "A task cannot depend on itself")
+                continue
+            if row["dependency_type"] in ORDERING_TYPES:
+                if self._closes_dependency_cycle(task_id, depends_on_id):
+                    self._fail(
+                        row_number,
+                        f"Dependency would create a cycle: task {row['depends_on_task_id']} "
+                        f"already depends on task {row['task_id']}",
+                    )
+                    continue
+                self._blockers.setdefault(task_id, set()).add(depends_on_id)
+            accepted[(task_id, depends_on_id)] = {
+                "id": generate_uuid(),
+                "task_id": task_id,
+                "depends_on_task_id": depends_on_id,
+                "dependency_type": row["dependency_type"],
+                "created_at": now,
+            }
+
+        if accepted:
+            statement = upsert_statement(
+                self.db, TaskDependency, ["task_id", "depends_on_task_id"], ["dependency_type"]
+            )
+            self.db.execute(statement, list(accepted.values()))
+        return len(accepted)
+
+    def _write_goal_projects(self, batch: List[Tuple[int, Dict[str, Any]]]) -> int:
+        self._lookup(self.goal_ids, Goal.id, (row["goal_id"] for _, row in batch))
+        self._lookup(
+            self.project_ids,
+            Project.id,
+            (row["project_id"] for _, row in batch if row["project_id"] not in self.project_names),
+        )
+
+        accepted: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for row_number, row in batch:
+            goal_id = self.goal_ids.get(row["goal_id"])
+            project_id = self._project_id(row["project_id"])
+            if goal_id is None:
+                self._fail(row_number, f"Goal {row['goal_id']} not found")
+                continue
+            if project_id is None:
+                self._fail(row_number, f"Project {row['project_id']} not found")
+                continue
+            accepted[(goal_id, project_id)] = {
+                "goal_id": goal_id,
+                "project_id": project_id,
+                "weight": row["weight"],
+            }
+
+        if accepted:
+            statement = upsert_statement(
+                self.db, GoalProject, ["goal_id", "project_id"], ["weight"]
+            )
+            self.db.execute(statement, list(accepted.values()))
+        return len(accepted)
+
+    def _resolve_deferred_parents(self) -> None:
+        """Link tasks whose parent appeared later in the source, in batched updates"""
+        deferred, self.deferred_parents = self.deferred_parents, []
+        skipped, self._skipped_parents = self._skipped_parents, []
+        self._lookup_tasks(
+            [ref for _, task_id, parent_ref in deferred + skipped for ref in (task_id, parent_ref)]
+        )
+
+        # A skipped record's link was lost only if its task still has no parent
+        unlinked: Set[str] = set()
+        for chunk in chunked([task_id for _, task_id, _ in skipped if task_id]):
+            unlinked.update(
+                self.db.scalars(
+                    select(Task.id).where(Task.id.in_(chunk), Task.parent_task_id.is_(None))
+                )
+            )
+        for row_number, task_id, parent_ref in skipped:
+            if task_id in unlinked:
+                deferred.append((row_number, task_id, parent_ref))
+            elif task_id is None and (
+                self._skipped_rows.get(parent_ref, 0) > row_number
+                or self.task_ids.get(parent_ref) in self._parents
+            ):
+                # The parent came later in the source, so the link was deferred and lost
+                self._fail(
+                    row_number,
+                    f"Parent task {parent_ref} cannot be linked after resuming a task "
+                    "without an id; imported without a parent",
+                )
+
+        params = []
+        for row_number, task_id, parent_ref in sorted(deferred):
+            parent_id = self.task_ids.get(parent_ref)
+            if parent_id is None:
+                self._fail(
+                    row_number, f"Parent task {parent_ref} not found; imported without a parent"
+                )
+                continue
+            if self._task_projects.get(parent_id) != self._task_projects.get(task_id):
+                self._fail(
+                    row_number,
+                    "Parent task must be in the same project; imported without a parent",
+                )
+                continue
+            if closes_parent_cycle(self.db, task_id, parent_id, self._parents, {}):
+                self._fail(
+                    row_number,
+                    f"Parent task {parent_ref} would create a cycle; imported without a parent",
+                )
+                continue
+            self._parents[task_id] = parent_id
+            params.append({"id": task_id, "parent_task_id": parent_id})
+
+        for chunk in chunked(params):
+            self.db.execute(update(Task), list(chunk))
+
+
+def import_file(
+    db: Session,
+    entity: str,
+    stream: Any,
+    import_format: str,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    checkpoint: Optional[ImportCheckpoint] = None,
+    on_batch: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """Import every record of a binary file object"""
+    importer = BulkImporter(
+        db, entity, batch_size=batch_size, checkpoint=checkpoint, on_batch=on_batch
+    )
+    try:
+        importer.add_all(read_records(stream, import_format))
+        return importer.finish()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def _infer_format(path: str) -> str:
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
+
+
+def main():
+    """Command-line entry point: goalpath-import ENTITY FILE"""
+    import argparse
+
+    from .database import db_manager
+
+    parser = argparse.ArgumentParser(description="GoalPath Bulk Import")
+    parser.add_argument("entity", choices=sorted(IMPORT_ENTITIES), help="Table to import into")
+    parser.add_argument("path", help="CSV or NDJSON file, or - for stdin")
+    parser.add_argument(
+        "--format", choices=IMPORT_FORMATS, help="Source format (default: from the extension)"
+    )
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Rows per commit")
+    parser.add_argument(
+        "--checkpoint",
+        help="Checkpoint file for resuming an interrupted import "
+        "(default: FILE.checkpoint; ignored for stdin)",
+    )
+    args = parser.parse_args()
+
+    import_format = args.format or _infer_format(args.path)
+    checkpoint = None
+    if args.path != "-":
+        checkpoint = ImportCheckpoint(
+            args.checkpoint or f"{args.path}.checkpoint", args.entity
+        ).load()
+        if checkpoint.rows:
+            print(f"↻ Resuming after {checkpoint.rows} records")
+
+    def progress(report: ImportReport) -> None:
+        print(
+            f"  {report.committed_rows} records committed "
+            f"({report.rows_per_second:.0f} rows/s, {report.failed} failed)"
+        )
+
+    with db_manager.get_sync_session() as session:
+        if args.path == "-":
+            report = import_file(
+                session,
+                args.entity,
+                sys.stdin.buffer,
+                import_format,
+                args.batch_size,
+                on_batch=progress,
+            )
+        else:
+            with open(args.path, "rb") as stream:
+                report = import_file(
+                    session,
+                    args.entity,
+                    stream,
+                    import_format,
+                    args.batch_size,
+                    checkpoint=checkpoint,
+                    on_batch=progress,
+                )
+
+    print(
+        f"✅ Imported {report.imported} {args.entity} in {report.elapsed_seconds:.1f}s "
+        f"({report.rows_per_second:.0f} rows/s)"
+    )
+    for error in report.errors:
+        print(f"❌ Row {error.row}: {error.error}")
+    if report.failed > len(report.errors):
+        print(f"   ... and {report.failed - len(report.errors)} more rejected rows")
+
+
+if __name__ == "__main__":
+    main()
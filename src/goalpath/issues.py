@@ -0,0 +1,196 @@
+"""
+Issue triage for GoalPath
+Keyset-paginated issue listing, bulk promotion of issues to tasks and triage counters
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, func, insert, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from .bulk_operations import chunked, next_order_indexes
+from .models import Task, generate_uuid
+from .models.extended import Issue
+from .ordering import ORDER_GAP
+from .read_models import KeysetCursor, encode_cursor
+from .schemas import IssuePromotion, IssuePromoteResponse, TaskStatus
+
+ISSUE_PAGE_SIZE = 50
+
+# Task type for each issue type; the priorities share their names
+PROMOTED_TASK_TYPES = {
+    "bug": "bug",
+    "feature": "story",
+    "enhancement": "task",
+    "question": "task",
+}
+
+
+def issue_page_select(
+    project_id: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    issue_type: Optional[str] = None,
+    assignee: Optional[str] = None,
+    promoted: Optional[bool] = None,
+    after: Optional[KeysetCursor] = None,
+    limit: int = ISSUE_PAGE_SIZE,
+) -> Select:
+    """
+    One keyset page of issues, newest first.
+
+    Pages continue strictly after ``after`` in (created_at, id) order, so
+    every page is a single index range (idx_issues_created,
+    idx_issues_project_created, or idx_issues_triage for a project's queue
+    by status) however deep the listing goes. One extra row is selected to tell whether a next page
+    exists.
+    """
+    statement = select(Issue)
+    if project_id:
+        statement = statement.where(Issue.project_id == project_id)
+    if status:
+        statement = statement.where(Issue.status == status)
+    if priority:
+        statement = statement.where(Issue.priority == priority)
+    if issue_type:
+        statement = statement.where(Issue.issue_type == issue_type)
+    if assignee:
+        statement = statement.where(Issue.assignee == assignee)
+    if promoted is not None:
+        column = Issue.promoted_to_task_id
+        statement = statement.where(column.is_not(None) if promoted else column.is_(None))
+    if after is not None:
+        statement = statement.where(tuple_(Issue.created_at, Issue.id) < tuple_(*after))
+    return statement.order_by(Issue.created_at.desc(), Issue.id.desc()).limit(limit + 1)
+
+
+def load_issue_page(
+    db: Session, limit: int = ISSUE_PAGE_SIZE, **filters: Any
+) -> Tuple[List[Issue], Optional[str]]:
+    """Issues of one page and the cursor of the next (None on the last page)"""
+    issues = db.scalars(issue_page_select(limit=limit, **filters)).all()
+    if len(issues) <= limit:
+        return list(issues), None
+    last = issues[limit - 1]
+    return list(issues[:limit]), encode_cursor(last.created_at, last.id)
+
+
+def load_issues(db: Session, issue_ids: Sequence[str]) -> Dict[str, Issue]:
+    """id -> Issue for the given IDs, looked up in chunks"""
+    found: Dict[str, Issue] = {}
+    for chunk in chunked(list(dict.fromkeys(issue_ids))):
+        issues = db.scalars(select(Issue).where(Issue.id.in_(chunk)))
+        found.update((issue.id, issue) for issue in issues)
+    return found
+
+
+def promote_issues(
+    db: Session, issues: Sequence[Issue], status: TaskStatus = TaskStatus.BACKLOG
+) -> IssuePromoteResponse:
+    """
+    Create one task per unpromoted issue and back-link it, in one transaction.
+
+    Tasks go to the end of their project's top level, one multi-row INSERT
+    for all of them, and the issues are updated with one executemany
+    UPDATE; issues still in triage move to the backlog. Issues that
+    already have a task are skipped. The caller commits.
+    """
+    now = datetime.utcnow()
+    pending = [issue for issue in issues if issue.promoted_to_task_id is None]
+    order_maxima = next_order_indexes(db, [(issue.project_id, None) for issue in pending])
+
+    task_rows = []
+    issue_params = []
+    for issue in pending:
+        key = (issue.project_id, None)
+        order_maxima[key] = order_maxima.get(key, 0) + ORDER_GAP
+        task_id = generate_uuid()
+        task_rows.append(
+            {
+                "id": task_id,
+                "project_id": issue.project_id,
+                "title": issue.title,
+                "description": issue.description,
+                "task_type": PROMOTED_TASK_TYPES.get(issue.issue_type, "task"),
+                "status": status.value,
+                "priority": issue.priority,
+                "assigned_to": issue.assignee,
+                "created_by": issue.reporter,
+                "order_index": order_maxima[key],
+                "created_at": now,
+                "updated_at": now,
+                "completed_date": now if status is TaskStatus.DONE else None,
+            }
+        )
+        issue_params.append(
+            {
+                "id": issue.id,
+                "promoted_to_task_id": task_id,
+                "status": "backlog" if issue.status == "triage" else issue.status,
+                "updated_at": now,
+            }
+        )
+
+    if task_rows:
+        db.execute(insert(Task), task_rows)
+        db.execute(update(Issue), issue_params)
+
+    return IssuePromoteResponse(
+        promoted=[
+            IssuePromotion(issue_id=params["id"], task_id=params["promoted_to_task_id"])
+            for params in issue_params
+        ],
+        skipped=[issue.id for issue in issues if issue.promoted_to_task_id is not None],
+    )
+
+
+def triage_counters(db: Session, project_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Dashboard counters: issues per status, how many were promoted, and the
+    triage queue by priority and type with its unassigned count.
+
+    Three small grouped queries, each over a narrow index range: status
+    totals are counted from idx_issues_status (idx_issues_triage within a
+    project) without touching rows, and only triage rows are read for the
+    breakdown.
+    """
+
+    def scoped(statement: Select) -> Select:
+        return statement.where(Issue.project_id == project_id) if project_id else statement
+
+    by_status = dict(
+        db.execute(scoped(select(Issue.status, func.count()).group_by(Issue.status))).all()
+    )
+    promoted = db.scalar(scoped(select(func.count()).where(Issue.promoted_to_task_id.is_not(None))))
+    unassigned = Issue.assignee.is_(None)
+    triage_rows = db.execute(
+        scoped(
+            select(Issue.priority, Issue.issue_type, unassigned, func.count())
+            .where(Issue.status == "triage")
+            .group_by(Issue.priority, Issue.issue_type, unassigned)
+        )
+    )
+
+    by_priority: Counter = Counter()
+    by_type: Counter = Counter()
+    unassigned_count = 0
+    for priority, issue_type, is_unassigned, count in triage_rows:
+        by_priority[priority] += count
+        by_type[issue_type] += count
+        if is_unassigned:
+            unassigned_count += count
+
+    return {
+        "project_id": project_id,
+        "total": sum(by_status.values()),
+        "promoted": promoted,
+        "by_status": by_status,
+        "triage": {
+            "total": by_status.get("triage", 0),
+            "unassigned": unassigned_count,
+            "by_priority": dict(by_priority),
+            "by_type": dict(by_type),
+        },
+    }
@@ -3,7 +3,7 @@ GoalPath FastAPI Application
 Enhanced main application with HTMX frontend support
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import uvicorn
@@ -11,17 +11,43 @@ from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from .database import get_db, init_database
+from .comments import activity_page, comment_count_cache
+from .database import db_manager, get_db, init_database
+from .etags import ConditionalETag, with_etag
+from .events import DataVersionBroadcastBackend, hub, set_backend
+from .htmx_utils import DASHBOARD_TAG, fragment_cache, render_cached_fragment
 from .models import Goal, GoalProject, Project, Task
+from .read_models import (
+    dashboard_counts,
+    fetch_recent_projects,
+    fetch_task_items,
+    task_list_select,
+    to_task_items,
+)
 # Import extended models to ensure they are registered
 from .models.extended import Issue, Reminder, TaskComment, TaskAttachment, ProjectContext, ScheduleEvent  # noqa: F401
-from .routers import goals_router, projects_router, tasks_router
+from .routers import (
+    batch_router,
+    calendar_router,
+    comments_router,
+    events_router,
+    export_router,
+    goals_router,
+    import_router,
+    issues_router,
+    projects_router,
+    reminders_router,
+    sprints_router,
+    tasks_router,
+    timeline_router,
+)
 from .routers.htmx_projects import router as htmx_projects_router
 from .routers.htmx_tasks import router as htmx_tasks_router
+from .recurrence import next_reminder_trigger
+from .reminders import ReminderScheduler, scheduler_enabled
+from .templating import templates, templates_dir, warm_up_templates
 
 # Create FastAPI application
 app = FastAPI(
@@ -34,19 +60,27 @@ app = FastAPI(
 
 # Setup static files and templates
 static_dir = Path(__file__).parent / "static"
-templates_dir = Path(__file__).parent / "templates"
 
 # Create directories if they don't exist
 static_dir.mkdir(exist_ok=True)
 templates_dir.mkdir(exist_ok=True)
 
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
-templates = Jinja2Templates(directory=templates_dir)
 
 # Include API routers
 app.include_router(projects_router)
 app.include_router(tasks_router)
 app.include_router(goals_router)
+app.include_router(events_router)
+app.include_router(export_router)
+app.include_router(import_router)
+app.include_router(batch_router)
+app.include_router(timeline_router)
+app.include_router(calendar_router)
+app.include_router(sprints_router)
+app.include_router(issues_router)
+app.include_router(comments_router)
+app.include_router(reminders_router)
 
 # Include HTMX routers
 app.include_router(htmx_projects_router)
@@ -63,15 +97,45 @@ app.add_middleware(
 )
 
 
+# Fires due reminders in the background while the app runs. Its database work
+# runs in worker threads, so it gets sessions that never share a request's connection.
+reminder_scheduler = ReminderScheduler(
+    db_manager.get_dedicated_session_factory(), next_trigger=next_reminder_trigger
+)
+
+# Tells this replica's SSE subscribers about writes committed on the others
+change_events = DataVersionBroadcastBackend(hub, db_manager.get_dedicated_session_factory())
+set_backend(change_events)
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
+    """Initialize database, precompile templates and start the background tasks"""
     try:
         init_database()
         print("✅ Database initialized successfully")
     except Exception as e:
         print(f"❌ Database initialization failed: {e}")
 
+    try:
+        template_count = warm_up_templates()
+        print(f"✅ Precompiled {template_count} templates")
+    except Exception as e:
+        print(f"❌ Template precompilation failed: {e}")
+
+    change_events.start()
+
+    if scheduler_enabled():
+        reminder_scheduler.start()
+        print("✅ Reminder scheduler started")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks"""
+    await reminder_scheduler.stop()
+    await change_events.stop()
+
 
 # Helper function to detect HTMX requests
 def is_htmx_request(request: Request) -> bool:
@@ -84,33 +148,23 @@ def is_htmx_request(request: Request) -> bool:
 async def dashboard(request: Request, db: Session = Depends(get_db)):
     """Enhanced dashboard view with real-time stats"""
 
-    # Get dashboard data
-    projects = db.query(Project).order_by(Project.updated_at.desc()).limit(10).all()
-    recent_tasks = db.query(Task).order_by(Task.updated_at.desc()).limit(15).all()
+    # Get dashboard data as column-projected rows
+    projects = fetch_recent_projects(db, limit=10)
+    recent_tasks = fetch_task_items(db, limit=15)
     active_goals = db.query(Goal).filter(Goal.status == "active").limit(6).all()
 
-    # Calculate enhanced statistics
-    total_projects = db.query(Project).count()
-    total_tasks = db.query(Task).count()
-    completed_tasks = db.query(Task).filter(Task.status == "done").count()
-
-    # Calculate this week's completed tasks
-    from datetime import timedelta
-
+    # Calculate enhanced statistics in one aggregate query
     week_start = date.today() - timedelta(days=date.today().weekday())
-    tasks_completed_this_week = (
-        db.query(Task)
-        .filter(Task.status == "done", func.date(Task.updated_at) >= week_start)
-        .count()
-    )
+    stats = dashboard_counts(db, week_start)
 
     # Get today's tasks (tasks due today or overdue)
     today = date.today()
-    todays_tasks = (
-        db.query(Task)
-        .filter(Task.due_date <= today, Task.status.in_(["todo", "in_progress"]))
-        .limit(5)
-        .all()
+    todays_tasks = to_task_items(
+        db.execute(
+            task_list_select()
+            .where(Task.due_date <= today, Task.status.in_(["todo", "in_progress"]))
+            .limit(5)
+        )
     )
 
     context = {
@@ -119,15 +173,7 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
         "recent_tasks": recent_tasks,
         "active_goals": active_goals,
         "todays_tasks": todays_tasks,
-        "stats": {
-            "total_projects": total_projects,
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "completion_rate": round(
-                (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0, 1
-            ),
-            "tasks_completed_this_week": tasks_completed_this_week,
-        },
+        "stats": stats,
     }
 
     # Return content fragment for HTMX requests, full page otherwise
@@ -195,23 +241,16 @@ async def edit_task_modal(task_id: str, request: Request, db: Session = Depends(
 
 # Enhanced API endpoints for dashboard
 @app.get("/api/dashboard/stats")
-async def get_dashboard_stats(request: Request, db: Session = Depends(get_db)):
+async def get_dashboard_stats(
+    request: Request,
+    db: Session = Depends(get_db),
+    etag: str = Depends(ConditionalETag(Project, Task, Goal, extra=date.today)),
+):
     """Get real-time dashboard statistics"""
 
-    # Calculate current stats
-    total_projects = db.query(Project).count()
-    total_tasks = db.query(Task).count()
-    completed_tasks = db.query(Task).filter(Task.status == "done").count()
-
-    # Calculate this week's stats
-    from datetime import timedelta
-
+    # Calculate current and this week's stats in one aggregate query
     week_start = date.today() - timedelta(days=date.today().weekday())
-    tasks_completed_this_week = (
-        db.query(Task)
-        .filter(Task.status == "done", func.date(Task.updated_at) >= week_start)
-        .count()
-    )
+    stats = dashboard_counts(db, week_start)
 
     # Get active goals for progress calculation
     active_goals = db.query(Goal).filter(Goal.status == "active").all()
@@ -219,31 +258,25 @@ async def get_dashboard_stats(request: Request, db: Session = Depends(get_db)):
     context = {
         "request": request,
         "active_goals": active_goals,
-        "stats": {
-            "total_projects": total_projects,
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "completion_rate": round(
-                (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0, 1
-            ),
-            "tasks_completed_this_week": tasks_completed_this_week,
-        },
+        "stats": stats,
     }
 
     # Return HTML fragment for HTMX requests, JSON for API calls
     if is_htmx_request(request):
-        return templates.TemplateResponse("fragments/dashboard_stats.html", context)
+        version = (
+            tuple(sorted(context["stats"].items())),
+            tuple((goal.id, goal.updated_at, goal.progress_percentage) for goal in active_goals),
+        )
+        html = render_cached_fragment(
+            "fragments/dashboard_stats.html",
+            context,
+            request,
+            version=version,
+            tags=(DASHBOARD_TAG,),
+        )
+        return with_etag(HTMLResponse(content=html), etag)
     else:
-        return {
-            "total_projects": total_projects,
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "completion_rate": round(
-                (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0, 1
-            ),
-            "tasks_completed_this_week": tasks_completed_this_week,
-            "updated_at": datetime.now().isoformat(),
-        }
+        return {**stats, "updated_at": datetime.now().isoformat()}
 
 
 # Projects page
@@ -386,6 +419,9 @@ async def task_detail(task_id: str, request: Request, db: Session = Depends(get_
             .all()
         )
 
+    # First page of the activity feed; older entries load through HTMX
+    activity, activity_cursor = activity_page(db, task_id)
+
     context = {
         "request": request,
         "task": task,
@@ -393,6 +429,9 @@ async def task_detail(task_id: str, request: Request, db: Session = Depends(get_
         "subtasks": subtasks,
         "parent_task": parent_task,
         "related_tasks": related_tasks,
+        "activity": activity,
+        "activity_cursor": activity_cursor,
+        "comment_count": comment_count_cache.get(db, task_id),
         "subtask_count": len(subtasks),
         "completion_stats": {
             "total_subtasks": len(subtasks),
@@ -516,6 +555,13 @@ async def health_check():
     return {"status": "healthy", "app": "goalpath", "version": "0.2.0"}
 
 
+# Fragment cache metrics
+@app.get("/api/cache/fragments")
+async def fragment_cache_stats():
+    """Rendered HTMX fragment cache size and hit-rate metrics"""
+    return fragment_cache.stats()
+
+
 # Quick task endpoint for dashboard
 @app.post("/api/quick-task")
 async def create_quick_task(request: Request, db: Session = Depends(get_db)):
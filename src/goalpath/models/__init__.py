@@ -12,6 +12,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -184,6 +185,15 @@ class Task(Base):
             "estimated_hours IS NULL OR estimated_hours >= 0", name="chk_estimated_hours"
         ),
         CheckConstraint("actual_hours IS NULL OR actual_hours >= 0", name="chk_actual_hours"),
+        # Serves ordered sibling listing and the neighbour lookups of task moves
+        Index("idx_tasks_sibling_order", "project_id", "parent_task_id", "order_index"),
+        # Serves subtree CTE joins and the ON DELETE SET NULL check on parent_task_id
+        Index("idx_tasks_parent_task_id", "parent_task_id"),
+        # Date-window overlap queries (timeline): range on due_date, filter on start_date
+        Index("idx_tasks_timeline", "due_date", "start_date"),
+        Index("idx_tasks_project_timeline", "project_id", "due_date", "start_date"),
+        # Weekly throughput history (forecasting): range on completed_date per project
+        Index("idx_tasks_project_completed", "project_id", "completed_date"),
     )
 
 
@@ -211,6 +221,7 @@ class TaskDependency(Base):
         ),
         CheckConstraint("task_id != depends_on_task_id", name="chk_no_self_dependency"),
         UniqueConstraint("task_id", "depends_on_task_id", name="uq_task_dependency"),
+        Index("idx_task_dependencies_depends_on", "depends_on_task_id"),
     )
 
 
@@ -248,6 +259,7 @@ class Goal(Base):
             "progress_percentage >= 0 AND progress_percentage <= 100",
             name="chk_progress_percentage",
         ),
+        Index("idx_goals_parent_goal_id", "parent_goal_id"),
     )
 
 
@@ -293,6 +305,7 @@ class Sprint(Base):
             "status IN ('planning', 'active', 'completed', 'cancelled')", name="chk_sprint_status"
         ),
         CheckConstraint("end_date > start_date", name="chk_sprint_dates"),
+        Index("idx_sprints_timeline", "end_date", "start_date"),
     )
 
 
@@ -3,12 +3,16 @@ Additional SQLAlchemy models for GoalPath - Part 2
 Reminders, Issues, Comments, Context, and other supporting entities
 """
 
+from datetime import datetime
+
 from sqlalchemy import (
     BigInteger,
     CheckConstraint,
     Column,
     DateTime,
     ForeignKey,
+    Index,
+    Integer,
     String,
     Text,
     UniqueConstraint,
@@ -33,8 +37,14 @@ class Reminder(Base):
     trigger_datetime = Column(DateTime, nullable=False)
     view_after = Column(DateTime)
     recurrence_pattern = Column(Text)  # JSON string for SQLite compatibility
+    # Occurrence a snoozed reminder was due at; its series continues from here
+    recurrence_anchor = Column(DateTime)
     status = Column(String(20), nullable=False, default="pending")
     acknowledged_at = Column(DateTime)
+    fired_at = Column(DateTime)
+    # Scheduler lease: the replica firing this reminder and when its claim lapses
+    leased_by = Column(String(100))
+    lease_expires_at = Column(DateTime)
     created_at = Column(DateTime, nullable=False, default=func.now())
 
     # Relationships
@@ -45,13 +55,15 @@ class Reminder(Base):
     __table_args__ = (
         CheckConstraint("reminder_type IN ('one_time', 'recurring')", name="chk_reminder_type"),
         CheckConstraint(
-            "status IN ('pending', 'acknowledged', 'snoozed', 'cancelled')",
+            "status IN ('pending', 'fired', 'acknowledged', 'snoozed', 'cancelled')",
             name="chk_reminder_status",
         ),
         CheckConstraint(
             "(task_id IS NOT NULL AND project_id IS NULL) OR (task_id IS NULL AND project_id IS NOT NULL)",
             name="chk_reminder_relation",
         ),
+        # Due-queue scans: one ordered range per status, keyset on (trigger_datetime, id)
+        Index("idx_reminders_due", "status", "trigger_datetime", "id"),
     )
 
 
@@ -70,7 +82,8 @@ class Issue(Base):
     reporter = Column(String(100), nullable=False)
     assignee = Column(String(100))
     promoted_to_task_id = Column(String, ForeignKey("tasks.id", ondelete="SET NULL"))
-    created_at = Column(DateTime, nullable=False, default=func.now())
+    # Stamped in Python: keyset cursors need microseconds, func.now() stores whole seconds
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
 
     # Relationships
@@ -89,6 +102,14 @@ class Issue(Base):
             "status IN ('triage', 'backlog', 'in_progress', 'resolved', 'closed')",
             name="chk_issue_status",
         ),
+        Index("idx_issues_status", "status"),
+        Index("idx_issues_priority", "priority"),
+        Index("idx_issues_assignee", "assignee"),
+        Index("idx_issues_promoted_task", "promoted_to_task_id"),
+        # Keyset pages, newest first: (created_at, id) overall, per project and per triage queue
+        Index("idx_issues_created", "created_at", "id"),
+        Index("idx_issues_project_created", "project_id", "created_at", "id"),
+        Index("idx_issues_triage", "project_id", "status", "created_at", "id"),
     )
 
 
@@ -103,7 +124,8 @@ class TaskComment(Base):
     content = Column(Text, nullable=False)
     comment_type = Column(String(20), nullable=False, default="comment")
     comment_metadata = Column(Text)  # JSON string for SQLite compatibility
-    created_at = Column(DateTime, nullable=False, default=func.now())
+    # Stamped in Python like Issue.created_at, for the keyset cursors
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Relationships
     task = relationship("Task", back_populates="comments")
@@ -114,6 +136,7 @@ class TaskComment(Base):
             "comment_type IN ('comment', 'status_change', 'assignment', 'attachment')",
             name="chk_comment_type",
         ),
+        Index("idx_task_comments_history", "task_id", "comment_type", "created_at", "id"),
     )
 
 
@@ -192,9 +215,19 @@ class ScheduleEvent(Base):
         CheckConstraint(
             "end_datetime IS NULL OR end_datetime > start_datetime", name="chk_event_dates"
         ),
+        Index("idx_schedule_events_timeline", "end_datetime", "start_datetime"),
     )
 
 
+class DataVersion(Base):
+    """Per-table counter of committed write transactions, shared by every app process"""
+
+    __tablename__ = "data_versions"
+
+    table_name = Column(String(100), primary_key=True)
+    version = Column(BigInteger().with_variant(Integer, "sqlite"), nullable=False, default=0)
+
+
 # Export all models
 __all__ = [
     "Reminder",
@@ -203,4 +236,5 @@ __all__ = [
     "TaskAttachment",
     "ProjectContext",
     "ScheduleEvent",
+    "DataVersion",
 ]
@@ -0,0 +1,180 @@
+"""
+Sibling ordering for GoalPath tasks
+Gap-based order_index values so a move usually rewrites only the moved task
+"""
+
+from typing import Any, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from .db_utils import QueryUtils
+from .models import Task
+from .read_models import SIBLING_ORDER
+
+# Distance between neighbouring order_index values after a rebalance. A
+# sibling group absorbs about log2(ORDER_GAP) inserts at one spot before the
+# next rebalance renumbers it.
+ORDER_GAP = 1024
+
+_UNCHANGED: Any = object()
+
+
+def sibling_clause(project_id: str, parent_task_id: Optional[str]) -> List[Any]:
+    """WHERE terms selecting one sibling group; matches idx_tasks_sibling_order"""
+    parent = (
+        Task.parent_task_id.is_(None)
+        if parent_task_id is None
+        else Task.parent_task_id == parent_task_id
+    )
+    return [Task.project_id == project_id, parent]
+
+
+def next_order_index(db: Session, project_id: str, parent_task_id: Optional[str]) -> int:
+    """order_index for a task appended after its last sibling"""
+    current = db.execute(
+        select(func.max(Task.order_index)).where(*sibling_clause(project_id, parent_task_id))
+    ).scalar()
+    return (current or 0) + ORDER_GAP
+
+
+def rebalance_siblings(
+    db: Session, project_id: str, parent_task_id: Optional[str], exclude_id: Optional[str] = None
+) -> int:
+    """Renumber a sibling group ORDER_GAP apart, keeping its order; returns rows written"""
+    statement = select(Task.id).where(*sibling_clause(project_id, parent_task_id))
+    if exclude_id is not None:
+        statement = statement.where(Task.id != exclude_id)
+    ids = db.execute(statement.order_by(*SIBLING_ORDER)).scalars().all()
+    params = [
+        {"id": task_id, "order_index": (position + 1) * ORDER_GAP}
+        for position, task_id in enumerate(ids)
+    ]
+    if params:
+        db.execute(update(Task), params)
+    return len(params)
+
+
+def _neighbour(
+    db: Session, task: Task, parent_task_id: Optional[str], order_index: int, below: bool
+) -> Optional[int]:
+    """order_index of the closest sibling below (or above) ``order_index``"""
+    column = Task.order_index
+    statement = select(func.max(column) if below else func.min(column)).where(
+        *sibling_clause(task.project_id, parent_task_id),
+        Task.id != task.id,
+        column < order_index if below else column > order_index,
+    )
+    return db.execute(statement).scalar()
+
+
+def _is_tied(db: Session, task: Task, parent_task_id: Optional[str], neighbour: Task) -> bool:
+    """Whether another sibling shares ``neighbour``'s order_index, leaving its position ambiguous"""
+    return (
+        db.execute(
+            select(Task.id)
+            .where(
+                *sibling_clause(task.project_id, parent_task_id),
+                Task.id.notin_([task.id, neighbour.id]),
+                Task.order_index == neighbour.order_index,
+            )
+            .limit(1)
+        ).first()
+        is not None
+    )
+
+
+def _slot(
+    db: Session,
+    task: Task,
+    parent_task_id: Optional[str],
+    before: Optional[Task],
+    after: Optional[Task],
+) -> Optional[int]:
+    """A free order_index between the requested neighbours, or None if there is no gap"""
+    if after is not None:
+        lower = after.order_index or 0
+        upper = (
+            before.order_index
+            if before is not None
+            else _neighbour(db, task, parent_task_id, lower, below=False)
+        )
+    elif before is not None:
+        upper = before.order_index or 0
+        lower = _neighbour(db, task, parent_task_id, upper, below=True)
+    else:
+        return next_order_index(db, task.project_id, parent_task_id)
+
+    if any(
+        _is_tied(db, task, parent_task_id, neighbour)
+        for neighbour in (before, after)
+        if neighbour is not None
+    ):
+        return None
+    if upper is None:
+        return lower + ORDER_GAP
+    if lower is None:
+        lower = 0
+    if upper - lower < 2:
+        return None
+    return (lower + upper) // 2
+
+
+def move_task(
+    db: Session,
+    task: Task,
+    before_id: Optional[str] = None,
+    after_id: Optional[str] = None,
+    parent_task_id: Any = _UNCHANGED,
+) -> Task:
+    """
+    Place ``task`` before ``before_id`` and/or after ``after_id`` among its siblings.
+
+    ``parent_task_id`` moves the task under another parent (None for the
+    top level) first; without neighbours the task goes to the end of its
+    sibling group. The new order_index is taken from the gap between the
+    neighbours, so a move normally writes one row. When the gap is used up
+    the group is renumbered once and the move retried. The caller commits.
+    Raises ValueError for references that do not fit the move.
+    """
+    new_parent_id = task.parent_task_id if parent_task_id is _UNCHANGED else parent_task_id
+    if new_parent_id != task.parent_task_id and new_parent_id is not None:
+        parent = db.get(Task, new_parent_id)
+        if parent is None:
+            raise ValueError(f"Parent task with ID {new_parent_id} not found")
+        if parent.project_id != task.project_id:
+            raise ValueError("Parent task must be in the same project")
+        if not QueryUtils.validate_task_hierarchy(db, task.id, new_parent_id):
+            raise ValueError("Invalid task hierarchy - would create a cycle")
+
+    neighbours = {}
+    for name, reference_id in (("before", before_id), ("after", after_id)):
+        if reference_id is None:
+            continue
+        if reference_id == task.id:
+            raise ValueError("A task cannot be moved relative to itself")
+        neighbour = db.get(Task, reference_id)
+        if neighbour is None:
+            raise ValueError(f"Task with ID {reference_id} not found")
+        if (neighbour.project_id, neighbour.parent_task_id) != (task.project_id, new_parent_id):
+            raise ValueError(f"Task {reference_id} is not a sibling at the target position")
+        neighbours[name] = neighbour
+
+    before, after = neighbours.get("before"), neighbours.get("after")
+    if before is not None and after is not None:
+        if (after.order_index or 0) > (before.order_index or 0):
+            raise ValueError("'after' must come before 'before' in the sibling order")
+
+    slot = _slot(db, task, new_parent_id, before, after)
+    if slot is None:
+        rebalance_siblings(db, task.project_id, new_parent_id, exclude_id=task.id)
+        for neighbour in neighbours.values():
+            db.refresh(neighbour, ["order_index"])
+        slot = _slot(db, task, new_parent_id, before, after)
+        if slot is None:
+            # Only possible when 'after' and 'before' were tied and not adjacent
+            raise ValueError("'after' must come before 'before' in the sibling order")
+
+    task.parent_task_id = new_parent_id
+    task.order_index = slot
+    return task
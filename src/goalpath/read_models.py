@@ -0,0 +1,313 @@
+"""
+Read models for GoalPath list views
+Column-projected SELECTs returned as lightweight __slots__ DTOs instead of ORM entities
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import Select, case, func, select
+from sqlalchemy.orm import Session
+
+from .models import Project, Task
+
+# Columns shown by list views; heavy text columns are opt-in
+TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.project_id,
+    Task.parent_task_id,
+    Task.title,
+    Task.task_type,
+    Task.status,
+    Task.priority,
+    Task.story_points,
+    Task.estimated_hours,
+    Task.actual_hours,
+    Task.start_date,
+    Task.due_date,
+    Task.completed_date,
+    Task.assigned_to,
+    Task.created_by,
+    Task.order_index,
+    Task.created_at,
+    Task.updated_at,
+)
+
+PROJECT_LIST_COLUMNS = (
+    Project.id,
+    Project.name,
+    Project.status,
+    Project.priority,
+    Project.start_date,
+    Project.target_end_date,
+    Project.actual_end_date,
+    Project.created_at,
+    Project.updated_at,
+    Project.created_by,
+)
+
+# Task list order: position among siblings, ties broken by creation order
+SIBLING_ORDER = (Task.order_index, Task.created_at, Task.id)
+
+# Derived project fields that need the per-project task counts
+PROJECT_STAT_FIELDS = {"total_tasks", "completed_tasks", "completion_percentage"}
+
+# (created_at, id) of the last row on a keyset page
+KeysetCursor = Tuple[datetime, str]
+
+
+class ReadModel:
+    """
+    Base for slot-only DTOs wrapping a result row.
+
+    Column values are read straight from the row; ``_optional`` supplies
+    defaults for columns a narrower SELECT left out.
+    """
+
+    __slots__ = ("_row",)
+
+    _optional: Dict[str, Any] = {}
+
+    def __init__(self, row: Any):
+        self._row = row
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return getattr(self._row, name)
+        except AttributeError:
+            if name in self._optional:
+                return self._optional[name]
+            raise
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**self._optional, **self._row._mapping}
+
+
+class ProjectRef:
+    """The project fields a task card displays"""
+
+    __slots__ = ("id", "name", "updated_at")
+
+    def __init__(self, id: str, name: str, updated_at: Any):
+        self.id = id
+        self.name = name
+        self.updated_at = updated_at
+
+
+class TaskListItem(ReadModel):
+    """A task row for list views; ``description`` is None unless selected"""
+
+    __slots__ = ("project",)
+
+    _optional = {"description": None, "subtask_count": 0}
+
+    def __init__(self, row: Any, project: Optional[ProjectRef] = None):
+        super().__init__(row)
+        self.project = project
+
+
+class ProjectListItem(ReadModel):
+    """A project row with its task statistics"""
+
+    __slots__ = ()
+
+    _optional = {"description": None}
+
+    @property
+    def completion_percentage(self) -> float:
+        return completion_percentage(self.total_tasks, self.completed_tasks)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**super().as_dict(), "completion_percentage": self.completion_percentage}
+
+
+def completion_percentage(total_tasks: int, completed_tasks: int) -> float:
+    return round((completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0, 1)
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated ``?fields=`` value against a response schema.
+
+    Returns None when no fieldset was requested (all fields). ``id`` is always
+    included. Raises ValueError naming any field the schema does not have.
+    """
+    if not fields:
+        return None
+
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(schema.model_fields))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(["id", *requested]))
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Opaque page cursor for the row at (created_at, id)"""
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> KeysetCursor:
+    """(created_at, id) from a page cursor; ValueError when it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def _select_columns(
+    columns: Iterable[Any], fields: Optional[Collection[str]], optional: Iterable[Any] = ()
+) -> List[Any]:
+    """List columns narrowed to a fieldset; optional columns only when named"""
+    if fields is None:
+        return list(columns)
+    return [column for column in (*columns, *optional) if column.key in fields]
+
+
+def task_list_select(
+    include_description: bool = False,
+    with_subtask_count: bool = False,
+    with_project: bool = False,
+    fields: Optional[Collection[str]] = None,
+) -> Select:
+    """
+    SELECT for task lists; counts and the project name are folded into the same statement.
+
+    A ``fields`` collection narrows the projection to those columns and
+    overrides ``include_description`` / ``with_subtask_count``.
+    """
+    columns = _select_columns(TASK_LIST_COLUMNS, fields, optional=(Task.description,))
+    if fields is not None:
+        with_subtask_count = "subtask_count" in fields
+    elif include_description:
+        columns.append(Task.description)
+    if with_subtask_count:
+        subtasks = Task.__table__.alias("subtasks")
+        columns.append(
+            select(func.count(subtasks.c.id))
+            .where(subtasks.c.parent_task_id == Task.id)
+            .scalar_subquery()
+            .label("subtask_count")
+        )
+
+    statement = select(*columns)
+    if with_project:
+        statement = statement.add_columns(
+            Project.name.label("project_name"), Project.updated_at.label("project_updated_at")
+        ).outerjoin(Project, Project.id == Task.project_id)
+    return statement
+
+
+def project_list_select(
+    include_description: bool = False, fields: Optional[Collection[str]] = None
+) -> Select:
+    """
+    SELECT for project lists with total and completed task counts per row.
+
+    With a ``fields`` collection the counts are only selected when a task
+    statistic is requested.
+    """
+    columns = _select_columns(PROJECT_LIST_COLUMNS, fields, optional=(Project.description,))
+    if fields is None and include_description:
+        columns.append(Project.description)
+    if fields is not None and not PROJECT_STAT_FIELDS & set(fields):
+        return select(*columns)
+
+    columns.append(
+        select(func.count(Task.id))
+        .where(Task.project_id == Project.id)
+        .scalar_subquery()
+        .label("total_tasks")
+    )
+    columns.append(
+        select(func.count(Task.id))
+        .where(Task.project_id == Project.id, Task.status == "done")
+        .scalar_subquery()
+        .label("completed_tasks")
+    )
+    return select(*columns)
+
+
+def to_task_items(rows: Iterable[Any]) -> List[TaskListItem]:
+    items = []
+    for row in rows:
+        project = None
+        if "project_name" in row._fields and row.project_name is not None:
+            project = ProjectRef(row.project_id, row.project_name, row.project_updated_at)
+        items.append(TaskListItem(row, project))
+    return items
+
+
+def to_project_items(rows: Iterable[Any]) -> List[ProjectListItem]:
+    return [ProjectListItem(row) for row in rows]
+
+
+def fetch_task_items(
+    db: Session,
+    project_id: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    include_description: bool = False,
+    limit: int = 15,
+) -> List[TaskListItem]:
+    """Most recently updated tasks, with their project reference, for list fragments"""
+    statement = task_list_select(include_description=include_description, with_project=True)
+    if project_id:
+        statement = statement.where(Task.project_id == project_id)
+    if status:
+        statement = statement.where(Task.status == status)
+    if priority:
+        statement = statement.where(Task.priority == priority)
+
+    statement = statement.order_by(Task.updated_at.desc()).limit(limit)
+    return to_task_items(db.execute(statement))
+
+
+def fetch_recent_projects(
+    db: Session, include_description: bool = True, limit: int = 10
+) -> List[ProjectListItem]:
+    """Most recently updated projects with task statistics"""
+    statement = (
+        project_list_select(include_description=include_description)
+        .order_by(Project.updated_at.desc())
+        .limit(limit)
+    )
+    return to_project_items(db.execute(statement))
+
+
+def dashboard_counts(db: Session, week_start: date) -> Dict[str, Any]:
+    """Dashboard statistics in a single aggregate statement"""
+    done = Task.status == "done"
+    row = db.execute(
+        select(
+            select(func.count(Project.id)).scalar_subquery().label("total_projects"),
+            func.count(Task.id).label("total_tasks"),
+            func.coalesce(func.sum(case((done, 1), else_=0)), 0).label("completed_tasks"),
+            func.coalesce(
+                func.sum(case((done & (func.date(Task.updated_at) >= week_start), 1), else_=0)),
+                0,
+            ).label("tasks_completed_this_week"),
+        ).select_from(Task)
+    ).one()
+
+    return {
+        "total_projects": row.total_projects,
+        "total_tasks": row.total_tasks,
+        "completed_tasks": row.completed_tasks,
+        "completion_rate": completion_percentage(row.total_tasks, row.completed_tasks),
+        "tasks_completed_this_week": row.tasks_completed_this_week,
+    }
@@ -0,0 +1,387 @@
+"""
+Recurrence rules for GoalPath
+RRULE-style patterns, parsed once per pattern text and expanded lazily over a window
+"""
+
+import calendar
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+FREQUENCIES = ("daily", "weekly", "monthly", "yearly")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Periods in a row without an occurrence after which a rule counts as exhausted
+# (e.g. a monthly rule on the 30th restricted to February)
+MAX_EMPTY_PERIODS = 1_000
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """
+    A parsed recurrence pattern.
+
+    Occurrences keep the time of day of the series start (``dtstart``, or
+    the start the caller supplies). BYDAY expands weekly rules, and monthly
+    and yearly rules without BYMONTHDAY; BYMONTHDAY expands monthly and
+    yearly rules; BYMONTH expands yearly rules. Otherwise each BY* part
+    filters, as in RFC 5545.
+    """
+
+    freq: str
+    interval: int = 1
+    by_weekday: Tuple[int, ...] = ()
+    by_month_day: Tuple[int, ...] = ()
+    by_month: Tuple[int, ...] = ()
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+    dtstart: Optional[datetime] = None
+
+    def occurrences(
+        self, dtstart: datetime, after: Optional[datetime] = None
+    ) -> Iterator[datetime]:
+        """
+        Occurrences from ``dtstart`` on, in order; unbounded rules never end.
+
+        With ``after`` and no COUNT, periods before ``after`` are skipped
+        arithmetically instead of being walked, so expanding a window costs
+        the same however old the series is. (COUNT rules have to be walked
+        from the start to know where they end.)
+        """
+        first_day = dtstart.date()
+        at = dtstart.time()
+        index = 0
+        if after is not None and self.count is None and after > dtstart:
+            index = self._period_index(first_day, after.date())
+
+        emitted = 0
+        empty = 0
+        while empty <= MAX_EMPTY_PERIODS:
+            try:
+                days = self._period_days(first_day, index)
+            except (OverflowError, ValueError):
+                # Ran past the last representable date
+                return
+            empty += 1
+            for day in days:
+                moment = datetime.combine(day, at)
+                if moment < dtstart:
+                    continue
+                if self.until is not None and moment > self.until:
+                    return
+                empty = 0
+                emitted += 1
+                yield moment
+                if self.count is not None and emitted >= self.count:
+                    return
+            index += 1
+
+    def between(
+        self, dtstart: datetime, window_start: datetime, window_end: datetime
+    ) -> Iterator[datetime]:
+        """Occurrences in ``[window_start, window_end]``, generated lazily"""
+        for moment in self.occurrences(dtstart, after=window_start):
+            if moment > window_end:
+                return
+            if moment >= window_start:
+                yield moment
+
+    def expand(
+        self, dtstart: datetime, window_start: datetime, window_end: datetime
+    ) -> Iterator[datetime]:
+        """
+        Occurrences in ``[window_start, window_end]``, generated lazily.
+
+        A series without COUNT that started before the window is moved to
+        its last period start before the window, which keeps its phase,
+        and only then expanded. The day list depends on the rule, that
+        start and the window, so it is cached and thousands of reminders
+        sharing a pattern expand at the cost of a few; occurrences are
+        only built from it as they are consumed.
+        """
+        if self.count is not None or dtstart >= window_start:
+            yield from self.between(dtstart, window_start, window_end)
+            return
+
+        at = dtstart.time()
+        first_day = self._phase_start(dtstart.date(), window_start.date())
+        for day in _window_days(self, first_day, window_start.date(), window_end.date()):
+            moment = datetime.combine(day, at)
+            if self.until is not None and moment > self.until:
+                return
+            if window_start <= moment <= window_end:
+                yield moment
+
+    def next_after(self, dtstart: datetime, moment: datetime) -> Optional[datetime]:
+        """The first occurrence strictly after ``moment``, or None when the series ended"""
+        for occurrence in self.occurrences(dtstart, after=moment):
+            if occurrence > moment:
+                return occurrence
+        return None
+
+    def _period_index(self, first_day: date, day: date) -> int:
+        """Index of the interval-aligned period containing ``day`` (or just before it)"""
+        if self.freq == "daily":
+            offset = (day - first_day).days
+        elif self.freq == "weekly":
+            offset = (_monday(day) - _monday(first_day)).days // 7
+        elif self.freq == "monthly":
+            offset = (day.year - first_day.year) * 12 + day.month - first_day.month
+        else:
+            offset = day.year - first_day.year
+        return max(0, offset // self.interval)
+
+    def _phase_start(self, first_day: date, day: date) -> date:
+        """
+        ``first_day`` moved forward by whole periods to the last such start
+        on or before ``day``; weekday, day of month and month carry over.
+        """
+        periods = self._period_index(first_day, day)
+        while periods > 0:
+            try:
+                start = self._shift(first_day, periods)
+            except ValueError:
+                # No such day that month (the 31st, February 29th)
+                start = None
+            if start is not None and start <= day:
+                return start
+            periods -= 1
+        return first_day
+
+    def _shift(self, first_day: date, periods: int) -> date:
+        if self.freq == "daily":
+            return first_day + timedelta(days=periods * self.interval)
+        if self.freq == "weekly":
+            return first_day + timedelta(weeks=periods * self.interval)
+        months = periods * (self.interval if self.freq == "monthly" else 12 * self.interval)
+        year, month = divmod(first_day.month - 1 + months, 12)
+        return date(first_day.year + year, month + 1, first_day.day)
+
+    def _period_days(self, first_day: date, index: int) -> List[date]:
+        """Candidate days of one period, in order, with the BY* filters applied"""
+        step = index * self.interval
+        if self.freq == "daily":
+            days = [first_day + timedelta(days=step)]
+        elif self.freq == "weekly":
+            monday = _monday(first_day) + timedelta(weeks=step)
+            days = [
+                monday + timedelta(days=weekday)
+                for weekday in (self.by_weekday or (first_day.weekday(),))
+            ]
+        elif self.freq == "monthly":
+            year, month = divmod(first_day.month - 1 + step, 12)
+            days = self._month_days(first_day, first_day.year + year, month + 1)
+        else:
+            year = first_day.year + step
+            days = [
+                day
+                for month in (self.by_month or (first_day.month,))
+                for day in self._month_days(first_day, year, month)
+            ]
+        return [day for day in days if self._keep(day)]
+
+    def _month_days(self, first_day: date, year: int, month: int) -> List[date]:
+        length = calendar.monthrange(year, month)[1]
+        if self.by_month_day:
+            numbers = sorted(
+                {
+                    number if number > 0 else length + number + 1
+                    for number in self.by_month_day
+                    if abs(number) <= length
+                }
+            )
+        elif self.by_weekday:
+            first_weekday = date(year, month, 1).weekday()
+            numbers = [
+                number
+                for number in range(1, length + 1)
+                if (first_weekday + number - 1) % 7 in self.by_weekday
+            ]
+        else:
+            # A start on the 31st skips shorter months, as RRULE does
+            numbers = [first_day.day] if first_day.day <= length else []
+        return [date(year, month, number) for number in numbers]
+
+    def _keep(self, day: date) -> bool:
+        if self.by_month and day.month not in self.by_month:
+            return False
+        if self.by_weekday and day.weekday() not in self.by_weekday:
+            return False
+        if self.by_month_day and self.freq in ("daily", "weekly"):
+            length = calendar.monthrange(day.year, day.month)[1]
+            return any(
+                day.day == (number if number > 0 else length + number + 1)
+                for number in self.by_month_day
+            )
+        return True
+
+
+# Callers bound the window (the calendar to CALENDAR_MAX_DAYS), which bounds each entry
+@lru_cache(maxsize=1024)
+def _window_days(
+    rule: RecurrenceRule, first_day: date, window_start: date, window_end: date
+) -> Tuple[date, ...]:
+    """Days of ``rule`` started on ``first_day`` that fall in the window"""
+    return tuple(
+        moment.date()
+        for moment in rule.between(
+            datetime.combine(first_day, time.min),
+            datetime.combine(window_start, time.min),
+            datetime.combine(window_end, time.max),
+        )
+    )
+
+
+def _monday(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [part for part in str(value).split(",") if part.strip()]
+
+
+def _as_int(value: Any, name: str, low: int, high: Optional[int] = None) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid recurrence {name}: {value!r}")
+    if number < low or (high is not None and number > high):
+        raise ValueError(f"Recurrence {name} out of range: {value!r}")
+    return number
+
+
+def _as_weekday(value: Any) -> int:
+    if isinstance(value, int) and 0 <= value <= 6:
+        return value
+    code = str(value).strip().upper()[:2]
+    if code not in WEEKDAYS:
+        raise ValueError(f"Invalid recurrence weekday: {value!r}")
+    return WEEKDAYS.index(code)
+
+
+def _as_month_day(value: Any) -> int:
+    number = _as_int(value, "month day", -31, 31)
+    if number == 0:
+        raise ValueError("Recurrence month day cannot be 0")
+    return number
+
+
+def _as_datetime(value: Any, name: str, end_of_day: bool = False) -> datetime:
+    """Parse ISO or RRULE (``20250131T090000Z``) datetimes; aware values become naive UTC"""
+    text = str(value).strip()
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"Invalid recurrence {name}: {value!r}")
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    elif end_of_day and "T" not in text.upper() and " " not in text:
+        # A date-only UNTIL includes that whole day
+        moment = datetime.combine(moment.date(), time.max)
+    return moment
+
+
+def _rrule_fields(text: str) -> Dict[str, Any]:
+    """Fields of an RRULE string such as ``FREQ=WEEKLY;BYDAY=MO,WE``"""
+    fields: Dict[str, Any] = {}
+    for line in text.replace("\n", ";").split(";"):
+        line = line.strip()
+        if not line:
+            continue
+        if line.upper().startswith("RRULE:"):
+            line = line[len("RRULE:") :]
+        elif line.upper().startswith("DTSTART:"):
+            line = "DTSTART=" + line[len("DTSTART:") :]
+        name, separator, value = line.partition("=")
+        if not separator:
+            raise ValueError(f"Invalid recurrence rule part: {line!r}")
+        fields[name.strip().lower()] = value.strip()
+    return fields
+
+
+def _build_rule(fields: Dict[str, Any]) -> RecurrenceRule:
+    freq = str(fields.get("freq") or "").lower()
+    if freq not in FREQUENCIES:
+        raise ValueError(f"Unsupported recurrence frequency: {fields.get('freq')!r}")
+    if "count" in fields and "until" in fields:
+        raise ValueError("Recurrence rules take either COUNT or UNTIL, not both")
+
+    weekdays = fields.get("byday", fields.get("byweekday"))
+    return RecurrenceRule(
+        freq=freq,
+        interval=_as_int(fields.get("interval", 1), "interval", 1),
+        by_weekday=tuple(sorted({_as_weekday(value) for value in _as_list(weekdays)})),
+        by_month_day=tuple(
+            sorted({_as_month_day(value) for value in _as_list(fields.get("bymonthday"))})
+        ),
+        by_month=tuple(
+            sorted({_as_int(value, "month", 1, 12) for value in _as_list(fields.get("bymonth"))})
+        ),
+        count=_as_int(fields["count"], "count", 1) if fields.get("count") is not None else None,
+        until=(
+            _as_datetime(fields["until"], "until", end_of_day=True)
+            if fields.get("until") is not None
+            else None
+        ),
+        dtstart=(
+            _as_datetime(fields["dtstart"], "dtstart")
+            if fields.get("dtstart") is not None
+            else None
+        ),
+    )
+
+
+@lru_cache(maxsize=4096)
+def parse_recurrence(pattern: str) -> RecurrenceRule:
+    """
+    Parse a recurrence pattern; cached by pattern text, so each distinct
+    pattern is parsed once however many reminders share it.
+
+    Accepts a JSON object (``{"freq": "weekly", "interval": 2, "byday":
+    ["MO", "WE"]}``) or an RRULE string (``FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE``),
+    bare or JSON-encoded. Raises ValueError for patterns it cannot evaluate.
+    """
+    text = pattern.strip()
+    if text.startswith(("{", '"')):
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid recurrence pattern: {e}")
+    else:
+        value = text
+
+    if isinstance(value, str):
+        fields = _rrule_fields(value)
+    elif isinstance(value, dict):
+        fields = {str(name).lower(): field for name, field in value.items()}
+    else:
+        raise ValueError("Recurrence pattern must be an object or an RRULE string")
+    return _build_rule(fields)
+
+
+def next_reminder_trigger(reminder: Any, now: datetime) -> Optional[datetime]:
+    """
+    Next trigger of a recurring reminder that just fired, after ``now``.
+
+    Only this one occurrence is materialized, into the reminder's
+    trigger_datetime. The series is anchored on the pattern's DTSTART, or
+    else on the occurrence that fired (so COUNT only ends a series that has a
+    DTSTART); for a snoozed reminder that is the recurrence_anchor it was
+    due at, not the snooze time. Missed occurrences are not replayed.
+    Returns None when the series has ended or the pattern cannot be
+    evaluated, and the reminder is then left fired.
+    """
+    if not reminder.recurrence_pattern:
+        return None
+    try:
+        rule = parse_recurrence(reminder.recurrence_pattern)
+    except ValueError:
+        return None
+    dtstart = rule.dtstart or reminder.recurrence_anchor or reminder.trigger_datetime
+    return rule.next_after(dtstart, max(now, reminder.trigger_datetime))
@@ -0,0 +1,444 @@
+"""
+Reminder scheduler for GoalPath
+Fires due reminders from an in-memory min-heap that is refilled page by page from the database
+"""
+
+import asyncio
+import heapq
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Select, event, func, or_, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from .events import queue_event
+from .models.extended import Reminder
+
+logger = logging.getLogger(__name__)
+
+# Statuses the scheduler fires; a snoozed reminder is due again at its trigger_datetime
+DUE_STATUSES = ("pending", "snoozed")
+# Statuses a reminder can be snoozed from; acknowledged and cancelled ones are done
+SNOOZABLE_STATUSES = ("pending", "fired", "snoozed")
+
+# Reminders read per refill; the heap holds about this many upcoming reminders
+PREFETCH_SIZE = 1_000
+# Due reminders claimed and fired per transaction
+FIRE_BATCH_SIZE = 500
+# How long a claimed batch stays reserved for the replica that claimed it
+LEASE_DURATION = timedelta(seconds=60)
+# Reload the head of the queue this often to pick up rows written elsewhere
+RESYNC_INTERVAL = timedelta(seconds=60)
+# Seconds to wait after a failed iteration
+ERROR_BACKOFF = 5.0
+
+# Columns read for claimed reminders when they fire
+FIRE_COLUMNS = (
+    Reminder.id,
+    Reminder.task_id,
+    Reminder.project_id,
+    Reminder.title,
+    Reminder.message,
+    Reminder.reminder_type,
+    Reminder.recurrence_pattern,
+    Reminder.recurrence_anchor,
+    Reminder.trigger_datetime,
+)
+
+DueKey = Tuple[datetime, str]
+# Next trigger of a recurring reminder fired at the given time, or None when the series ended
+NextTrigger = Callable[[Any, datetime], Optional[datetime]]
+
+
+def due_select(status: str, after: Optional[DueKey], limit: int) -> Select:
+    """
+    Next ``limit`` reminders with ``status`` after the ``after`` key.
+
+    A keyset page over idx_reminders_due: one ordered index range, however
+    many reminders are pending.
+    """
+    statement = select(Reminder.trigger_datetime, Reminder.id).where(Reminder.status == status)
+    if after is not None:
+        statement = statement.where(tuple_(Reminder.trigger_datetime, Reminder.id) > tuple_(*after))
+    return statement.order_by(Reminder.trigger_datetime, Reminder.id).limit(limit)
+
+
+def load_due_keys(db: Session, after: Optional[DueKey], limit: int) -> Tuple[List[DueKey], bool]:
+    """
+    The ``limit`` earliest due keys after ``after`` across DUE_STATUSES.
+
+    Each status is read as its own index range and the pages are merged, so
+    no sort over the whole queue is needed. Returns the keys and whether
+    the queue is exhausted past them.
+    """
+    pages = [
+        [tuple(row) for row in db.execute(due_select(status, after, limit))]
+        for status in DUE_STATUSES
+    ]
+    keys = list(islice(heapq.merge(*pages), limit))
+    exhausted = all(len(page) < limit for page in pages)
+    return keys, exhausted
+
+
+def claim_due(
+    db: Session, reminder_ids: Sequence[str], owner: str, now: datetime, lease: timedelta
+) -> List[Any]:
+    """
+    Lease the due, unleased reminders among ``reminder_ids`` to ``owner``.
+
+    The conditional UPDATE is the arbitration between replicas: a row is
+    only taken when it is still due and nobody holds a live lease on it, so
+    each reminder is claimed by one replica. A lease that lapses (its holder
+    died mid-batch) can be claimed again. Returns the claimed rows.
+    """
+    db.execute(
+        update(Reminder)
+        .where(
+            Reminder.id.in_(reminder_ids),
+            Reminder.status.in_(DUE_STATUSES),
+            Reminder.trigger_datetime <= now,
+            or_(Reminder.lease_expires_at.is_(None), Reminder.lease_expires_at <= now),
+        )
+        .values(leased_by=owner, lease_expires_at=now + lease)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return db.execute(
+        select(*FIRE_COLUMNS).where(Reminder.id.in_(reminder_ids), Reminder.leased_by == owner)
+    ).all()
+
+
+def fire_claimed(
+    db: Session,
+    rows: Sequence[Any],
+    owner: str,
+    now: datetime,
+    next_trigger: Optional[NextTrigger] = None,
+) -> Tuple[List[DueKey], int]:
+    """
+    Mark the claimed reminders ``owner`` still holds fired and commit.
+
+    A lease may have lapsed since the claim and been taken by another
+    replica; those rows are left to it. The rows still held are written
+    first, which locks them until commit, then read back, and only they
+    are fired, with one executemany UPDATE that is also keyed on the
+    lease. Recurring reminders whose ``next_trigger`` returns a time go
+    back to pending at that time instead. A reminder event is published
+    for each fired row once the batch commits. Returns the rescheduled
+    keys and the number fired.
+    """
+    reminder_ids = [row.id for row in rows]
+    if reminder_ids:
+        db.execute(
+            update(Reminder)
+            .where(Reminder.id.in_(reminder_ids), Reminder.leased_by == owner)
+            .values(leased_by=owner)
+            .execution_options(synchronize_session=False)
+        )
+        held = set(
+            db.scalars(
+                select(Reminder.id).where(
+                    Reminder.id.in_(reminder_ids), Reminder.leased_by == owner
+                )
+            )
+        )
+        rows = [row for row in rows if row.id in held]
+
+    params = []
+    rescheduled = []
+    for row in rows:
+        following = None
+        if row.reminder_type == "recurring" and next_trigger is not None:
+            following = next_trigger(row, now)
+        params.append(
+            {
+                "id": row.id,
+                "status": "pending" if following else "fired",
+                "trigger_datetime": following or row.trigger_datetime,
+                "view_after": None,
+                "recurrence_anchor": None,
+                "fired_at": now,
+                "leased_by": None,
+                "lease_expires_at": None,
+            }
+        )
+        if following:
+            rescheduled.append((following, row.id))
+        queue_event(
+            db,
+            "reminder",
+            "fired",
+            row.id,
+            task_id=row.task_id,
+            project_id=row.project_id,
+            title=row.title,
+            message=row.message,
+            trigger_datetime=row.trigger_datetime.isoformat(),
+        )
+    if params:
+        db.execute(
+            update(Reminder)
+            .where(Reminder.leased_by == owner)
+            .execution_options(synchronize_session=None),
+            params,
+        )
+    db.commit()
+    return rescheduled, len(params)
+
+
+def snooze_reminders(db: Session, reminder_ids: Iterable[str], until: datetime) -> int:
+    """
+    Snooze reminders until ``until`` with one UPDATE.
+
+    Only reminders in SNOOZABLE_STATUSES are snoozed. The trigger moves to
+    ``until`` (kept in view_after as well), so the snoozed reminder
+    re-enters the due queue in order. The trigger it had is kept as
+    recurrence_anchor (the first one, if snoozed again) so a recurring
+    series keeps its times. Running schedulers are told once the session
+    commits. Returns the number snoozed.
+    """
+    reminder_ids = list(reminder_ids)
+    if not reminder_ids:
+        return 0
+    result = db.execute(
+        update(Reminder)
+        .where(Reminder.id.in_(reminder_ids), Reminder.status.in_(SNOOZABLE_STATUSES))
+        .values(
+            status="snoozed",
+            recurrence_anchor=func.coalesce(Reminder.recurrence_anchor, Reminder.trigger_datetime),
+            trigger_datetime=until,
+            view_after=until,
+            leased_by=None,
+            lease_expires_at=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    _pending(db).extend((until, reminder_id) for reminder_id in reminder_ids)
+    return result.rowcount
+
+
+class ReminderScheduler:
+    """
+    Background task that fires reminders when they come due.
+
+    Only the head of the queue lives in memory: a min-heap of the next
+    ``prefetch`` (trigger_datetime, id) keys, refilled by keyset pages when
+    it runs low. The task sleeps until the earliest trigger rather than
+    polling, and is woken early when this process commits a reminder that
+    is due sooner. Rows written by other processes are picked up by a
+    resync every ``resync_interval``. Due reminders are fired in batches,
+    each claimed through a lease first so several replicas can run the
+    scheduler against one database without firing a reminder twice.
+
+    Database work runs in worker threads, so ``session_factory`` must not
+    hand out sessions sharing a connection with the request sessions; see
+    DatabaseManager.get_dedicated_session_factory.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        prefetch: int = PREFETCH_SIZE,
+        batch_size: int = FIRE_BATCH_SIZE,
+        lease: timedelta = LEASE_DURATION,
+        resync_interval: timedelta = RESYNC_INTERVAL,
+        next_trigger: Optional[NextTrigger] = None,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        self.session_factory = session_factory
+        self.prefetch = prefetch
+        self.batch_size = batch_size
+        self.lease = lease
+        self.resync_interval = resync_interval
+        self.next_trigger = next_trigger
+        self.clock = clock
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._heap: List[DueKey] = []
+        # Last key loaded into the heap; nothing after it is in memory unless exhausted
+        self._cursor: Optional[DueKey] = None
+        self._exhausted = False
+        self._next_resync: Optional[datetime] = None
+        self._refilling = False
+        self._held: List[DueKey] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+        self.fired = 0
+        self.refills = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def queued(self) -> int:
+        """Keys currently held in the in-memory heap"""
+        return len(self._heap)
+
+    def start(self) -> None:
+        """Start the scheduler task on the running event loop"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._next_resync = None
+        self._task = self._loop.create_task(self.run())
+        _schedulers.add(self)
+
+    async def stop(self) -> None:
+        """Cancel the scheduler task and wait for it to finish"""
+        _schedulers.discard(self)
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def notify(self, keys: Iterable[DueKey]) -> None:
+        """Offer newly due keys; safe to call from any thread"""
+        loop = self._loop
+        if loop is None or not self.running:
+            return
+        try:
+            loop.call_soon_threadsafe(self._offer, list(keys))
+        except RuntimeError:
+            # The loop has closed; the scheduler is gone with it
+            _schedulers.discard(self)
+
+    def _offer(self, keys: List[DueKey]) -> None:
+        if self._refilling:
+            self._held.extend(keys)
+            return
+        for key in keys:
+            if self._exhausted or (self._cursor is not None and key <= self._cursor):
+                heapq.heappush(self._heap, key)
+        if self._wake is not None:
+            self._wake.set()
+
+    async def run(self) -> None:
+        """Scheduler loop; failures are logged and retried after a pause"""
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Reminder scheduler iteration failed")
+                await asyncio.sleep(ERROR_BACKOFF)
+
+    async def tick(self) -> None:
+        """Refill if needed, fire one due batch, or sleep until the next trigger"""
+        self._wake.clear()
+        now = self.clock()
+        if self._next_resync is None or now >= self._next_resync:
+            await self.resync()
+        elif not self._exhausted and len(self._heap) < self.prefetch // 4:
+            await self.refill()
+
+        now = self.clock()
+        due = []
+        seen = set()
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            _, reminder_id = heapq.heappop(self._heap)
+            if reminder_id not in seen:
+                seen.add(reminder_id)
+                due.append(reminder_id)
+        if due:
+            await self.fire(due, now)
+            return
+
+        timeout = (self._next_resync - now).total_seconds()
+        if self._heap:
+            timeout = min(timeout, (self._heap[0][0] - now).total_seconds())
+        try:
+            await asyncio.wait_for(self._wake.wait(), max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+
+    async def resync(self) -> None:
+        """Drop the in-memory queue and reload its head from the database"""
+        self._heap = []
+        self._cursor = None
+        self._exhausted = False
+        self._next_resync = self.clock() + self.resync_interval
+        await self.refill()
+
+    async def refill(self) -> None:
+        """Load the next page of due keys after the cursor"""
+        self._refilling = True
+        try:
+            keys, exhausted = await asyncio.to_thread(self._load, self._cursor, self.prefetch)
+        finally:
+            self._refilling = False
+        self.refills += 1
+        for key in keys:
+            heapq.heappush(self._heap, key)
+        if keys:
+            self._cursor = keys[-1]
+        self._exhausted = exhausted
+        held, self._held = self._held, []
+        self._offer(held)
+
+    def _load(self, after: Optional[DueKey], limit: int) -> Tuple[List[DueKey], bool]:
+        with self.session_factory() as db:
+            return load_due_keys(db, after, limit)
+
+    async def fire(self, reminder_ids: List[str], now: datetime) -> int:
+        """Claim and fire a batch of due reminders; returns how many this replica fired"""
+        rescheduled, fired = await asyncio.to_thread(self._fire, reminder_ids, now)
+        self.fired += fired
+        self._offer(rescheduled)
+        return fired
+
+    def _fire(self, reminder_ids: List[str], now: datetime) -> Tuple[List[DueKey], int]:
+        with self.session_factory() as db:
+            rows = claim_due(db, reminder_ids, self.owner, now, self.lease)
+            if not rows:
+                return [], 0
+            return fire_claimed(db, rows, self.owner, now, self.next_trigger)
+
+
+def scheduler_enabled() -> bool:
+    """Whether this process runs the scheduler; GOALPATH_REMINDER_SCHEDULER=off disables it"""
+    return os.environ.get("GOALPATH_REMINDER_SCHEDULER", "on").lower() not in ("off", "0", "false")
+
+
+# Schedulers running in this process, told about reminders committed here
+_schedulers: Set[ReminderScheduler] = set()
+
+_PENDING_REMINDERS_KEY = "goalpath_pending_reminders"
+
+
+def _pending(session: Session) -> List[DueKey]:
+    return session.info.setdefault(_PENDING_REMINDERS_KEY, [])
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_reminder_changes(session: Session, flush_context: Any) -> None:
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Reminder) and obj.status in DUE_STATUSES:
+            _pending(session).append((obj.trigger_datetime, obj.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_schedulers(session: Session) -> None:
+    keys = session.info.pop(_PENDING_REMINDERS_KEY, None)
+    if not keys:
+        return
+    for scheduler in list(_schedulers):
+        scheduler.notify(keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_reminder_changes(session: Session) -> None:
+    session.info.pop(_PENDING_REMINDERS_KEY, None)
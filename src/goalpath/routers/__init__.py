@@ -2,8 +2,32 @@
 API Routers for GoalPath
 """
 
+from .batch import router as batch_router
+from .calendar import router as calendar_router
+from .comments import router as comments_router
+from .events import router as events_router
+from .export import router as export_router
 from .goals import router as goals_router
+from .imports import router as import_router
+from .issues import router as issues_router
 from .projects import router as projects_router
+from .reminders import router as reminders_router
+from .sprints import router as sprints_router
 from .tasks import router as tasks_router
+from .timeline import router as timeline_router
 
-__all__ = ["projects_router", "tasks_router", "goals_router"]
+__all__ = [
+    "projects_router",
+    "tasks_router",
+    "goals_router",
+    "events_router",
+    "export_router",
+    "import_router",
+    "batch_router",
+    "timeline_router",
+    "calendar_router",
+    "sprints_router",
+    "issues_router",
+    "comments_router",
+    "reminders_router",
+]
@@ -0,0 +1,87 @@
+"""
+Batch API Router
+Runs an ordered list of task operations in one request and one transaction
+"""
+
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import HTMLResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from ..bulk_operations import apply_task_batch
+from ..database import get_db
+from ..htmx_utils import is_htmx_request, render_task_item
+from ..models import Task
+from ..schemas import BatchRequest, BatchResponse
+from ..serializers import dumps, json_response
+
+router = APIRouter(prefix="/api/batch", tags=["batch"])
+
+
+def _oob_bundle(
+    db: Session, request: Request, response: BatchResponse, tasks: list
+) -> HTMLResponse:
+    """Updated task cards as out-of-band swaps, plus notification and stats triggers"""
+    if tasks:
+        # One query for the final state of every card, project names included
+        tasks = (
+            db.execute(
+                select(Task)
+                .options(selectinload(Task.project))
+                .where(Task.id.in_([task.id for task in tasks]))
+                .execution_options(populate_existing=True)
+            )
+            .scalars()
+            .all()
+        )
+    html = "\n".join(render_task_item(task, request, oob=True) for task in tasks)
+
+    if response.committed:
+        notification = {
+            "type": "success",
+            "title": "Success",
+            "message": f"{response.applied} change(s) saved",
+        }
+    else:
+        failures = [result.error for result in response.results if result.error][:1]
+        notification = {
+            "type": "error",
+            "title": "Error",
+            "message": f"No changes saved: {failures[0] if failures else 'batch rejected'}",
+        }
+    triggers = {"showNotification": notification}
+    if response.committed and response.applied:
+        triggers["updateDashboardStats"] = True
+
+    return HTMLResponse(
+        content=html,
+        status_code=200 if response.committed else 400,
+        headers={"HX-Trigger": json.dumps(triggers), "HX-Reswap": "none"},
+    )
+
+
+@router.post("", response_model=BatchResponse, summary="Run a batch of task operations")
+async def run_batch(request: Request, batch: BatchRequest, db: Session = Depends(get_db)):
+    """
+    Apply status changes, reorders and field edits in order, in one transaction.
+
+    JSON clients get per-operation results. HTMX requests get the changed
+    task cards as an out-of-band swap bundle instead. An atomic batch with
+    a rejected operation is rolled back and answered with 400.
+    """
+    try:
+        response, tasks = apply_task_batch(db, batch)
+
+        if is_htmx_request(request):
+            return _oob_bundle(db, request, response, tasks)
+        return json_response(
+            dumps(response.model_dump(mode="json")), status_code=200 if response.committed else 400
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Error running batch: {str(e)}")
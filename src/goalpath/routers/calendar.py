@@ -0,0 +1,43 @@
+"""
+Calendar API Router
+Expanded reminder occurrences and schedule events in a date window, as columnar JSON
+"""
+
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from ..calendar_feed import CALENDAR_MAX_DAYS, CALENDAR_MAX_ITEMS, build_calendar
+from ..database import get_db
+from ..serializers import dumps, json_response
+
+router = APIRouter(prefix="/api/calendar", tags=["calendar"])
+
+
+@router.get("", summary="Get calendar items in a date window")
+async def get_calendar(
+    from_date: date = Query(..., alias="from", description="First day of the window"),
+    to_date: date = Query(..., alias="to", description="Last day of the window"),
+    project_id: Optional[str] = Query(None, description="Restrict to one project"),
+    limit: int = Query(CALENDAR_MAX_ITEMS, ge=1, le=200_000, description="Maximum items"),
+    db: Session = Depends(get_db),
+):
+    """
+    Reminders, with recurring ones expanded to their occurrences in the
+    window, merged with schedule events in start-time order. The window
+    spans at most CALENDAR_MAX_DAYS days.
+    """
+
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (to_date - from_date).days >= CALENDAR_MAX_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"The window may span at most {CALENDAR_MAX_DAYS} days"
+        )
+
+    try:
+        return json_response(dumps(build_calendar(db, from_date, to_date, project_id, limit)))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error building calendar: {str(e)}")
@@ -0,0 +1,194 @@
+"""
+Comments API Router
+Task comment threads and the task activity feed, both keyset-paginated
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..comments import (
+    ACTIVITY_PAGE_SIZE,
+    COMMENT_PAGE_SIZE,
+    activity_page,
+    comment_count_cache,
+    load_comment_page,
+)
+from ..database import get_db
+from ..db_utils import TransactionManager
+from ..models import Task
+from ..models.extended import TaskComment
+from ..read_models import KeysetCursor, decode_cursor
+from ..schemas import (
+    ActivityPage,
+    CommentCreate,
+    CommentPage,
+    CommentResponse,
+    CommentUpdate,
+    MessageResponse,
+)
+from ..serializers import dumps, json_response, serialize_one, to_record
+
+router = APIRouter(prefix="/api/tasks", tags=["comments"])
+
+
+def _require_task(db: Session, task_id: str) -> None:
+    if not db.get(Task, task_id):
+        raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+
+
+def _get_comment(db: Session, task_id: str, comment_id: str) -> TaskComment:
+    comment = db.get(TaskComment, comment_id)
+    if not comment or comment.task_id != task_id or comment.comment_type != "comment":
+        raise HTTPException(status_code=404, detail=f"Comment with ID {comment_id} not found")
+    return comment
+
+
+def _decode(cursor: Optional[str]) -> Optional[KeysetCursor]:
+    try:
+        return decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/{task_id}/comments", response_model=CommentPage, summary="List task comments")
+async def list_comments(
+    task_id: str,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=200, description="Comments per page"),
+    db: Session = Depends(get_db),
+) -> CommentPage:
+    """
+    A task's comments newest first, one keyset page at a time.
+
+    Pass the returned `next_cursor` to get older comments; it is null on the
+    last page. `total` is the task's comment count.
+    """
+
+    before = _decode(cursor)
+
+    try:
+        _require_task(db, task_id)
+        comments, next_cursor = load_comment_page(db, task_id, before, limit)
+        items = [to_record(comment, CommentResponse) for comment in comments]
+        total = comment_count_cache.get(db, task_id)
+        return json_response(dumps({"items": items, "next_cursor": next_cursor, "total": total}))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving comments: {str(e)}")
+
+
+@router.post(
+    "/{task_id}/comments",
+    response_model=CommentResponse,
+    status_code=201,
+    summary="Add task comment",
+)
+async def create_comment(
+    task_id: str, comment: CommentCreate, db: Session = Depends(get_db)
+) -> CommentResponse:
+    """Add a comment to a task's thread."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            _require_task(db_session, task_id)
+
+            new_comment = TaskComment(
+                task_id=task_id,
+                comment_type="comment",
+                created_at=datetime.utcnow(),
+                **comment.model_dump(),
+            )
+            db_session.add(new_comment)
+            db_session.commit()
+            db_session.refresh(new_comment)
+
+            return json_response(serialize_one(new_comment, CommentResponse), 201)
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail=f"Comment creation failed: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating comment: {str(e)}")
+
+
+@router.put(
+    "/{task_id}/comments/{comment_id}",
+    response_model=CommentResponse,
+    summary="Edit task comment",
+)
+async def update_comment(
+    task_id: str, comment_id: str, comment_update: CommentUpdate, db: Session = Depends(get_db)
+) -> CommentResponse:
+    """Edit the text of a comment."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            comment = _get_comment(db_session, task_id, comment_id)
+            comment.content = comment_update.content
+
+            db_session.commit()
+            db_session.refresh(comment)
+
+            return json_response(serialize_one(comment, CommentResponse))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating comment: {str(e)}")
+
+
+@router.delete(
+    "/{task_id}/comments/{comment_id}",
+    response_model=MessageResponse,
+    summary="Delete task comment",
+)
+async def delete_comment(
+    task_id: str, comment_id: str, db: Session = Depends(get_db)
+) -> MessageResponse:
+    """Delete a comment; status events in the activity feed cannot be deleted."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            comment = _get_comment(db_session, task_id, comment_id)
+
+            db_session.delete(comment)
+            db_session.commit()
+
+            return MessageResponse(message="Comment deleted successfully")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting comment: {str(e)}")
+
+
+@router.get("/{task_id}/activity", response_model=ActivityPage, summary="Get task activity")
+async def get_activity(
+    task_id: str,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(ACTIVITY_PAGE_SIZE, ge=1, le=200, description="Entries per page"),
+    db: Session = Depends(get_db),
+) -> ActivityPage:
+    """
+    Comments and status changes of a task merged newest first, one keyset
+    page at a time; pass the returned `next_cursor` to get older entries.
+    """
+
+    before = _decode(cursor)
+
+    try:
+        _require_task(db, task_id)
+        items, next_cursor = activity_page(db, task_id, before, limit)
+        return json_response(dumps({"items": items, "next_cursor": next_cursor}))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving activity: {str(e)}")
@@ -0,0 +1,60 @@
+"""
+Events Router - Server-Sent Events
+Pushes task, project, goal and dashboard change notifications to browsers
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from ..events import format_sse, hub
+
+router = APIRouter(tags=["events"])
+
+HEARTBEAT_SECONDS = 15.0
+RETRY_MILLISECONDS = 5000
+
+
+async def event_stream(
+    request: Request, topics: Optional[set] = None, heartbeat: float = HEARTBEAT_SECONDS
+) -> AsyncIterator[str]:
+    """Yield SSE frames for one subscriber until the client disconnects"""
+    subscription = hub.subscribe(topics)
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        while not await request.is_disconnected():
+            try:
+                message = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                # Comment frame keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(message)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get("/events", summary="Stream change events")
+async def stream_events(
+    request: Request,
+    topics: Optional[str] = Query(
+        None, description="Comma-separated entities to receive (task, project, goal, dashboard)"
+    ),
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of committed changes.
+
+    Each frame's event name is the entity (`task`, `project`, `goal` or
+    `dashboard`) and its data is a JSON object with `action` and `id`. Clients
+    re-fetch the affected fragment on notification instead of polling.
+    """
+
+    topic_set = {topic.strip() for topic in topics.split(",") if topic.strip()} if topics else None
+
+    return StreamingResponse(
+        event_stream(request, topic_set),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,74 @@
+"""
+Export API Router
+Streams projects, tasks and goals as NDJSON or CSV without loading them into memory
+"""
+
+from datetime import date
+from typing import Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from ..database import get_session_factory
+from ..exports import (
+    EXPORT_FORMATS,
+    goal_export_select,
+    project_export_select,
+    stream_export,
+    task_export_select,
+)
+from ..schemas import GoalFilters, ProjectFilters, TaskFilters
+
+router = APIRouter(prefix="/api/export", tags=["export"])
+
+FORMAT_QUERY = Query("ndjson", description="Export format: ndjson or csv")
+
+
+def _export_response(
+    session_factory: Callable[[], Session], entity: str, statement: Select, export_format: str
+) -> StreamingResponse:
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported export format: {export_format}. Use one of: "
+            + ", ".join(EXPORT_FORMATS),
+        )
+
+    filename = f"{entity}-{date.today().isoformat()}.{export_format}"
+    return StreamingResponse(
+        stream_export(session_factory, statement, export_format),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/tasks", summary="Export tasks")
+async def export_tasks(
+    filters: TaskFilters = Depends(),
+    format: str = FORMAT_QUERY,
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+):
+    """Stream every task matching the task list filters"""
+    return _export_response(session_factory, "tasks", task_export_select(filters), format)
+
+
+@router.get("/projects", summary="Export projects")
+async def export_projects(
+    filters: ProjectFilters = Depends(),
+    format: str = FORMAT_QUERY,
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+):
+    """Stream every project matching the project list filters"""
+    return _export_response(session_factory, "projects", project_export_select(filters), format)
+
+
+@router.get("/goals", summary="Export goals")
+async def export_goals(
+    filters: GoalFilters = Depends(),
+    format: str = FORMAT_QUERY,
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+):
+    """Stream every goal matching the goal list filters"""
+    return _export_response(session_factory, "goals", goal_export_select(filters), format)
@@ -12,13 +12,17 @@ from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..db_utils import QueryUtils, TransactionManager
-from ..models import Goal, GoalProject, Project
+from ..etags import ConditionalETag, with_etag
+from ..hierarchy import delete_node
+from ..models import Goal, GoalProject, Project, Task
+from ..read_models import parse_fields
 from ..schemas import (
     GoalCreate,
     GoalResponse,
     GoalUpdate,
     MessageResponse,
 )
+from ..serializers import json_response, serialize_many, serialize_one
 
 router = APIRouter(prefix="/api/goals", tags=["goals"])
 
@@ -29,16 +33,26 @@ async def list_goals(
     goal_type: Optional[str] = Query(None, description="Filter by goal type"),
     parent_goal_id: Optional[str] = Query(None, description="Filter by parent goal"),
     search: Optional[str] = Query(None, description="Search in title and description"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return, e.g. id,title,status"
+    ),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
+    etag: str = Depends(ConditionalETag(Goal, GoalProject, Project, Task)),
 ) -> List[GoalResponse]:
     """
     Get all goals with optional filtering and pagination.
 
     **Database Implementation**: Queries goals with calculated progress from linked projects.
+    With `fields`, progress and counts are only computed when requested.
     """
 
+    try:
+        fieldset = parse_fields(fields, GoalResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         # Use QueryUtils for database operations with progress calculation
         goals_data = QueryUtils.get_goals_with_progress(
@@ -49,9 +63,10 @@ async def list_goals(
             search=search,
             page=page,
             size=size,
+            fields=fieldset,
         )
 
-        return [GoalResponse(**goal) for goal in goals_data]
+        return with_etag(json_response(serialize_many(goals_data, GoalResponse, fieldset)), etag)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving goals: {str(e)}")
@@ -91,23 +106,16 @@ async def get_goal(goal_id: str, db: Session = Depends(get_db)) -> GoalResponse:
         # Count subgoals
         subgoal_count = db.query(Goal).filter(Goal.parent_goal_id == goal_id).count()
 
-        # Build response data
-        goal_data = {
-            "id": goal.id,
-            "parent_goal_id": goal.parent_goal_id,
-            "title": goal.title,
-            "description": goal.description,
-            "goal_type": goal.goal_type,
-            "target_date": goal.target_date.isoformat() if goal.target_date else None,
-            "status": goal.status,
-            "progress_percentage": round(calculated_progress, 1),
-            "created_at": goal.created_at.isoformat(),
-            "updated_at": goal.updated_at.isoformat(),
-            "subgoal_count": subgoal_count,
-            "linked_projects": len(project_links),
-        }
-
-        return GoalResponse(**goal_data)
+        # Serialize straight from the entity; values come from the database
+        return json_response(
+            serialize_one(
+                goal,
+                GoalResponse,
+                progress_percentage=round(calculated_progress, 1),
+                subgoal_count=subgoal_count,
+                linked_projects=len(project_links),
+            )
+        )
 
     except HTTPException:
         raise
@@ -297,28 +305,12 @@ async def delete_goal(
 
             goal_title = goal.title
 
-            # Handle subgoals
-            subgoals = db_session.query(Goal).filter(Goal.parent_goal_id == goal_id).all()
-
-            if subgoals:
-                if cascade:
-                    # Delete all subgoals (will cascade to their subgoals)
-                    for subgoal in subgoals:
-                        db_session.delete(subgoal)
-                else:
-                    # Promote subgoals to this goal's parent level
-                    for subgoal in subgoals:
-                        subgoal.parent_goal_id = goal.parent_goal_id
-
-            # Delete goal-project links (will be handled by CASCADE in schema)
-            # But we'll do it explicitly for clarity
-            db_session.query(GoalProject).filter(GoalProject.goal_id == goal_id).delete()
-
-            # Delete the goal
-            db_session.delete(goal)
+            # Subtree delete or child promotion runs as set-based statements;
+            # goal-project links go through ON DELETE CASCADE
+            affected = delete_node(db_session, Goal, goal, cascade)
             db_session.commit()
 
-            action_desc = "and all subgoals " if cascade and subgoals else ""
+            action_desc = "and all subgoals " if cascade and affected else ""
             return MessageResponse(message=f"Goal '{goal_title}' {action_desc}deleted successfully")
 
     except HTTPException:
@@ -7,16 +7,19 @@ from datetime import datetime
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, Form, Request
+from fastapi.responses import HTMLResponse
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..db_utils import QueryUtils, TransactionManager
+from ..etags import ConditionalETag, with_etag
 from ..htmx_utils import (
     htmx_error_response,
     htmx_required,
     htmx_response,
     htmx_success_response,
+    render_project_card,
 )
 from ..models import Project, Task
 
@@ -317,11 +320,7 @@ async def get_project_card_htmx(
                 status_code=404,
             )
 
-        context = {"request": request, "project": project_with_stats}
-
-        return htmx_response(
-            template_name="fragments/project_card.html", context=context, request=request
-        )
+        return HTMLResponse(content=render_project_card(project_with_stats, request))
 
     except Exception as e:
         return htmx_error_response(
@@ -340,6 +339,7 @@ async def get_projects_list_htmx(
     limit: int = 10,
     db: Session = Depends(get_db),
     _htmx: bool = Depends(htmx_required),
+    etag: str = Depends(ConditionalETag(Project, Task)),
 ) -> Any:
     """
     Get a list of project cards for dashboard updates.
@@ -350,10 +350,16 @@ async def get_projects_list_htmx(
             db=db, status=status, priority=priority, search=search, page=1, size=limit
         )
 
-        context = {"request": request, "projects": projects_data}
+        # Assemble the list from cached cards; only changed projects are re-rendered
+        cards = [render_project_card(project, request) for project in projects_data]
+
+        context = {"request": request, "projects": projects_data, "cards": cards}
 
-        return htmx_response(
-            template_name="fragments/projects_list.html", context=context, request=request
+        return with_etag(
+            htmx_response(
+                template_name="fragments/projects_list.html", context=context, request=request
+            ),
+            etag,
         )
 
     except Exception as e:
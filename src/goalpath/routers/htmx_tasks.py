@@ -10,15 +10,20 @@ from fastapi import APIRouter, Depends, Form, Query, Request
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from ..comments import activity_page
 from ..database import get_db
 from ..db_utils import TransactionManager
+from ..etags import ConditionalETag, with_etag
 from ..htmx_utils import (
     htmx_error_response,
     htmx_required,
     htmx_response,
     htmx_success_response,
+    render_task_item,
 )
 from ..models import Project, Task
+from ..read_models import decode_cursor, fetch_task_items
+from ..status_propagation import StatusChange, propagate_status_changes
 
 router = APIRouter(prefix="/htmx/tasks", tags=["htmx-tasks"])
 
@@ -185,6 +190,9 @@ async def update_task_status_htmx(
             elif status != "done" and old_status == "done":
                 task.actual_end_date = None
 
+            propagate_status_changes(
+                db_session, [StatusChange(task.id, task.project_id, old_status, status)]
+            )
             db_session.commit()
             db_session.refresh(task)
 
@@ -308,6 +316,8 @@ async def update_task_htmx(
                     status_code=404,
                 )
 
+            previous_status = task.status
+
             # Update task fields
             task.title = title.strip()
             task.description = description.strip()
@@ -320,6 +330,9 @@ async def update_task_htmx(
             task.estimated_hours = estimated_hours
             task.updated_at = datetime.utcnow()
 
+            propagate_status_changes(
+                db_session, [StatusChange(task.id, task.project_id, previous_status, status)]
+            )
             db_session.commit()
             db_session.refresh(task)
 
@@ -410,33 +423,73 @@ async def get_tasks_list_htmx(
     limit: int = 15,
     db: Session = Depends(get_db),
     _htmx: bool = Depends(htmx_required),
+    etag: str = Depends(ConditionalETag(Task, Project)),
 ) -> Any:
     """
     Get a list of task items for dashboard updates.
     """
 
     try:
-        # Build query
-        query = db.query(Task).order_by(Task.updated_at.desc())
+        # Column-projected rows; task cards never show the description
+        tasks = fetch_task_items(
+            db, project_id=project_id, status=status, priority=priority, limit=limit
+        )
 
-        if project_id:
-            query = query.filter(Task.project_id == project_id)
-        if status:
-            query = query.filter(Task.status == status)
-        if priority:
-            query = query.filter(Task.priority == priority)
+        # Assemble the list from cached cards; only changed tasks are re-rendered
+        cards = [render_task_item(task, request) for task in tasks]
 
-        tasks = query.limit(limit).all()
+        context = {"request": request, "tasks": tasks, "cards": cards}
 
-        context = {"request": request, "tasks": tasks}
+        return with_etag(
+            htmx_response(
+                template_name="fragments/tasks_list.html", context=context, request=request
+            ),
+            etag,
+        )
+
+    except Exception as e:
+        return htmx_error_response(
+            error_message=f"An error occurred while retrieving tasks: {str(e)}",
+            request=request,
+            status_code=500,
+        )
+
+
+@router.get("/{task_id}/activity")
+async def get_task_activity_htmx(
+    request: Request,
+    task_id: str,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    _htmx: bool = Depends(htmx_required),
+) -> Any:
+    """
+    Render the next page of a task's activity feed; it replaces the
+    "Load older" button that requested it.
+    """
+
+    try:
+        before = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return htmx_error_response(error_message=str(e), request=request, status_code=400)
+
+    try:
+        activity, activity_cursor = activity_page(db, task_id, before)
+
+        context = {
+            "request": request,
+            "task_id": task_id,
+            "activity": activity,
+            "activity_cursor": activity_cursor,
+        }
 
         return htmx_response(
-            template_name="fragments/tasks_list.html", context=context, request=request
+            template_name="fragments/activity_items.html", context=context, request=request
         )
 
     except Exception as e:
         return htmx_error_response(
-            error_message=f"An error occurred while retrieving tasks: {str(e)}",
+            error_message=f"An error occurred while retrieving activity: {str(e)}",
             request=request,
             status_code=500,
         )
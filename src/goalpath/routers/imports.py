@@ -0,0 +1,61 @@
+"""
+Import API Router
+Streams CSV or NDJSON uploads into projects, tasks, dependencies and goal links
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..database import get_db
+from ..importer import IMPORT_BATCH_SIZE, IMPORT_ENTITIES, BulkImporter, make_parser
+from ..schemas import ImportReport
+
+router = APIRouter(prefix="/api/import", tags=["import"])
+
+
+@router.post("/{entity}", response_model=ImportReport, summary="Bulk import records")
+async def import_records(
+    entity: str,
+    request: Request,
+    format: str = Query("ndjson", description="Upload format: ndjson or csv"),
+    resume_from: int = Query(
+        0, ge=0, description="Skip this many records (committed_rows of an interrupted run)"
+    ),
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=10000, description="Rows per commit"),
+    db: Session = Depends(get_db),
+):
+    """
+    Import the request body, parsed as it is received.
+
+    Each batch is committed on its own; if the upload is interrupted, send
+    it again with ``resume_from`` set to the last reported ``committed_rows``.
+    The skipped records are still read for their parent links, so children
+    committed before the interruption are linked to parents that follow it.
+    """
+    if entity not in IMPORT_ENTITIES:
+        raise HTTPException(status_code=404, detail=f"Unknown import entity: {entity}")
+    try:
+        parser = make_parser(format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    importer = BulkImporter(db, entity, batch_size=batch_size, skip=resume_from)
+    try:
+        async for chunk in request.stream():
+            importer.add_all(parser.feed(chunk))
+        importer.add_all(parser.close())
+        return importer.finish()
+
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Import stopped after {importer.report.committed_rows} records: {str(e.orig)}",
+        )
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Import stopped after {importer.report.committed_rows} records: {str(e)}",
+        )
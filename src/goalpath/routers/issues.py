@@ -0,0 +1,219 @@
+"""
+Issues API Router
+Issue CRUD with keyset-paginated listing, bulk promotion to tasks and triage counters
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..database import get_db
+from ..db_utils import TransactionManager
+from ..issues import (
+    ISSUE_PAGE_SIZE,
+    load_issue_page,
+    load_issues,
+    promote_issues,
+    triage_counters,
+)
+from ..models import Project
+from ..models.extended import Issue
+from ..read_models import decode_cursor
+from ..schemas import (
+    IssueCreate,
+    IssuePage,
+    IssuePromoteRequest,
+    IssuePromoteResponse,
+    IssueResponse,
+    IssueStatus,
+    IssueType,
+    IssueUpdate,
+    MessageResponse,
+    Priority,
+)
+from ..serializers import dumps, json_response, serialize_one, to_record
+
+router = APIRouter(prefix="/api/issues", tags=["issues"])
+
+
+def _get_issue(db: Session, issue_id: str) -> Issue:
+    issue = db.get(Issue, issue_id)
+    if not issue:
+        raise HTTPException(status_code=404, detail=f"Issue with ID {issue_id} not found")
+    return issue
+
+
+@router.get("/", response_model=IssuePage, summary="List issues")
+async def list_issues(
+    project_id: Optional[str] = Query(None, description="Filter by project"),
+    status: Optional[IssueStatus] = Query(None, description="Filter by status"),
+    priority: Optional[Priority] = Query(None, description="Filter by priority"),
+    issue_type: Optional[IssueType] = Query(None, description="Filter by issue type"),
+    assignee: Optional[str] = Query(None, description="Filter by assignee"),
+    promoted: Optional[bool] = Query(None, description="Only promoted (true) or unpromoted"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(ISSUE_PAGE_SIZE, ge=1, le=200, description="Issues per page"),
+    db: Session = Depends(get_db),
+) -> IssuePage:
+    """
+    Issues newest first, one keyset page at a time.
+
+    Pass the returned `next_cursor` to get the following page; it is null
+    on the last one. Each page costs one index range scan, however deep.
+    """
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        issues, next_cursor = load_issue_page(
+            db,
+            limit,
+            project_id=project_id,
+            status=status.value if status else None,
+            priority=priority.value if priority else None,
+            issue_type=issue_type.value if issue_type else None,
+            assignee=assignee,
+            promoted=promoted,
+            after=after,
+        )
+        items = [to_record(issue, IssueResponse) for issue in issues]
+        return json_response(dumps({"items": items, "next_cursor": next_cursor}))
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving issues: {str(e)}")
+
+
+@router.get("/counters", summary="Get triage counters")
+async def get_triage_counters(
+    project_id: Optional[str] = Query(None, description="Restrict to one project"),
+    db: Session = Depends(get_db),
+):
+    """Issue totals per status, and the triage queue by priority and type."""
+
+    try:
+        return json_response(dumps(triage_counters(db, project_id)))
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error counting issues: {str(e)}")
+
+
+@router.post("/promote", response_model=IssuePromoteResponse, summary="Promote issues to tasks")
+async def promote(request: IssuePromoteRequest, db: Session = Depends(get_db)):
+    """
+    Create a task for each issue and link it back through
+    `promoted_to_task_id`, all in one transaction: one multi-row task
+    insert and one batched issue update. Issues already promoted are
+    skipped; an unknown issue rejects the whole request.
+    """
+
+    try:
+        with TransactionManager(db) as db_session:
+            found = load_issues(db_session, request.issue_ids)
+            missing = [issue_id for issue_id in request.issue_ids if issue_id not in found]
+            if missing:
+                raise HTTPException(
+                    status_code=404, detail=f"Issues not found: {', '.join(missing)}"
+                )
+
+            ordered = [found[issue_id] for issue_id in dict.fromkeys(request.issue_ids)]
+            result = promote_issues(db_session, ordered, request.status)
+            db_session.commit()
+
+            return result
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail=f"Issue promotion failed: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error promoting issues: {str(e)}")
+
+
+@router.get("/{issue_id}", response_model=IssueResponse, summary="Get issue by ID")
+async def get_issue(issue_id: str, db: Session = Depends(get_db)) -> IssueResponse:
+    """Get a specific issue by ID."""
+
+    try:
+        return json_response(serialize_one(_get_issue(db, issue_id), IssueResponse))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving issue: {str(e)}")
+
+
+@router.post("/", response_model=IssueResponse, status_code=201, summary="Create new issue")
+async def create_issue(issue: IssueCreate, db: Session = Depends(get_db)) -> IssueResponse:
+    """Report an issue against an existing project."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            if not db_session.get(Project, issue.project_id):
+                raise HTTPException(
+                    status_code=404, detail=f"Project with ID {issue.project_id} not found"
+                )
+
+            new_issue = Issue(**issue.model_dump())
+            db_session.add(new_issue)
+            db_session.commit()
+            db_session.refresh(new_issue)
+
+            return json_response(serialize_one(new_issue, IssueResponse), 201)
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail=f"Issue creation failed: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating issue: {str(e)}")
+
+
+@router.put("/{issue_id}", response_model=IssueResponse, summary="Update issue")
+async def update_issue(
+    issue_id: str, issue_update: IssueUpdate, db: Session = Depends(get_db)
+) -> IssueResponse:
+    """Triage an issue: change its type, priority, status or assignee."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            issue = _get_issue(db_session, issue_id)
+
+            for field, value in issue_update.model_dump(exclude_unset=True).items():
+                setattr(issue, field, value)
+
+            db_session.commit()
+            db_session.refresh(issue)
+
+            return json_response(serialize_one(issue, IssueResponse))
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail=f"Issue update failed: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating issue: {str(e)}")
+
+
+@router.delete("/{issue_id}", response_model=MessageResponse, summary="Delete issue")
+async def delete_issue(issue_id: str, db: Session = Depends(get_db)) -> MessageResponse:
+    """Delete an issue; a task promoted from it is kept."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            issue = _get_issue(db_session, issue_id)
+            issue_title = issue.title
+
+            db_session.delete(issue)
+            db_session.commit()
+
+            return MessageResponse(message=f"Issue '{issue_title}' deleted successfully")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting issue: {str(e)}")
@@ -10,15 +10,22 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from ..critical_path import critical_path_cache
 from ..database import get_db
 from ..db_utils import QueryUtils, TransactionManager
-from ..models import Project
+from ..dependency_graph import graph_cache
+from ..etags import ConditionalETag, with_etag
+from ..forecast import FORECAST_TRIALS, HISTORY_WEEKS, forecast_cache
+from ..models import Project, Task
+from ..read_models import parse_fields
 from ..schemas import (
     MessageResponse,
     ProjectCreate,
     ProjectResponse,
     ProjectUpdate,
+    ScheduleWeight,
 )
+from ..serializers import dumps, json_response, serialize_many, serialize_one
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
@@ -28,23 +35,41 @@ async def list_projects(
     status: Optional[str] = Query(None, description="Filter by status"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
     search: Optional[str] = Query(None, description="Search in name and description"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return, e.g. id,name,status"
+    ),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
+    etag: str = Depends(ConditionalETag(Project, Task)),
 ) -> List[ProjectResponse]:
     """
     Get all projects with optional filtering and pagination.
 
     **Database Implementation**: Queries projects with calculated statistics.
+    With `fields`, task statistics are only computed when requested.
     """
 
+    try:
+        fieldset = parse_fields(fields, ProjectResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         # Use QueryUtils for database operations with statistics
         projects_data = QueryUtils.get_projects_with_stats(
-            db=db, status=status, priority=priority, search=search, page=page, size=size
+            db=db,
+            status=status,
+            priority=priority,
+            search=search,
+            page=page,
+            size=size,
+            fields=fieldset,
         )
 
-        return [ProjectResponse(**project) for project in projects_data]
+        return with_etag(
+            json_response(serialize_many(projects_data, ProjectResponse, fieldset)), etag
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving projects: {str(e)}")
@@ -64,7 +89,7 @@ async def get_project(project_id: str, db: Session = Depends(get_db)) -> Project
         if not project_data:
             raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
 
-        return ProjectResponse(**project_data)
+        return json_response(serialize_one(project_data, ProjectResponse))
 
     except HTTPException:
         raise
@@ -285,3 +310,100 @@ async def get_project_statistics(project_id: str, db: Session = Depends(get_db))
         raise HTTPException(
             status_code=500, detail=f"Error calculating project statistics: {str(e)}"
         )
+
+
+@router.get("/{project_id}/dependency-order", summary="Get tasks in dependency order")
+async def get_dependency_order(project_id: str, db: Session = Depends(get_db)) -> dict:
+    """
+    Task IDs of a project ordered so every blocker comes before the tasks it
+    blocks. Tasks without dependencies keep their sibling order.
+    """
+
+    try:
+        project = db.get(Project, project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
+
+        graph = graph_cache.get(db, project_id)
+        try:
+            order = graph.topological_order()
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return {
+            "project_id": project_id,
+            "task_count": len(graph),
+            "dependency_count": graph.edge_count,
+            "order": order,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error ordering project tasks: {str(e)}")
+
+
+@router.get("/{project_id}/critical-path", summary="Get project critical path")
+async def get_critical_path(
+    project_id: str,
+    weight: ScheduleWeight = Query(
+        ScheduleWeight.ESTIMATED_HOURS, description="Task duration: estimated_hours or story_points"
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Critical path of a project's blocking dependencies (CPM).
+
+    Returns the project duration, the critical chain and per-task earliest
+    and latest start/finish with slack, in dependency order. Done and
+    cancelled tasks, and tasks without an estimate, count as zero-length.
+    Results are cached until the dependency graph or a task changes.
+    """
+
+    try:
+        project = db.get(Project, project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
+
+        try:
+            report = critical_path_cache.get(db, project_id, weight)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return json_response(dumps(report))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing critical path: {str(e)}")
+
+
+@router.get("/{project_id}/forecast", summary="Get project delivery forecast")
+async def get_forecast(
+    project_id: str,
+    trials: int = Query(FORECAST_TRIALS, ge=1_000, le=100_000, description="Simulated futures"),
+    history_weeks: int = Query(
+        HISTORY_WEEKS, ge=1, le=104, description="Weeks of throughput history to sample"
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Monte Carlo forecast of when the project's open tasks will be done.
+
+    Each trial replays weeks drawn from the project's recent weekly
+    throughput until the backlog is exhausted; the response gives the
+    P50/P85/P95 number of weeks and dates alongside the sampled history.
+    Results are cached until a task of the project changes.
+    """
+
+    try:
+        project = db.get(Project, project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
+
+        return json_response(dumps(forecast_cache.get(db, project, trials, history_weeks)))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing forecast: {str(e)}")
@@ -0,0 +1,62 @@
+"""
+Reminders API Router
+Snoozing reminders; the reminder scheduler picks up the new trigger times
+"""
+
+from datetime import timezone
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..database import get_db
+from ..db_utils import TransactionManager
+from ..models.extended import Reminder
+from ..reminders import SNOOZABLE_STATUSES, snooze_reminders
+from ..schemas import ReminderSnoozeRequest, ReminderSnoozeResponse
+
+router = APIRouter(prefix="/api/reminders", tags=["reminders"])
+
+
+@router.post("/snooze", response_model=ReminderSnoozeResponse, summary="Snooze reminders")
+async def snooze(request: ReminderSnoozeRequest, db: Session = Depends(get_db)):
+    """
+    Make reminders due again at `until`, in one UPDATE. A recurring
+    reminder keeps its series' times after the snoozed occurrence fires.
+    Acknowledged and cancelled reminders are skipped; an unknown reminder
+    rejects the whole request.
+    """
+
+    until = request.until
+    if until.tzinfo is not None:
+        until = until.astimezone(timezone.utc).replace(tzinfo=None)
+
+    try:
+        with TransactionManager(db) as db_session:
+            reminder_ids = list(dict.fromkeys(request.reminder_ids))
+            statuses = dict(
+                db_session.execute(
+                    select(Reminder.id, Reminder.status).where(Reminder.id.in_(reminder_ids))
+                ).all()
+            )
+            missing = [reminder_id for reminder_id in reminder_ids if reminder_id not in statuses]
+            if missing:
+                raise HTTPException(
+                    status_code=404, detail=f"Reminders not found: {', '.join(missing)}"
+                )
+
+            snoozed, skipped = [], []
+            for reminder_id in reminder_ids:
+                if statuses[reminder_id] in SNOOZABLE_STATUSES:
+                    snoozed.append(reminder_id)
+                else:
+                    skipped.append(reminder_id)
+            snooze_reminders(db_session, snoozed, until)
+            db_session.commit()
+
+            return {"snoozed": snoozed, "skipped": skipped}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error snoozing reminders: {str(e)}")
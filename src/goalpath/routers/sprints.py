@@ -0,0 +1,307 @@
+"""
+Sprints API Router
+Sprint CRUD, the sprint board, bulk task membership and burndown series
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..database import get_db
+from ..db_utils import TransactionManager
+from ..models import Project, Sprint, SprintTask, Task
+from ..schemas import (
+    BurndownUnit,
+    MessageResponse,
+    SprintCreate,
+    SprintResponse,
+    SprintStatus,
+    SprintTaskIds,
+    SprintUpdate,
+)
+from ..serializers import dumps, json_response, serialize_many, serialize_one, to_record
+from ..sprints import build_board, build_burndown, burndown_cache, sprint_task_rows
+
+router = APIRouter(prefix="/api/sprints", tags=["sprints"])
+
+
+def _get_sprint(db: Session, sprint_id: str) -> Sprint:
+    sprint = db.get(Sprint, sprint_id)
+    if not sprint:
+        raise HTTPException(status_code=404, detail=f"Sprint with ID {sprint_id} not found")
+    return sprint
+
+
+def _task_count(db: Session, sprint_id: str) -> int:
+    return db.scalar(
+        select(func.count()).select_from(SprintTask).where(SprintTask.sprint_id == sprint_id)
+    )
+
+
+def _check_dates(start_date, end_date) -> None:
+    if end_date <= start_date:
+        raise HTTPException(status_code=400, detail="Sprint must end after it starts")
+
+
+@router.get("/", response_model=List[SprintResponse], summary="List sprints")
+async def list_sprints(
+    project_id: Optional[str] = Query(None, description="Filter by project"),
+    status: Optional[SprintStatus] = Query(None, description="Filter by status"),
+    db: Session = Depends(get_db),
+) -> List[SprintResponse]:
+    """Sprints in start-date order, each with its task count."""
+
+    try:
+        counts = (
+            select(SprintTask.sprint_id, func.count().label("task_count"))
+            .group_by(SprintTask.sprint_id)
+            .subquery()
+        )
+        statement = (
+            select(Sprint, func.coalesce(counts.c.task_count, 0))
+            .outerjoin(counts, counts.c.sprint_id == Sprint.id)
+            .order_by(Sprint.start_date, Sprint.id)
+        )
+        if project_id:
+            statement = statement.where(Sprint.project_id == project_id)
+        if status:
+            statement = statement.where(Sprint.status == status.value)
+
+        records = [
+            to_record(sprint, SprintResponse, task_count=task_count)
+            for sprint, task_count in db.execute(statement)
+        ]
+        return json_response(serialize_many(records, SprintResponse))
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving sprints: {str(e)}")
+
+
+@router.get("/{sprint_id}", response_model=SprintResponse, summary="Get sprint by ID")
+async def get_sprint(sprint_id: str, db: Session = Depends(get_db)) -> SprintResponse:
+    """Get a sprint with its task count."""
+
+    try:
+        sprint = _get_sprint(db, sprint_id)
+        return json_response(
+            serialize_one(sprint, SprintResponse, task_count=_task_count(db, sprint_id))
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving sprint: {str(e)}")
+
+
+@router.post("/", response_model=SprintResponse, status_code=201, summary="Create new sprint")
+async def create_sprint(sprint: SprintCreate, db: Session = Depends(get_db)) -> SprintResponse:
+    """Create a sprint in an existing project."""
+
+    _check_dates(sprint.start_date, sprint.end_date)
+
+    try:
+        with TransactionManager(db) as db_session:
+            if not db_session.get(Project, sprint.project_id):
+                raise HTTPException(
+                    status_code=404, detail=f"Project with ID {sprint.project_id} not found"
+                )
+
+            new_sprint = Sprint(**sprint.model_dump())
+            db_session.add(new_sprint)
+            db_session.commit()
+            db_session.refresh(new_sprint)
+
+            return json_response(serialize_one(new_sprint, SprintResponse, task_count=0), 201)
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail=f"Sprint creation failed: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating sprint: {str(e)}")
+
+
+@router.put("/{sprint_id}", response_model=SprintResponse, summary="Update sprint")
+async def update_sprint(
+    sprint_id: str, sprint_update: SprintUpdate, db: Session = Depends(get_db)
+) -> SprintResponse:
+    """Update a sprint's name, goal, dates or status."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            sprint = _get_sprint(db_session, sprint_id)
+            update_data = sprint_update.model_dump(exclude_unset=True)
+            _check_dates(
+                update_data.get("start_date", sprint.start_date),
+                update_data.get("end_date", sprint.end_date),
+            )
+
+            for field, value in update_data.items():
+                setattr(sprint, field, value)
+
+            db_session.commit()
+            db_session.refresh(sprint)
+            burndown_cache.invalidate(sprint_id)
+
+            return json_response(
+                serialize_one(sprint, SprintResponse, task_count=_task_count(db_session, sprint_id))
+            )
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail=f"Sprint update failed: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating sprint: {str(e)}")
+
+
+@router.delete("/{sprint_id}", response_model=MessageResponse, summary="Delete sprint")
+async def delete_sprint(sprint_id: str, db: Session = Depends(get_db)) -> MessageResponse:
+    """Delete a sprint; its tasks stay in the project."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            sprint = _get_sprint(db_session, sprint_id)
+            sprint_name = sprint.name
+
+            db_session.execute(delete(SprintTask).where(SprintTask.sprint_id == sprint_id))
+            db_session.delete(sprint)
+            db_session.commit()
+            burndown_cache.invalidate(sprint_id)
+
+            return MessageResponse(message=f"Sprint '{sprint_name}' deleted successfully")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting sprint: {str(e)}")
+
+
+@router.get("/{sprint_id}/board", summary="Get the sprint board")
+async def get_sprint_board(sprint_id: str, db: Session = Depends(get_db)):
+    """
+    The sprint's tasks grouped into one column per status, in workflow
+    order, with per-column counts and story points. Reads the sprint and
+    its tasks in two queries.
+    """
+
+    try:
+        sprint = _get_sprint(db, sprint_id)
+        rows = sprint_task_rows(db, sprint_id)
+        return json_response(
+            dumps(
+                {
+                    "sprint": to_record(sprint, SprintResponse, task_count=len(rows)),
+                    "columns": build_board(rows),
+                }
+            )
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error building sprint board: {str(e)}")
+
+
+@router.post("/{sprint_id}/tasks", summary="Add tasks to a sprint")
+async def add_sprint_tasks(sprint_id: str, body: SprintTaskIds, db: Session = Depends(get_db)):
+    """
+    Add tasks to the sprint in one multi-row insert. Tasks must belong to
+    the sprint's project; tasks already in the sprint are skipped.
+    """
+
+    task_ids = list(dict.fromkeys(body.task_ids))
+
+    try:
+        with TransactionManager(db) as db_session:
+            sprint = _get_sprint(db_session, sprint_id)
+
+            projects = dict(
+                db_session.execute(
+                    select(Task.id, Task.project_id).where(Task.id.in_(task_ids))
+                ).all()
+            )
+            missing = [task_id for task_id in task_ids if task_id not in projects]
+            if missing:
+                raise HTTPException(
+                    status_code=404, detail=f"Tasks not found: {', '.join(missing)}"
+                )
+            foreign = [task_id for task_id in task_ids if projects[task_id] != sprint.project_id]
+            if foreign:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Tasks belong to another project: {', '.join(foreign)}",
+                )
+
+            existing = set(
+                db_session.scalars(
+                    select(SprintTask.task_id).where(
+                        SprintTask.sprint_id == sprint_id, SprintTask.task_id.in_(task_ids)
+                    )
+                )
+            )
+            added = [task_id for task_id in task_ids if task_id not in existing]
+            if added:
+                db_session.execute(
+                    insert(SprintTask),
+                    [{"sprint_id": sprint_id, "task_id": task_id} for task_id in added],
+                )
+            db_session.commit()
+
+            return json_response(
+                dumps({"added": added, "skipped": [t for t in task_ids if t in existing]})
+            )
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail=f"Adding sprint tasks failed: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error adding sprint tasks: {str(e)}")
+
+
+@router.delete("/{sprint_id}/tasks", summary="Remove tasks from a sprint")
+async def remove_sprint_tasks(sprint_id: str, body: SprintTaskIds, db: Session = Depends(get_db)):
+    """Remove tasks from the sprint in one statement; unknown IDs are ignored."""
+
+    try:
+        with TransactionManager(db) as db_session:
+            _get_sprint(db_session, sprint_id)
+            result = db_session.execute(
+                delete(SprintTask).where(
+                    SprintTask.sprint_id == sprint_id, SprintTask.task_id.in_(body.task_ids)
+                )
+            )
+            db_session.commit()
+
+            return json_response(dumps({"removed": result.rowcount}))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error removing sprint tasks: {str(e)}")
+
+
+@router.get("/{sprint_id}/burndown", summary="Get sprint burndown and burnup series")
+async def get_sprint_burndown(
+    sprint_id: str,
+    unit: BurndownUnit = Query(BurndownUnit.TASKS, description="What the series count"),
+    db: Session = Depends(get_db),
+):
+    """
+    Daily scope, completed and remaining work plus the ideal line, one
+    value per sprint day. Past days are replayed from the task status log
+    and cached per sprint day; today is read from the live statuses.
+    """
+
+    try:
+        sprint = _get_sprint(db, sprint_id)
+        return json_response(dumps(build_burndown(db, sprint, unit)))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error building burndown: {str(e)}")
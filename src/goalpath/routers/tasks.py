@@ -10,15 +10,27 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from ..bulk_operations import apply_task_bulk
 from ..database import get_db
 from ..db_utils import QueryUtils, TransactionManager
-from ..models import Project, Task
+from ..dependency_graph import ORDERING_TYPES, graph_cache
+from ..etags import ConditionalETag, with_etag
+from ..hierarchy import delete_node
+from ..models import Project, Task, TaskDependency
+from ..ordering import move_task, next_order_index
+from ..read_models import parse_fields
 from ..schemas import (
     MessageResponse,
+    TaskBulkRequest,
+    TaskBulkResponse,
     TaskCreate,
+    TaskDependencyCreate,
+    TaskMove,
     TaskResponse,
     TaskUpdate,
 )
+from ..serializers import json_response, serialize_many, serialize_one
+from ..status_propagation import StatusChange, propagate_status_changes
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
@@ -31,16 +43,27 @@ async def list_tasks(
     task_type: Optional[str] = Query(None, description="Filter by task type"),
     assigned_to: Optional[str] = Query(None, description="Filter by assignee"),
     search: Optional[str] = Query(None, description="Search in title and description"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return, e.g. id,title,status"
+    ),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
+    etag: str = Depends(ConditionalETag(Task, TaskDependency)),
 ) -> List[TaskResponse]:
     """
     List all tasks with filtering and pagination.
 
     **Database Implementation**: Queries tasks with hierarchy information.
+    With `fields`, only the requested columns are selected and derived counts
+    are computed only when asked for.
     """
 
+    try:
+        fieldset = parse_fields(fields, TaskResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         # Use QueryUtils for database operations with hierarchy
         tasks_data = QueryUtils.get_tasks_with_hierarchy(
@@ -50,30 +73,21 @@ async def list_tasks(
             status=status,
             task_type=task_type,
             assigned_to=assigned_to,
+            search=search,
             page=page,
             size=size,
+            fields=fieldset,
         )
 
-        # Apply search filter if provided
-        if search:
-            search_lower = search.lower()
-            tasks_data = [
-                task
-                for task in tasks_data
-                if search_lower in task["title"].lower()
-                or search_lower in (task["description"] or "").lower()
-            ]
-
-        # Add dependency count for each task
-        for task_data in tasks_data:
-            from ..models import TaskDependency
-
-            dependency_count = (
-                db.query(TaskDependency).filter(TaskDependency.task_id == task_data["id"]).count()
+        # Add dependency count for each task in one grouped query
+        if fieldset is None or "dependency_count" in fieldset:
+            dependency_counts = QueryUtils.get_dependency_counts(
+                db, [task_data["id"] for task_data in tasks_data]
             )
-            task_data["dependency_count"] = dependency_count
+            for task_data in tasks_data:
+                task_data["dependency_count"] = dependency_counts[task_data["id"]]
 
-        return [TaskResponse(**task) for task in tasks_data]
+        return with_etag(json_response(serialize_many(tasks_data, TaskResponse, fieldset)), etag)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving tasks: {str(e)}")
@@ -98,38 +112,19 @@ async def get_task(task_id: str, db: Session = Depends(get_db)) -> TaskResponse:
         subtask_count = db.query(Task).filter(Task.parent_task_id == task_id).count()
 
         # Calculate dependency count
-        from ..models import TaskDependency
-
         dependency_count = (
             db.query(TaskDependency).filter(TaskDependency.task_id == task_id).count()
         )
 
-        # Build response data
-        task_data = {
-            "id": task.id,
-            "project_id": task.project_id,
-            "parent_task_id": task.parent_task_id,
-            "title": task.title,
-            "description": task.description,
-            "task_type": task.task_type,
-            "status": task.status,
-            "priority": task.priority,
-            "story_points": task.story_points,
-            "estimated_hours": float(task.estimated_hours) if task.estimated_hours else None,
-            "actual_hours": float(task.actual_hours) if task.actual_hours else None,
-            "start_date": task.start_date.isoformat() if task.start_date else None,
-            "due_date": task.due_date.isoformat() if task.due_date else None,
-            "completed_date": task.completed_date.isoformat() if task.completed_date else None,
-            "assigned_to": task.assigned_to,
-            "created_by": task.created_by,
-            "order_index": task.order_index,
-            "created_at": task.created_at.isoformat(),
-            "updated_at": task.updated_at.isoformat(),
-            "subtask_count": subtask_count,
-            "dependency_count": dependency_count,
-        }
-
-        return TaskResponse(**task_data)
+        # Serialize straight from the entity; values come from the database
+        return json_response(
+            serialize_one(
+                task,
+                TaskResponse,
+                subtask_count=subtask_count,
+                dependency_count=dependency_count,
+            )
+        )
 
     except HTTPException:
         raise
@@ -186,16 +181,9 @@ async def create_task(task: TaskCreate, db: Session = Depends(get_db)) -> TaskRe
 
             # Calculate order index if not provided
             if "order_index" not in task_data:
-                max_order = (
-                    db_session.query(Task.order_index)
-                    .filter(
-                        Task.project_id == task.project_id,
-                        Task.parent_task_id == task.parent_task_id,
-                    )
-                    .order_by(Task.order_index.desc())
-                    .first()
+                task_data["order_index"] = next_order_index(
+                    db_session, task.project_id, task.parent_task_id
                 )
-                task_data["order_index"] = (max_order[0] + 1) if max_order and max_order[0] else 1
 
             new_task = Task(**task_data)
             db_session.add(new_task)
@@ -241,6 +229,28 @@ async def create_task(task: TaskCreate, db: Session = Depends(get_db)) -> TaskRe
         raise HTTPException(status_code=500, detail=f"Error creating task: {str(e)}")
 
 
+@router.post("/bulk", response_model=TaskBulkResponse, summary="Bulk create, update and delete")
+async def bulk_tasks(request: TaskBulkRequest, db: Session = Depends(get_db)) -> TaskBulkResponse:
+    """
+    Apply arrays of create, update, status and delete operations at once.
+
+    **Database Implementation**: References are validated with set-based
+    lookups, `order_index` values are assigned in one pass and all writes are
+    batched into a single transaction. Each item gets its own result; rejected
+    items do not prevent the others from being applied.
+    """
+
+    try:
+        return apply_task_bulk(db, request)
+
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Bulk operation failed: {str(e)}")
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Error applying bulk operation: {str(e)}")
+
+
 @router.put("/{task_id}", response_model=TaskResponse, summary="Update task")
 async def update_task(
     task_id: str, task_update: TaskUpdate, db: Session = Depends(get_db)
@@ -293,9 +303,14 @@ async def update_task(
                     update_data["completed_date"] = None
 
             # Update fields from request
+            old_status = task.status
             for field, value in update_data.items():
                 setattr(task, field, value)
 
+            # Log the change and unblock/block dependents in the same transaction
+            propagate_status_changes(
+                db_session, [StatusChange(task.id, task.project_id, old_status, task.status)]
+            )
             db_session.commit()
             db_session.refresh(task)
 
@@ -367,24 +382,12 @@ async def delete_task(
 
             task_title = task.title
 
-            # Handle subtasks
-            subtasks = db_session.query(Task).filter(Task.parent_task_id == task_id).all()
-
-            if subtasks:
-                if cascade:
-                    # Delete all subtasks (will cascade to their subtasks)
-                    for subtask in subtasks:
-                        db_session.delete(subtask)
-                else:
-                    # Reassign subtasks to this task's parent
-                    for subtask in subtasks:
-                        subtask.parent_task_id = task.parent_task_id
-
-            # Delete the task (dependencies will be handled by CASCADE)
-            db_session.delete(task)
+            # Subtree delete or child promotion runs as set-based statements;
+            # dependencies and comments go through ON DELETE CASCADE
+            affected = delete_node(db_session, Task, task, cascade)
             db_session.commit()
 
-            action_desc = "and all subtasks " if cascade and subtasks else ""
+            action_desc = "and all subtasks " if cascade and affected else ""
             return MessageResponse(message=f"Task '{task_title}' {action_desc}deleted successfully")
 
     except HTTPException:
@@ -433,6 +436,9 @@ async def update_task_status(
                 task.completed_date = None
 
             task.status = status
+            propagate_status_changes(
+                db_session, [StatusChange(task.id, task.project_id, old_status, status)]
+            )
             db_session.commit()
             db_session.refresh(task)
 
@@ -478,6 +484,54 @@ async def update_task_status(
         raise HTTPException(status_code=500, detail=f"Error updating task status: {str(e)}")
 
 
+@router.post("/{task_id}/move", response_model=TaskResponse, summary="Move task among siblings")
+async def move_task_position(
+    task_id: str, move: TaskMove, db: Session = Depends(get_db)
+) -> TaskResponse:
+    """
+    Reorder a task relative to its siblings, optionally under a new parent.
+
+    Only the moved task is written unless its sibling group has run out of
+    gaps between order_index values, in which case the group is renumbered.
+    """
+
+    try:
+        task = db.get(Task, task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+
+        options = {"before_id": move.before_id, "after_id": move.after_id}
+        if "parent_task_id" in move.model_fields_set:
+            options["parent_task_id"] = move.parent_task_id
+        try:
+            move_task(db, task, **options)
+        except ValueError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+        db.commit()
+        db.refresh(task)
+
+        subtask_count = db.query(Task).filter(Task.parent_task_id == task_id).count()
+        dependency_count = (
+            db.query(TaskDependency).filter(TaskDependency.task_id == task_id).count()
+        )
+        return json_response(
+            serialize_one(
+                task,
+                TaskResponse,
+                subtask_count=subtask_count,
+                dependency_count=dependency_count,
+            )
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Error moving task: {str(e)}")
+
+
 @router.get("/{task_id}/subtasks", response_model=List[TaskResponse], summary="Get task subtasks")
 async def get_task_subtasks(
     task_id: str,
@@ -502,14 +556,12 @@ async def get_task_subtasks(
             db=db, parent_task_id=task_id, page=page, size=size
         )
 
-        # Add dependency count for each subtask
+        # Add dependency count for each subtask in one grouped query
+        dependency_counts = QueryUtils.get_dependency_counts(
+            db, [task_data["id"] for task_data in subtasks_data]
+        )
         for task_data in subtasks_data:
-            from ..models import TaskDependency
-
-            dependency_count = (
-                db.query(TaskDependency).filter(TaskDependency.task_id == task_data["id"]).count()
-            )
-            task_data["dependency_count"] = dependency_count
+            task_data["dependency_count"] = dependency_counts[task_data["id"]]
 
         return [TaskResponse(**task) for task in subtasks_data]
 
@@ -585,3 +637,142 @@ async def get_task_dependencies(task_id: str, db: Session = Depends(get_db)) ->
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving task dependencies: {str(e)}")
+
+
+def _dependency_summaries(db: Session, task_ids: List[str]) -> List[dict]:
+    """id/title/status of the given tasks, in the given order, in one query"""
+    rows = {
+        row.id: row
+        for row in db.query(Task.id, Task.title, Task.status).filter(Task.id.in_(task_ids))
+    }
+    return [
+        {"task_id": task_id, "task_title": rows[task_id].title, "task_status": rows[task_id].status}
+        for task_id in task_ids
+        if task_id in rows
+    ]
+
+
+@router.post("/{task_id}/dependencies", status_code=201, summary="Add task dependency")
+async def add_task_dependency(
+    task_id: str, dependency: TaskDependencyCreate, db: Session = Depends(get_db)
+) -> dict:
+    """
+    Make a task depend on another task of the same project.
+
+    Blocking dependencies are checked against the project's cached
+    dependency graph and rejected when they would close a cycle.
+    """
+
+    try:
+        task = db.get(Task, task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+
+        depends_on_id = dependency.depends_on_task_id
+        depends_on = db.get(Task, depends_on_id)
+        if not depends_on:
+            raise HTTPException(status_code=404, detail=f"Task with ID {depends_on_id} not found")
+        if depends_on_id == task_id:
+            raise HTTPException(status_code=400, detail="A task cannot depend on itself")
+        if depends_on.project_id != task.project_id:
+            raise HTTPException(
+                status_code=400, detail="Dependencies must link tasks in the same project"
+            )
+
+        dependency_type = dependency.dependency_type.value
+        if dependency_type in ORDERING_TYPES:
+            graph = graph_cache.get(db, task.project_id)
+            if graph.would_create_cycle(task_id, depends_on_id):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Dependency would create a cycle: "
+                    f"task {depends_on_id} already depends on task {task_id}",
+                )
+
+        link = TaskDependency(
+            task_id=task_id, depends_on_task_id=depends_on_id, dependency_type=dependency_type
+        )
+        db.add(link)
+        db.commit()
+        db.refresh(link)
+
+        return {
+            "dependency_id": link.id,
+            "task_id": task_id,
+            "depends_on_task_id": depends_on_id,
+            "dependency_type": link.dependency_type,
+            "created_at": link.created_at.isoformat(),
+        }
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Dependency creation failed: {str(e)}")
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Error adding task dependency: {str(e)}")
+
+
+@router.delete(
+    "/{task_id}/dependencies/{depends_on_task_id}",
+    response_model=MessageResponse,
+    summary="Remove task dependency",
+)
+async def remove_task_dependency(
+    task_id: str, depends_on_task_id: str, db: Session = Depends(get_db)
+) -> MessageResponse:
+    """Remove the dependency of a task on another task"""
+
+    try:
+        deleted = (
+            db.query(TaskDependency)
+            .filter(
+                TaskDependency.task_id == task_id,
+                TaskDependency.depends_on_task_id == depends_on_task_id,
+            )
+            .delete(synchronize_session=False)
+        )
+        if not deleted:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Task {task_id} does not depend on task {depends_on_task_id}",
+            )
+        db.commit()
+
+        return MessageResponse(message="Dependency removed successfully")
+
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Error removing task dependency: {str(e)}")
+
+
+@router.get("/{task_id}/dependencies/transitive", summary="Get transitive task dependencies")
+async def get_transitive_dependencies(task_id: str, db: Session = Depends(get_db)) -> dict:
+    """
+    Every task this task waits on (blockers) and every task waiting on it
+    (blockees), through any number of blocking dependencies, nearest first.
+    """
+
+    try:
+        task = db.get(Task, task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+
+        graph = graph_cache.get(db, task.project_id)
+        return {
+            "task_id": task_id,
+            "task_title": task.title,
+            "blockers": _dependency_summaries(db, graph.blockers(task_id)),
+            "blockees": _dependency_summaries(db, graph.blockees(task_id)),
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Error retrieving transitive dependencies: {str(e)}"
+        )
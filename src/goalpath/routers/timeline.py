@@ -0,0 +1,39 @@
+"""
+Timeline API Router
+Tasks, sprints and schedule events overlapping a date window, as columnar JSON
+"""
+
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from ..database import get_db
+from ..serializers import dumps, json_response
+from ..timeline import TIMELINE_MAX_ROWS, build_timeline
+
+router = APIRouter(prefix="/api/timeline", tags=["timeline"])
+
+
+@router.get("", summary="Get timeline items in a date window")
+async def get_timeline(
+    from_date: date = Query(..., alias="from", description="First day of the window"),
+    to_date: date = Query(..., alias="to", description="Last day of the window"),
+    project_id: Optional[str] = Query(None, description="Restrict to one project"),
+    limit: int = Query(TIMELINE_MAX_ROWS, ge=1, le=50_000, description="Rows per section"),
+    db: Session = Depends(get_db),
+):
+    """
+    Tasks, sprints and schedule events whose date range overlaps
+    ``[from, to]``. Each section lists its values column by column, ready to
+    be zipped into bars on the client.
+    """
+
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+
+    try:
+        return json_response(dumps(build_timeline(db, from_date, to_date, project_id, limit)))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error building timeline: {str(e)}")
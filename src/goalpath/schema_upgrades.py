@@ -0,0 +1,152 @@
+"""
+Schema upgrades for GoalPath
+In-place upgrades for databases created before a table gained columns or constraints
+"""
+
+from typing import List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateTable
+
+from .models import Base
+from .models.extended import Reminder
+
+# Added to reminders for the scheduler's leased batch firing and snoozing
+REMINDER_SCHEDULER_COLUMNS = ("fired_at", "leased_by", "lease_expires_at", "recurrence_anchor")
+
+# Tables paged by (created_at, id) keyset cursors
+KEYSET_TIMESTAMP_TABLES = ("issues", "task_comments")
+
+_REMINDERS_REBUILD = "reminders_upgrade"
+_SQLITE_TABLE_SQL = "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"
+
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """
+    Bring an existing database up to the current models.
+
+    create_all only creates missing tables, so columns, constraints and
+    indexes added to existing tables are applied here. Every upgrade checks
+    whether it is needed first, so this is safe to run on each start.
+    Returns the names of the upgrades applied.
+    """
+    applied = []
+    with engine.begin() as connection:
+        if _reminders_outdated(connection):
+            _upgrade_reminders(connection)
+            applied.append("reminder_scheduler")
+        if _normalize_keyset_timestamps(connection):
+            applied.append("keyset_timestamps")
+        if _create_missing_indexes(connection):
+            applied.append("model_indexes")
+    return applied
+
+
+def _reminders_outdated(connection: Connection) -> bool:
+    inspector = inspect(connection)
+    if not inspector.has_table("reminders"):
+        return False
+    columns = {column["name"] for column in inspector.get_columns("reminders")}
+    if not columns.issuperset(REMINDER_SCHEDULER_COLUMNS):
+        return True
+    # The status CHECK must allow 'fired'; SQLite keeps it in the table's SQL
+    if connection.dialect.name == "sqlite":
+        checks = [connection.scalar(text(_SQLITE_TABLE_SQL), {"name": "reminders"})]
+    else:
+        checks = [check["sqltext"] for check in inspector.get_check_constraints("reminders")]
+    return any("'snoozed'" in check and "'fired'" not in check for check in checks)
+
+
+def _upgrade_reminders(connection: Connection) -> None:
+    """
+    Add the scheduler columns and the 'fired' status to reminders.
+
+    SQLite cannot alter a CHECK constraint, so there the table is rebuilt
+    from the model and the rows copied over; upgrade_reminder_scheduler.sql
+    under database/ is the same upgrade by hand. Other databases alter the
+    table in place.
+    """
+    table = Reminder.__table__
+    if connection.dialect.name != "sqlite":
+        existing = {column["name"] for column in inspect(connection).get_columns("reminders")}
+        for name in REMINDER_SCHEDULER_COLUMNS:
+            if name not in existing:
+                column_type = table.c[name].type.compile(dialect=connection.dialect)
+                connection.execute(text(f"ALTER TABLE reminders ADD COLUMN {name} {column_type}"))
+        status_check = next(
+            constraint
+            for constraint in table.constraints
+            if constraint.name == "chk_reminder_status"
+        )
+        connection.execute(
+            text("ALTER TABLE reminders DROP CONSTRAINT IF EXISTS chk_reminder_status")
+        )
+        connection.execute(
+            text(
+                "ALTER TABLE reminders ADD CONSTRAINT chk_reminder_status "
+                f"CHECK ({status_check.sqltext})"
+            )
+        )
+        return
+
+    existing = [column["name"] for column in inspect(connection).get_columns("reminders")]
+    copied = ", ".join(name for name in existing if name in table.c)
+    ddl = str(CreateTable(table).compile(dialect=connection.dialect)).replace(
+        "CREATE TABLE reminders", f"CREATE TABLE {_REMINDERS_REBUILD}", 1
+    )
+    # A rebuild that failed part way leaves only the new, uncommitted copy behind
+    connection.execute(text(f"DROP TABLE IF EXISTS {_REMINDERS_REBUILD}"))
+    connection.execute(text(ddl))
+    connection.execute(
+        text(f"INSERT INTO {_REMINDERS_REBUILD} ({copied}) SELECT {copied} FROM reminders")
+    )
+    connection.execute(text("DROP TABLE reminders"))
+    connection.execute(text(f"ALTER TABLE {_REMINDERS_REBUILD} RENAME TO reminders"))
+    for index in table.indexes:
+        index.create(connection, checkfirst=True)
+
+
+def _normalize_keyset_timestamps(connection: Connection) -> int:
+    """
+    Give whole-second created_at values the microseconds SQLAlchemy writes.
+
+    SQLite keeps DATETIME as text and compares it as text. Rows stamped by
+    CURRENT_TIMESTAMP hold "YYYY-MM-DD HH:MM:SS" while a keyset cursor binds
+    "YYYY-MM-DD HH:MM:SS.ffffff", so a cursor never moves past same-second
+    rows. Other databases compare real timestamps and need nothing. Returns
+    the rows rewritten.
+    """
+    if connection.dialect.name != "sqlite":
+        return 0
+    inspector = inspect(connection)
+    rewritten = 0
+    for table in KEYSET_TIMESTAMP_TABLES:
+        if inspector.has_table(table):
+            rewritten += connection.execute(
+                text(
+                    f"UPDATE {table} SET created_at = created_at || '.000000'"
+                    " WHERE length(created_at) = 19"
+                )
+            ).rowcount
+    return rewritten
+
+
+def _create_missing_indexes(connection: Connection) -> List[str]:
+    """
+    Create the indexes declared on the models that an existing table lacks.
+
+    Indexes added to a model after its table was created would otherwise
+    only exist in new databases. Returns the names of the indexes created.
+    """
+    inspector = inspect(connection)
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if not table.indexes or not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name not in existing:
+                index.create(connection)
+                created.append(index.name)
+    return created
@@ -5,7 +5,7 @@ Request and response models for validation and documentation
 
 from datetime import date, datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -60,6 +60,45 @@ class GoalType(str, Enum):
     MILESTONE = "milestone"
 
 
+class DependencyType(str, Enum):
+    BLOCKS = "blocks"
+    SUBTASK_OF = "subtask_of"
+    RELATED_TO = "related_to"
+
+
+class ScheduleWeight(str, Enum):
+    ESTIMATED_HOURS = "estimated_hours"
+    STORY_POINTS = "story_points"
+
+
+class SprintStatus(str, Enum):
+    PLANNING = "planning"
+    ACTIVE = "active"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+class IssueType(str, Enum):
+    BUG = "bug"
+    FEATURE = "feature"
+    ENHANCEMENT = "enhancement"
+    QUESTION = "question"
+
+
+class IssueStatus(str, Enum):
+    TRIAGE = "triage"
+    BACKLOG = "backlog"
+    IN_PROGRESS = "in_progress"
+    RESOLVED = "resolved"
+    CLOSED = "closed"
+
+
+class BurndownUnit(str, Enum):
+    TASKS = "tasks"
+    STORY_POINTS = "story_points"
+    ESTIMATED_HOURS = "estimated_hours"
+
+
 # Project Schemas
 class ProjectBase(BaseModel):
     name: str = Field(..., max_length=255, description="Project name")
@@ -153,6 +192,110 @@ class TaskResponse(TaskBase):
         from_attributes = True
 
 
+class TaskMove(BaseModel):
+    before_id: Optional[str] = Field(None, description="Place the task just before this sibling")
+    after_id: Optional[str] = Field(None, description="Place the task just after this sibling")
+    parent_task_id: Optional[str] = Field(
+        None, description="New parent task; send null for the top level, omit to keep the parent"
+    )
+
+
+class TaskDependencyCreate(BaseModel):
+    depends_on_task_id: str = Field(..., description="Task that must be finished first")
+    dependency_type: DependencyType = Field(DependencyType.BLOCKS, description="Dependency type")
+
+
+class TaskBulkUpdate(TaskUpdate):
+    id: str = Field(..., description="Task ID")
+
+
+class TaskBulkStatus(BaseModel):
+    id: str = Field(..., description="Task ID")
+    status: TaskStatus = Field(..., description="New task status")
+
+
+class TaskBulkRequest(BaseModel):
+    create: List[TaskCreate] = Field(default_factory=list, description="Tasks to create")
+    update: List[TaskBulkUpdate] = Field(default_factory=list, description="Field updates")
+    status: List[TaskBulkStatus] = Field(default_factory=list, description="Status changes")
+    delete: List[str] = Field(default_factory=list, description="IDs of tasks to delete")
+
+
+class TaskBulkItemResult(BaseModel):
+    op: str = Field(..., description="Operation: create, update, status, reorder or delete")
+    index: int = Field(..., description="Position of the item in its operation array")
+    id: Optional[str] = Field(None, description="Task ID (assigned for creates)")
+    success: bool = Field(..., description="Whether the item was applied")
+    error: Optional[str] = Field(None, description="Why the item was rejected")
+
+
+class TaskBulkResponse(BaseModel):
+    results: List[TaskBulkItemResult] = Field(..., description="Per-item results")
+    created: int = Field(0, description="Number of tasks created")
+    updated: int = Field(0, description="Number of tasks updated (fields or status)")
+    deleted: int = Field(0, description="Number of tasks deleted")
+    failed: int = Field(0, description="Number of rejected items")
+
+
+# Batch Schemas
+class BatchStatusOperation(BaseModel):
+    op: Literal["status"] = Field(..., description="Change a task's status")
+    id: str = Field(..., description="Task ID")
+    status: TaskStatus = Field(..., description="New task status")
+
+
+class BatchReorderOperation(BaseModel):
+    op: Literal["reorder"] = Field(..., description="Move a task within its siblings")
+    id: str = Field(..., description="Task ID")
+    order_index: int = Field(..., ge=0, description="New sort order within parent")
+
+
+class BatchUpdateOperation(BaseModel):
+    op: Literal["update"] = Field(..., description="Edit task fields")
+    id: str = Field(..., description="Task ID")
+    fields: TaskUpdate = Field(..., description="Fields to change")
+
+
+BatchOperation = Annotated[
+    Union[BatchStatusOperation, BatchReorderOperation, BatchUpdateOperation],
+    Field(discriminator="op"),
+]
+
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperation] = Field(
+        ..., min_length=1, max_length=500, description="Operations, applied in order"
+    )
+    atomic: bool = Field(True, description="Roll back every operation if any of them fails")
+
+
+class BatchResponse(BaseModel):
+    results: List[TaskBulkItemResult] = Field(..., description="Per-operation results")
+    applied: int = Field(0, description="Number of operations applied")
+    failed: int = Field(0, description="Number of rejected operations")
+    committed: bool = Field(..., description="Whether the transaction was committed")
+
+
+# Import Schemas
+class ImportRowError(BaseModel):
+    row: int = Field(..., description="1-based record number in the source")
+    error: str = Field(..., description="Why the record was rejected")
+
+
+class ImportReport(BaseModel):
+    entity: str = Field(..., description="Imported table")
+    processed: int = Field(0, description="Records read in this run")
+    imported: int = Field(0, description="Records inserted or updated")
+    failed: int = Field(0, description="Records rejected by validation")
+    skipped: int = Field(0, description="Records skipped because a checkpoint covered them")
+    committed_rows: int = Field(0, description="Records covered by committed batches")
+    elapsed_seconds: float = Field(0.0, description="Wall-clock time of the run")
+    rows_per_second: float = Field(0.0, description="Processed records per second")
+    errors: List[ImportRowError] = Field(
+        default_factory=list, description="First rejected records with reasons"
+    )
+
+
 # Goal Schemas
 class GoalBase(BaseModel):
     title: str = Field(..., max_length=255, description="Goal title")
@@ -191,6 +334,150 @@ class GoalResponse(GoalBase):
         from_attributes = True
 
 
+# Sprint Schemas
+class SprintBase(BaseModel):
+    name: str = Field(..., max_length=100, description="Sprint name")
+    goal: Optional[str] = Field(None, description="Sprint goal")
+    start_date: date = Field(..., description="First day of the sprint")
+    end_date: date = Field(..., description="Last day of the sprint")
+    status: SprintStatus = Field(SprintStatus.PLANNING, description="Sprint status")
+
+
+class SprintCreate(SprintBase):
+    project_id: str = Field(..., description="Project the sprint belongs to")
+
+
+class SprintUpdate(BaseModel):
+    name: Optional[str] = Field(None, max_length=100)
+    goal: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    status: Optional[SprintStatus] = None
+
+
+class SprintResponse(SprintBase):
+    id: str = Field(..., description="Sprint ID")
+    project_id: str = Field(..., description="Project the sprint belongs to")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+    # Related data
+    task_count: int = Field(0, description="Number of tasks in the sprint")
+
+    class Config:
+        from_attributes = True
+
+
+class SprintTaskIds(BaseModel):
+    task_ids: List[str] = Field(..., min_length=1, description="Task IDs to add or remove")
+
+
+# Issue Schemas
+class IssueBase(BaseModel):
+    title: str = Field(..., max_length=255, description="Issue title")
+    description: Optional[str] = Field(None, description="Issue description")
+    issue_type: IssueType = Field(IssueType.FEATURE, description="Issue type")
+    priority: Priority = Field(Priority.MEDIUM, description="Issue priority")
+    status: IssueStatus = Field(IssueStatus.TRIAGE, description="Issue status")
+    reporter: str = Field(..., max_length=100, description="Who reported the issue")
+    assignee: Optional[str] = Field(None, max_length=100, description="Assignee identifier")
+
+
+class IssueCreate(IssueBase):
+    project_id: str = Field(..., description="Project the issue belongs to")
+
+
+class IssueUpdate(BaseModel):
+    title: Optional[str] = Field(None, max_length=255)
+    description: Optional[str] = None
+    issue_type: Optional[IssueType] = None
+    priority: Optional[Priority] = None
+    status: Optional[IssueStatus] = None
+    assignee: Optional[str] = Field(None, max_length=100)
+
+
+class IssueResponse(IssueBase):
+    id: str = Field(..., description="Issue ID")
+    project_id: str = Field(..., description="Project the issue belongs to")
+    promoted_to_task_id: Optional[str] = Field(None, description="Task created from the issue")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+    class Config:
+        from_attributes = True
+
+
+class IssuePage(BaseModel):
+    items: List[IssueResponse] = Field(..., description="Issues, newest first")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, if any")
+
+
+class IssuePromoteRequest(BaseModel):
+    issue_ids: List[str] = Field(..., min_length=1, description="Issues to promote to tasks")
+    status: TaskStatus = Field(TaskStatus.BACKLOG, description="Status of the created tasks")
+
+
+class IssuePromotion(BaseModel):
+    issue_id: str = Field(..., description="Promoted issue ID")
+    task_id: str = Field(..., description="Task created from the issue")
+
+
+class IssuePromoteResponse(BaseModel):
+    promoted: List[IssuePromotion] = Field(..., description="Issues promoted by this request")
+    skipped: List[str] = Field(..., description="Issues that were already promoted")
+
+
+class ReminderSnoozeRequest(BaseModel):
+    reminder_ids: List[str] = Field(..., min_length=1, description="Reminders to snooze")
+    until: datetime = Field(..., description="When the reminders are due again (UTC if naive)")
+
+
+class ReminderSnoozeResponse(BaseModel):
+    snoozed: List[str] = Field(..., description="Reminders snoozed by this request")
+    skipped: List[str] = Field(..., description="Reminders already acknowledged or cancelled")
+
+
+class CommentCreate(BaseModel):
+    author: str = Field(..., min_length=1, max_length=100, description="Comment author")
+    content: str = Field(..., min_length=1, description="Comment text")
+
+
+class CommentUpdate(BaseModel):
+    content: str = Field(..., min_length=1, description="Comment text")
+
+
+class CommentResponse(BaseModel):
+    id: str = Field(..., description="Comment ID")
+    task_id: str = Field(..., description="Task the comment belongs to")
+    author: str = Field(..., description="Comment author")
+    content: str = Field(..., description="Comment text")
+    created_at: datetime = Field(..., description="Creation timestamp")
+
+    class Config:
+        from_attributes = True
+
+
+class CommentPage(BaseModel):
+    items: List[CommentResponse] = Field(..., description="Comments, newest first")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, if any")
+    total: int = Field(..., description="Comments on the task")
+
+
+class ActivityItem(BaseModel):
+    id: str = Field(..., description="Event log entry ID")
+    kind: str = Field(..., description="Entry type: comment or status_change")
+    author: str = Field(..., description="Who commented or changed the status")
+    content: str = Field(..., description="Comment text or change summary")
+    created_at: datetime = Field(..., description="When it happened")
+    from_status: Optional[str] = Field(None, description="Previous status of a status change")
+    to_status: Optional[str] = Field(None, description="New status of a status change")
+
+
+class ActivityPage(BaseModel):
+    items: List[ActivityItem] = Field(..., description="Activity, newest first")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, if any")
+
+
 # Common response schemas
 class ErrorResponse(BaseModel):
     detail: str = Field(..., description="Error message")
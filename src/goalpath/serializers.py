@@ -0,0 +1,98 @@
+"""
+JSON serialization for GoalPath
+Turns ORM rows, Row tuples and dicts straight into response bytes with orjson
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Collection, Iterable, Mapping, Optional, Tuple, Type
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Types orjson does not handle natively"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to JSON bytes; dates, datetimes, enums and Decimals included"""
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class JSONBytesResponse(Response):
+    """JSON response that accepts pre-serialized bytes or serializes with orjson"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def response_fields(schema: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    """Field names of a response schema with their defaults, in declaration order"""
+    return tuple(
+        (name, None if field.is_required() else field.get_default(call_default_factory=True))
+        for name, field in schema.model_fields.items()
+    )
+
+
+def to_record(
+    source: Any,
+    schema: Type[BaseModel],
+    fields: Optional[Collection[str]] = None,
+    **overrides: Any,
+) -> dict:
+    """
+    Shape a dict, Row or ORM object like ``schema`` without validating it.
+
+    Only the schema's fields are emitted, so the payload matches what the
+    response model would produce; ``fields`` narrows that to a sparse
+    fieldset. Use this on trusted read paths where the values come straight
+    from the database.
+    """
+    if isinstance(source, Mapping):
+        get = source.get
+    elif hasattr(source, "_mapping"):
+        get = source._mapping.get
+    else:
+
+        def get(name: str, default: Any = None) -> Any:
+            return getattr(source, name, default)
+
+    record = {
+        name: get(name, default)
+        for name, default in response_fields(schema)
+        if fields is None or name in fields
+    }
+    if overrides:
+        record.update((name, value) for name, value in overrides.items() if name in record)
+    return record
+
+
+def serialize_one(source: Any, schema: Type[BaseModel], **overrides: Any) -> bytes:
+    """Serialize a single record shaped by ``schema``"""
+    return dumps(to_record(source, schema, **overrides))
+
+
+def serialize_many(
+    sources: Iterable[Any], schema: Type[BaseModel], fields: Optional[Collection[str]] = None
+) -> bytes:
+    """Serialize a list of records shaped by ``schema``, optionally a sparse fieldset"""
+    return dumps([to_record(source, schema, fields) for source in sources])
+
+
+def json_response(
+    content: bytes, status_code: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> JSONBytesResponse:
+    """Wrap serialized bytes in a response"""
+    return JSONBytesResponse(content=content, status_code=status_code, headers=headers)
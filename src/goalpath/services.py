@@ -10,7 +10,10 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from .db_utils import QueryUtils, TransactionManager
+from .hierarchy import delete_node
 from .models import Goal, GoalProject, Project, Task, TaskDependency
+from .ordering import next_order_index
+from .status_propagation import StatusChange, propagate_status_changes
 
 
 class ProjectService:
@@ -248,12 +251,9 @@ class TaskService:
 
             # Set order_index if not provided
             if "order_index" not in task_data:
-                max_order = (
-                    db_session.query(func.coalesce(func.max(Task.order_index), 0))
-                    .filter(Task.project_id == task_data["project_id"])
-                    .scalar()
+                task_data["order_index"] = next_order_index(
+                    db_session, task_data["project_id"], task_data.get("parent_task_id")
                 )
-                task_data["order_index"] = (max_order or 0) + 1
 
             new_task = Task(**task_data)
             db_session.add(new_task)
@@ -285,9 +285,13 @@ class TaskService:
                 ):
                     raise ValueError("Invalid task hierarchy - would create cycle")
 
+            old_status = task.status
             for field, value in update_data.items():
                 setattr(task, field, value)
 
+            propagate_status_changes(
+                db_session, [StatusChange(task.id, task.project_id, old_status, task.status)]
+            )
             db_session.commit()
             db_session.refresh(task)
 
@@ -303,12 +307,8 @@ class TaskService:
 
             task_title = task.title
 
-            # Handle subtasks - either reassign to parent or delete cascade
-            subtasks = db_session.query(Task).filter(Task.parent_task_id == task_id).all()
-            for subtask in subtasks:
-                subtask.parent_task_id = task.parent_task_id  # Move to grandparent
-
-            db_session.delete(task)
+            # Move subtasks to the grandparent in one UPDATE, then delete
+            delete_node(db_session, Task, task, cascade=False)
             db_session.commit()
 
             return task_title
@@ -437,15 +437,8 @@ class GoalService:
 
             goal_title = goal.title
 
-            # Handle subgoals - move to parent or orphan
-            subgoals = db_session.query(Goal).filter(Goal.parent_goal_id == goal_id).all()
-            for subgoal in subgoals:
-                subgoal.parent_goal_id = goal.parent_goal_id
-
-            # Remove goal-project links
-            db_session.query(GoalProject).filter(GoalProject.goal_id == goal_id).delete()
-
-            db_session.delete(goal)
+            # Move subgoals to the parent level; goal-project links cascade in the database
+            delete_node(db_session, Goal, goal, cascade=False)
             db_session.commit()
 
             return goal_title
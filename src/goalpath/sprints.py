@@ -0,0 +1,261 @@
+"""
+Sprint boards and burndown for GoalPath
+Board columns from one query, and daily burndown/burnup series replayed from the task event log
+"""
+
+import json
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .caching import MISSING, LRUCache
+from .models import Sprint, SprintTask, Task
+from .models.extended import TaskComment
+from .schemas import BurndownUnit, TaskStatus
+
+# Board columns in workflow order
+BOARD_COLUMNS = tuple(status.value for status in TaskStatus)
+
+# Task fields shown on a board card
+BOARD_FIELDS = (
+    "id",
+    "title",
+    "task_type",
+    "priority",
+    "assigned_to",
+    "story_points",
+    "estimated_hours",
+    "parent_task_id",
+)
+
+# (changed_at, from_status, to_status) entries from the task event log
+StatusEvent = Tuple[datetime, Optional[str], Optional[str]]
+
+
+def sprint_task_rows(db: Session, sprint_id: str) -> List[Any]:
+    """The sprint's tasks with what boards and burndowns need, in one query"""
+    return db.execute(
+        select(
+            Task.id,
+            Task.title,
+            Task.task_type,
+            Task.status,
+            Task.priority,
+            Task.assigned_to,
+            Task.story_points,
+            Task.estimated_hours,
+            Task.parent_task_id,
+            SprintTask.added_at,
+        )
+        .join(SprintTask, SprintTask.task_id == Task.id)
+        .where(SprintTask.sprint_id == sprint_id)
+        .order_by(Task.order_index, Task.id)
+    ).all()
+
+
+def build_board(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Board columns in workflow order, each with its cards, count and story points"""
+    columns: Dict[str, List[Dict[str, Any]]] = {status: [] for status in BOARD_COLUMNS}
+    for row in rows:
+        card = {field: getattr(row, field) for field in BOARD_FIELDS}
+        columns.setdefault(row.status, []).append(card)
+    return [
+        {
+            "status": status,
+            "count": len(cards),
+            "story_points": sum(card["story_points"] or 0 for card in cards),
+            "tasks": cards,
+        }
+        for status, cards in columns.items()
+    ]
+
+
+def status_history(db: Session, task_ids: Sequence[str]) -> Dict[str, List[StatusEvent]]:
+    """status_change entries of the task event log per task, oldest first"""
+    history: Dict[str, List[StatusEvent]] = defaultdict(list)
+    if not task_ids:
+        return history
+    rows = db.execute(
+        select(TaskComment.task_id, TaskComment.created_at, TaskComment.comment_metadata)
+        .where(
+            TaskComment.task_id.in_(task_ids),
+            TaskComment.comment_type == "status_change",
+        )
+        .order_by(TaskComment.task_id, TaskComment.created_at, TaskComment.id)
+    )
+    for task_id, created_at, metadata in rows:
+        try:
+            change = json.loads(metadata) if metadata else {}
+        except ValueError:
+            continue
+        history[task_id].append((created_at, change.get("from"), change.get("to")))
+    return history
+
+
+def status_at(events: Sequence[StatusEvent], moment: datetime, current: str) -> Optional[str]:
+    """
+    A task's status just before ``moment``: the target of the last change
+    before it, else the origin of the first change after it, else the
+    current status (the task never changed).
+    """
+    if not events:
+        return current
+    status = events[0][1]
+    for changed_at, _, new_status in events:
+        if changed_at >= moment:
+            break
+        status = new_status
+    return status
+
+
+def _weight(row: Any, unit: BurndownUnit) -> float:
+    if unit is BurndownUnit.TASKS:
+        return 1.0
+    value = row.story_points if unit is BurndownUnit.STORY_POINTS else row.estimated_hours
+    return float(value or 0)
+
+
+def _day_totals(
+    rows: Sequence[Any],
+    unit: BurndownUnit,
+    moment: datetime,
+    status_of: Any,
+) -> Tuple[float, float]:
+    """Scope and completed work at ``moment``; cancelled tasks leave the scope"""
+    scope = completed = 0.0
+    for row in rows:
+        if row.added_at is not None and row.added_at >= moment:
+            continue
+        status = status_of(row)
+        if status == TaskStatus.CANCELLED.value:
+            continue
+        weight = _weight(row, unit)
+        scope += weight
+        if status == TaskStatus.DONE.value:
+            completed += weight
+    return scope, completed
+
+
+def closed_day_totals(
+    rows: Sequence[Any],
+    history: Dict[str, List[StatusEvent]],
+    days: Sequence[date],
+    unit: BurndownUnit,
+) -> List[Tuple[float, float]]:
+    """Scope and completed work at the end of each of ``days``, replayed from the log"""
+    totals = []
+    for day in days:
+        end_of_day = datetime.combine(day + timedelta(days=1), time.min)
+        totals.append(
+            _day_totals(
+                rows,
+                unit,
+                end_of_day,
+                lambda row: status_at(history.get(row.id, ()), end_of_day, row.status),
+            )
+        )
+    return totals
+
+
+def membership_signature(rows: Sequence[Any], unit: BurndownUnit) -> int:
+    """Fingerprint of the sprint's tasks, when they joined and what they weigh"""
+    return hash(tuple((row.id, row.added_at, _weight(row, unit)) for row in rows))
+
+
+class BurndownCache(LRUCache):
+    """
+    Bounded cache of the closed days of sprint burndowns, per sprint, unit
+    and calendar day.
+
+    The event log is append-only, so the totals of days before today only
+    change when the sprint's membership or estimates do; entries carry a
+    signature of those and are recomputed when it differs. Today's point
+    is always computed from the live task statuses.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        super().__init__(capacity=max_entries)
+
+    def get(
+        self, sprint_id: str, unit: BurndownUnit, today: date, signature: int
+    ) -> Optional[List[Tuple[float, float]]]:
+        entry = self.lookup((sprint_id, unit.value, today), lambda entry: entry[0] == signature)
+        return None if entry is MISSING else entry[1]
+
+    def put(
+        self,
+        sprint_id: str,
+        unit: BurndownUnit,
+        today: date,
+        signature: int,
+        totals: List[Tuple[float, float]],
+    ) -> None:
+        self.store((sprint_id, unit.value, today), (signature, totals))
+
+    def invalidate(self, *sprint_ids: str) -> None:
+        """Drop the cached days of the given sprints"""
+        self.discard_where(lambda key, _: key[0] in sprint_ids)
+
+
+# Global burndown cache shared by all routes
+burndown_cache = BurndownCache()
+
+
+def build_burndown(
+    db: Session,
+    sprint: Sprint,
+    unit: BurndownUnit,
+    rows: Optional[Sequence[Any]] = None,
+    today: Optional[date] = None,
+) -> Dict[str, Any]:
+    """
+    Daily burndown and burnup series of a sprint, one entry per sprint day.
+
+    ``scope`` and ``completed`` are the burnup lines and ``remaining`` the
+    burndown; ``ideal`` falls linearly from the first day's scope to zero.
+    Days after today are None. Closed days come from the burndown cache
+    or, on a miss, from one query over the status log; today comes from
+    ``rows`` (read when not given).
+    """
+    today = today or datetime.utcnow().date()
+    if rows is None:
+        rows = sprint_task_rows(db, sprint.id)
+
+    day_count = (sprint.end_date - sprint.start_date).days + 1
+    dates = [sprint.start_date + timedelta(days=offset) for offset in range(day_count)]
+    closed = [day for day in dates if day < today]
+
+    signature = membership_signature(rows, unit)
+    totals = burndown_cache.get(sprint.id, unit, today, signature)
+    if totals is None:
+        history = status_history(db, [row.id for row in rows]) if closed else {}
+        totals = closed_day_totals(rows, history, closed, unit)
+        burndown_cache.put(sprint.id, unit, today, signature, totals)
+
+    totals = list(totals)
+    if sprint.start_date <= today <= sprint.end_date:
+        totals.append(_day_totals(rows, unit, datetime.max, lambda row: row.status))
+
+    scope = [round(value, 2) for value, _ in totals]
+    completed = [round(value, 2) for _, value in totals]
+    remaining = [round(total - done, 2) for total, done in zip(scope, completed)]
+    padding = [None] * (day_count - len(totals))
+
+    initial = scope[0] if scope else 0.0
+    steps = max(day_count - 1, 1)
+    ideal = [round(initial * (1 - offset / steps), 2) for offset in range(day_count)]
+
+    return {
+        "sprint_id": sprint.id,
+        "unit": unit.value,
+        "start_date": sprint.start_date,
+        "end_date": sprint.end_date,
+        "dates": dates,
+        "scope": scope + padding,
+        "completed": completed + padding,
+        "remaining": remaining + padding,
+        "ideal": ideal,
+    }
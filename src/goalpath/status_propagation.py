@@ -0,0 +1,165 @@
+"""
+Blocked-status propagation for GoalPath
+Moves dependents between todo and blocked when their blockers finish or reopen
+"""
+
+import json
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from .dependency_graph import FINISHED_STATUSES, graph_cache
+from .events import queue_event
+from .models import Task
+from .models.extended import TaskComment
+from .schemas import TaskStatus
+
+# Author recorded on status changes made by the propagation engine
+SYSTEM_AUTHOR = "system"
+
+
+class StatusChange(NamedTuple):
+    """One task's status transition"""
+
+    task_id: str
+    project_id: str
+    old_status: Optional[str]
+    new_status: str
+
+
+def record_status_changes(
+    db: Session, changes: Iterable[StatusChange], author: str, reason: Optional[str] = None
+) -> int:
+    """
+    Append status_change comments to the task event log in one INSERT.
+
+    The comment metadata holds the old and new status so activity feeds and
+    burndown charts can be rebuilt from the log alone.
+    """
+    now = datetime.utcnow()
+    rows = [
+        {
+            "task_id": change.task_id,
+            "author": author,
+            "content": f"Status changed from {change.old_status} to {change.new_status}",
+            "comment_type": "status_change",
+            "comment_metadata": json.dumps(
+                {"from": change.old_status, "to": change.new_status, "reason": reason}
+            ),
+            "created_at": now,
+        }
+        for change in changes
+    ]
+    if rows:
+        db.execute(insert(TaskComment.__table__), rows)
+    return len(rows)
+
+
+def _value(status: Any) -> Any:
+    """Plain string for TaskStatus members, which format as 'TaskStatus.DONE'"""
+    return getattr(status, "value", status)
+
+
+def _is_finished(status: Optional[str]) -> bool:
+    return status in FINISHED_STATUSES
+
+
+def dependent_updates(
+    db: Session, project_id: str, task_ids: Iterable[str], exclude: Iterable[str] = ()
+) -> List[StatusChange]:
+    """
+    Status changes implied for the direct dependents of ``task_ids``.
+
+    A blocked dependent whose blockers are all finished goes back to todo; a
+    todo dependent with an unfinished blocker becomes blocked. Other statuses
+    are left to people, as are the ``exclude`` tasks. Only the dependents
+    and their direct blockers are read, with one query, so the cost follows
+    the affected subgraph.
+    """
+    graph = graph_cache.get(db, project_id)
+    dependents = {dependent for task_id in task_ids for dependent in graph.direct_blockees(task_id)}
+    dependents.difference_update(exclude)
+    if not dependents:
+        return []
+
+    blockers = {dependent: graph.direct_blockers(dependent) for dependent in dependents}
+    needed = dependents.union(*blockers.values())
+    statuses: Dict[str, str] = dict(
+        db.execute(select(Task.id, Task.status).where(Task.id.in_(needed))).all()
+    )
+
+    changes = []
+    for dependent in sorted(dependents, key=graph.index.__getitem__):
+        status = statuses.get(dependent)
+        satisfied = all(_is_finished(statuses.get(blocker)) for blocker in blockers[dependent])
+        if status == TaskStatus.BLOCKED.value and satisfied:
+            new_status = TaskStatus.TODO.value
+        elif status == TaskStatus.TODO.value and not satisfied:
+            new_status = TaskStatus.BLOCKED.value
+        else:
+            continue
+        changes.append(StatusChange(dependent, project_id, status, new_status))
+    return changes
+
+
+def propagate_status_changes(
+    db: Session, changes: Iterable[StatusChange], author: str = SYSTEM_AUTHOR
+) -> List[StatusChange]:
+    """
+    Log status changes and propagate them to dependent tasks.
+
+    Call after applying ``changes`` and before committing. Every real change
+    is written to the event log; changes that cross the finished boundary
+    update their dependents with one executemany UPDATE, are logged too and
+    publish task events on commit. Dependents only ever move between todo
+    and blocked, so propagation never needs to go further than one level.
+    Returns the propagated changes.
+    """
+    changes = [
+        change._replace(old_status=_value(change.old_status), new_status=_value(change.new_status))
+        for change in changes
+    ]
+    changes = [change for change in changes if change.old_status != change.new_status]
+    if not changes:
+        return []
+    record_status_changes(db, changes, author)
+
+    flipped = defaultdict(list)
+    for change in changes:
+        if _is_finished(change.old_status) != _is_finished(change.new_status):
+            flipped[change.project_id].append(change.task_id)
+    if not flipped:
+        return []
+
+    db.flush()
+    # Tasks changed explicitly in this call keep the status they were given
+    changed_ids = {change.task_id for change in changes}
+    propagated = []
+    for project_id, task_ids in flipped.items():
+        propagated.extend(dependent_updates(db, project_id, task_ids, exclude=changed_ids))
+    if not propagated:
+        return []
+
+    now = datetime.utcnow()
+    db.execute(
+        update(Task),
+        [
+            {"id": change.task_id, "status": change.new_status, "updated_at": now}
+            for change in propagated
+        ],
+    )
+    record_status_changes(db, propagated, SYSTEM_AUTHOR, reason="dependencies")
+    for change in propagated:
+        queue_event(
+            db,
+            "task",
+            "updated",
+            change.task_id,
+            project_id=change.project_id,
+            status=change.new_status,
+            reason="dependencies",
+        )
+    return propagated
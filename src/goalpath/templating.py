@@ -0,0 +1,52 @@
+"""
+Shared Jinja2 template environment for GoalPath
+One environment for page routes and HTMX fragments, with a filesystem
+bytecode cache and eager compilation at startup
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+templates_dir = Path(__file__).parent / "templates"
+
+# Templates only change on deploy in production, so skip the per-render mtime check there
+ENVIRONMENT = os.environ.get("ENVIRONMENT", "development")
+AUTO_RELOAD = ENVIRONMENT != "production"
+
+# Compiled bytecode survives worker restarts when this directory is on a persistent volume
+bytecode_cache_dir = Path(
+    os.environ.get("GOALPATH_TEMPLATE_CACHE_DIR")
+    or Path(tempfile.gettempdir()) / "goalpath-jinja-cache"
+)
+
+
+def create_environment() -> Environment:
+    """Create the Jinja2 environment shared by every template consumer"""
+    bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=True,
+        auto_reload=AUTO_RELOAD,
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_cache_dir)),
+        cache_size=-1,  # Never evict compiled templates; the template set is small and fixed
+    )
+
+
+templates = Jinja2Templates(env=create_environment())
+
+
+def warm_up_templates() -> int:
+    """
+    Compile every template under templates/ so the first request in a worker
+    does not pay the compilation cost. Returns the number of templates loaded.
+    """
+    env = templates.env
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    return len(names)
@@ -0,0 +1,159 @@
+"""
+Timeline queries for GoalPath
+Date-window overlap SELECTs for tasks, sprints and schedule events, returned column-wise
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from .models import Sprint, Task
+from .models.extended import ScheduleEvent
+
+# Upper bound on rows per entity in one timeline response
+TIMELINE_MAX_ROWS = 10_000
+
+TASK_TIMELINE_COLUMNS = (
+    Task.id,
+    Task.project_id,
+    Task.parent_task_id,
+    Task.title,
+    Task.task_type,
+    Task.status,
+    Task.priority,
+    Task.start_date.label("start"),
+    Task.due_date.label("end"),
+)
+
+SPRINT_TIMELINE_COLUMNS = (
+    Sprint.id,
+    Sprint.project_id,
+    Sprint.name,
+    Sprint.status,
+    Sprint.start_date.label("start"),
+    Sprint.end_date.label("end"),
+)
+
+EVENT_TIMELINE_COLUMNS = (
+    ScheduleEvent.id,
+    ScheduleEvent.project_id,
+    ScheduleEvent.task_id,
+    ScheduleEvent.event_type,
+    ScheduleEvent.title,
+    ScheduleEvent.start_datetime.label("start"),
+    ScheduleEvent.end_datetime.label("end"),
+)
+
+
+def task_timeline_select(
+    window_start: date, window_end: date, project_id: Optional[str] = None
+) -> Select:
+    """
+    Tasks whose [start_date, due_date] overlaps the window.
+
+    A task with only a due date is a point on that date, and one with only a
+    start date a point on its start. Served by idx_tasks_timeline /
+    idx_tasks_project_timeline.
+    """
+    start = func.coalesce(Task.start_date, Task.due_date)
+    statement = select(*TASK_TIMELINE_COLUMNS).where(
+        or_(
+            and_(Task.due_date >= window_start, start <= window_end),
+            and_(
+                Task.due_date.is_(None),
+                Task.start_date >= window_start,
+                Task.start_date <= window_end,
+            ),
+        )
+    )
+    if project_id:
+        statement = statement.where(Task.project_id == project_id)
+    return statement.order_by(start, Task.id)
+
+
+def sprint_timeline_select(
+    window_start: date, window_end: date, project_id: Optional[str] = None
+) -> Select:
+    """Sprints overlapping the window; served by idx_sprints_timeline"""
+    statement = select(*SPRINT_TIMELINE_COLUMNS).where(
+        Sprint.end_date >= window_start, Sprint.start_date <= window_end
+    )
+    if project_id:
+        statement = statement.where(Sprint.project_id == project_id)
+    return statement.order_by(Sprint.start_date, Sprint.id)
+
+
+def event_timeline_select(
+    window_start: date, window_end: date, project_id: Optional[str] = None
+) -> Select:
+    """
+    Schedule events overlapping the window; served by idx_schedule_events_timeline.
+
+    Events belong to a project directly or through their task, so a project
+    filter matches both.
+    """
+    first = datetime.combine(window_start, time.min)
+    after_last = datetime.combine(window_end + timedelta(days=1), time.min)
+    statement = select(*EVENT_TIMELINE_COLUMNS).where(
+        or_(
+            and_(ScheduleEvent.end_datetime >= first, ScheduleEvent.start_datetime < after_last),
+            and_(
+                ScheduleEvent.end_datetime.is_(None),
+                ScheduleEvent.start_datetime >= first,
+                ScheduleEvent.start_datetime < after_last,
+            ),
+        )
+    )
+    if project_id:
+        statement = statement.where(
+            or_(
+                ScheduleEvent.project_id == project_id,
+                ScheduleEvent.task_id.in_(select(Task.id).where(Task.project_id == project_id)),
+            )
+        )
+    return statement.order_by(ScheduleEvent.start_datetime, ScheduleEvent.id)
+
+
+def to_columns(names: Sequence[str], rows: Sequence[Sequence[Any]]) -> Dict[str, List[Any]]:
+    """Column-wise layout: one list per column instead of one object per row"""
+    if not rows:
+        return {name: [] for name in names}
+    return {name: list(values) for name, values in zip(names, zip(*rows))}
+
+
+def _section(db: Session, statement: Select, limit: int) -> Dict[str, Any]:
+    result = db.execute(statement.limit(limit + 1))
+    names = list(result.keys())
+    rows = result.all()
+    truncated = len(rows) > limit
+    rows = rows[:limit]
+    return {"count": len(rows), "truncated": truncated, "columns": to_columns(names, rows)}
+
+
+def build_timeline(
+    db: Session,
+    window_start: date,
+    window_end: date,
+    project_id: Optional[str] = None,
+    limit: int = TIMELINE_MAX_ROWS,
+) -> Dict[str, Any]:
+    """
+    Tasks, sprints and schedule events overlapping a date window.
+
+    Each section is columnar (``{"id": [...], "start": [...], ...}``) so a
+    few thousand bars cost a few short arrays rather than thousands of
+    repeated keys. At most ``limit`` rows per section are returned and
+    ``truncated`` says whether more matched.
+    """
+    return {
+        "from": window_start,
+        "to": window_end,
+        "project_id": project_id,
+        "tasks": _section(db, task_timeline_select(window_start, window_end, project_id), limit),
+        "sprints": _section(
+            db, sprint_timeline_select(window_start, window_end, project_id), limit
+        ),
+        "events": _section(db, event_timeline_select(window_start, window_end, project_id), limit),
+    }
@@ -2,14 +2,18 @@
 Test configuration and fixtures for GoalPath
 """
 
+import os
 import uuid
 
 import pytest
 from fastapi.testclient import TestClient
 
-from src.goalpath.database import DatabaseManager, get_db
+from src.goalpath.database import DatabaseManager, get_db, get_session_factory
 from src.goalpath.main import app
 
+# The app's reminder scheduler would run against the default database, not the test one
+os.environ.setdefault("GOALPATH_REMINDER_SCHEDULER", "off")
+
 
 @pytest.fixture(scope="session")
 def test_db_manager():
@@ -97,7 +101,7 @@ def test_db_session(test_db_manager):
 
 
 @pytest.fixture(scope="function")
-def test_client(test_db_session):
+def test_client(test_db_manager, test_db_session):
     """Create a test client with database dependency override"""
 
     def override_get_db():
@@ -107,6 +111,7 @@ def test_client(test_db_session):
             pass  # Session cleanup handled by test_db_session fixture
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = test_db_manager.get_dedicated_session_factory
 
     with TestClient(app) as client:
         yield client
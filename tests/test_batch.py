@@ -0,0 +1,118 @@
+"""
+Tests for the batch operation API
+"""
+
+from src.goalpath.models import Task
+
+
+class TestBatch:
+    """Test /api/batch"""
+
+    def test_operations_applied_in_order(self, test_client, test_db_session, db_helper):
+        """Status, reorder and field edits run in order in one transaction"""
+        project = db_helper.create_test_project(test_db_session)
+        first = db_helper.create_test_task(test_db_session, project.id, title="First")
+        second = db_helper.create_test_task(test_db_session, project.id, title="Second")
+
+        response = test_client.post(
+            "/api/batch",
+            json={
+                "operations": [
+                    {"op": "status", "id": first.id, "status": "done"},
+                    {"op": "reorder", "id": first.id, "order_index": 2},
+                    {"op": "reorder", "id": second.id, "order_index": 1},
+                    {"op": "update", "id": second.id, "fields": {"title": "Renamed"}},
+                    {"op": "status", "id": first.id, "status": "in_progress"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["applied"], body["failed"], body["committed"]) == (5, 0, True)
+
+        test_db_session.expire_all()
+        first_row = test_db_session.get(Task, first.id)
+        second_row = test_db_session.get(Task, second.id)
+        assert (first_row.status, first_row.order_index) == ("in_progress", 2)
+        assert first_row.completed_date is None
+        assert (second_row.title, second_row.order_index) == ("Renamed", 1)
+
+    def test_atomic_batch_rolls_back(self, test_client, test_db_session, db_helper):
+        """One rejected operation undoes the whole atomic batch"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id, status="todo")
+
+        response = test_client.post(
+            "/api/batch",
+            json={
+                "operations": [
+                    {"op": "status", "id": task.id, "status": "done"},
+                    {"op": "status", "id": "missing", "status": "done"},
+                ]
+            },
+        )
+
+        assert response.status_code == 400
+        body = response.json()
+        assert body["committed"] is False
+        assert body["results"][0]["error"] == "Not applied: batch rolled back"
+        test_db_session.expire_all()
+        assert test_db_session.get(Task, task.id).status == "todo"
+
+    def test_non_atomic_batch_keeps_valid_operations(self, test_client, test_db_session, db_helper):
+        """Without atomic, valid operations commit and failures are reported"""
+        project = db_helper.create_test_project(test_db_session)
+        parent = db_helper.create_test_task(test_db_session, project.id, title="Parent")
+        child = db_helper.create_test_task(
+            test_db_session, project.id, title="Child", parent_task_id=parent.id
+        )
+
+        response = test_client.post(
+            "/api/batch",
+            json={
+                "atomic": False,
+                "operations": [
+                    {"op": "update", "id": parent.id, "fields": {"parent_task_id": child.id}},
+                    {"op": "status", "id": child.id, "status": "blocked"},
+                ],
+            },
+        )
+
+        body = response.json()
+        assert (body["applied"], body["failed"], body["committed"]) == (1, 1, True)
+        assert "cycle" in body["results"][0]["error"]
+        test_db_session.expire_all()
+        assert test_db_session.get(Task, child.id).status == "blocked"
+        assert test_db_session.get(Task, parent.id).parent_task_id is None
+
+    def test_htmx_oob_bundle(self, test_client, test_db_session, db_helper):
+        """HTMX callers get the changed cards as out-of-band swaps"""
+        project = db_helper.create_test_project(test_db_session)
+        first = db_helper.create_test_task(test_db_session, project.id, title="Card One")
+        second = db_helper.create_test_task(test_db_session, project.id, title="Card Two")
+
+        response = test_client.post(
+            "/api/batch",
+            headers={"HX-Request": "true"},
+            json={
+                "operations": [
+                    {"op": "status", "id": first.id, "status": "done"},
+                    {"op": "status", "id": second.id, "status": "done"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.text.count('hx-swap-oob="true"') == 2
+        assert f'id="task-{first.id}"' in response.text
+        assert "updateDashboardStats" in response.headers["HX-Trigger"]
+        assert response.headers["HX-Reswap"] == "none"
+
+    def test_unknown_operation_rejected(self, test_client):
+        """Operations are validated against their schema"""
+        response = test_client.post(
+            "/api/batch", json={"operations": [{"op": "explode", "id": "x"}]}
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,159 @@
+"""
+Tests for the bulk task API
+"""
+
+from src.goalpath.models import Task
+from src.goalpath.ordering import ORDER_GAP
+
+
+class TestBulkTasks:
+    """Test /api/tasks/bulk"""
+
+    def test_bulk_create_assigns_order_in_one_pass(self, test_client, test_db_session, db_helper):
+        """Creates get gap-spaced order_index values after the existing siblings"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id, order_index=4)
+
+        response = test_client.post(
+            "/api/tasks/bulk",
+            json={
+                "create": [
+                    {"title": f"Imported {index}", "project_id": project.id} for index in range(3)
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["created"] == 3
+        assert body["failed"] == 0
+
+        test_db_session.expire_all()
+        created_ids = [result["id"] for result in body["results"]]
+        orders = sorted(
+            task.order_index
+            for task in test_db_session.query(Task).filter(Task.id.in_(created_ids))
+        )
+        assert orders == [4 + ORDER_GAP, 4 + 2 * ORDER_GAP, 4 + 3 * ORDER_GAP]
+
+    def test_invalid_items_reported_per_item(self, test_client, test_db_session, db_helper):
+        """Bad references are rejected individually while valid items are applied"""
+        project = db_helper.create_test_project(test_db_session)
+        other = db_helper.create_test_project(test_db_session, name="Other")
+        foreign_parent = db_helper.create_test_task(test_db_session, other.id)
+
+        response = test_client.post(
+            "/api/tasks/bulk",
+            json={
+                "create": [
+                    {"title": "Good", "project_id": project.id},
+                    {"title": "No project", "project_id": "missing"},
+                    {
+                        "title": "Wrong parent",
+                        "project_id": project.id,
+                        "parent_task_id": foreign_parent.id,
+                    },
+                ],
+                "delete": ["missing-task"],
+            },
+        )
+
+        body = response.json()
+        assert body["created"] == 1
+        assert body["failed"] == 3
+        errors = {(r["op"], r["index"]): r["error"] for r in body["results"] if not r["success"]}
+        assert "Project with ID missing not found" in errors[("create", 1)]
+        assert "same project" in errors[("create", 2)]
+        assert ("delete", 0) in errors
+
+    def test_bulk_update_and_status(self, test_client, test_db_session, db_helper):
+        """Field updates and status changes are applied, with completed_date handling"""
+        project = db_helper.create_test_project(test_db_session)
+        first = db_helper.create_test_task(test_db_session, project.id, title="First")
+        second = db_helper.create_test_task(test_db_session, project.id, title="Second")
+
+        response = test_client.post(
+            "/api/tasks/bulk",
+            json={
+                "update": [{"id": first.id, "title": "Renamed", "priority": "high"}],
+                "status": [
+                    {"id": first.id, "status": "in_progress"},
+                    {"id": second.id, "status": "done"},
+                ],
+            },
+        )
+
+        body = response.json()
+        assert body["updated"] == 2
+        assert body["failed"] == 0
+
+        test_db_session.expire_all()
+        first_row = test_db_session.get(Task, first.id)
+        second_row = test_db_session.get(Task, second.id)
+        assert (first_row.title, first_row.priority, first_row.status) == (
+            "Renamed",
+            "high",
+            "in_progress",
+        )
+        assert second_row.status == "done"
+        assert second_row.completed_date is not None
+
+    def test_parent_cycle_within_one_request_rejected(
+        self, test_client, test_db_session, db_helper
+    ):
+        """Parent changes in the same request are checked against each other"""
+        project = db_helper.create_test_project(test_db_session)
+        first = db_helper.create_test_task(test_db_session, project.id, title="First")
+        second = db_helper.create_test_task(test_db_session, project.id, title="Second")
+        third = db_helper.create_test_task(test_db_session, project.id, title="Third")
+
+        response = test_client.post(
+            "/api/tasks/bulk",
+            json={
+                "update": [
+                    {"id": first.id, "parent_task_id": second.id},
+                    {"id": second.id, "parent_task_id": third.id},
+                    {"id": third.id, "parent_task_id": first.id},
+                ]
+            },
+        )
+
+        body = response.json()
+        assert body["updated"] == 2
+        errors = {(r["op"], r["index"]): r["error"] for r in body["results"] if not r["success"]}
+        assert "cycle" in errors[("update", 2)]
+        test_db_session.expire_all()
+        assert test_db_session.get(Task, third.id).parent_task_id is None
+
+    def test_bulk_delete_reparents_children(self, test_client, test_db_session, db_helper):
+        """Children of deleted tasks move to the nearest surviving ancestor"""
+        project = db_helper.create_test_project(test_db_session)
+        root = db_helper.create_test_task(test_db_session, project.id, title="Root")
+        middle = db_helper.create_test_task(
+            test_db_session, project.id, title="Middle", parent_task_id=root.id
+        )
+        inner = db_helper.create_test_task(
+            test_db_session, project.id, title="Inner", parent_task_id=middle.id
+        )
+        leaf = db_helper.create_test_task(
+            test_db_session, project.id, title="Leaf", parent_task_id=inner.id
+        )
+
+        response = test_client.post("/api/tasks/bulk", json={"delete": [middle.id, inner.id]})
+
+        assert response.json()["deleted"] == 2
+        test_db_session.expire_all()
+        assert test_db_session.get(Task, middle.id) is None
+        assert test_db_session.get(Task, leaf.id).parent_task_id == root.id
+
+    def test_malformed_payload_rejected(self, test_client, test_db_session, db_helper):
+        """Schema violations fail the whole request before anything is written"""
+        project = db_helper.create_test_project(test_db_session)
+
+        response = test_client.post(
+            "/api/tasks/bulk",
+            json={"create": [{"title": "Bad", "project_id": project.id, "status": "nope"}]},
+        )
+
+        assert response.status_code == 422
+        assert test_db_session.query(Task).count() == 0
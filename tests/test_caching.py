@@ -0,0 +1,93 @@
+"""
+Tests for the LRU cache base and the commit-time invalidation hooks
+"""
+
+import pytest
+from sqlalchemy import update
+
+from src.goalpath import caching
+from src.goalpath.caching import MISSING, LRUCache, invalidate_on_commit
+from src.goalpath.models import Project, Task
+
+
+class TestLRUCache:
+    """Test the shared LRU base"""
+
+    def test_lookup_store_and_eviction(self):
+        """The least recently used entry goes first; stale entries are misses"""
+        cache = LRUCache(capacity=2)
+        cache.store("a", 1)
+        cache.store("b", 2)
+        assert cache.lookup("a") == 1
+        cache.store("c", 3)
+
+        assert cache.lookup("b") is MISSING
+        assert cache.lookup("c", lambda value: value == 4) is MISSING
+        assert cache.stats() == {
+            "entries": 2,
+            "hits": 1,
+            "misses": 2,
+            "evictions": 1,
+            "hit_rate": 0.3333,
+        }
+
+    def test_discard_and_clear(self):
+        """Entries are dropped by key or predicate; clear also resets the metrics"""
+        cache = LRUCache(capacity=10)
+        for key in ("p1-a", "p1-b", "p2-a"):
+            cache.store(key, key)
+
+        assert cache.discard("p2-a", "missing") == 1
+        assert cache.discard_where(lambda key, _: key.startswith("p1")) == 2
+        assert len(cache) == 0
+
+        cache.store("x", None)
+        assert cache.lookup("x") is None
+        cache.clear()
+        assert (len(cache), cache.hits) == (0, 0)
+
+
+class TestInvalidateOnCommit:
+    """Test the shared session hooks"""
+
+    @pytest.fixture
+    def calls(self):
+        saved = list(caching._subscriptions)
+        calls = []
+        invalidate_on_commit(
+            (Task,),
+            lambda task: (task.id,),
+            lambda *keys: calls.append(set(keys)),
+            lambda: calls.append("all"),
+            deletes=(Project,),
+        )
+        yield calls
+        caching._subscriptions[:] = saved
+
+    def test_committed_writes_invalidate_their_keys(self, calls, test_db_session, db_helper):
+        """Keys are handed over once per commit; a rollback discards them"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        assert calls == [{task.id}]
+
+        task.title = "Renamed"
+        test_db_session.flush()
+        test_db_session.rollback()
+        assert calls == [{task.id}]
+
+        project.name = "Renamed"
+        test_db_session.commit()
+        assert calls == [{task.id}]
+
+    def test_bulk_statements_and_deletes(self, calls, test_db_session, db_helper):
+        """Bulk statements invalidate everything; delete-only models count on delete"""
+        project = db_helper.create_test_project(test_db_session)
+        calls.clear()
+
+        test_db_session.execute(update(Task).values(priority="high"))
+        test_db_session.commit()
+        assert calls == ["all"]
+
+        test_db_session.delete(project)
+        test_db_session.commit()
+        assert calls == ["all", {project.id}]
@@ -0,0 +1,205 @@
+"""
+Tests for the calendar endpoint
+"""
+
+from datetime import date, datetime
+
+from src.goalpath import calendar_feed
+from src.goalpath.calendar_feed import build_calendar
+from src.goalpath.models.extended import Reminder, ScheduleEvent
+
+MARCH = "from=2025-03-01&to=2025-03-31"
+
+
+def _calendar(client, query=MARCH):
+    response = client.get(f"/api/calendar?{query}")
+    assert response.status_code == 200
+    return response.json()
+
+
+def _items(data):
+    columns = data["columns"]
+    return list(zip(columns["start"], columns["kind"], columns["title"]))
+
+
+class TestCalendar:
+    """Test reminder expansion, merging with events and filtering"""
+
+    def test_merges_expanded_reminders_with_events(self, test_client, test_db_session, db_helper):
+        """Recurring reminders expand inside the window and interleave with events"""
+        project = db_helper.create_test_project(test_db_session)
+        test_db_session.add_all(
+            [
+                Reminder(
+                    project_id=project.id,
+                    title="Weekly review",
+                    reminder_type="recurring",
+                    recurrence_pattern="FREQ=WEEKLY;BYDAY=MO",
+                    trigger_datetime=datetime(2025, 3, 3, 9, 0),
+                ),
+                Reminder(
+                    project_id=project.id,
+                    title="Invoice",
+                    trigger_datetime=datetime(2025, 3, 15, 12, 0),
+                ),
+                Reminder(
+                    project_id=project.id,
+                    title="Cancelled",
+                    status="cancelled",
+                    trigger_datetime=datetime(2025, 3, 16, 12, 0),
+                ),
+                Reminder(
+                    project_id=project.id,
+                    title="April",
+                    trigger_datetime=datetime(2025, 4, 1, 12, 0),
+                ),
+                ScheduleEvent(
+                    project_id=project.id,
+                    event_type="milestone",
+                    title="Launch",
+                    start_datetime=datetime(2025, 3, 10, 8, 0),
+                    end_datetime=datetime(2025, 3, 10, 10, 0),
+                ),
+            ]
+        )
+        test_db_session.commit()
+
+        data = _calendar(test_client)
+
+        assert _items(data) == [
+            ("2025-03-03T09:00:00", "reminder", "Weekly review"),
+            ("2025-03-10T08:00:00", "event", "Launch"),
+            ("2025-03-10T09:00:00", "reminder", "Weekly review"),
+            ("2025-03-15T12:00:00", "reminder", "Invoice"),
+            ("2025-03-17T09:00:00", "reminder", "Weekly review"),
+            ("2025-03-24T09:00:00", "reminder", "Weekly review"),
+            ("2025-03-31T09:00:00", "reminder", "Weekly review"),
+        ]
+        assert data["columns"]["end"][1] == "2025-03-10T10:00:00"
+        assert data["columns"]["type"][:2] == ["recurring", "milestone"]
+
+    def test_series_start_and_fired_reminders(self, test_client, test_db_session, db_helper):
+        """Series expand from DTSTART or their next trigger; fired reminders stay visible"""
+        project = db_helper.create_test_project(test_db_session)
+        test_db_session.add_all(
+            [
+                Reminder(
+                    project_id=project.id,
+                    title="Next trigger",
+                    reminder_type="recurring",
+                    recurrence_pattern='{"freq": "monthly", "bymonthday": [1, 20]}',
+                    trigger_datetime=datetime(2025, 3, 20, 7, 0),
+                ),
+                Reminder(
+                    project_id=project.id,
+                    title="Anchored",
+                    reminder_type="recurring",
+                    recurrence_pattern="DTSTART:20240105T070000\nRRULE:FREQ=YEARLY;BYMONTH=3",
+                    trigger_datetime=datetime(2025, 3, 5, 7, 0),
+                ),
+                Reminder(
+                    project_id=project.id,
+                    title="Done",
+                    status="fired",
+                    trigger_datetime=datetime(2025, 3, 2, 7, 0),
+                ),
+            ]
+        )
+        test_db_session.commit()
+
+        assert _items(_calendar(test_client)) == [
+            ("2025-03-02T07:00:00", "reminder", "Done"),
+            ("2025-03-05T07:00:00", "reminder", "Anchored"),
+            ("2025-03-20T07:00:00", "reminder", "Next trigger"),
+        ]
+
+    def test_snoozed_series_keeps_its_times(self, test_client, test_db_session, db_helper):
+        """A snoozed occurrence shows at the snooze time, the rest of the series at its own"""
+        project = db_helper.create_test_project(test_db_session)
+        test_db_session.add(
+            Reminder(
+                project_id=project.id,
+                title="Snoozed",
+                reminder_type="recurring",
+                recurrence_pattern="FREQ=WEEKLY",
+                status="snoozed",
+                recurrence_anchor=datetime(2025, 3, 3, 9, 0),
+                trigger_datetime=datetime(2025, 3, 3, 11, 30),
+            )
+        )
+        test_db_session.commit()
+
+        assert [start for start, _, _ in _items(_calendar(test_client))] == [
+            "2025-03-03T11:30:00",
+            "2025-03-10T09:00:00",
+            "2025-03-17T09:00:00",
+            "2025-03-24T09:00:00",
+            "2025-03-31T09:00:00",
+        ]
+
+    def test_project_filter_and_limit(self, test_client, test_db_session, db_helper):
+        """Reminders match a project directly or through their task; limit truncates"""
+        project = db_helper.create_test_project(test_db_session)
+        other = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        test_db_session.add_all(
+            [
+                Reminder(
+                    task_id=task.id,
+                    title="Daily stand-up",
+                    reminder_type="recurring",
+                    recurrence_pattern="FREQ=DAILY",
+                    trigger_datetime=datetime(2025, 3, 1, 9, 30),
+                ),
+                Reminder(
+                    project_id=other.id,
+                    title="Elsewhere",
+                    trigger_datetime=datetime(2025, 3, 1, 8, 0),
+                ),
+            ]
+        )
+        test_db_session.commit()
+
+        scoped = _calendar(test_client, f"{MARCH}&project_id={project.id}")
+        assert scoped["count"] == 31
+        assert set(scoped["columns"]["task_id"]) == {task.id}
+
+        limited = _calendar(test_client, f"{MARCH}&limit=5")
+        assert limited["count"] == 5
+        assert limited["truncated"] is True
+        assert limited["columns"]["title"][0] == "Elsewhere"
+
+    def test_invalid_window(self, test_client):
+        assert test_client.get("/api/calendar?from=2025-03-31&to=2025-03-01").status_code == 400
+        assert test_client.get("/api/calendar?from=2025-01-01&to=2026-01-01").status_code == 200
+        assert test_client.get("/api/calendar?from=2000-01-01&to=2999-12-31").status_code == 400
+
+    def test_limit_stops_expansion(self, test_db_session, db_helper, monkeypatch):
+        """Only the occurrences needed for the first ``limit`` + 1 items are generated"""
+        project = db_helper.create_test_project(test_db_session)
+        test_db_session.add_all(
+            Reminder(
+                project_id=project.id,
+                title=f"Daily {index}",
+                reminder_type="recurring",
+                recurrence_pattern="FREQ=DAILY",
+                trigger_datetime=datetime(2025, 1, 1, 9, index),
+            )
+            for index in range(5)
+        )
+        test_db_session.commit()
+        generated = []
+        occurrences = calendar_feed.reminder_occurrences
+
+        def counting(*args):
+            for item in occurrences(*args):
+                generated.append(item)
+                yield item
+
+        monkeypatch.setattr(calendar_feed, "reminder_occurrences", counting)
+        data = build_calendar(test_db_session, date(2025, 1, 1), date(2025, 12, 31), limit=1)
+
+        assert (data["count"], data["truncated"]) == (1, True)
+        assert data["columns"]["title"] == ["Daily 0"]
+        # One head per reminder, then the next of each stream popped
+        assert len(generated) <= 7
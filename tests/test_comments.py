@@ -0,0 +1,226 @@
+"""
+Tests for task comments, the activity feed and the comment counts cache
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, text
+
+from src.goalpath.comments import CommentCountCache, activity_page, comment_count_cache
+from src.goalpath.database import DatabaseManager
+from src.goalpath.models import Project, Task
+from src.goalpath.models.extended import TaskComment
+from src.goalpath.read_models import decode_cursor
+from src.goalpath.schema_upgrades import upgrade_schema
+
+CREATED = datetime(2025, 4, 1, 9, 0)
+
+
+def _log(session, task, *entries):
+    """Add (minutes, comment_type) entries to a task's event log"""
+    comments = []
+    for minutes, comment_type in entries:
+        metadata = None
+        if comment_type == "status_change":
+            metadata = json.dumps({"from": "todo", "to": "in_progress", "reason": None})
+        comments.append(
+            TaskComment(
+                task_id=task.id,
+                author="dev",
+                content=f"{comment_type} at {minutes}",
+                comment_type=comment_type,
+                comment_metadata=metadata,
+                created_at=CREATED + timedelta(minutes=minutes),
+            )
+        )
+    session.add_all(comments)
+    session.commit()
+    return comments
+
+
+class TestCommentThread:
+    """Test the comments API"""
+
+    def test_pages_walk_every_comment_once(self, test_client, test_db_session, db_helper):
+        """Following next_cursor lists every comment newest first, without repeats"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        # Status events and equal timestamps must not disturb the thread
+        comments = _log(test_db_session, task, *[(minute, "comment") for minute in range(5)])
+        comments += _log(test_db_session, task, (2, "comment"), (3, "status_change"))
+        comments = [comment for comment in comments if comment.comment_type == "comment"]
+
+        seen, cursor = [], None
+        while True:
+            query = "limit=2" + (f"&cursor={cursor}" if cursor else "")
+            page = test_client.get(f"/api/tasks/{task.id}/comments?{query}").json()
+            assert page["total"] == 6
+            seen += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        expected = sorted(comments, key=lambda comment: (comment.created_at, comment.id))
+        assert seen == [comment.id for comment in reversed(expected)]
+
+    def test_pages_walk_database_stamped_comments(
+        self, test_client, test_db_manager, test_db_session, db_helper
+    ):
+        """Whole-second comments from SQL scripts page through once upgraded"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        for index in range(3):
+            test_db_session.execute(
+                text(
+                    "INSERT INTO task_comments (id, task_id, author, content, comment_type,"
+                    " created_at) VALUES (:id, :task, 'dev', 'Seeded', 'comment',"
+                    " '2025-04-01 09:00:00')"
+                ),
+                {"id": f"c{index}", "task": task.id},
+            )
+        test_db_session.commit()
+        assert upgrade_schema(test_db_manager.engine) == ["keyset_timestamps"]
+
+        seen, cursor = [], None
+        while len(seen) <= 3:
+            query = "limit=1" + (f"&cursor={cursor}" if cursor else "")
+            page = test_client.get(f"/api/tasks/{task.id}/comments?{query}").json()
+            seen += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == ["c2", "c1", "c0"]
+
+    def test_create_update_delete(self, test_client, test_db_session, db_helper):
+        """Comments are added, edited and removed; status events are not editable"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        (event,) = _log(test_db_session, task, (0, "status_change"))
+        url = f"/api/tasks/{task.id}/comments"
+
+        created = test_client.post(url, json={"author": "ana", "content": "Looks good"})
+        assert created.status_code == 201
+        comment_id = created.json()["id"]
+
+        edited = test_client.put(f"{url}/{comment_id}", json={"content": "Ship it"})
+        assert edited.json()["content"] == "Ship it"
+        assert test_client.put(f"{url}/{event.id}", json={"content": "x"}).status_code == 404
+
+        assert test_client.delete(f"{url}/{comment_id}").status_code == 200
+        assert test_client.get(url).json() == {"items": [], "next_cursor": None, "total": 0}
+
+    def test_errors(self, test_client, test_db_session, db_helper):
+        """Unknown tasks are 404 and malformed cursors 400"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+
+        assert test_client.get("/api/tasks/missing/comments").status_code == 404
+        assert test_client.get("/api/tasks/missing/activity").status_code == 404
+        comment = {"author": "ana", "content": "hi"}
+        assert test_client.post("/api/tasks/missing/comments", json=comment).status_code == 404
+        bad = test_client.get(f"/api/tasks/{task.id}/comments?cursor=garbage")
+        assert bad.status_code == 400
+
+
+class TestActivityFeed:
+    """Test the merged activity feed"""
+
+    def test_merges_comments_and_status_events(self, test_db_session, db_helper):
+        """Pages interleave both streams newest first and continue from the cursor"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        entries = [(minute, "comment" if minute % 3 else "status_change") for minute in range(10)]
+        log = _log(test_db_session, task, *entries)
+        _log(test_db_session, task, (4, "assignment"))
+
+        seen, cursor = [], None
+        while True:
+            before = decode_cursor(cursor) if cursor else None
+            items, cursor = activity_page(test_db_session, task.id, before, limit=4)
+            seen += items
+            if cursor is None:
+                break
+
+        expected = sorted(log, key=lambda entry: (entry.created_at, entry.id), reverse=True)
+        assert [item["id"] for item in seen] == [entry.id for entry in expected]
+        status = next(item for item in seen if item["kind"] == "status_change")
+        assert (status["from_status"], status["to_status"]) == ("todo", "in_progress")
+
+    def test_endpoint_and_htmx_fragment(self, test_client, test_db_session, db_helper):
+        """The API pages the feed; the fragment ends in a "Load older" button while more remain"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        _log(test_db_session, task, *[(minute, "comment") for minute in range(35)])
+
+        page = test_client.get(f"/api/tasks/{task.id}/activity?limit=30").json()
+        assert len(page["items"]) == 30
+        assert page["items"][0]["content"] == "comment at 34"
+
+        html = test_client.get(
+            f"/htmx/tasks/{task.id}/activity?cursor={page['next_cursor']}",
+            headers={"HX-Request": "true"},
+        ).text
+        assert html.count("comment at") == 5
+        assert "Load older" not in html
+
+        detail = test_client.get(f"/tasks/{task.id}", headers={"HX-Request": "true"}).text
+        assert "comment at 34" in detail and "comment at 4" not in detail
+        assert "Load older" in detail and "35 comments" in detail
+
+
+class TestCommentCounts:
+    """Test the comment counts cache"""
+
+    def test_counts_are_cached_until_comments_change(self, test_db_session, db_helper):
+        """Counts come from the cache until a comment write commits"""
+        comment_count_cache.clear()
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        other = db_helper.create_test_task(test_db_session, project.id)
+        _log(test_db_session, task, (0, "comment"), (1, "comment"), (2, "status_change"))
+
+        counts = comment_count_cache.get_many(test_db_session, [task.id, other.id])
+        assert counts == {task.id: 2, other.id: 0}
+        assert comment_count_cache.get(test_db_session, task.id) == 2
+        assert (comment_count_cache.hits, comment_count_cache.misses) == (1, 2)
+
+        # The commit drops the task's count and moves the table's stamp
+        _log(test_db_session, task, (3, "comment"))
+        assert comment_count_cache.get(test_db_session, task.id) == 3
+        assert comment_count_cache.get(test_db_session, other.id) == 0
+        assert comment_count_cache.misses == 4
+        assert comment_count_cache.get(test_db_session, other.id) == 0
+        assert comment_count_cache.misses == 4
+
+        test_db_session.execute(delete(TaskComment).where(TaskComment.task_id == task.id))
+        test_db_session.commit()
+        assert comment_count_cache.get(test_db_session, task.id) == 0
+
+    def test_comments_from_other_replicas_are_noticed(self, tmp_path):
+        """A count cached on one replica is refreshed after another replica comments"""
+        url = f"sqlite:///{tmp_path / 'shared.db'}"
+        writer, reader = DatabaseManager(url), DatabaseManager(url)
+        writer.create_tables()
+        with writer.get_sync_session() as session:
+            project = Project(name="Replicated")
+            session.add(project)
+            session.flush()
+            task = Task(project_id=project.id, title="Discussed")
+            session.add(task)
+            session.commit()
+            task_id = task.id
+
+        cache = CommentCountCache()
+        with reader.get_sync_session() as session:
+            assert cache.get(session, task_id) == 0
+
+        with writer.get_sync_session() as session:
+            session.add(TaskComment(task_id=task_id, author="dev", content="From the writer"))
+            session.commit()
+
+        with reader.get_sync_session() as session:
+            assert cache.get(session, task_id) == 1
+        writer.engine.dispose()
+        reader.engine.dispose()
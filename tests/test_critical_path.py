@@ -0,0 +1,103 @@
+"""
+Tests for critical path computation
+"""
+
+from decimal import Decimal
+
+from src.goalpath.critical_path import critical_path_cache
+from src.goalpath.dependency_graph import DependencyGraph
+from src.goalpath.models import TaskDependency
+
+
+class TestCriticalPathMethod:
+    """Test the CPM passes on the dependency graph"""
+
+    def test_diamond(self):
+        """The longer branch is critical and the shorter one has slack"""
+        # A -> (B | C) -> D, edges point from a task to its blocker
+        graph = DependencyGraph("ABCD", [("B", "A"), ("C", "A"), ("D", "B"), ("D", "C")])
+
+        result = graph.critical_path([2, 5, 1, 3])
+
+        assert result.duration == 10
+        assert [graph.task_ids[p] for p in result.chain] == ["A", "B", "D"]
+        assert list(result.earliest_start) == [0, 2, 2, 7]
+        assert list(result.latest_start) == [0, 2, 6, 7]
+        assert result.slack(graph.index["C"]) == 4
+
+    def test_independent_tasks(self):
+        """Unlinked tasks run in parallel; the longest one sets the duration"""
+        graph = DependencyGraph("AB", [])
+
+        result = graph.critical_path([3, 8])
+
+        assert result.duration == 8
+        assert result.slack(0) == 5
+
+
+class TestCriticalPathEndpoint:
+    """Test /api/projects/{id}/critical-path"""
+
+    def _project(self, test_db_session, db_helper):
+        project = db_helper.create_test_project(test_db_session)
+        design, build, docs = (
+            db_helper.create_test_task(
+                test_db_session, project.id, title=title, estimated_hours=hours, story_points=points
+            )
+            for title, hours, points in (("Design", 4, 1), ("Build", 10, 8), ("Docs", 2, 5))
+        )
+        test_db_session.add_all(
+            [
+                TaskDependency(task_id=build.id, depends_on_task_id=design.id),
+                TaskDependency(task_id=docs.id, depends_on_task_id=design.id),
+            ]
+        )
+        test_db_session.commit()
+        return project, design, build, docs
+
+    def test_hours_and_points(self, test_client, test_db_session, db_helper):
+        """The critical chain depends on the chosen weight"""
+        project, design, build, docs = self._project(test_db_session, db_helper)
+        url = f"/api/projects/{project.id}/critical-path"
+
+        hours = test_client.get(url).json()
+        points = test_client.get(url, params={"weight": "story_points"}).json()
+
+        assert hours["project_duration"] == 14
+        assert hours["critical_chain"] == [design.id, build.id]
+        docs_row = next(task for task in hours["tasks"] if task["task_id"] == docs.id)
+        assert (docs_row["slack"], docs_row["critical"]) == (8, False)
+        assert points["project_duration"] == 9
+        assert points["critical_chain"] == [design.id, build.id]
+
+    def test_cached_until_estimates_change(self, test_client, test_db_session, db_helper):
+        """Repeated reads hit the cache; an estimate edit recomputes the path"""
+        project, design, _, docs = self._project(test_db_session, db_helper)
+        url = f"/api/projects/{project.id}/critical-path"
+
+        test_client.get(url)
+        hits = critical_path_cache.hits
+        test_client.get(url)
+        assert critical_path_cache.hits == hits + 1
+
+        docs.estimated_hours = Decimal("20")
+        test_db_session.commit()
+        report = test_client.get(url).json()
+
+        assert report["critical_chain"] == [design.id, docs.id]
+        assert report["project_duration"] == 24
+
+    def test_finished_and_missing(self, test_client, test_db_session, db_helper):
+        """Done tasks take no time, unknown projects are 404 and bad weights 422"""
+        project, design, build, _ = self._project(test_db_session, db_helper)
+        design.status = "done"
+        test_db_session.commit()
+
+        report = test_client.get(f"/api/projects/{project.id}/critical-path").json()
+
+        assert report["project_duration"] == 10
+        assert test_client.get("/api/projects/missing/critical-path").status_code == 404
+        bad_weight = test_client.get(
+            f"/api/projects/{project.id}/critical-path", params={"weight": "x"}
+        )
+        assert bad_weight.status_code == 422
@@ -5,6 +5,7 @@ Integration tests for database operations
 
 import pytest
 
+from src.goalpath.database import DatabaseManager
 from src.goalpath.models import GoalProject, Project, Task
 
 
@@ -217,3 +218,25 @@ class TestDatabaseIntegration:
             finally:
                 session1.close()
                 session2.close()
+
+
+def test_dedicated_sessions_do_not_share_the_request_connection(tmp_path):
+    """A commit or rollback in a dedicated session leaves request sessions alone"""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'dedicated.db'}")
+    manager.create_tables()
+    request_session = manager.get_sync_session()
+    request_session.add(Project(name="Half written"))
+    request_session.flush()
+
+    background = manager.get_dedicated_session_factory()()
+    background.query(Project).count()
+    background.commit()
+    background.close()
+    request_session.rollback()
+    request_session.close()
+
+    with manager.get_sync_session() as session:
+        assert session.query(Project).count() == 0
+    in_memory = DatabaseManager("sqlite:///:memory:")
+    assert in_memory.get_dedicated_session_factory() is in_memory.SessionLocal
+    manager.engine.dispose()
@@ -0,0 +1,129 @@
+"""
+Tests for the task dependency graph and the dependency endpoints
+"""
+
+import pytest
+
+from src.goalpath.dependency_graph import DependencyGraph, graph_cache
+from src.goalpath.models import TaskDependency
+
+
+class TestDependencyGraph:
+    """Test graph traversal on adjacency arrays"""
+
+    def test_transitive_lookups(self):
+        """Blockers and blockees follow edges in both directions, nearest first"""
+        graph = DependencyGraph("ABCDE", [("B", "A"), ("C", "B"), ("D", "B"), ("D", "C")])
+
+        assert graph.blockers("D") == ["B", "C", "A"]
+        assert graph.blockees("A") == ["B", "C", "D"]
+        assert graph.blockers("E") == [] and graph.blockees("E") == []
+
+    def test_cycle_detection(self):
+        """An edge closing a loop is detected; parallel paths are not cycles"""
+        graph = DependencyGraph("ABCD", [("B", "A"), ("C", "B"), ("D", "A")])
+
+        assert graph.would_create_cycle("A", "C")
+        assert graph.would_create_cycle("A", "A")
+        assert not graph.would_create_cycle("C", "D")
+
+    def test_topological_order(self):
+        """Blockers come first and unrelated tasks keep their load order"""
+        graph = DependencyGraph("ABCD", [("A", "C"), ("B", "C"), ("A", "D")])
+
+        assert graph.topological_order() == ["C", "D", "B", "A"]
+
+        with pytest.raises(ValueError):
+            DependencyGraph("AB", [("A", "B"), ("B", "A")]).topological_order()
+
+
+class TestDependencyEndpoints:
+    """Test /api/tasks/{id}/dependencies and /api/projects/{id}/dependency-order"""
+
+    @staticmethod
+    def _chain(test_db_session, db_helper):
+        project = db_helper.create_test_project(test_db_session)
+        tasks = [
+            db_helper.create_test_task(test_db_session, project.id, title=title, order_index=i)
+            for i, title in enumerate("ABC")
+        ]
+        return project, tasks
+
+    def test_add_rejects_cycles(self, test_client, test_db_session, db_helper):
+        """A -> B -> C is accepted, C -> A is rejected as a cycle"""
+        _, (a, b, c) = self._chain(test_db_session, db_helper)
+
+        first = test_client.post(
+            f"/api/tasks/{a.id}/dependencies", json={"depends_on_task_id": b.id}
+        )
+        second = test_client.post(
+            f"/api/tasks/{b.id}/dependencies", json={"depends_on_task_id": c.id}
+        )
+        cycle = test_client.post(
+            f"/api/tasks/{c.id}/dependencies", json={"depends_on_task_id": a.id}
+        )
+
+        assert (first.status_code, second.status_code) == (201, 201)
+        assert cycle.status_code == 400
+        assert "cycle" in cycle.json()["detail"]
+        assert test_db_session.query(TaskDependency).count() == 2
+
+    def test_related_links_skip_cycle_check(self, test_client, test_db_session, db_helper):
+        """related_to links do not order work, so they may point either way"""
+        _, (a, b, _) = self._chain(test_db_session, db_helper)
+        test_client.post(f"/api/tasks/{a.id}/dependencies", json={"depends_on_task_id": b.id})
+
+        response = test_client.post(
+            f"/api/tasks/{b.id}/dependencies",
+            json={"depends_on_task_id": a.id, "dependency_type": "related_to"},
+        )
+
+        assert response.status_code == 201
+
+    def test_invalid_targets(self, test_client, test_db_session, db_helper):
+        """Self links, other projects, unknown tasks and duplicates are rejected"""
+        _, (a, b, _) = self._chain(test_db_session, db_helper)
+        other_project = db_helper.create_test_project(test_db_session)
+        stranger = db_helper.create_test_task(test_db_session, other_project.id)
+        url = f"/api/tasks/{a.id}/dependencies"
+
+        assert test_client.post(url, json={"depends_on_task_id": a.id}).status_code == 400
+        assert test_client.post(url, json={"depends_on_task_id": stranger.id}).status_code == 400
+        assert test_client.post(url, json={"depends_on_task_id": "missing"}).status_code == 404
+        assert test_client.post(url, json={"depends_on_task_id": b.id}).status_code == 201
+        assert test_client.post(url, json={"depends_on_task_id": b.id}).status_code == 400
+
+    def test_remove_and_transitive(self, test_client, test_db_session, db_helper):
+        """Transitive lookups reflect removals immediately"""
+        _, (a, b, c) = self._chain(test_db_session, db_helper)
+        test_client.post(f"/api/tasks/{a.id}/dependencies", json={"depends_on_task_id": b.id})
+        test_client.post(f"/api/tasks/{b.id}/dependencies", json={"depends_on_task_id": c.id})
+
+        before = test_client.get(f"/api/tasks/{a.id}/dependencies/transitive").json()
+        removed = test_client.delete(f"/api/tasks/{b.id}/dependencies/{c.id}")
+        after = test_client.get(f"/api/tasks/{a.id}/dependencies/transitive").json()
+        missing = test_client.delete(f"/api/tasks/{b.id}/dependencies/{c.id}")
+
+        assert [item["task_title"] for item in before["blockers"]] == ["B", "C"]
+        assert removed.status_code == 200
+        assert [item["task_title"] for item in after["blockers"]] == ["B"]
+        assert missing.status_code == 404
+
+    def test_dependency_order_and_cache(self, test_client, test_db_session, db_helper):
+        """The project order puts blockers first and the graph is reused until edges change"""
+        project, (a, b, c) = self._chain(test_db_session, db_helper)
+        test_client.post(f"/api/tasks/{a.id}/dependencies", json={"depends_on_task_id": c.id})
+
+        url = f"/api/projects/{project.id}/dependency-order"
+        first = test_client.get(url).json()
+        hits = graph_cache.hits
+        test_client.get(url)
+        assert graph_cache.hits == hits + 1
+
+        test_client.post(f"/api/tasks/{c.id}/dependencies", json={"depends_on_task_id": b.id})
+        second = test_client.get(url).json()
+
+        assert first["order"] == [b.id, c.id, a.id]
+        assert second["order"] == [b.id, c.id, a.id]
+        assert second["dependency_count"] == 2
+        assert test_client.get("/api/projects/missing/dependency-order").status_code == 404
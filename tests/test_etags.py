@@ -0,0 +1,122 @@
+"""
+Tests for ETag / If-None-Match conditional responses
+"""
+
+from src.goalpath.database import DatabaseManager
+from src.goalpath.etags import data_version
+from src.goalpath.models import Project
+
+HTMX_HEADERS = {"HX-Request": "true"}
+
+
+class TestConditionalGet:
+    """Test weak ETags and 304 responses on read routes"""
+
+    def test_list_returns_weak_etag(self, test_client, test_db_session, db_helper):
+        """List endpoints tag their responses with a weak ETag"""
+        db_helper.create_test_project(test_db_session)
+
+        response = test_client.get("/api/projects/")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_matching_etag_returns_304(self, test_client, test_db_session, db_helper):
+        """A matching If-None-Match yields an empty 304"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id)
+
+        first = test_client.get("/api/tasks/")
+        etag = first.headers["etag"]
+
+        second = test_client.get("/api/tasks/", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_write_changes_etag(self, test_client, test_db_session, db_helper):
+        """A committed write produces a new ETag"""
+        db_helper.create_test_goal(test_db_session)
+        etag = test_client.get("/api/goals/").headers["etag"]
+
+        created = test_client.post(
+            "/api/goals/", json={"title": "Another Goal", "goal_type": "short_term"}
+        )
+        assert created.status_code == 201
+
+        response = test_client.get("/api/goals/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_filters_have_distinct_etags(self, test_client, test_db_session, db_helper):
+        """Different query strings never share an ETag"""
+        db_helper.create_test_project(test_db_session)
+
+        all_projects = test_client.get("/api/projects/").headers["etag"]
+        active = test_client.get("/api/projects/?status=active").headers["etag"]
+
+        assert all_projects != active
+
+    def test_dashboard_stats_html_and_json_variants(self, test_client, test_db_session, db_helper):
+        """The HTML and JSON variants of dashboard stats are tagged separately"""
+        db_helper.create_test_project(test_db_session)
+
+        json_etag = test_client.get("/api/dashboard/stats").headers["etag"]
+        html = test_client.get("/api/dashboard/stats", headers=HTMX_HEADERS)
+
+        assert html.headers["etag"] != json_etag
+        repeat = test_client.get(
+            "/api/dashboard/stats", headers={**HTMX_HEADERS, "If-None-Match": html.headers["etag"]}
+        )
+        assert repeat.status_code == 304
+
+    def test_htmx_list_fragments(self, test_client, test_db_session, db_helper):
+        """HTMX list fragments answer conditional requests"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id, status="todo")
+
+        for path in ("/htmx/tasks/list", "/htmx/projects/list"):
+            etag = test_client.get(path, headers=HTMX_HEADERS).headers["etag"]
+            response = test_client.get(path, headers={**HTMX_HEADERS, "If-None-Match": etag})
+            assert response.status_code == 304
+
+        etag = test_client.get("/htmx/tasks/list", headers=HTMX_HEADERS).headers["etag"]
+        test_client.put(
+            f"/htmx/tasks/{task.id}/status", params={"status": "done"}, headers=HTMX_HEADERS
+        )
+        response = test_client.get(
+            "/htmx/tasks/list", headers={**HTMX_HEADERS, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+
+def test_data_version_is_shared_between_replicas(tmp_path):
+    """Two app processes on one database see the same stamp, even for same-second writes"""
+    url = f"sqlite:///{tmp_path / 'shared.db'}"
+    writer, reader = DatabaseManager(url), DatabaseManager(url)
+    writer.create_tables()
+    session = writer.get_sync_session()
+    project = Project(name="Replicated")
+    session.add(project)
+    session.commit()
+
+    def versions():
+        with writer.get_sync_session() as first, reader.get_sync_session() as second:
+            return data_version(first, Project), data_version(second, Project)
+
+    before, seen = versions()
+    assert before == seen
+
+    # Neither the row count nor the whole-second updated_at moves
+    project.description = "Edited"
+    project.updated_at = project.updated_at
+    session.commit()
+    session.close()
+
+    after, seen = versions()
+    assert after == seen
+    assert after != before
+    writer.engine.dispose()
+    reader.engine.dispose()
@@ -0,0 +1,199 @@
+"""
+Tests for the change event hub and the SSE stream
+"""
+
+import asyncio
+
+import pytest
+
+from src.goalpath import events
+from src.goalpath.database import DatabaseManager
+from src.goalpath.events import (
+    BroadcastBackend,
+    DataVersionBroadcastBackend,
+    EventHub,
+    LocalBroadcastBackend,
+    format_sse,
+)
+from src.goalpath.models import Project
+from src.goalpath.routers.events import event_stream
+
+
+class RecordingBackend(LocalBroadcastBackend):
+    """Local backend that also records what was published"""
+
+    def __init__(self, hub):
+        super().__init__(hub)
+        self.messages = []
+
+    def publish(self, message):
+        self.messages.append(message)
+        super().publish(message)
+
+
+class FakeRequest:
+    """Request stand-in that disconnects after a number of checks"""
+
+    def __init__(self, checks):
+        self.checks = checks
+
+    async def is_disconnected(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+@pytest.fixture
+def recording_backend():
+    previous = events.get_backend()
+    backend = RecordingBackend(events.hub)
+    events.set_backend(backend)
+    yield backend
+    events.set_backend(previous)
+
+
+class TestEventHub:
+    """Test in-process fan-out"""
+
+    def test_deliver_respects_topics(self):
+        """Subscribers only receive the entities they asked for"""
+
+        async def scenario():
+            hub = EventHub()
+            tasks_only = hub.subscribe({"task"})
+            everything = hub.subscribe()
+
+            hub.deliver({"entity": "project", "action": "created", "id": "p1"})
+            hub.deliver({"entity": "task", "action": "created", "id": "t1"})
+            await asyncio.sleep(0)
+
+            return tasks_only.queue.qsize(), everything.queue.qsize()
+
+        assert asyncio.run(scenario()) == (1, 2)
+
+    def test_full_queue_drops_oldest(self):
+        """A slow subscriber keeps only the most recent events"""
+
+        async def scenario():
+            hub = EventHub(max_queue_size=2)
+            subscription = hub.subscribe()
+            for index in range(3):
+                hub.deliver({"entity": "task", "action": "updated", "id": str(index)})
+            await asyncio.sleep(0)
+            return [subscription.queue.get_nowait()["id"] for _ in range(2)]
+
+        assert asyncio.run(scenario()) == ["1", "2"]
+
+    def test_backend_interface_is_abstract(self):
+        """A backend has to implement publish"""
+        with pytest.raises(TypeError):
+            BroadcastBackend(EventHub())
+
+    def test_format_sse(self):
+        """Frames are named after the entity and carry JSON data"""
+        frame = format_sse({"entity": "goal", "action": "deleted", "id": "g1"})
+
+        assert frame.startswith("event: goal\ndata: {")
+        assert frame.endswith("\n\n")
+
+
+class TestCommitEvents:
+    """Test that committed ORM writes publish change events"""
+
+    def test_commit_publishes_task_and_dashboard(
+        self, recording_backend, test_db_session, db_helper
+    ):
+        """Creating a task emits task, project and dashboard notifications"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id)
+
+        entities = [message["entity"] for message in recording_backend.messages]
+        assert "project" in entities
+        assert "task" in entities
+        assert "dashboard" in entities
+
+        task_event = next(m for m in recording_backend.messages if m["entity"] == "task")
+        assert task_event["action"] == "created"
+        assert task_event["project_id"] == project.id
+
+    def test_rollback_publishes_nothing(self, recording_backend, test_db_session):
+        """Rolled back changes are never announced"""
+        from src.goalpath.models import Project
+
+        test_db_session.add(Project(name="Never Saved", created_by="test"))
+        test_db_session.flush()
+        test_db_session.rollback()
+
+        assert recording_backend.messages == []
+
+    def test_api_write_reaches_subscriber(self, test_client, recording_backend):
+        """A write through the API is broadcast to the hub"""
+        response = test_client.post("/api/projects/", json={"name": "Broadcast Project"})
+
+        assert response.status_code == 201
+        created = [m for m in recording_backend.messages if m["entity"] == "project"]
+        assert created[0]["id"] == response.json()["id"]
+
+
+class TestEventStream:
+    """Test the SSE generator behind /events"""
+
+    def test_stream_yields_events_then_unsubscribes(self):
+        """Published events are streamed as frames until disconnect"""
+
+        async def scenario():
+            stream = event_stream(FakeRequest(checks=1), topics={"task"}, heartbeat=1.0)
+            frames = [await stream.__anext__()]
+            receive = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0)
+            events.hub.deliver({"entity": "task", "action": "updated", "id": "t1"})
+            frames.append(await receive)
+            async for frame in stream:
+                frames.append(frame)
+            return frames
+
+        frames = asyncio.run(scenario())
+
+        assert frames[0].startswith("retry:")
+        assert frames[1].startswith("event: task")
+        assert events.hub.subscriber_count == 0
+
+    def test_idle_stream_sends_heartbeat(self):
+        """An idle stream emits keep-alive comments without touching the database"""
+
+        async def scenario():
+            stream = event_stream(FakeRequest(checks=1), heartbeat=0.01)
+            return [frame async for frame in stream]
+
+        frames = asyncio.run(scenario())
+
+        assert frames == ["retry: 5000\n\n", ": keep-alive\n\n"]
+
+
+def test_version_poll_announces_writes_from_other_replicas(tmp_path):
+    """A replica's subscribers hear about commits made through another engine"""
+    url = f"sqlite:///{tmp_path / 'replicas.db'}"
+    writer, reader = DatabaseManager(url), DatabaseManager(url)
+    writer.create_tables()
+
+    async def scenario():
+        hub = EventHub()
+        backend = DataVersionBroadcastBackend(hub, reader.get_dedicated_session_factory())
+        subscription = hub.subscribe()
+        assert backend.poll() == 0
+        with writer.get_sync_session() as session:
+            session.add(Project(name="Elsewhere"))
+            session.commit()
+        changed = (backend.poll(), backend.poll())
+        await asyncio.sleep(0)
+        messages = [subscription.queue.get_nowait() for _ in range(subscription.queue.qsize())]
+        return changed, messages
+
+    changed, messages = asyncio.run(scenario())
+
+    assert changed == (1, 0)
+    assert [(message["entity"], message["action"]) for message in messages] == [
+        ("project", "bulk"),
+        ("dashboard", "changed"),
+    ]
+    writer.engine.dispose()
+    reader.engine.dispose()
@@ -0,0 +1,111 @@
+"""
+Tests for the streaming export API
+"""
+
+import csv
+import io
+import json
+
+from src.goalpath.database import DatabaseManager
+from src.goalpath.exports import (
+    project_export_select,
+    stream_export,
+    stream_ndjson,
+    task_export_select,
+)
+from src.goalpath.models import Project
+from src.goalpath.schemas import ProjectFilters, TaskFilters
+
+
+class TestExport:
+    """Test /api/export/{entity}"""
+
+    def test_tasks_ndjson(self, test_client, test_db_session, db_helper):
+        """Each task is one JSON line including the description"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id, title="First", description="A")
+        db_helper.create_test_task(test_db_session, project.id, title="Second")
+
+        response = test_client.get("/api/export/tasks")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert "attachment" in response.headers["content-disposition"]
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        by_title = {line["title"]: line for line in lines}
+        assert sorted(by_title) == ["First", "Second"]
+        assert by_title["First"]["description"] == "A"
+        assert by_title["First"]["project_id"] == project.id
+
+    def test_tasks_csv_with_filters(self, test_client, test_db_session, db_helper):
+        """CSV output has a header row and honours the task filters"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id, title="Open", status="todo")
+        db_helper.create_test_task(test_db_session, project.id, title="Closed", status="done")
+
+        response = test_client.get("/api/export/tasks?format=csv&status=done")
+
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["title"] for row in rows] == ["Closed"]
+        assert rows[0]["completed_date"] == ""
+
+    def test_empty_csv_has_header(self, test_client):
+        """An export with no matching rows still carries the header"""
+        response = test_client.get("/api/export/projects?format=csv")
+
+        assert response.status_code == 200
+        assert response.text.splitlines()[0].startswith("id,name,status")
+
+    def test_projects_and_goals(self, test_client, test_db_session, db_helper):
+        """Projects and goals export with their own filters"""
+        db_helper.create_test_project(test_db_session, name="Alpha", priority="high")
+        db_helper.create_test_project(test_db_session, name="Beta", priority="low")
+        db_helper.create_test_goal(test_db_session, title="Grow")
+
+        projects = test_client.get("/api/export/projects?priority=high")
+        goals = test_client.get("/api/export/goals?search=Grow")
+
+        assert [json.loads(line)["name"] for line in projects.text.splitlines()] == ["Alpha"]
+        assert [json.loads(line)["title"] for line in goals.text.splitlines()] == ["Grow"]
+
+    def test_invalid_format_and_filter(self, test_client):
+        """Unknown formats are a client error; filter values are validated"""
+        assert test_client.get("/api/export/tasks?format=xml").status_code == 400
+        assert test_client.get("/api/export/tasks?status=nope").status_code == 422
+
+    def test_stream_is_chunked_per_batch(self, test_db_session, db_helper):
+        """Rows are fetched and encoded one batch at a time"""
+        project = db_helper.create_test_project(test_db_session)
+        for index in range(5):
+            db_helper.create_test_task(test_db_session, project.id, title=f"Task {index}")
+
+        chunks = list(
+            stream_ndjson(test_db_session, task_export_select(TaskFilters()), batch_size=2)
+        )
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+
+def test_stream_reads_on_its_own_connection(tmp_path):
+    """Finishing a stream never ends another session's open transaction"""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'export.db'}")
+    manager.create_tables()
+    request_session = manager.get_sync_session()
+    request_session.add(Project(name="In flight"))
+    request_session.flush()
+
+    body = b"".join(
+        stream_export(
+            manager.get_dedicated_session_factory(),
+            project_export_select(ProjectFilters()),
+            "ndjson",
+        )
+    )
+    request_session.commit()
+    request_session.close()
+
+    assert body == b""
+    with manager.get_sync_session() as session:
+        assert session.query(Project).count() == 1
+    manager.engine.dispose()
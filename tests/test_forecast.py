@@ -0,0 +1,115 @@
+"""
+Tests for Monte Carlo delivery forecasting
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.goalpath.forecast import (
+    MAX_FORECAST_WEEKS,
+    build_forecast,
+    forecast_cache,
+    simulate_completion_weeks,
+    weekly_throughput,
+)
+
+NOW = datetime(2025, 6, 2, 12, 0)
+
+
+def _done(session, db_helper, project, *ages_in_days):
+    for age in ages_in_days:
+        db_helper.create_test_task(
+            session, project.id, status="done", completed_date=NOW - timedelta(days=age)
+        )
+
+
+class TestSimulation:
+    """Test the vectorized simulation"""
+
+    def test_constant_throughput_is_exact(self):
+        """With a constant rate every trial needs the same number of weeks"""
+        weeks = simulate_completion_weeks(np.array([5, 5, 5]), 21, 2_000)
+        assert set(weeks.tolist()) == {5}
+
+    def test_matches_a_scalar_simulation(self):
+        """Percentiles agree with a plain loop drawing the same kind of weeks"""
+        history = np.array([0, 2, 3, 7, 1, 4])
+        vectorized = simulate_completion_weeks(history, 40, 20_000, np.random.default_rng(1))
+
+        rng = np.random.default_rng(2)
+        scalar = []
+        for _ in range(20_000):
+            done = week = 0
+            while done < 40:
+                done += rng.choice(history)
+                week += 1
+            scalar.append(week)
+
+        for percentile in (50, 85, 95):
+            assert (
+                abs(np.percentile(vectorized, percentile) - np.percentile(scalar, percentile)) <= 1
+            )
+
+    def test_empty_backlog_and_no_throughput(self):
+        """Nothing left takes zero weeks; no completed work never finishes"""
+        assert not simulate_completion_weeks(np.array([0, 0]), 0, 10).any()
+        stalled = simulate_completion_weeks(np.array([0, 0]), 3, 10)
+        assert set(stalled.tolist()) == {MAX_FORECAST_WEEKS + 1}
+
+
+class TestForecast:
+    """Test the throughput history, the report and its cache"""
+
+    def test_weekly_throughput(self, test_db_session, db_helper):
+        """Completions are bucketed into weeks ending now, oldest first"""
+        project = db_helper.create_test_project(test_db_session)
+        _done(test_db_session, db_helper, project, 1, 2, 6, 8, 20, 40)
+
+        throughput = weekly_throughput(test_db_session, project.id, NOW, 4)
+
+        assert throughput.tolist() == [0, 1, 1, 3]
+
+    def test_report(self, test_db_session, db_helper):
+        """Percentile dates follow from the history and the open backlog"""
+        project = db_helper.create_test_project(test_db_session)
+        project.created_at = NOW - timedelta(weeks=52)
+        _done(test_db_session, db_helper, project, *[week * 7 + 1 for week in range(4)] * 2)
+        for _ in range(6):
+            db_helper.create_test_task(test_db_session, project.id, status="todo")
+        db_helper.create_test_task(test_db_session, project.id, status="cancelled")
+
+        report = build_forecast(test_db_session, project, 1_000, 4, now=NOW)
+
+        assert report["remaining_tasks"] == 6
+        assert report["throughput"] == [2, 2, 2, 2]
+        assert [item["weeks"] for item in report["forecasts"]] == [3, 3, 3]
+        assert report["forecasts"][0]["date"] == (NOW + timedelta(weeks=3)).date()
+
+    def test_history_starts_at_project_creation(self, test_db_session, db_helper):
+        """A project younger than the window samples only the weeks it existed"""
+        project = db_helper.create_test_project(test_db_session)
+        project.created_at = NOW - timedelta(days=10)
+
+        report = build_forecast(test_db_session, project, 1_000, 12, now=NOW)
+
+        assert report["history_weeks"] == 2
+        assert report["forecasts"][0] == {"percentile": 50, "weeks": 0, "date": NOW.date()}
+
+    def test_endpoint_caches_until_tasks_change(self, test_client, test_db_session, db_helper):
+        """Repeat requests hit the cache; a new task re-runs the simulation"""
+        forecast_cache.clear()
+        project = db_helper.create_test_project(test_db_session)
+        _done(test_db_session, db_helper, project, 1)
+        db_helper.create_test_task(test_db_session, project.id, status="todo")
+        url = f"/api/projects/{project.id}/forecast?trials=1000"
+
+        first = test_client.get(url)
+        assert first.status_code == 200
+        assert test_client.get(url).json() == first.json()
+        assert (forecast_cache.hits, forecast_cache.misses) == (1, 1)
+
+        db_helper.create_test_task(test_db_session, project.id, status="todo")
+        assert test_client.get(url).json()["remaining_tasks"] == 2
+        assert forecast_cache.misses == 2
+        assert test_client.get("/api/projects/missing/forecast").status_code == 404
@@ -0,0 +1,139 @@
+"""
+Tests for the rendered HTMX fragment cache
+"""
+
+import pytest
+
+from src.goalpath.htmx_utils import FragmentCache, fragment_cache
+
+HTMX_HEADERS = {"HX-Request": "true"}
+
+
+class TestFragmentCache:
+    """Test the FragmentCache LRU"""
+
+    def test_hit_and_miss_metrics(self):
+        """Lookups are counted and the hit rate reflects them"""
+        cache = FragmentCache()
+
+        assert cache.get("card.html", ("a", 1)) is None
+        cache.put("card.html", ("a", 1), "<div>a</div>")
+        assert cache.get("card.html", ("a", 1)) == "<div>a</div>"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    def test_new_version_misses(self):
+        """A changed version tuple does not return the old HTML"""
+        cache = FragmentCache()
+        cache.put("card.html", ("a", "2025-01-01T00:00:00"), "old")
+
+        assert cache.get("card.html", ("a", "2025-01-02T00:00:00")) is None
+
+    def test_evicts_least_recently_used_past_byte_bound(self):
+        """Entries beyond max_bytes are evicted oldest first"""
+        cache = FragmentCache(max_bytes=10)
+        cache.put("card.html", "a", "aaaa")
+        cache.put("card.html", "b", "bbbb")
+        cache.get("card.html", "a")  # a is now most recently used
+        cache.put("card.html", "c", "cccc")
+
+        assert cache.get("card.html", "b") is None
+        assert cache.get("card.html", "a") == "aaaa"
+        assert cache.get("card.html", "c") == "cccc"
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["size_bytes"] == 8
+
+    def test_invalidate_by_tag(self):
+        """Invalidating a tag drops every entry carrying it"""
+        cache = FragmentCache()
+        cache.put("task.html", "t1", "task 1", tags=("t1", "p1"))
+        cache.put("task.html", "t2", "task 2", tags=("t2", "p1"))
+        cache.put("task.html", "t3", "task 3", tags=("t3", "p2"))
+
+        assert cache.invalidate("p1", None) == 2
+
+        assert cache.get("task.html", "t1") is None
+        assert cache.get("task.html", "t2") is None
+        assert cache.get("task.html", "t3") == "task 3"
+
+
+class TestFragmentCacheRoutes:
+    """Test the fragment cache through the HTMX routes"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        fragment_cache.clear()
+        yield
+        fragment_cache.clear()
+
+    def test_task_list_reuses_cards(self, test_client, test_db_session, db_helper):
+        """A second list render is served from cached task cards"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id, title="Cached Task A")
+        db_helper.create_test_task(test_db_session, project.id, title="Cached Task B")
+
+        first = test_client.get("/htmx/tasks/list", headers=HTMX_HEADERS)
+        assert first.status_code == 200
+        assert fragment_cache.stats()["misses"] == 2
+
+        second = test_client.get("/htmx/tasks/list", headers=HTMX_HEADERS)
+        assert second.text == first.text
+        assert fragment_cache.stats()["hits"] == 2
+
+    def test_status_update_invalidates_card(self, test_client, test_db_session, db_helper):
+        """Writing through the HTMX router re-renders the changed card"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(
+            test_db_session, project.id, title="Toggle Me", status="todo"
+        )
+
+        test_client.get("/htmx/tasks/list", headers=HTMX_HEADERS)
+        assert fragment_cache.stats()["entries"] == 1
+
+        response = test_client.put(
+            f"/htmx/tasks/{task.id}/status", params={"status": "done"}, headers=HTMX_HEADERS
+        )
+        assert response.status_code == 200
+        assert fragment_cache.stats()["entries"] == 0
+
+        listing = test_client.get("/htmx/tasks/list", headers=HTMX_HEADERS)
+        assert "status-done" in listing.text
+
+    def test_write_within_updated_at_resolution_rerenders(
+        self, test_client, test_db_session, db_helper
+    ):
+        """A committed task write drops its card even when updated_at is unchanged"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id, title="Same Second")
+        test_client.get("/htmx/tasks/list", headers=HTMX_HEADERS)
+
+        # A write stamped in the same second as the render keeps the version tuple
+        task.title = "Renamed In Place"
+        task.updated_at = task.updated_at
+        test_db_session.commit()
+
+        listing = test_client.get("/htmx/tasks/list", headers=HTMX_HEADERS)
+        assert "Renamed In Place" in listing.text
+        assert "Same Second" not in listing.text
+
+    def test_rest_write_invalidates_card(self, test_client, test_db_session, db_helper):
+        """Writes through the JSON API drop cached cards too"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id, title="Via REST")
+        test_client.get("/htmx/tasks/list", headers=HTMX_HEADERS)
+        assert fragment_cache.stats()["entries"] == 1
+
+        response = test_client.put(f"/api/tasks/{task.id}", json={"title": "Renamed Via REST"})
+        assert response.status_code == 200
+        assert fragment_cache.stats()["entries"] == 0
+
+    def test_metrics_endpoint(self, test_client):
+        """The metrics endpoint exposes the cache statistics"""
+        response = test_client.get("/api/cache/fragments")
+
+        assert response.status_code == 200
+        assert {"entries", "hits", "misses", "hit_rate"} <= set(response.json())
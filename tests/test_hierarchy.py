@@ -0,0 +1,117 @@
+"""
+Tests for set-based subtree deletes and child promotion
+"""
+
+from src.goalpath.hierarchy import delete_subtree, subtree_ids
+from src.goalpath.models import Goal, GoalProject, Task, TaskDependency
+from src.goalpath.models.extended import TaskComment
+
+
+def _task_chain(session, db_helper, project_id, depth):
+    """A single branch of ``depth`` nested tasks; returns them root first"""
+    tasks = []
+    parent_id = None
+    for level in range(depth):
+        task = db_helper.create_test_task(
+            session, project_id, title=f"Level {level}", parent_task_id=parent_id
+        )
+        tasks.append(task)
+        parent_id = task.id
+    return tasks
+
+
+class TestSubtreeQueries:
+    """Test the recursive CTE helpers"""
+
+    def test_subtree_ids_deepest_first(self, test_db_session, db_helper):
+        """Descendants come back deepest first and siblings of the root are excluded"""
+        project = db_helper.create_test_project(test_db_session)
+        chain = _task_chain(test_db_session, db_helper, project.id, 4)
+        db_helper.create_test_task(test_db_session, project.id, title="Unrelated")
+
+        ids = subtree_ids(test_db_session, Task, chain[1].id)
+
+        assert ids == [task.id for task in reversed(chain[1:])]
+        assert subtree_ids(test_db_session, Task, chain[1].id, include_root=False) == ids[:-1]
+
+    def test_batched_delete(self, test_db_session, db_helper):
+        """Batches smaller than the subtree still remove every row"""
+        project = db_helper.create_test_project(test_db_session)
+        chain = _task_chain(test_db_session, db_helper, project.id, 7)
+
+        deleted = delete_subtree(test_db_session, Task, chain[0].id, batch_size=2)
+        test_db_session.commit()
+
+        assert deleted == 7
+        assert test_db_session.query(Task).count() == 0
+
+
+class TestCascadeDeleteEndpoints:
+    """Test DELETE /api/tasks/{id} and /api/goals/{id} with and without cascade"""
+
+    def test_task_cascade_removes_subtree(self, test_client, test_db_session, db_helper):
+        """The whole subtree and its dependent rows are removed"""
+        project = db_helper.create_test_project(test_db_session)
+        root, child, grandchild = _task_chain(test_db_session, db_helper, project.id, 3)
+        other = db_helper.create_test_task(test_db_session, project.id, title="Other")
+        test_db_session.add_all(
+            [
+                TaskDependency(
+                    task_id=other.id, depends_on_task_id=grandchild.id, dependency_type="blocks"
+                ),
+                TaskComment(task_id=child.id, author="tester", content="Note"),
+            ]
+        )
+        test_db_session.commit()
+
+        response = test_client.delete(f"/api/tasks/{root.id}?cascade=true")
+
+        assert response.status_code == 200
+        assert "and all subtasks" in response.json()["message"]
+        test_db_session.expire_all()
+        assert [task.id for task in test_db_session.query(Task)] == [other.id]
+        assert test_db_session.query(TaskDependency).count() == 0
+        assert test_db_session.query(TaskComment).count() == 0
+
+    def test_task_delete_promotes_children(self, test_client, test_db_session, db_helper):
+        """Without cascade, direct children move up to the deleted task's parent"""
+        project = db_helper.create_test_project(test_db_session)
+        root, middle, leaf = _task_chain(test_db_session, db_helper, project.id, 3)
+        sibling = db_helper.create_test_task(
+            test_db_session, project.id, title="Sibling", parent_task_id=middle.id
+        )
+
+        middle_id = middle.id
+        response = test_client.delete(f"/api/tasks/{middle_id}")
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "Task 'Level 1' deleted successfully"
+        test_db_session.expire_all()
+        assert test_db_session.query(Task).filter(Task.id == middle_id).count() == 0
+        for task_id in (leaf.id, sibling.id):
+            assert test_db_session.get(Task, task_id).parent_task_id == root.id
+
+    def test_goal_cascade_and_promote(self, test_client, test_db_session, db_helper):
+        """Goal deletes cascade through subgoals and project links, or promote subgoals"""
+        project = db_helper.create_test_project(test_db_session)
+        top = db_helper.create_test_goal(test_db_session, title="Top")
+        middle = db_helper.create_test_goal(test_db_session, title="Mid", parent_goal_id=top.id)
+        leaf = db_helper.create_test_goal(test_db_session, title="Leaf", parent_goal_id=middle.id)
+        test_db_session.add(GoalProject(goal_id=leaf.id, project_id=project.id, weight=1.0))
+        test_db_session.commit()
+
+        promote = test_client.delete(f"/api/goals/{middle.id}")
+        test_db_session.expire_all()
+        assert promote.status_code == 200
+        assert test_db_session.get(Goal, leaf.id).parent_goal_id == top.id
+
+        cascade = test_client.delete(f"/api/goals/{top.id}?cascade=true")
+        test_db_session.expire_all()
+        assert cascade.status_code == 200
+        assert "and all subgoals" in cascade.json()["message"]
+        assert test_db_session.query(Goal).count() == 0
+        assert test_db_session.query(GoalProject).count() == 0
+
+    def test_missing_task(self, test_client):
+        """Unknown IDs still return 404"""
+        assert test_client.delete("/api/tasks/missing?cascade=true").status_code == 404
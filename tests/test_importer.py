@@ -0,0 +1,232 @@
+"""
+Tests for the bulk import pipeline
+"""
+
+import io
+import json
+
+from src.goalpath.importer import (
+    CSVParser,
+    ImportCheckpoint,
+    NDJSONParser,
+    RowError,
+    import_file,
+)
+from src.goalpath.models import GoalProject, Project, Task, TaskDependency
+
+
+def _ndjson(*records):
+    return "\n".join(json.dumps(record) for record in records).encode()
+
+
+class TestParsers:
+    """Test the incremental CSV and NDJSON parsers"""
+
+    def test_ndjson_across_chunks(self):
+        """Lines split across chunks are reassembled; bad lines become RowErrors"""
+        parser = NDJSONParser()
+        records = list(parser.feed(b'{"a": 1}\n{"a"')) + list(parser.feed(b": 2}\nnot json\n"))
+        records += list(parser.close())
+
+        assert records[:2] == [{"a": 1}, {"a": 2}]
+        assert isinstance(records[2], RowError)
+
+    def test_csv_quoted_newline_across_chunks(self):
+        """Quoted values spanning lines and chunks stay in one record"""
+        data = b'title,description\nFirst,"line one\nline two"\nSecond,plain\n'
+        parser = CSVParser()
+        records = []
+        for start in range(0, len(data), 7):
+            records += list(parser.feed(data[start : start + 7]))
+        records += list(parser.close())
+
+        assert records == [
+            {"title": "First", "description": "line one\nline two"},
+            {"title": "Second", "description": "plain"},
+        ]
+
+
+class TestBulkImport:
+    """Test import_file and the /api/import endpoint"""
+
+    def test_projects_upsert_by_name(self, test_db_session, db_helper):
+        """Re-importing a project with a known name updates it instead of failing"""
+        existing = db_helper.create_test_project(test_db_session, name="Legacy")
+
+        report = import_file(
+            test_db_session,
+            "projects",
+            io.BytesIO(b"id,name,priority\nP-1,Legacy,high\nP-2,Fresh,low\n"),
+            "csv",
+        )
+
+        assert (report.imported, report.failed) == (2, 0)
+        test_db_session.expire_all()
+        assert test_db_session.get(Project, existing.id).priority == "high"
+        assert test_db_session.get(Project, "P-2").name == "Fresh"
+
+    def test_tasks_resolve_references(self, test_db_session, db_helper):
+        """Projects resolve by ID or name; forward parent links are applied at the end"""
+        project = db_helper.create_test_project(test_db_session, name="Tracker")
+        source = _ndjson(
+            {"id": "T-2", "project_id": "Tracker", "title": "Child", "parent_task_id": "T-1"},
+            {"id": "T-1", "project_id": project.id, "title": "Parent", "status": "done"},
+            {"id": "T-3", "project_id": "Nowhere", "title": "Orphan"},
+            {"id": "T-4", "project_id": project.id, "title": "Bad", "status": "finished"},
+        )
+
+        report = import_file(test_db_session, "tasks", io.BytesIO(source), "ndjson", batch_size=1)
+
+        assert report.imported == 2
+        assert report.failed == 2
+        assert [error.row for error in report.errors] == [3, 4]
+        assert "status" in report.errors[1].error
+        test_db_session.expire_all()
+        assert test_db_session.get(Task, "T-2").parent_task_id == "T-1"
+        assert test_db_session.get(Task, "T-1").completed_date is not None
+
+    def test_dependencies_and_goal_links(self, test_db_session, db_helper):
+        """Link tables upsert on their natural keys"""
+        project = db_helper.create_test_project(test_db_session)
+        first = db_helper.create_test_task(test_db_session, project.id)
+        second = db_helper.create_test_task(test_db_session, project.id)
+        goal = db_helper.create_test_goal(test_db_session)
+
+        dependency = {"task_id": first.id, "depends_on_task_id": second.id}
+        import_file(test_db_session, "task_dependencies", io.BytesIO(_ndjson(dependency)), "ndjson")
+        report = import_file(
+            test_db_session,
+            "task_dependencies",
+            io.BytesIO(_ndjson({**dependency, "dependency_type": "related_to"})),
+            "ndjson",
+        )
+        links = import_file(
+            test_db_session,
+            "goal_projects",
+            io.BytesIO(_ndjson({"goal_id": goal.id, "project_id": project.id, "weight": 0.5})),
+            "ndjson",
+        )
+
+        assert (report.imported, links.imported) == (1, 1)
+        dependencies = test_db_session.query(TaskDependency).all()
+        assert [d.dependency_type for d in dependencies] == ["related_to"]
+        assert float(test_db_session.query(GoalProject).one().weight) == 0.5
+
+    def test_resume_from_checkpoint(self, test_db_session, db_helper, tmp_path):
+        """A checkpoint skips the records a previous run already committed"""
+        project = db_helper.create_test_project(test_db_session)
+        source = _ndjson(
+            *({"id": f"T-{n}", "project_id": project.id, "title": f"Task {n}"} for n in range(5))
+        )
+        checkpoint = ImportCheckpoint(str(tmp_path / "tasks.checkpoint"), "tasks")
+        checkpoint.rows = 3
+        checkpoint.save()
+
+        report = import_file(
+            test_db_session,
+            "tasks",
+            io.BytesIO(source),
+            "ndjson",
+            checkpoint=ImportCheckpoint(checkpoint.path, "tasks").load(),
+        )
+
+        assert (report.skipped, report.processed, report.imported) == (3, 2, 2)
+        assert report.rows_per_second > 0
+        assert {task.id for task in test_db_session.query(Task)} == {"T-3", "T-4"}
+        assert not (tmp_path / "tasks.checkpoint").exists()
+
+    def test_cycles_rejected(self, test_db_session, db_helper):
+        """Parent links and blocking dependencies that close a loop are rejected"""
+        project = db_helper.create_test_project(test_db_session)
+        tasks = _ndjson(
+            {"id": "C-1", "project_id": project.id, "title": "One", "parent_task_id": "C-2"},
+            {"id": "C-2", "project_id": project.id, "title": "Two", "parent_task_id": "C-1"},
+            {"id": "C-3", "project_id": project.id, "title": "Three", "parent_task_id": "C-2"},
+        )
+        report = import_file(test_db_session, "tasks", io.BytesIO(tasks), "ndjson", batch_size=1)
+
+        assert [error.row for error in report.errors] == [1]
+        assert "cycle" in report.errors[0].error
+        test_db_session.expire_all()
+        parents = {task.id: task.parent_task_id for task in test_db_session.query(Task)}
+        assert parents == {"C-1": None, "C-2": "C-1", "C-3": "C-2"}
+
+        # Re-parenting a stored ancestor under its descendant is caught too
+        moved = _ndjson(
+            {"id": "C-1", "project_id": project.id, "title": "One", "parent_task_id": "C-3"}
+        )
+        report = import_file(test_db_session, "tasks", io.BytesIO(moved), "ndjson")
+        assert (report.imported, report.failed) == (0, 1)
+
+        dependencies = _ndjson(
+            {"task_id": "C-1", "depends_on_task_id": "C-2"},
+            {"task_id": "C-2", "depends_on_task_id": "C-3"},
+            {"task_id": "C-3", "depends_on_task_id": "C-1"},
+            {"task_id": "C-3", "depends_on_task_id": "C-1", "dependency_type": "related_to"},
+        )
+        report = import_file(
+            test_db_session, "task_dependencies", io.BytesIO(dependencies), "ndjson", batch_size=2
+        )
+        assert [error.row for error in report.errors] == [3]
+        assert report.imported == 3
+
+    def test_parents_from_other_projects_rejected(self, test_db_session, db_helper):
+        """A parent in another project is refused, whether it comes first or later"""
+        first = db_helper.create_test_project(test_db_session)
+        second = db_helper.create_test_project(test_db_session)
+        source = _ndjson(
+            {"id": "X-1", "project_id": first.id, "title": "Parent"},
+            {"id": "X-2", "project_id": second.id, "title": "Child", "parent_task_id": "X-1"},
+            {"id": "X-3", "project_id": second.id, "title": "Early", "parent_task_id": "X-4"},
+            {"id": "X-4", "project_id": first.id, "title": "Late parent"},
+        )
+
+        report = import_file(test_db_session, "tasks", io.BytesIO(source), "ndjson", batch_size=1)
+
+        assert [error.row for error in report.errors] == [2, 3]
+        assert all("same project" in error.error for error in report.errors)
+        test_db_session.expire_all()
+        assert test_db_session.get(Task, "X-2") is None
+        assert test_db_session.get(Task, "X-3").parent_task_id is None
+
+    def test_resume_from_restores_forward_parent_links(
+        self, test_client, test_db_session, db_helper
+    ):
+        """Resuming an upload links children whose parent came after the interruption"""
+        project = db_helper.create_test_project(test_db_session)
+        records = [
+            {"id": "R-1", "project_id": project.id, "title": "Child", "parent_task_id": "R-3"},
+            {"id": "R-2", "project_id": project.id, "title": "Sibling", "parent_task_id": "R-3"},
+            {"id": "R-3", "project_id": project.id, "title": "Parent"},
+        ]
+        # The first upload stopped after two records were committed
+        first = test_client.post("/api/import/tasks?batch_size=1", content=_ndjson(*records[:2]))
+        assert first.json()["committed_rows"] == 2
+
+        resumed = test_client.post(
+            "/api/import/tasks?resume_from=2&batch_size=1", content=_ndjson(*records)
+        )
+
+        assert resumed.status_code == 200
+        assert (resumed.json()["imported"], resumed.json()["failed"]) == (1, 0)
+        test_db_session.expire_all()
+        assert test_db_session.get(Task, "R-1").parent_task_id == "R-3"
+        assert test_db_session.get(Task, "R-2").parent_task_id == "R-3"
+
+    def test_upload_endpoint(self, test_client, test_db_session, db_helper):
+        """The endpoint parses a streamed CSV upload and reports throughput"""
+        project = db_helper.create_test_project(test_db_session)
+        body = f"project_id,title,story_points\n{project.id},Imported,3\n{project.id},Bad,-1\n"
+
+        response = test_client.post("/api/import/tasks?format=csv", content=body.encode())
+
+        assert response.status_code == 200
+        report = response.json()
+        assert (report["imported"], report["failed"]) == (1, 1)
+        assert report["errors"][0]["error"] == "story_points must be positive"
+        assert "rows_per_second" in report
+
+    def test_upload_rejects_unknown_entity_and_format(self, test_client):
+        """Unknown tables and formats are client errors"""
+        assert test_client.post("/api/import/users", content=b"").status_code == 404
+        assert test_client.post("/api/import/tasks?format=xml", content=b"").status_code == 400
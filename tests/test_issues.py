@@ -0,0 +1,204 @@
+"""
+Tests for the issue triage API
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect, text
+
+from src.goalpath.models import Task
+from src.goalpath.models.extended import Issue
+from src.goalpath.read_models import decode_cursor, encode_cursor
+from src.goalpath.schema_upgrades import upgrade_schema
+
+CREATED = datetime(2025, 3, 1, 9, 0)
+
+
+def _issues(session, project, count, **fields):
+    issues = [
+        Issue(
+            project_id=project.id,
+            title=f"Issue {index}",
+            reporter="reporter",
+            created_at=CREATED + timedelta(minutes=index),
+            **fields,
+        )
+        for index in range(count)
+    ]
+    session.add_all(issues)
+    session.commit()
+    return issues
+
+
+class TestIssueListing:
+    """Test keyset pagination and filters"""
+
+    def test_pages_walk_every_issue_once(self, test_client, test_db_session, db_helper):
+        """Following next_cursor lists every issue newest first, without repeats"""
+        project = db_helper.create_test_project(test_db_session)
+        issues = _issues(test_db_session, project, 7)
+        # Same timestamp: the id breaks the tie
+        issues += _issues(test_db_session, project, 2, status="backlog")
+
+        seen, cursor = [], None
+        while True:
+            query = f"project_id={project.id}&limit=3" + (f"&cursor={cursor}" if cursor else "")
+            page = test_client.get(f"/api/issues/?{query}").json()
+            seen += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        expected = sorted(issues, key=lambda issue: (issue.created_at, issue.id), reverse=True)
+        assert seen == [issue.id for issue in expected]
+
+    def test_pages_walk_issues_created_through_the_api(
+        self, test_client, test_db_session, db_helper
+    ):
+        """Issues reported within the same second page through without repeats"""
+        project = db_helper.create_test_project(test_db_session)
+        payload = {"project_id": project.id, "reporter": "qa"}
+        created = [
+            test_client.post("/api/issues/", json={**payload, "title": f"Crash {index}"}).json()
+            for index in range(6)
+        ]
+
+        seen, cursor = [], None
+        while len(seen) <= len(created):
+            query = f"project_id={project.id}&limit=2" + (f"&cursor={cursor}" if cursor else "")
+            page = test_client.get(f"/api/issues/?{query}").json()
+            seen += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(issue["id"] for issue in created)
+
+    def test_pages_walk_database_stamped_issues(
+        self, test_client, test_db_manager, test_db_session, db_helper
+    ):
+        """Whole-second rows from SQL scripts page through once upgraded"""
+        project = db_helper.create_test_project(test_db_session)
+        for index in range(3):
+            # As CURRENT_TIMESTAMP stores it
+            test_db_session.execute(
+                text(
+                    "INSERT INTO issues (id, project_id, title, issue_type, priority, status,"
+                    " reporter, created_at, updated_at) VALUES (:id, :project, 'Seeded', 'bug',"
+                    " 'medium', 'triage', 'qa', '2025-03-01 09:00:00', '2025-03-01 09:00:00')"
+                ),
+                {"id": f"i{index}", "project": project.id},
+            )
+        # Stamped by the model default
+        test_db_session.add_all(
+            Issue(project_id=project.id, title="Reported", reporter="qa") for _ in range(3)
+        )
+        test_db_session.commit()
+        assert upgrade_schema(test_db_manager.engine) == ["keyset_timestamps"]
+
+        seen, cursor = [], None
+        while len(seen) <= 6:
+            query = f"project_id={project.id}&limit=1" + (f"&cursor={cursor}" if cursor else "")
+            page = test_client.get(f"/api/issues/?{query}").json()
+            seen += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 6
+        assert seen[-3:] == ["i2", "i1", "i0"]
+
+    def test_filters(self, test_client, test_db_session, db_helper):
+        """Status, priority and promotion filters narrow the listing"""
+        project = db_helper.create_test_project(test_db_session)
+        _issues(test_db_session, project, 2, priority="high")
+        _issues(test_db_session, project, 1, status="closed")
+
+        def ids(query):
+            return len(test_client.get(f"/api/issues/?{query}").json()["items"])
+
+        assert ids("status=triage&priority=high") == 2
+        assert ids("status=closed") == 1
+        assert ids("promoted=true") == 0
+        assert test_client.get("/api/issues/?cursor=garbage").status_code == 400
+
+    def test_cursor_round_trip(self):
+        """Cursors are opaque but decode to the (created_at, id) key"""
+        assert decode_cursor(encode_cursor(CREATED, "abc")) == (CREATED, "abc")
+
+    def test_keyset_indexes(self, test_db_session):
+        """Pages are served by (created_at, id) indexes"""
+        indexes = {
+            index["name"]: index["column_names"]
+            for index in inspect(test_db_session.get_bind()).get_indexes("issues")
+        }
+        assert indexes["idx_issues_created"] == ["created_at", "id"]
+        assert indexes["idx_issues_project_created"] == ["project_id", "created_at", "id"]
+        assert indexes["idx_issues_triage"] == ["project_id", "status", "created_at", "id"]
+
+
+class TestIssueEndpoints:
+    """Test CRUD, promotion and counters"""
+
+    def test_create_update_delete(self, test_client, test_db_session, db_helper):
+        """Issues are reported, triaged and deleted"""
+        project = db_helper.create_test_project(test_db_session)
+        payload = {"project_id": project.id, "title": "Crash", "reporter": "qa"}
+
+        created = test_client.post("/api/issues/", json={**payload, "issue_type": "bug"})
+        assert created.status_code == 201
+        issue_id = created.json()["id"]
+        assert created.json()["status"] == "triage"
+
+        updated = test_client.put(f"/api/issues/{issue_id}", json={"priority": "critical"})
+        assert updated.json()["priority"] == "critical"
+
+        missing = test_client.post("/api/issues/", json={**payload, "project_id": "missing"})
+        assert missing.status_code == 404
+        assert test_client.delete(f"/api/issues/{issue_id}").status_code == 200
+        assert test_client.get(f"/api/issues/{issue_id}").status_code == 404
+
+    def test_bulk_promote(self, test_client, test_db_session, db_helper):
+        """Promotion creates linked tasks once and moves issues out of triage"""
+        project = db_helper.create_test_project(test_db_session)
+        bug, feature = _issues(test_db_session, project, 2, assignee="dev")
+        bug.issue_type, bug.priority = "bug", "critical"
+        test_db_session.commit()
+
+        response = test_client.post(
+            "/api/issues/promote", json={"issue_ids": [bug.id, feature.id], "status": "todo"}
+        )
+
+        assert response.status_code == 200
+        promoted = {item["issue_id"]: item["task_id"] for item in response.json()["promoted"]}
+        assert set(promoted) == {bug.id, feature.id}
+        test_db_session.expire_all()
+        task = test_db_session.get(Task, promoted[bug.id])
+        assert (task.title, task.task_type, task.priority) == ("Issue 0", "bug", "critical")
+        assert (task.status, task.assigned_to, task.project_id) == ("todo", "dev", project.id)
+        assert test_db_session.get(Task, promoted[feature.id]).task_type == "story"
+        issue = test_db_session.get(Issue, bug.id)
+        assert (issue.promoted_to_task_id, issue.status) == (promoted[bug.id], "backlog")
+
+        again = test_client.post("/api/issues/promote", json={"issue_ids": [bug.id]}).json()
+        assert again == {"promoted": [], "skipped": [bug.id]}
+        missing = test_client.post("/api/issues/promote", json={"issue_ids": ["missing"]})
+        assert missing.status_code == 404
+
+    def test_triage_counters(self, test_client, test_db_session, db_helper):
+        """Counters cover statuses and the triage queue by priority and type"""
+        project = db_helper.create_test_project(test_db_session)
+        _issues(test_db_session, project, 2, priority="high")
+        _issues(test_db_session, project, 1, issue_type="bug", assignee="dev")
+        _issues(test_db_session, project, 1, status="closed")
+
+        counters = test_client.get(f"/api/issues/counters?project_id={project.id}").json()
+
+        assert counters["total"] == 4
+        assert counters["by_status"] == {"triage": 3, "closed": 1}
+        assert counters["triage"] == {
+            "total": 3,
+            "unassigned": 2,
+            "by_priority": {"high": 2, "medium": 1},
+            "by_type": {"feature": 2, "bug": 1},
+        }
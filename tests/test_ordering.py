@@ -0,0 +1,139 @@
+"""
+Tests for gap-based task ordering and the move endpoint
+"""
+
+from datetime import datetime
+
+from sqlalchemy import and_, inspect
+from sqlalchemy.dialects import postgresql
+
+from src.goalpath.models import Task
+from src.goalpath.ordering import ORDER_GAP, move_task, sibling_clause
+
+
+def _sibling_titles(test_client, project_id):
+    response = test_client.get(f"/api/tasks/?project_id={project_id}&fields=title")
+    return [task["title"] for task in response.json()]
+
+
+class TestTaskMove:
+    """Test /api/tasks/{id}/move"""
+
+    def test_create_leaves_gaps(self, test_client, test_db_session, db_helper):
+        """New tasks are appended ORDER_GAP after the last sibling"""
+        project = db_helper.create_test_project(test_db_session)
+        for title in ("A", "B"):
+            test_client.post("/api/tasks/", json={"title": title, "project_id": project.id})
+
+        orders = [task.order_index for task in test_db_session.query(Task).order_by(Task.title)]
+        assert orders == [ORDER_GAP, 2 * ORDER_GAP]
+
+    def test_move_writes_only_the_moved_task(self, test_client, test_db_session, db_helper):
+        """Moving into a gap leaves every sibling's order_index untouched"""
+        project = db_helper.create_test_project(test_db_session)
+        first, _, last = (
+            db_helper.create_test_task(test_db_session, project.id, title=title, order_index=order)
+            for title, order in (("A", 1024), ("B", 2048), ("C", 3072))
+        )
+
+        response = test_client.post(f"/api/tasks/{last.id}/move", json={"before_id": first.id})
+
+        assert response.status_code == 200
+        assert response.json()["order_index"] == 512
+        assert _sibling_titles(test_client, project.id) == ["C", "A", "B"]
+        test_db_session.expire_all()
+        assert sorted(t.order_index for t in test_db_session.query(Task)) == [512, 1024, 2048]
+
+    def test_tied_legacy_values_rebalance(self, test_client, test_db_session, db_helper):
+        """Siblings sharing an order_index are renumbered once, keeping their order"""
+        project = db_helper.create_test_project(test_db_session)
+        first, second, third = (
+            db_helper.create_test_task(
+                test_db_session, project.id, title=title, created_at=datetime(2025, 1, 1, 9, minute)
+            )
+            for minute, title in enumerate("ABC")
+        )
+
+        response = test_client.post(
+            f"/api/tasks/{third.id}/move", json={"after_id": first.id, "before_id": second.id}
+        )
+
+        assert response.status_code == 200
+        assert _sibling_titles(test_client, project.id) == ["A", "C", "B"]
+
+    def test_repeated_inserts_at_one_spot(self, test_db_session, db_helper):
+        """Exhausting a gap triggers a rebalance and the order stays correct"""
+        project = db_helper.create_test_project(test_db_session)
+        head = db_helper.create_test_task(test_db_session, project.id, title="head", order_index=1)
+        tail = db_helper.create_test_task(test_db_session, project.id, title="tail", order_index=2)
+
+        # Each new task goes straight after head, in front of the previous one
+        upper = tail
+        for number in range(15):
+            task = db_helper.create_test_task(test_db_session, project.id, title=f"t{number}")
+            move_task(test_db_session, task, after_id=head.id, before_id=upper.id)
+            test_db_session.commit()
+            upper = task
+
+        titles = [
+            task.title
+            for task in test_db_session.query(Task).order_by(Task.order_index, Task.created_at)
+        ]
+        assert titles == ["head", *(f"t{number}" for number in reversed(range(15))), "tail"]
+
+    def test_reparent_and_append(self, test_client, test_db_session, db_helper):
+        """A new parent without neighbours appends the task to that sibling group"""
+        project = db_helper.create_test_project(test_db_session)
+        parent = db_helper.create_test_task(test_db_session, project.id, title="Parent")
+        db_helper.create_test_task(
+            test_db_session, project.id, title="Child", parent_task_id=parent.id, order_index=5
+        )
+        moved = db_helper.create_test_task(test_db_session, project.id, title="Moved")
+
+        response = test_client.post(
+            f"/api/tasks/{moved.id}/move", json={"parent_task_id": parent.id}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["parent_task_id"] == parent.id
+        assert response.json()["order_index"] == 5 + ORDER_GAP
+
+    def test_invalid_moves(self, test_client, test_db_session, db_helper):
+        """Cycles, non-siblings and unknown tasks are rejected"""
+        project = db_helper.create_test_project(test_db_session)
+        parent = db_helper.create_test_task(test_db_session, project.id, title="Parent")
+        child = db_helper.create_test_task(
+            test_db_session, project.id, title="Child", parent_task_id=parent.id
+        )
+        other = db_helper.create_test_task(test_db_session, project.id, title="Other")
+
+        cycle = test_client.post(f"/api/tasks/{parent.id}/move", json={"parent_task_id": child.id})
+        not_sibling = test_client.post(f"/api/tasks/{other.id}/move", json={"before_id": child.id})
+        missing = test_client.post("/api/tasks/missing/move", json={})
+
+        assert cycle.status_code == 400
+        assert "cycle" in cycle.json()["detail"]
+        assert not_sibling.status_code == 400
+        assert missing.status_code == 404
+
+    def test_sibling_index_exists(self, test_db_session):
+        """The (project_id, parent_task_id, order_index) index is created with the table"""
+        indexes = inspect(test_db_session.get_bind()).get_indexes("tasks")
+
+        columns = {index["name"]: index["column_names"] for index in indexes}
+        assert columns["idx_tasks_sibling_order"] == [
+            "project_id",
+            "parent_task_id",
+            "order_index",
+        ]
+
+
+def test_sibling_clause_compiles_for_postgresql():
+    """A parent id is compared with =, only a missing parent with IS NULL"""
+
+    def compiled(parent_task_id):
+        clause = and_(*sibling_clause("p1", parent_task_id))
+        return str(clause.compile(dialect=postgresql.dialect()))
+
+    assert "tasks.parent_task_id = %(parent_task_id_1)s" in compiled("t1")
+    assert "tasks.parent_task_id IS NULL" in compiled(None)
@@ -0,0 +1,159 @@
+"""
+Tests for column-projected list read models
+"""
+
+from datetime import date, timedelta
+
+from src.goalpath.db_utils import QueryUtils
+from src.goalpath.read_models import (
+    dashboard_counts,
+    fetch_recent_projects,
+    fetch_task_items,
+)
+
+
+class TestReadModels:
+    """Test the lightweight list DTOs and aggregate queries"""
+
+    def test_task_items_skip_description(self, test_db_session, db_helper):
+        """Task list rows carry the project reference but not the description"""
+        project = db_helper.create_test_project(test_db_session, name="Ref Project")
+        db_helper.create_test_task(
+            test_db_session, project.id, title="Listed", description="long text " * 50
+        )
+
+        items = fetch_task_items(test_db_session)
+
+        assert len(items) == 1
+        item = items[0]
+        assert item.title == "Listed"
+        assert item.description is None
+        assert item.project.name == "Ref Project"
+        assert item["status"] == item.status
+
+    def test_task_items_include_description_on_request(self, test_db_session, db_helper):
+        """The description column is selected when asked for"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id, description="Details")
+
+        items = fetch_task_items(test_db_session, include_description=True)
+
+        assert items[0].description == "Details"
+
+    def test_project_items_carry_statistics(self, test_db_session, db_helper):
+        """Project rows include task counts computed in the same statement"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id, status="done")
+        db_helper.create_test_task(test_db_session, project.id, status="todo")
+        db_helper.create_test_task(test_db_session, project.id, status="todo")
+
+        item = fetch_recent_projects(test_db_session)[0]
+
+        assert item.total_tasks == 3
+        assert item.completed_tasks == 1
+        assert item.completion_percentage == 33.3
+        assert item.as_dict()["completion_percentage"] == 33.3
+
+    def test_dashboard_counts(self, test_db_session, db_helper):
+        """Dashboard statistics come from one aggregate query"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_project(test_db_session, name="Second")
+        db_helper.create_test_task(test_db_session, project.id, status="done")
+        db_helper.create_test_task(test_db_session, project.id, status="in_progress")
+
+        week_start = date.today() - timedelta(days=date.today().weekday())
+        stats = dashboard_counts(test_db_session, week_start)
+
+        assert stats["total_projects"] == 2
+        assert stats["total_tasks"] == 2
+        assert stats["completed_tasks"] == 1
+        assert stats["completion_rate"] == 50.0
+        assert stats["tasks_completed_this_week"] == 1
+
+    def test_hierarchy_without_description(self, test_db_session, db_helper):
+        """QueryUtils can leave the description out of task lists"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id, description="Hidden")
+
+        tasks = QueryUtils.get_tasks_with_hierarchy(
+            test_db_session, project_id=project.id, include_description=False
+        )
+
+        assert tasks[0]["description"] is None
+        assert tasks[0]["subtask_count"] == 0
+
+    def test_dashboard_shows_project_statistics(self, test_client, test_db_session, db_helper):
+        """Dashboard project cards render counts from the read model"""
+        project = db_helper.create_test_project(test_db_session, name="Dashboard Project")
+        db_helper.create_test_task(test_db_session, project.id, status="done")
+
+        response = test_client.get("/")
+
+        assert response.status_code == 200
+        assert "Dashboard Project" in response.text
+        assert "1 tasks" in " ".join(response.text.split())
+
+
+class TestSparseFieldsets:
+    """Test ?fields= on the REST list endpoints"""
+
+    def test_task_fields(self, test_client, test_db_session, db_helper):
+        """Only the requested task fields are returned, id always included"""
+        project = db_helper.create_test_project(test_db_session)
+        db_helper.create_test_task(test_db_session, project.id, title="Kanban Card", status="todo")
+
+        response = test_client.get("/api/tasks/?fields=title,status,priority,order_index")
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "id": response.json()[0]["id"],
+                "title": "Kanban Card",
+                "status": "todo",
+                "priority": "medium",
+                "order_index": 0,
+            }
+        ]
+
+    def test_task_derived_counts_on_request(self, test_client, test_db_session, db_helper):
+        """Derived counts are computed when named in the fieldset"""
+        project = db_helper.create_test_project(test_db_session)
+        parent = db_helper.create_test_task(test_db_session, project.id, title="Parent")
+        db_helper.create_test_task(
+            test_db_session, project.id, title="Child", parent_task_id=parent.id
+        )
+
+        response = test_client.get(
+            "/api/tasks/?fields=subtask_count,dependency_count&search=Parent"
+        )
+
+        assert response.json() == [{"id": parent.id, "subtask_count": 1, "dependency_count": 0}]
+
+    def test_project_fields_skip_statistics(self, test_db_session, db_helper):
+        """Task counts are not selected unless a statistic is requested"""
+        from src.goalpath.read_models import project_list_select
+
+        statement = str(project_list_select(fields=("id", "name")))
+        assert "tasks" not in statement
+
+        project = db_helper.create_test_project(test_db_session, name="Narrow")
+        db_helper.create_test_task(test_db_session, project.id, status="done")
+        rows = QueryUtils.get_projects_with_stats(
+            test_db_session, fields=("id", "name", "completion_percentage")
+        )
+        assert rows == [{"id": project.id, "name": "Narrow", "completion_percentage": 100.0}]
+
+    def test_goal_fields(self, test_client, test_db_session, db_helper):
+        """Goals honour the fieldset"""
+        goal = db_helper.create_test_goal(test_db_session, title="Narrow Goal")
+
+        response = test_client.get("/api/goals/?fields=title,subgoal_count")
+
+        assert response.json() == [{"id": goal.id, "title": "Narrow Goal", "subgoal_count": 0}]
+
+    def test_unknown_field_rejected(self, test_client):
+        """Unknown field names are a client error"""
+        response = test_client.get("/api/projects/?fields=name,secret")
+
+        assert response.status_code == 400
+        assert "secret" in response.json()["detail"]
@@ -0,0 +1,147 @@
+"""
+Tests for the recurrence engine
+"""
+
+from datetime import datetime
+from itertools import islice
+from types import SimpleNamespace
+
+import pytest
+
+from src.goalpath.recurrence import next_reminder_trigger, parse_recurrence
+
+START = datetime(2025, 1, 31, 9, 0)
+
+
+def _first(pattern, count=5, dtstart=START):
+    rule = parse_recurrence(pattern)
+    return [moment.isoformat() for moment in islice(rule.occurrences(dtstart), count)]
+
+
+class TestRecurrenceRule:
+    """Test parsing and expansion of RRULE-style patterns"""
+
+    def test_rrule_and_json_patterns_are_equivalent(self):
+        """RRULE text, JSON objects and JSON-encoded RRULE text parse alike"""
+        rule = parse_recurrence("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR")
+        assert parse_recurrence('{"freq": "weekly", "interval": 2, "byday": ["FR", "MO"]}') == rule
+        assert parse_recurrence('"RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR"') == rule
+        assert _first("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR") == [
+            "2025-01-31T09:00:00",
+            "2025-02-10T09:00:00",
+            "2025-02-14T09:00:00",
+            "2025-02-24T09:00:00",
+            "2025-02-28T09:00:00",
+        ]
+
+    def test_month_lengths(self):
+        """A start on the 31st skips short months; BYMONTHDAY=-1 is the last day"""
+        assert _first("FREQ=MONTHLY", 3) == [
+            "2025-01-31T09:00:00",
+            "2025-03-31T09:00:00",
+            "2025-05-31T09:00:00",
+        ]
+        assert _first("FREQ=MONTHLY;BYMONTHDAY=-1;COUNT=10", 10) == [
+            "2025-01-31T09:00:00",
+            "2025-02-28T09:00:00",
+            "2025-03-31T09:00:00",
+            "2025-04-30T09:00:00",
+            "2025-05-31T09:00:00",
+            "2025-06-30T09:00:00",
+            "2025-07-31T09:00:00",
+            "2025-08-31T09:00:00",
+            "2025-09-30T09:00:00",
+            "2025-10-31T09:00:00",
+        ]
+        assert _first("FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=29", 2) == [
+            "2028-02-29T09:00:00",
+            "2032-02-29T09:00:00",
+        ]
+
+    def test_count_until_and_filters(self):
+        """COUNT and UNTIL end a series; BY* parts filter where they do not expand"""
+        assert len(_first("FREQ=DAILY;COUNT=3", 10)) == 3
+        assert _first("FREQ=DAILY;UNTIL=20250202", 10) == [
+            "2025-01-31T09:00:00",
+            "2025-02-01T09:00:00",
+            "2025-02-02T09:00:00",
+        ]
+        # First weekend day of each month
+        assert _first("FREQ=MONTHLY;BYDAY=SA,SU;BYMONTHDAY=1,2,3,4,5,6,7", 3) == [
+            "2025-02-01T09:00:00",
+            "2025-02-02T09:00:00",
+            "2025-03-01T09:00:00",
+        ]
+        assert _first("FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR", 2) == [
+            "2025-01-31T09:00:00",
+            "2025-02-03T09:00:00",
+        ]
+
+    def test_between_skips_to_the_window(self):
+        """A window far from the start is expanded without walking the series"""
+        window_start, window_end = datetime(2025, 3, 1), datetime(2025, 3, 10, 23, 59)
+        for pattern in ("FREQ=DAILY;INTERVAL=3", "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,SA"):
+            rule = parse_recurrence(pattern)
+            walked = []
+            for moment in rule.occurrences(datetime(1990, 1, 1, 9, 0)):
+                if moment > window_end:
+                    break
+                if moment >= window_start:
+                    walked.append(moment)
+
+            occurrences = list(rule.between(datetime(1990, 1, 1, 9, 0), window_start, window_end))
+
+            assert occurrences == walked
+            assert occurrences and all(moment.hour == 9 for moment in occurrences)
+
+    def test_next_after_and_dtstart(self):
+        """DTSTART in the pattern anchors the series"""
+        rule = parse_recurrence("DTSTART:20240101T080000Z\nRRULE:FREQ=WEEKLY")
+        assert rule.dtstart == datetime(2024, 1, 1, 8, 0)
+        assert rule.next_after(rule.dtstart, datetime(2025, 3, 5)) == datetime(2025, 3, 10, 8, 0)
+        assert parse_recurrence("FREQ=DAILY;COUNT=2").next_after(START, START) is not None
+        assert parse_recurrence("FREQ=DAILY;COUNT=1").next_after(START, START) is None
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "FREQ=HOURLY",
+            "FREQ=DAILY;COUNT=0",
+            "FREQ=WEEKLY;BYDAY=1MO",
+            "FREQ=MONTHLY;BYMONTHDAY=0",
+            "FREQ=YEARLY;BYMONTH=13",
+            '{"freq": "daily", "count": 2, "until": "2025-01-01"}',
+            "{not json",
+            "[1, 2]",
+        ],
+    )
+    def test_invalid_patterns(self, pattern):
+        with pytest.raises(ValueError):
+            parse_recurrence(pattern)
+
+    def test_patterns_are_parsed_once(self):
+        """Reminders sharing a pattern share one parsed rule"""
+        assert parse_recurrence("FREQ=MONTHLY;BYMONTHDAY=15") is parse_recurrence(
+            "FREQ=MONTHLY;BYMONTHDAY=15"
+        )
+
+
+class TestNextReminderTrigger:
+    """Test materializing the next occurrence of a fired reminder"""
+
+    def _reminder(self, pattern, trigger=START):
+        return SimpleNamespace(
+            recurrence_pattern=pattern, recurrence_anchor=None, trigger_datetime=trigger
+        )
+
+    def test_next_occurrence_after_now(self):
+        """Occurrences missed while the scheduler was down are not replayed"""
+        reminder = self._reminder("FREQ=DAILY")
+        assert next_reminder_trigger(reminder, START) == datetime(2025, 2, 1, 9, 0)
+        late = datetime(2025, 2, 10, 12, 0)
+        assert next_reminder_trigger(reminder, late) == datetime(2025, 2, 11, 9, 0)
+
+    def test_ended_or_invalid_series(self):
+        assert next_reminder_trigger(self._reminder("FREQ=DAILY;UNTIL=20250131"), START) is None
+        assert next_reminder_trigger(self._reminder("FREQ=SECONDLY"), START) is None
+        assert next_reminder_trigger(self._reminder(None), START) is None
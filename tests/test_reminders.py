@@ -0,0 +1,327 @@
+"""
+Tests for the reminder scheduler
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect, update
+
+from src.goalpath import events
+from src.goalpath.events import LocalBroadcastBackend
+from src.goalpath.models.extended import Reminder
+from src.goalpath.recurrence import next_reminder_trigger
+from src.goalpath.reminders import (
+    LEASE_DURATION,
+    ReminderScheduler,
+    claim_due,
+    fire_claimed,
+    load_due_keys,
+    snooze_reminders,
+)
+
+NOW = datetime(2025, 3, 1, 9, 0, 0)
+
+
+def _reminders(session, project, *offsets, **fields):
+    reminders = [
+        Reminder(
+            project_id=project.id,
+            title=f"Reminder {index}",
+            trigger_datetime=NOW + timedelta(minutes=offset),
+            **fields,
+        )
+        for index, offset in enumerate(offsets)
+    ]
+    session.add_all(reminders)
+    session.commit()
+    return reminders
+
+
+def _status(session, reminder_id):
+    return session.query(Reminder.status).filter(Reminder.id == reminder_id).scalar()
+
+
+class Recorder(LocalBroadcastBackend):
+    def __init__(self, hub):
+        super().__init__(hub)
+        self.published = []
+
+    def publish(self, message):
+        self.published.append(message)
+
+
+def _run_scheduler(scheduler, until, timeout=5.0):
+    """Run ``scheduler`` until ``until()`` holds or the timeout passes"""
+
+    async def scenario():
+        scheduler.start()
+        try:
+            deadline = asyncio.get_running_loop().time() + timeout
+            while not until() and asyncio.get_running_loop().time() < deadline:
+                await asyncio.sleep(0.01)
+        finally:
+            await scheduler.stop()
+
+    asyncio.run(scenario())
+
+
+class TestDueQueue:
+    """Test keyset loading, leases and batched status changes"""
+
+    def test_load_due_keys_pages_in_trigger_order(self, test_db_session, db_helper):
+        """Pending and snoozed reminders merge into one ordered, paged queue"""
+        project = db_helper.create_test_project(test_db_session)
+        pending = _reminders(test_db_session, project, 30, 10, 50)
+        snoozed = _reminders(test_db_session, project, 20, 40, status="snoozed")
+        _reminders(test_db_session, project, 5, status="acknowledged")
+        expected = sorted(
+            (reminder.trigger_datetime, reminder.id) for reminder in pending + snoozed
+        )
+
+        first, exhausted = load_due_keys(test_db_session, None, 3)
+        assert first == expected[:3]
+        assert exhausted is False
+
+        rest, exhausted = load_due_keys(test_db_session, first[-1], 3)
+        assert rest == expected[3:]
+        assert exhausted is True
+
+    def test_claims_are_exclusive_until_the_lease_lapses(self, test_db_session, db_helper):
+        """Only one replica claims a due reminder; a lapsed lease can be retaken"""
+        project = db_helper.create_test_project(test_db_session)
+        due, future = _reminders(test_db_session, project, -5, 60)
+        ids = [due.id, future.id]
+
+        first = claim_due(test_db_session, ids, "replica-a", NOW, LEASE_DURATION)
+        second = claim_due(test_db_session, ids, "replica-b", NOW, LEASE_DURATION)
+        assert [row.id for row in first] == [due.id]
+        assert second == []
+
+        later = NOW + LEASE_DURATION
+        retaken = claim_due(test_db_session, ids, "replica-b", later, LEASE_DURATION)
+        assert [row.id for row in retaken] == [due.id]
+
+    def test_fire_claimed_marks_fired_and_publishes(self, test_db_session, db_helper):
+        """Fired reminders are released and announced after commit"""
+        project = db_helper.create_test_project(test_db_session)
+        (reminder,) = _reminders(test_db_session, project, -1, message="Stand-up")
+        rows = claim_due(test_db_session, [reminder.id], "replica-a", NOW, LEASE_DURATION)
+
+        previous = events.get_backend()
+        recorder = Recorder(events.hub)
+        events.set_backend(recorder)
+        try:
+            assert fire_claimed(test_db_session, rows, "replica-a", NOW) == ([], 1)
+        finally:
+            events.set_backend(previous)
+
+        test_db_session.expire_all()
+        fired = test_db_session.get(Reminder, reminder.id)
+        assert (fired.status, fired.fired_at, fired.leased_by) == ("fired", NOW, None)
+        assert {
+            "entity": "reminder",
+            "action": "fired",
+            "id": reminder.id,
+            "task_id": None,
+            "project_id": project.id,
+            "title": "Reminder 0",
+            "message": "Stand-up",
+            "trigger_datetime": reminder.trigger_datetime.isoformat(),
+        } in recorder.published
+
+    def test_lapsed_claims_are_left_to_the_replica_that_retook_them(
+        self, test_db_session, db_helper
+    ):
+        """A replica whose lease was retaken neither fires the row nor clears the new lease"""
+        project = db_helper.create_test_project(test_db_session)
+        lapsed, held = _reminders(test_db_session, project, -5, -1)
+        ids = [lapsed.id, held.id]
+        rows = claim_due(test_db_session, ids, "replica-a", NOW, LEASE_DURATION)
+        test_db_session.execute(
+            update(Reminder)
+            .where(Reminder.id == lapsed.id)
+            .values(leased_by="replica-b", lease_expires_at=NOW + 2 * LEASE_DURATION)
+        )
+        test_db_session.commit()
+
+        previous = events.get_backend()
+        recorder = Recorder(events.hub)
+        events.set_backend(recorder)
+        try:
+            assert fire_claimed(test_db_session, rows, "replica-a", NOW) == ([], 1)
+        finally:
+            events.set_backend(previous)
+
+        test_db_session.expire_all()
+        retaken = test_db_session.get(Reminder, lapsed.id)
+        assert (retaken.status, retaken.leased_by) == ("pending", "replica-b")
+        assert _status(test_db_session, held.id) == "fired"
+        fired = [message["id"] for message in recorder.published if message["entity"] == "reminder"]
+        assert fired == [held.id]
+
+    def test_recurring_reminders_are_rescheduled(self, test_db_session, db_helper):
+        """A recurring reminder with a next trigger goes back to pending"""
+        project = db_helper.create_test_project(test_db_session)
+        (reminder,) = _reminders(test_db_session, project, -1, reminder_type="recurring")
+        rows = claim_due(test_db_session, [reminder.id], "replica-a", NOW, LEASE_DURATION)
+        following = reminder.trigger_datetime + timedelta(days=1)
+
+        rescheduled, fired = fire_claimed(
+            test_db_session, rows, "replica-a", NOW, lambda row, now: following
+        )
+
+        assert (rescheduled, fired) == ([(following, reminder.id)], 1)
+        test_db_session.expire_all()
+        assert test_db_session.get(Reminder, reminder.id).trigger_datetime == following
+        assert _status(test_db_session, reminder.id) == "pending"
+
+    def test_snooze_moves_the_trigger(self, test_db_session, db_helper):
+        """Snoozed reminders are due again at the snooze time; finished ones are left alone"""
+        project = db_helper.create_test_project(test_db_session)
+        reminders = _reminders(test_db_session, project, -10, -5)
+        until = NOW + timedelta(hours=1)
+
+        reminders[1].status = "cancelled"
+        test_db_session.commit()
+
+        assert snooze_reminders(test_db_session, [r.id for r in reminders], until) == 1
+        test_db_session.commit()
+
+        keys, _ = load_due_keys(test_db_session, None, 10)
+        assert keys == [(until, reminders[0].id)]
+        assert _status(test_db_session, reminders[0].id) == "snoozed"
+        assert _status(test_db_session, reminders[1].id) == "cancelled"
+
+    def test_snoozing_keeps_the_series_times(self, test_db_session, db_helper):
+        """Fire, snooze, fire: the series continues at its own time, not the snooze time"""
+        project = db_helper.create_test_project(test_db_session)
+        (reminder,) = _reminders(
+            test_db_session, project, 0, reminder_type="recurring", recurrence_pattern="FREQ=DAILY"
+        )
+
+        def fire(now):
+            rows = claim_due(test_db_session, [reminder.id], "replica-a", now, LEASE_DURATION)
+            assert len(rows) == 1
+            rescheduled, _ = fire_claimed(
+                test_db_session, rows, "replica-a", now, next_reminder_trigger
+            )
+            return rescheduled
+
+        assert fire(NOW) == [(NOW + timedelta(days=1), reminder.id)]
+        snoozed_until = NOW + timedelta(days=1, minutes=37)
+        snooze_reminders(test_db_session, [reminder.id], snoozed_until)
+        snooze_reminders(test_db_session, [reminder.id], snoozed_until + timedelta(minutes=5))
+        test_db_session.commit()
+
+        rescheduled = fire(snoozed_until + timedelta(minutes=5))
+        assert rescheduled == [(NOW + timedelta(days=2), reminder.id)]
+        test_db_session.expire_all()
+        assert test_db_session.get(Reminder, reminder.id).recurrence_anchor is None
+
+    def test_due_index(self, test_db_session):
+        """The due queue is served by a (status, trigger_datetime) index"""
+        indexes = {
+            index["name"]: index["column_names"]
+            for index in inspect(test_db_session.get_bind()).get_indexes("reminders")
+        }
+        assert indexes["idx_reminders_due"] == ["status", "trigger_datetime", "id"]
+
+
+class TestReminderScheduler:
+    """Test the background loop end to end"""
+
+    def test_fires_due_reminders_in_batches(self, test_db_manager, test_db_session, db_helper):
+        """Overdue reminders fire in batches; future ones stay queued"""
+        project = db_helper.create_test_project(test_db_session)
+        overdue = _reminders(test_db_session, project, -30, -20, -10, -5, -1)
+        (future,) = _reminders(test_db_session, project, 24 * 60)
+        scheduler = ReminderScheduler(
+            test_db_manager.get_sync_session, prefetch=4, batch_size=2, clock=lambda: NOW
+        )
+
+        _run_scheduler(scheduler, lambda: scheduler.fired == len(overdue))
+
+        assert scheduler.fired == len(overdue)
+        assert scheduler.queued == 1
+        test_db_session.expire_all()
+        assert {_status(test_db_session, r.id) for r in overdue} == {"fired"}
+        assert _status(test_db_session, future.id) == "pending"
+
+    def test_wakes_for_reminders_committed_while_sleeping(
+        self, test_db_manager, test_db_session, db_helper
+    ):
+        """A reminder due before the next trigger wakes the scheduler without polling"""
+        project = db_helper.create_test_project(test_db_session)
+        tomorrow = datetime.utcnow() + timedelta(days=1)
+        test_db_session.add(
+            Reminder(project_id=project.id, title="Later", trigger_datetime=tomorrow)
+        )
+        test_db_session.commit()
+        scheduler = ReminderScheduler(
+            test_db_manager.get_sync_session, resync_interval=timedelta(hours=1)
+        )
+        added = []
+
+        async def scenario():
+            scheduler.start()
+            try:
+                while scheduler.refills == 0:
+                    await asyncio.sleep(0.01)
+                session = test_db_manager.get_sync_session()
+                reminder = Reminder(
+                    project_id=project.id, title="Now", trigger_datetime=datetime.utcnow()
+                )
+                session.add(reminder)
+                session.commit()
+                added.append(reminder.id)
+                session.close()
+                for _ in range(500):
+                    if scheduler.fired:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await scheduler.stop()
+
+        asyncio.run(scenario())
+
+        assert scheduler.fired == 1
+        assert scheduler.refills == 1
+        assert _status(test_db_session, added[0]) == "fired"
+
+
+class TestSnoozeRoute:
+    """Test the snooze endpoint"""
+
+    def test_snooze_endpoint(self, test_client, test_db_session, db_helper):
+        """Live reminders are snoozed, finished ones skipped"""
+        project = db_helper.create_test_project(test_db_session)
+        live, done = _reminders(test_db_session, project, -10, -5)
+        done.status = "acknowledged"
+        test_db_session.commit()
+
+        response = test_client.post(
+            "/api/reminders/snooze",
+            json={"reminder_ids": [live.id, done.id], "until": "2025-03-01T10:30:00+01:00"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"snoozed": [live.id], "skipped": [done.id]}
+        test_db_session.expire_all()
+        snoozed = test_db_session.get(Reminder, live.id)
+        assert snoozed.status == "snoozed"
+        assert snoozed.trigger_datetime == NOW + timedelta(minutes=30)
+        assert snoozed.recurrence_anchor == NOW - timedelta(minutes=10)
+
+    def test_unknown_reminder_rejects_the_request(self, test_client, test_db_session, db_helper):
+        """An unknown reminder ID is a 404 and nothing is snoozed"""
+        project = db_helper.create_test_project(test_db_session)
+        (reminder,) = _reminders(test_db_session, project, -10)
+
+        response = test_client.post(
+            "/api/reminders/snooze",
+            json={"reminder_ids": [reminder.id, "missing"], "until": "2025-03-01T10:30:00"},
+        )
+
+        assert response.status_code == 404
+        assert _status(test_db_session, reminder.id) == "pending"
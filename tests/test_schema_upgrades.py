@@ -0,0 +1,121 @@
+"""
+Tests for upgrading databases created before the current models
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from src.goalpath.database import DatabaseManager
+from src.goalpath.models import Base, Project
+from src.goalpath.models.extended import Reminder
+from src.goalpath.schema_upgrades import REMINDER_SCHEDULER_COLUMNS, upgrade_schema
+
+# reminders as created before the scheduler columns and the 'fired' status
+OLD_REMINDERS = """
+CREATE TABLE reminders (
+    id VARCHAR NOT NULL,
+    task_id VARCHAR,
+    project_id VARCHAR,
+    title VARCHAR(255) NOT NULL,
+    message TEXT,
+    reminder_type VARCHAR(20) NOT NULL,
+    trigger_datetime DATETIME NOT NULL,
+    view_after DATETIME,
+    recurrence_pattern TEXT,
+    status VARCHAR(20) NOT NULL,
+    acknowledged_at DATETIME,
+    created_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT chk_reminder_type CHECK (reminder_type IN ('one_time', 'recurring')),
+    CONSTRAINT chk_reminder_status
+        CHECK (status IN ('pending', 'acknowledged', 'snoozed', 'cancelled')),
+    CONSTRAINT chk_reminder_relation CHECK (
+        (task_id IS NOT NULL AND project_id IS NULL)
+        OR (task_id IS NULL AND project_id IS NOT NULL)
+    ),
+    FOREIGN KEY(task_id) REFERENCES tasks (id) ON DELETE CASCADE,
+    FOREIGN KEY(project_id) REFERENCES projects (id) ON DELETE CASCADE
+)
+"""
+
+
+@pytest.fixture
+def old_db():
+    """A database whose reminders table predates the scheduler"""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.create_tables()
+    with db_manager.engine.begin() as connection:
+        connection.execute(text("DROP TABLE reminders"))
+        connection.execute(text(OLD_REMINDERS))
+    yield db_manager
+    db_manager.engine.dispose()
+
+
+def test_reminders_upgrade_keeps_rows_and_allows_fired(old_db):
+    """The upgrade adds the scheduler columns and the 'fired' status, once"""
+    session = old_db.get_sync_session()
+    project = Project(name="Upgrade")
+    session.add(project)
+    session.commit()
+    session.execute(
+        text(
+            "INSERT INTO reminders (id, project_id, title, reminder_type, trigger_datetime,"
+            " status, created_at) VALUES ('old', :project, 'Review', 'one_time',"
+            " '2025-03-01 09:00:00', 'snoozed', '2025-02-01 09:00:00')"
+        ),
+        {"project": project.id},
+    )
+    session.commit()
+    session.close()
+
+    assert upgrade_schema(old_db.engine) == ["reminder_scheduler"]
+    assert upgrade_schema(old_db.engine) == []
+
+    inspector = inspect(old_db.engine)
+    columns = {column["name"] for column in inspector.get_columns("reminders")}
+    assert columns.issuperset(REMINDER_SCHEDULER_COLUMNS)
+    assert [index["name"] for index in inspector.get_indexes("reminders")] == ["idx_reminders_due"]
+
+    session = old_db.get_sync_session()
+    reminder = session.get(Reminder, "old")
+    assert (reminder.title, reminder.status) == ("Review", "snoozed")
+    reminder.status = "fired"
+    reminder.fired_at = datetime(2025, 3, 1, 9, 0)
+    session.commit()
+    assert session.get(Reminder, "old").status == "fired"
+
+    # The rebuilt table keeps the remaining constraints
+    reminder.status = "unknown"
+    with pytest.raises(IntegrityError):
+        session.commit()
+    session.close()
+
+
+def test_missing_model_indexes_are_created():
+    """Tables created before their indexes were declared get them on upgrade"""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.create_tables()
+    declared = {index.name for table in Base.metadata.sorted_tables for index in table.indexes}
+    with db_manager.engine.begin() as connection:
+        for name in declared:
+            connection.execute(text(f"DROP INDEX {name}"))
+
+    assert upgrade_schema(db_manager.engine) == ["model_indexes"]
+    assert upgrade_schema(db_manager.engine) == []
+
+    inspector = inspect(db_manager.engine)
+    present = {
+        index["name"]
+        for table in inspector.get_table_names()
+        for index in inspector.get_indexes(table)
+    }
+    assert declared <= present
+    db_manager.engine.dispose()
+
+
+def test_current_schema_needs_no_upgrade(test_db_manager):
+    """Tables created from the current models are left alone"""
+    assert upgrade_schema(test_db_manager.engine) == []
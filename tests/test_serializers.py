@@ -0,0 +1,101 @@
+"""
+Tests for the orjson serialization layer
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from src.goalpath.schemas import GoalResponse, ProjectResponse, TaskResponse
+from src.goalpath.serializers import dumps, serialize_many, serialize_one, to_record
+
+
+def pydantic_json(schema, record):
+    """Payload as the response model would have produced it"""
+    return json.loads(schema(**record).model_dump_json())
+
+
+class TestSerializers:
+    """Test row-to-bytes serialization"""
+
+    def test_native_types(self):
+        """Dates, datetimes and Decimals serialize without manual conversion"""
+        payload = json.loads(
+            dumps(
+                {
+                    "due": date(2025, 7, 1),
+                    "at": datetime(2025, 7, 1, 9, 30, 15, 120000),
+                    "hours": Decimal("2.50"),
+                }
+            )
+        )
+
+        assert payload == {"due": "2025-07-01", "at": "2025-07-01T09:30:15.120000", "hours": 2.5}
+
+    def test_record_matches_response_model(self):
+        """Projected records produce the same JSON as validated response models"""
+        record = {
+            "id": "task-1",
+            "project_id": "project-1",
+            "parent_task_id": None,
+            "title": "Write docs",
+            "description": None,
+            "task_type": "task",
+            "status": "todo",
+            "priority": "high",
+            "story_points": 3,
+            "estimated_hours": 4.5,
+            "actual_hours": None,
+            "start_date": "2025-07-01",
+            "due_date": None,
+            "completed_date": None,
+            "assigned_to": None,
+            "created_by": "system",
+            "order_index": 0,
+            "created_at": datetime(2025, 7, 1, 9, 0),
+            "updated_at": datetime(2025, 7, 1, 9, 0),
+            "subtask_count": 2,
+        }
+
+        assert json.loads(serialize_one(record, TaskResponse)) == pydantic_json(
+            TaskResponse, record
+        )
+
+    def test_extra_keys_dropped_and_defaults_filled(self):
+        """Only schema fields are emitted; missing optional fields take their defaults"""
+        record = to_record({"id": "p1", "name": "Project", "in_progress_tasks": 3}, ProjectResponse)
+
+        assert "in_progress_tasks" not in record
+        assert record["total_tasks"] == 0
+        assert record["completion_percentage"] == 0.0
+
+    def test_orm_entity_with_overrides(self, test_db_session, db_helper):
+        """ORM entities serialize directly, with computed fields passed as overrides"""
+        goal = db_helper.create_test_goal(test_db_session)
+
+        payload = json.loads(serialize_one(goal, GoalResponse, subgoal_count=4))
+
+        assert payload["id"] == goal.id
+        assert payload["subgoal_count"] == 4
+        assert payload["created_at"] == goal.created_at.isoformat()
+
+    def test_serialize_many(self):
+        """Lists serialize to a JSON array in order"""
+        records = [{"id": str(index), "name": f"P{index}"} for index in range(3)]
+
+        payload = json.loads(serialize_many(records, ProjectResponse))
+
+        assert [item["id"] for item in payload] == ["0", "1", "2"]
+
+    def test_api_payload_shape_unchanged(self, test_client, test_db_session, db_helper):
+        """List and detail endpoints keep the response model's shape"""
+        project = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+
+        listing = test_client.get("/api/tasks/")
+        detail = test_client.get(f"/api/tasks/{task.id}")
+
+        assert listing.headers["content-type"] == "application/json"
+        assert set(listing.json()[0]) == set(TaskResponse.model_fields)
+        assert set(detail.json()) == set(TaskResponse.model_fields)
+        assert detail.json()["dependency_count"] == 0
@@ -0,0 +1,227 @@
+"""
+Tests for sprints, the sprint board and burndown series
+"""
+
+import json
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import inspect
+
+from src.goalpath.models import Sprint, SprintTask
+from src.goalpath.models.extended import TaskComment
+from src.goalpath.schemas import BurndownUnit
+from src.goalpath.sprints import build_burndown, burndown_cache, status_at
+
+START = date(2025, 3, 3)
+END = date(2025, 3, 7)
+
+
+def _sprint(session, project, **fields):
+    sprint = Sprint(
+        project_id=project.id,
+        name=fields.pop("name", "Sprint 1"),
+        start_date=fields.pop("start_date", START),
+        end_date=fields.pop("end_date", END),
+        **fields,
+    )
+    session.add(sprint)
+    session.commit()
+    return sprint
+
+
+def _log(session, task, changed_at, old, new):
+    session.add(
+        TaskComment(
+            task_id=task.id,
+            author="test",
+            content=f"Status changed from {old} to {new}",
+            comment_type="status_change",
+            comment_metadata=json.dumps({"from": old, "to": new, "reason": None}),
+            created_at=changed_at,
+        )
+    )
+    session.commit()
+
+
+def _at(day, hour=12):
+    return datetime(2025, 3, day, hour)
+
+
+class TestSprintEndpoints:
+    """Test sprint CRUD and bulk task membership"""
+
+    def test_create_list_and_get(self, test_client, test_db_session, db_helper):
+        """Sprints are created in a project and listed with task counts"""
+        project = db_helper.create_test_project(test_db_session)
+        payload = {
+            "project_id": project.id,
+            "name": "Sprint 1",
+            "start_date": "2025-03-03",
+            "end_date": "2025-03-14",
+        }
+
+        response = test_client.post("/api/sprints/", json=payload)
+        assert response.status_code == 201
+        created = response.json()
+        assert (created["status"], created["task_count"]) == ("planning", 0)
+
+        listed = test_client.get(f"/api/sprints/?project_id={project.id}").json()
+        assert [sprint["id"] for sprint in listed] == [created["id"]]
+        assert test_client.get(f"/api/sprints/{created['id']}").json()["name"] == "Sprint 1"
+
+        updated = test_client.put(f"/api/sprints/{created['id']}", json={"status": "active"})
+        assert updated.json()["status"] == "active"
+        assert test_client.get("/api/sprints/?status=planning").json() == []
+
+    def test_create_validation(self, test_client, test_db_session, db_helper):
+        """Unknown projects are 404 and sprints must end after they start"""
+        project = db_helper.create_test_project(test_db_session)
+        payload = {"name": "S", "start_date": "2025-03-03", "end_date": "2025-03-03"}
+
+        response = test_client.post("/api/sprints/", json={**payload, "project_id": project.id})
+        assert response.status_code == 400
+        response = test_client.post(
+            "/api/sprints/", json={**payload, "project_id": "missing", "end_date": "2025-03-04"}
+        )
+        assert response.status_code == 404
+        assert test_client.get("/api/sprints/missing").status_code == 404
+
+    def test_bulk_add_and_remove_tasks(self, test_client, test_db_session, db_helper):
+        """Tasks are added in bulk, duplicates skipped, foreign and unknown tasks rejected"""
+        project = db_helper.create_test_project(test_db_session)
+        other = db_helper.create_test_project(test_db_session)
+        tasks = [db_helper.create_test_task(test_db_session, project.id) for _ in range(3)]
+        foreign = db_helper.create_test_task(test_db_session, other.id)
+        sprint = _sprint(test_db_session, project)
+        url = f"/api/sprints/{sprint.id}/tasks"
+
+        first = test_client.post(url, json={"task_ids": [tasks[0].id, tasks[1].id]}).json()
+        assert first == {"added": [tasks[0].id, tasks[1].id], "skipped": []}
+        second = test_client.post(url, json={"task_ids": [tasks[1].id, tasks[2].id]}).json()
+        assert second == {"added": [tasks[2].id], "skipped": [tasks[1].id]}
+
+        assert test_client.post(url, json={"task_ids": [foreign.id]}).status_code == 400
+        assert test_client.post(url, json={"task_ids": ["missing"]}).status_code == 404
+        assert test_client.get(f"/api/sprints/{sprint.id}").json()["task_count"] == 3
+
+        removed = test_client.request("DELETE", url, json={"task_ids": [tasks[0].id, "missing"]})
+        assert removed.json() == {"removed": 1}
+        assert test_client.get(f"/api/sprints/{sprint.id}").json()["task_count"] == 2
+
+    def test_board_groups_by_status(self, test_client, test_db_session, db_helper):
+        """The board has one column per status in workflow order"""
+        project = db_helper.create_test_project(test_db_session)
+        sprint = _sprint(test_db_session, project)
+        for status, points in [("todo", 3), ("todo", 5), ("done", 2)]:
+            task = db_helper.create_test_task(
+                test_db_session, project.id, status=status, story_points=points
+            )
+            test_db_session.add(SprintTask(sprint_id=sprint.id, task_id=task.id))
+        test_db_session.commit()
+
+        board = test_client.get(f"/api/sprints/{sprint.id}/board").json()
+
+        columns = {column["status"]: column for column in board["columns"]}
+        assert list(columns)[:3] == ["backlog", "todo", "in_progress"]
+        assert (columns["todo"]["count"], columns["todo"]["story_points"]) == (2, 8)
+        assert (columns["done"]["count"], columns["backlog"]["count"]) == (1, 0)
+        assert board["sprint"]["task_count"] == 3
+
+
+class TestBurndown:
+    """Test series replayed from the status log and their caching"""
+
+    def setup_method(self):
+        burndown_cache.clear()
+
+    def test_status_at_replays_the_log(self):
+        """Status before the first change is its origin; after, the latest target"""
+        events = [(_at(4), "todo", "in_progress"), (_at(6), "in_progress", "done")]
+
+        assert status_at(events, _at(3), "done") == "todo"
+        assert status_at(events, _at(5), "done") == "in_progress"
+        assert status_at(events, _at(7), "done") == "done"
+        assert status_at([], _at(3), "todo") == "todo"
+
+    def test_series_from_the_event_log(self, test_db_session, db_helper):
+        """Completion, cancellation and late additions show on the right days"""
+        project = db_helper.create_test_project(test_db_session)
+        sprint = _sprint(test_db_session, project)
+
+        def task(status, points, added_on, *changes):
+            created = db_helper.create_test_task(
+                test_db_session, project.id, status=status, story_points=points
+            )
+            test_db_session.add(
+                SprintTask(sprint_id=sprint.id, task_id=created.id, added_at=_at(added_on, 8))
+            )
+            test_db_session.commit()
+            for day, old, new in changes:
+                _log(test_db_session, created, _at(day), old, new)
+
+        task("done", 3, 1, (4, "todo", "done"))
+        task("done", 5, 1, (3, "todo", "in_progress"), (6, "in_progress", "done"))
+        task("cancelled", 2, 1, (5, "todo", "cancelled"))
+        task("todo", 1, 4)
+
+        series = build_burndown(
+            test_db_session, sprint, BurndownUnit.STORY_POINTS, today=date(2025, 3, 6)
+        )
+
+        assert series["dates"][0] == START and len(series["dates"]) == 5
+        assert series["scope"] == [10.0, 11.0, 9.0, 9.0, None]
+        assert series["completed"] == [0.0, 3.0, 3.0, 8.0, None]
+        assert series["remaining"] == [10.0, 8.0, 6.0, 1.0, None]
+        assert series["ideal"] == [10.0, 7.5, 5.0, 2.5, 0.0]
+
+    def test_closed_days_are_cached_per_sprint_day(self, test_db_session, db_helper):
+        """A repeat read hits the cache; membership changes recompute it"""
+        project = db_helper.create_test_project(test_db_session)
+        sprint = _sprint(test_db_session, project)
+        today = date(2025, 3, 5)
+        first = db_helper.create_test_task(test_db_session, project.id, status="done")
+        test_db_session.add(SprintTask(sprint_id=sprint.id, task_id=first.id, added_at=_at(1)))
+        test_db_session.commit()
+
+        build_burndown(test_db_session, sprint, BurndownUnit.TASKS, today=today)
+        build_burndown(test_db_session, sprint, BurndownUnit.TASKS, today=today)
+        assert (burndown_cache.hits, burndown_cache.misses) == (1, 1)
+
+        second = db_helper.create_test_task(test_db_session, project.id)
+        test_db_session.add(SprintTask(sprint_id=sprint.id, task_id=second.id, added_at=_at(1)))
+        test_db_session.commit()
+        series = build_burndown(test_db_session, sprint, BurndownUnit.TASKS, today=today)
+
+        assert burndown_cache.misses == 2
+        assert series["scope"][:3] == [2.0, 2.0, 2.0]
+
+    def test_burndown_endpoint(self, test_client, test_db_session, db_helper):
+        """The endpoint returns one value per sprint day for the chosen unit"""
+        project = db_helper.create_test_project(test_db_session)
+        today = datetime.utcnow().date()
+        sprint = _sprint(
+            test_db_session,
+            project,
+            start_date=today - timedelta(days=2),
+            end_date=today + timedelta(days=2),
+        )
+        task = db_helper.create_test_task(test_db_session, project.id, estimated_hours=4)
+        test_db_session.add(SprintTask(sprint_id=sprint.id, task_id=task.id))
+        test_db_session.commit()
+
+        response = test_client.get(f"/api/sprints/{sprint.id}/burndown?unit=estimated_hours")
+
+        assert response.status_code == 200
+        series = response.json()
+        assert series["unit"] == "estimated_hours"
+        assert series["scope"] == [0.0, 0.0, 4.0, None, None]
+        assert test_client.get("/api/sprints/missing/burndown").status_code == 404
+
+    def test_history_index(self, test_db_session):
+        """Status history per task is served by the (task_id, comment_type, created_at) index"""
+        indexes = {
+            index["name"]: index["column_names"]
+            for index in inspect(test_db_session.get_bind()).get_indexes("task_comments")
+        }
+        history = ["task_id", "comment_type", "created_at", "id"]
+        assert indexes["idx_task_comments_history"] == history
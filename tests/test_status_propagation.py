@@ -0,0 +1,110 @@
+"""
+Tests for blocked-status propagation through task dependencies
+"""
+
+import json
+
+from src.goalpath import events
+from src.goalpath.events import LocalBroadcastBackend
+from src.goalpath.models import Task, TaskDependency
+from src.goalpath.models.extended import TaskComment
+
+
+def _status(session, task_id):
+    return session.query(Task.status).filter(Task.id == task_id).scalar()
+
+
+def _link(session, task, depends_on):
+    session.add(TaskDependency(task_id=task.id, depends_on_task_id=depends_on.id))
+    session.commit()
+
+
+class TestStatusPropagation:
+    """Test propagation from the status update paths"""
+
+    def _pair(self, session, db_helper, blocker_status, dependent_status):
+        project = db_helper.create_test_project(session)
+        blocker = db_helper.create_test_task(
+            session, project.id, title="Blocker", status=blocker_status
+        )
+        dependent = db_helper.create_test_task(
+            session, project.id, title="Dependent", status=dependent_status
+        )
+        _link(session, dependent, blocker)
+        return project, blocker, dependent
+
+    def test_finishing_blocker_unblocks(self, test_client, test_db_session, db_helper):
+        """A blocked dependent returns to todo and both changes are logged"""
+        _, blocker, dependent = self._pair(test_db_session, db_helper, "in_progress", "blocked")
+
+        response = test_client.put(f"/api/tasks/{blocker.id}/status?status=done")
+
+        assert response.status_code == 200
+        assert _status(test_db_session, dependent.id) == "todo"
+        log = test_db_session.query(TaskComment).filter(TaskComment.comment_type == "status_change")
+        entries = {entry.task_id: json.loads(entry.comment_metadata) for entry in log}
+        assert entries[blocker.id] == {"from": "in_progress", "to": "done", "reason": None}
+        assert entries[dependent.id] == {"from": "blocked", "to": "todo", "reason": "dependencies"}
+
+    def test_reopening_blocker_blocks(self, test_client, test_db_session, db_helper):
+        """A todo dependent becomes blocked when its blocker leaves done"""
+        _, blocker, dependent = self._pair(test_db_session, db_helper, "done", "todo")
+
+        test_client.put(f"/api/tasks/{blocker.id}", json={"status": "in_progress"})
+
+        assert _status(test_db_session, dependent.id) == "blocked"
+
+    def test_other_blockers_and_statuses_respected(self, test_client, test_db_session, db_helper):
+        """Dependents with unfinished blockers stay blocked; in-progress work is left alone"""
+        project, blocker, dependent = self._pair(test_db_session, db_helper, "todo", "blocked")
+        other = db_helper.create_test_task(test_db_session, project.id, status="in_progress")
+        _link(test_db_session, dependent, other)
+        working = db_helper.create_test_task(test_db_session, project.id, status="in_progress")
+        _link(test_db_session, working, blocker)
+
+        test_client.put(f"/api/tasks/{blocker.id}/status?status=done")
+        assert _status(test_db_session, dependent.id) == "blocked"
+        assert _status(test_db_session, working.id) == "in_progress"
+
+        test_client.put(f"/api/tasks/{other.id}/status?status=cancelled")
+        assert _status(test_db_session, dependent.id) == "todo"
+
+    def test_bulk_and_batch_paths(self, test_client, test_db_session, db_helper):
+        """Bulk status changes and batch operations propagate too"""
+        _, blocker, dependent = self._pair(test_db_session, db_helper, "todo", "blocked")
+
+        test_client.post("/api/tasks/bulk", json={"status": [{"id": blocker.id, "status": "done"}]})
+        assert _status(test_db_session, dependent.id) == "todo"
+
+        response = test_client.post(
+            "/api/batch",
+            headers={"HX-Request": "true"},
+            json={"operations": [{"op": "status", "id": blocker.id, "status": "todo"}]},
+        )
+        assert _status(test_db_session, dependent.id) == "blocked"
+        assert f'id="task-{dependent.id}"' in response.text
+
+    def test_propagated_change_publishes_event(self, test_client, test_db_session, db_helper):
+        """Each propagated change is announced as a task event after commit"""
+        _, blocker, dependent = self._pair(test_db_session, db_helper, "todo", "blocked")
+        published = []
+
+        class Recorder(LocalBroadcastBackend):
+            def publish(self, message):
+                published.append(message)
+
+        previous = events.get_backend()
+        events.set_backend(Recorder(events.hub))
+        try:
+            test_client.put(f"/api/tasks/{blocker.id}/status?status=done")
+        finally:
+            events.set_backend(previous)
+
+        assert {
+            "entity": "task",
+            "action": "updated",
+            "id": dependent.id,
+            "project_id": dependent.project_id,
+            "status": "todo",
+            "reason": "dependencies",
+        } in published
@@ -0,0 +1,32 @@
+"""
+Tests for the shared template environment
+"""
+
+from src.goalpath import htmx_utils, main
+from src.goalpath.templating import bytecode_cache_dir, templates, warm_up_templates
+
+
+class TestTemplating:
+    """Test template sharing, precompilation and bytecode caching"""
+
+    def test_single_shared_environment(self):
+        """Page routes and HTMX helpers render through the same environment"""
+        assert main.templates is templates
+        assert htmx_utils.templates is templates
+
+    def test_warm_up_compiles_every_template(self):
+        """Warm-up loads every HTML template into the environment cache"""
+        count = warm_up_templates()
+
+        names = templates.env.list_templates(extensions=["html"])
+        assert count == len(names)
+        assert "fragments/task_item.html" in names
+        cached_names = {name for _, name in templates.env.cache.keys()}
+        assert set(names) <= cached_names
+
+    def test_bytecode_cache_is_written(self):
+        """Compiled templates are persisted to the bytecode cache directory"""
+        warm_up_templates()
+
+        assert bytecode_cache_dir.exists()
+        assert any(bytecode_cache_dir.glob("__jinja2_*.cache"))
@@ -0,0 +1,134 @@
+"""
+Tests for the timeline endpoint
+"""
+
+from datetime import date, datetime
+
+from sqlalchemy import inspect
+
+from src.goalpath.models import Sprint
+from src.goalpath.models.extended import ScheduleEvent
+
+WINDOW = "from=2025-03-01&to=2025-03-31"
+
+
+def _timeline(client, query=WINDOW):
+    response = client.get(f"/api/timeline?{query}")
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestTimeline:
+    """Test window overlap, project filtering and the columnar layout"""
+
+    def test_task_overlap(self, test_client, test_db_session, db_helper):
+        """Ranged tasks overlap by interval, single-dated tasks by their date"""
+        project = db_helper.create_test_project(test_db_session)
+
+        def make(title, **dates):
+            db_helper.create_test_task(test_db_session, project.id, title=title, **dates)
+
+        make("spanning", start_date=date(2025, 2, 1), due_date=date(2025, 4, 30))
+        make("ends inside", start_date=date(2025, 2, 20), due_date=date(2025, 3, 1))
+        make("due only", due_date=date(2025, 3, 15))
+        make("start only", start_date=date(2025, 3, 31))
+        make("before", start_date=date(2025, 1, 1), due_date=date(2025, 2, 28))
+        make("after", start_date=date(2025, 4, 1), due_date=date(2025, 4, 2))
+        make("start only before", start_date=date(2025, 2, 1))
+        make("undated")
+
+        tasks = _timeline(test_client)["tasks"]
+
+        assert tasks["count"] == 4
+        assert tasks["truncated"] is False
+        assert tasks["columns"]["title"] == ["spanning", "ends inside", "due only", "start only"]
+        assert tasks["columns"]["start"][0] == "2025-02-01"
+        assert tasks["columns"]["end"][3] is None
+
+    def test_sprints_and_events(self, test_client, test_db_session, db_helper):
+        """Sprints and events are returned; events match a project through their task"""
+        project = db_helper.create_test_project(test_db_session)
+        other = db_helper.create_test_project(test_db_session)
+        task = db_helper.create_test_task(test_db_session, project.id)
+        test_db_session.add_all(
+            [
+                Sprint(
+                    project_id=project.id,
+                    name="Sprint 5",
+                    start_date=date(2025, 3, 24),
+                    end_date=date(2025, 4, 6),
+                ),
+                Sprint(
+                    project_id=project.id,
+                    name="Sprint 1",
+                    start_date=date(2025, 1, 6),
+                    end_date=date(2025, 1, 19),
+                ),
+                ScheduleEvent(
+                    task_id=task.id,
+                    event_type="deadline",
+                    title="Task deadline",
+                    start_datetime=datetime(2025, 3, 31, 17, 0),
+                ),
+                ScheduleEvent(
+                    project_id=other.id,
+                    event_type="meeting",
+                    title="Other meeting",
+                    start_datetime=datetime(2025, 3, 10, 9, 0),
+                    end_datetime=datetime(2025, 3, 10, 10, 0),
+                ),
+                ScheduleEvent(
+                    project_id=project.id,
+                    event_type="meeting",
+                    title="Late meeting",
+                    start_datetime=datetime(2025, 4, 1, 0, 0),
+                ),
+            ]
+        )
+        test_db_session.commit()
+
+        everything = _timeline(test_client)
+        assert everything["sprints"]["columns"]["name"] == ["Sprint 5"]
+        assert everything["events"]["columns"]["title"] == ["Other meeting", "Task deadline"]
+
+        scoped = _timeline(test_client, f"{WINDOW}&project_id={project.id}")
+        assert scoped["project_id"] == project.id
+        assert scoped["events"]["columns"]["title"] == ["Task deadline"]
+        assert scoped["events"]["columns"]["task_id"] == [task.id]
+
+    def test_truncation_and_empty_columns(self, test_client, test_db_session, db_helper):
+        """limit caps each section; empty sections still list their columns"""
+        project = db_helper.create_test_project(test_db_session)
+        for day in range(1, 6):
+            db_helper.create_test_task(test_db_session, project.id, due_date=date(2025, 3, day))
+
+        data = _timeline(test_client, f"{WINDOW}&limit=3")
+
+        assert data["tasks"]["count"] == 3
+        assert data["tasks"]["truncated"] is True
+        assert len(data["tasks"]["columns"]["id"]) == 3
+        assert data["sprints"] == {
+            "count": 0,
+            "truncated": False,
+            "columns": {
+                name: [] for name in ("id", "project_id", "name", "status", "start", "end")
+            },
+        }
+
+    def test_invalid_window(self, test_client):
+        """A reversed or missing window is rejected"""
+        assert test_client.get("/api/timeline?from=2025-03-31&to=2025-03-01").status_code == 400
+        assert test_client.get("/api/timeline?from=2025-03-01").status_code == 422
+
+    def test_timeline_indexes(self, test_db_session):
+        """Overlap queries are backed by (end, start) composite indexes"""
+        inspector = inspect(test_db_session.get_bind())
+        indexes = {
+            index["name"]: index["column_names"]
+            for table in ("tasks", "sprints", "schedule_events")
+            for index in inspector.get_indexes(table)
+        }
+        assert indexes["idx_tasks_timeline"] == ["due_date", "start_date"]
+        assert indexes["idx_tasks_project_timeline"] == ["project_id", "due_date", "start_date"]
+        assert indexes["idx_sprints_timeline"] == ["end_date", "start_date"]
+        assert indexes["idx_schedule_events_timeline"] == ["end_datetime", "start_datetime"]